@@ -0,0 +1,142 @@
+# core/models/backup/backup_blob_store.py
+"""
+Magasin de contenus adressés par empreinte pour les sauvegardes
+- Chaque contenu distinct est stocké une seule fois : .blobs/<2 car.>/<sha256>
+- Les fichiers de sauvegarde sont des liens physiques vers le blob : ils restent
+  des fichiers ordinaires (restauration, suppression et ZIP inchangés)
+- Compteur de références = nombre de liens du blob (st_nlink) : un blob qui n'est
+  plus référencé par aucune sauvegarde est supprimé (rotation, ramasse-miettes)
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from typing import Dict, Optional
+
+from infrastructure.logging.logging import log_message
+
+__all__ = ['BackupBlobStore', 'BLOB_FOLDER_NAME']
+
+BLOB_FOLDER_NAME = ".blobs"
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _file_digest(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupBlobStore:
+    """
+    Blobs dédupliqués d'un dossier de sauvegardes.
+
+    store() crée le fichier de sauvegarde comme lien vers le blob du contenu ; si le
+    système de fichiers ne gère pas les liens physiques, la sauvegarde redevient une
+    copie complète (sans blob) pour le reste de la session.
+    """
+
+    def __init__(self, backup_root: str):
+        self.root = os.path.join(backup_root, BLOB_FOLDER_NAME)
+        self._links_supported = True
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def store(self, source_path: str, backup_path: str) -> Optional[str]:
+        """
+        Crée backup_path avec le contenu de source_path.
+
+        Returns:
+            Empreinte du blob référencé, ou None si la sauvegarde est une copie simple
+        """
+        if not self._links_supported:
+            shutil.copy2(source_path, backup_path)
+            return None
+
+        digest = _file_digest(source_path)
+        blob_path = self.blob_path(digest)
+        with self._lock:
+            reused = os.path.exists(blob_path)
+            if not reused:
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                temp_path = f"{blob_path}.{os.getpid()}.tmp"
+                shutil.copy2(source_path, temp_path)
+                os.replace(temp_path, blob_path)
+
+            # Même horodatage à la seconde : la nouvelle sauvegarde remplace l'ancienne
+            if os.path.lexists(backup_path):
+                os.remove(backup_path)
+            try:
+                os.link(blob_path, backup_path)
+            except OSError as e:
+                self._links_supported = False
+                log_message("ATTENTION", f"Liens physiques indisponibles, sauvegardes en copies complètes: {e}", category="backup")
+                shutil.copy2(source_path, backup_path)
+                self._release_locked(digest)
+                return None
+
+        if reused:
+            log_message("DEBUG", f"Contenu déjà sauvegardé, blob réutilisé: {digest[:12]}", category="backup")
+        return digest
+
+    def release(self, digest: Optional[str]) -> bool:
+        """Supprime le blob s'il n'est plus référencé ; retourne True s'il a été supprimé"""
+        if not digest:
+            return False
+        with self._lock:
+            return self._release_locked(digest)
+
+    def _release_locked(self, digest: str) -> bool:
+        blob_path = self.blob_path(digest)
+        try:
+            if os.stat(blob_path).st_nlink > 1:
+                return False
+            os.remove(blob_path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            log_message("ATTENTION", f"Erreur suppression blob {digest[:12]}: {e}", category="backup_rotation")
+            return False
+
+    def collect_garbage(self) -> Dict[str, int]:
+        """
+        Supprime les blobs que plus aucune sauvegarde ne référence
+        (sauvegardes effacées hors du gestionnaire, depuis l'interface par exemple).
+
+        Returns:
+            dict: blobs conservés, supprimés et octets libérés
+        """
+        stats = {'kept': 0, 'removed': 0, 'freed_bytes': 0}
+        if not os.path.isdir(self.root):
+            return stats
+
+        with self._lock:
+            for shard in os.listdir(self.root):
+                shard_path = os.path.join(self.root, shard)
+                if not os.path.isdir(shard_path):
+                    continue
+                for name in os.listdir(shard_path):
+                    blob_path = os.path.join(shard_path, name)
+                    try:
+                        stat_result = os.stat(blob_path)
+                        # Fichiers temporaires orphelins (écriture interrompue)
+                        if name.endswith('.tmp') or stat_result.st_nlink <= 1:
+                            os.remove(blob_path)
+                            stats['removed'] += 1
+                            stats['freed_bytes'] += stat_result.st_size
+                        else:
+                            stats['kept'] += 1
+                    except OSError:
+                        continue
+                if not os.listdir(shard_path):
+                    os.rmdir(shard_path)
+
+        if stats['removed']:
+            log_message("DEBUG", f"Blobs non référencés supprimés: {stats['removed']} ({stats['freed_bytes']} octets)", category="backup_cleanup")
+        return stats
@@ -0,0 +1,279 @@
+# core/models/backup/backup_catalog.py
+"""
+Catalogue indexé des sauvegardes (SQLite, mode WAL)
+- Une ligne par sauvegarde : insertion/suppression unitaires au lieu de réécrire
+  tout le fichier de métadonnées JSON
+- Requêtes filtrées (jeu, fichier, type, période) et paginées, triées en SQL (date par défaut)
+- Statistiques calculées par agrégats SQL
+- Vue « dictionnaire » (CatalogMetadata) compatible avec l'ancien self.metadata
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from infrastructure.logging.logging import log_message
+
+__all__ = ['BackupCatalog', 'CatalogMetadata', 'open_catalog', 'SORT_COLUMNS']
+
+_SCHEMA_VERSION = 1
+
+# Colonnes acceptées pour le tri des requêtes paginées
+SORT_COLUMNS = ('created', 'game_name', 'file_name', 'type', 'size')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    id TEXT PRIMARY KEY,
+    backup_path TEXT,
+    game_name TEXT,
+    file_name TEXT,
+    type TEXT,
+    created TEXT,
+    size INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_backups_path ON backups(backup_path);
+CREATE INDEX IF NOT EXISTS idx_backups_created ON backups(created);
+CREATE INDEX IF NOT EXISTS idx_backups_game ON backups(game_name, file_name, type, created);
+CREATE INDEX IF NOT EXISTS idx_backups_type ON backups(type, created);
+CREATE TABLE IF NOT EXISTS catalog_info (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class BackupCatalog:
+    """
+    Catalogue SQLite des métadonnées de sauvegarde.
+
+    Une seule connexion protégée par un verrou : les écritures sont courtes
+    (une ligne) et validées immédiatement.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute("PRAGMA user_version=%d" % _SCHEMA_VERSION)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- informations du catalogue ---
+    def get_info(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM catalog_info WHERE key=?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_info(self, key: str, value: str):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO catalog_info(key, value) VALUES (?, ?)", (key, value))
+
+    # --- écriture ---
+    @staticmethod
+    def _row_values(metadata: Dict[str, Any]) -> Tuple:
+        return (
+            metadata['id'],
+            metadata.get('backup_path'),
+            metadata.get('game_name'),
+            metadata.get('file_name'),
+            metadata.get('type'),
+            metadata.get('created'),
+            metadata.get('size', 0),
+            json.dumps(metadata, ensure_ascii=False)
+        )
+
+    def upsert(self, metadata: Dict[str, Any]):
+        """Ajoute ou remplace une sauvegarde"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               self._row_values(metadata))
+
+    def upsert_many(self, items: List[Dict[str, Any]]):
+        """Ajoute plusieurs sauvegardes dans une seule transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                       [self._row_values(m) for m in items])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, backup_id: str) -> bool:
+        with self._lock:
+            return self._conn.execute("DELETE FROM backups WHERE id=?", (backup_id,)).rowcount > 0
+
+    def delete_many(self, backup_ids: List[str]) -> int:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                removed = self._conn.executemany("DELETE FROM backups WHERE id=?", [(i,) for i in backup_ids]).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return removed
+
+    # --- lecture ---
+    def get(self, backup_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM backups WHERE id=?", (backup_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def id_for_path(self, backup_path: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM backups WHERE backup_path=?", (backup_path,)).fetchone()
+        return row[0] if row else None
+
+    def ids(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT id FROM backups")]
+
+    def paths(self) -> Dict[str, str]:
+        """backup_path -> id de toutes les sauvegardes"""
+        with self._lock:
+            return {path: backup_id for backup_id, path in self._conn.execute("SELECT id, backup_path FROM backups")}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM backups").fetchone()[0]
+
+    @staticmethod
+    def _where(game_name=None, file_name=None, backup_type=None, since=None, until=None) -> Tuple[str, List]:
+        clauses, params = [], []
+        for column, value in (('game_name', game_name), ('file_name', file_name), ('type', backup_type)):
+            if value:
+                clauses.append(f"{column}=?")
+                params.append(value)
+        if since:
+            clauses.append("created>=?")
+            params.append(since)
+        if until:
+            clauses.append("created<?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, game_name: str = None, file_name: str = None, backup_type: str = None,
+              since: str = None, until: str = None, limit: int = None, offset: int = 0,
+              sort_by: str = 'created', descending: bool = True) -> List[Dict[str, Any]]:
+        """
+        Sauvegardes correspondant aux filtres, plus récentes en premier par défaut.
+
+        since/until : dates ISO (since incluse, until exclue) ; limit/offset : pagination
+        sort_by : colonne de tri (voir SORT_COLUMNS), appliquée avant la pagination
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Colonne de tri inconnue: {sort_by}")
+        where, params = self._where(game_name, file_name, backup_type, since, until)
+        collate = " COLLATE NOCASE" if sort_by in ('game_name', 'file_name', 'type') else ""
+        direction = "DESC" if descending else "ASC"
+        sql = f"SELECT data FROM backups{where} ORDER BY {sort_by}{collate} {direction}, created DESC, id"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, game_name: str = None, file_name: str = None, backup_type: str = None,
+              since: str = None, until: str = None) -> int:
+        where, params = self._where(game_name, file_name, backup_type, since, until)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM backups{where}", params).fetchone()[0]
+
+    def games(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT game_name FROM backups WHERE game_name IS NOT NULL ORDER BY game_name")]
+
+    def statistics(self, game_name: str = None, backup_type: str = None) -> Dict[str, Any]:
+        """Totaux, répartitions par jeu/type/fichier et dates extrêmes"""
+        where, params = self._where(game_name, None, backup_type)
+        stats = {
+            'total_backups': 0,
+            'total_size': 0,
+            'total_files': 0,
+            'by_game': {},
+            'by_type': {},
+            'by_file': {},
+            'oldest': None,
+            'newest': None
+        }
+        with self._lock:
+            total, size, oldest, newest = self._conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(created), MAX(created) FROM backups{where}", params).fetchone()
+            stats.update({'total_backups': total, 'total_size': size, 'oldest': oldest, 'newest': newest})
+            for game, count, game_size in self._conn.execute(
+                    f"SELECT game_name, COUNT(*), COALESCE(SUM(size), 0) FROM backups{where} GROUP BY game_name", params):
+                stats['by_game'][game] = {'count': count, 'size': game_size}
+            for backup_type_value, count in self._conn.execute(
+                    f"SELECT type, COUNT(*) FROM backups{where} GROUP BY type", params):
+                stats['by_type'][backup_type_value] = count
+            for file_name, count in self._conn.execute(
+                    f"SELECT file_name, COUNT(*) FROM backups{where} GROUP BY file_name", params):
+                stats['by_file'][file_name or 'unknown'] = count
+            stats['total_files'] = self._conn.execute(
+                f"SELECT COUNT(*) FROM (SELECT DISTINCT game_name, file_name FROM backups{where})", params).fetchone()[0]
+        return stats
+
+
+class CatalogMetadata(MutableMapping):
+    """
+    Vue dictionnaire id -> métadonnées adossée au catalogue.
+
+    Remplace l'ancien dictionnaire chargé depuis le JSON : chaque affectation ou
+    suppression est une écriture SQL unitaire (plus de réécriture complète).
+    """
+
+    def __init__(self, catalog: BackupCatalog):
+        self._catalog = catalog
+
+    def __getitem__(self, backup_id: str) -> Dict[str, Any]:
+        metadata = self._catalog.get(backup_id)
+        if metadata is None:
+            raise KeyError(backup_id)
+        return metadata
+
+    def __setitem__(self, backup_id: str, metadata: Dict[str, Any]):
+        self._catalog.upsert(dict(metadata, id=backup_id))
+
+    def __delitem__(self, backup_id: str):
+        if not self._catalog.delete(backup_id):
+            raise KeyError(backup_id)
+
+    def __contains__(self, backup_id) -> bool:
+        return self._catalog.get(backup_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._catalog.ids())
+
+    def __len__(self) -> int:
+        return len(self._catalog)
+
+    def items(self):
+        # Une seule requête au lieu d'une lecture par id
+        return [(m['id'], m) for m in self._catalog.query()]
+
+    def values(self):
+        return self._catalog.query()
+
+
+def open_catalog(db_path: str) -> Optional[BackupCatalog]:
+    """Ouvre le catalogue, ou None si SQLite est indisponible ou la base illisible"""
+    try:
+        return BackupCatalog(db_path)
+    except Exception as e:
+        log_message("ATTENTION", f"Catalogue des sauvegardes indisponible ({os.path.basename(db_path)}): {e}", category="backup_metadata")
+        return None
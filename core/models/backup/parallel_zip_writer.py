@@ -0,0 +1,169 @@
+# core/models/backup/parallel_zip_writer.py
+"""
+Écriture d'archives ZIP avec compression parallèle
+- Formats déjà compressés (images, audio, vidéo, .rpa...) stockés sans compression
+- Autres membres compressés (deflate brut) dans des threads de travail, puis écrits
+  dans l'ordre de soumission : l'archive est identique d'une exécution à l'autre
+- Membre stocké tel quel si la compression ne le réduit pas
+- Gros fichiers écrits en flux par zipfile (mémoire bornée)
+- Écriture directe des membres compressés limitée aux versions de CPython vérifiées
+  (RAW_WRITE_VERSIONS) ; ailleurs, membres écrits par ZipFile.writestr
+"""
+
+import os
+import platform
+import sys
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from infrastructure.logging.logging import log_message
+
+__all__ = ['ParallelZipWriter', 'STORED_EXTENSIONS']
+
+# Extensions dont le contenu est déjà compressé : deflate n'y gagne rien
+STORED_EXTENSIONS = frozenset((
+    '.png', '.jpg', '.jpeg', '.webp', '.avif', '.gif',
+    '.ogg', '.opus', '.mp3', '.m4a', '.flac',
+    '.webm', '.mp4', '.mkv', '.ogv', '.avi',
+    '.rpa', '.rpyc', '.rpymc', '.zip', '.7z', '.rar', '.gz', '.bz2', '.xz', '.woff', '.woff2'
+))
+
+# Au-delà, le fichier est écrit en flux par zipfile au lieu d'être chargé en mémoire
+STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# L'écriture directe d'un membre déjà compressé n'a pas d'API publique : elle utilise
+# des attributs internes de zipfile.ZipFile, identiques de CPython 3.11 à 3.13.
+# Autre version ou autre implémentation : repli sur ZipFile.writestr (la compression
+# se fait alors dans le thread d'écriture, seules les lectures restent parallèles).
+RAW_WRITE_VERSIONS = ((3, 11), (3, 13))
+_RAW_WRITE_ATTRIBUTES = ('_writecheck', '_didModify', 'fp', 'filelist', 'NameToInfo', 'start_dir')
+
+
+def _raw_write_supported(zipf: zipfile.ZipFile) -> bool:
+    """Vrai si les membres compressés en threads peuvent être écrits directement dans zipf"""
+    oldest, newest = RAW_WRITE_VERSIONS
+    return (platform.python_implementation() == 'CPython'
+            and oldest <= sys.version_info[:2] <= newest
+            and all(hasattr(zipf, name) for name in _RAW_WRITE_ATTRIBUTES)
+            and hasattr(zipfile.ZipInfo, 'FileHeader'))
+
+
+def _pack_member(file_path: str, compress: bool) -> Tuple[int, int, bytes, int]:
+    """(CRC, taille, données écrites, méthode) d'un membre (exécuté dans un thread)"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    crc = zlib.crc32(data)
+    if compress and data:
+        # zlib libère le GIL : les compressions des différents threads se recouvrent
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        packed = compressor.compress(data) + compressor.flush()
+        if len(packed) < len(data):
+            return crc, len(data), packed, zipfile.ZIP_DEFLATED
+    return crc, len(data), data, zipfile.ZIP_STORED
+
+
+def _zip_date_time(timestamp: float) -> Tuple[int, ...]:
+    date_time = time.localtime(timestamp)[:6]
+    # Le format ZIP ne représente pas les dates antérieures à 1980
+    return date_time if date_time[0] >= 1980 else (1980, 1, 1, 0, 0, 0)
+
+
+class ParallelZipWriter:
+    """
+    Ajoute des fichiers à une archive ZIP ouverte en écriture.
+
+    add() soumet le membre ; les membres sont écrits dans l'ordre des appels,
+    au plus max_workers + 2 membres étant en mémoire à la fois. close() attend
+    la fin des écritures et retourne les statistiques.
+    """
+
+    def __init__(self, zipf: zipfile.ZipFile, max_workers: Optional[int] = None):
+        self.zipf = zipf
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="zip-deflate")
+        self._pending = deque()
+        self.raw_write = _raw_write_supported(zipf)
+        if not self.raw_write:
+            log_message("DEBUG", f"Écriture ZIP directe non vérifiée pour Python {platform.python_version()}, "
+                        f"membres écrits par zipfile", category="backup_zip")
+        self.stats = {'files': 0, 'bytes_in': 0, 'bytes_out': 0, 'stored': 0, 'deflated': 0, 'streamed': 0}
+
+    def add(self, file_path: str, arcname: str, stat_result: os.stat_result = None):
+        stat_result = stat_result or os.stat(file_path)
+        compress = os.path.splitext(file_path)[1].lower() not in STORED_EXTENSIONS
+
+        if stat_result.st_size > STREAM_THRESHOLD:
+            self._pending.append(('stream', file_path, arcname, stat_result, compress))
+        else:
+            # Sans écriture directe, les threads ne font que lire : zipfile compresse
+            future = self._executor.submit(_pack_member, file_path, compress and self.raw_write)
+            self._pending.append(('packed', future, arcname, stat_result, compress))
+
+        while len(self._pending) > self.max_workers + 2:
+            self._write_next()
+
+    def close(self) -> Dict[str, int]:
+        try:
+            while self._pending:
+                self._write_next()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        return dict(self.stats)
+
+    def _write_next(self):
+        kind, source, arcname, stat_result, compress = self._pending.popleft()
+        if kind == 'stream':
+            compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            self.zipf.write(source, arcname, compress_type=compress_type)
+            info = self.zipf.getinfo(arcname.replace(os.sep, '/'))
+            self.stats['streamed'] += 1
+            self.stats['deflated' if compress else 'stored'] += 1
+            self.stats['bytes_in'] += info.file_size
+            self.stats['bytes_out'] += info.compress_size
+        elif self.raw_write:
+            crc, file_size, payload, compress_type = source.result()
+            self._write_raw_member(arcname, stat_result, crc, file_size, payload, compress_type)
+            self.stats['deflated' if compress_type == zipfile.ZIP_DEFLATED else 'stored'] += 1
+            self.stats['bytes_in'] += file_size
+            self.stats['bytes_out'] += len(payload)
+        else:
+            _, file_size, data, _ = source.result()
+            zinfo = self._member_info(arcname, stat_result)
+            self.zipf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED)
+            self.stats['deflated' if compress else 'stored'] += 1
+            self.stats['bytes_in'] += file_size
+            self.stats['bytes_out'] += zinfo.compress_size
+        self.stats['files'] += 1
+
+    @staticmethod
+    def _member_info(arcname: str, stat_result: os.stat_result) -> zipfile.ZipInfo:
+        zinfo = zipfile.ZipInfo(arcname.replace(os.sep, '/'), _zip_date_time(stat_result.st_mtime))
+        zinfo.external_attr = (stat_result.st_mode & 0xFFFF) << 16
+        return zinfo
+
+    def _write_raw_member(self, arcname: str, stat_result: os.stat_result, crc: int,
+                          file_size: int, payload: bytes, compress_type: int):
+        """
+        Écrit un membre déjà compressé (en-tête local + données) à la position courante.
+        Attributs internes de ZipFile : appelé seulement si raw_write (voir RAW_WRITE_VERSIONS).
+        """
+        zinfo = self._member_info(arcname, stat_result)
+        zinfo.compress_type = compress_type
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(payload)
+        zinfo.CRC = crc
+
+        zipf = self.zipf
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zinfo.header_offset = zipf.fp.tell()
+        zip64 = file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(payload)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
@@ -9,6 +9,8 @@ Structure: Game_name/file_name/backup_type/fichiers
 - Structure unifiée pour tous les types
 - Harmonisation avec les systèmes d'avertissement et nettoyage
 - Cache mémoire pour optimiser les performances avec beaucoup de sauvegardes
+- Déduplication : un contenu identique n'est stocké qu'une fois (liens vers des blobs)
+- Catalogue SQLite indexé : écritures unitaires, listes filtrées et paginées sans parcours disque
 """
 
 import os
@@ -20,11 +22,16 @@ import time
 import pickle
 import zipfile
 import fnmatch
+import threading
 from typing import List, Dict, Optional
 from pathlib import Path
+from infrastructure.config.config import config_manager
 from infrastructure.config.constants import FOLDERS, ensure_folders_exist
 from infrastructure.logging.logging import log_message
 from infrastructure.helpers.unified_functions import extract_game_name
+from core.models.backup.backup_blob_store import BackupBlobStore
+from core.models.backup.backup_catalog import CatalogMetadata, open_catalog
+from core.models.backup.parallel_zip_writer import ParallelZipWriter
 
 class BackupType:
     """Énumération des types de sauvegarde"""
@@ -77,6 +84,11 @@ class UnifiedBackupManager:
         self.backup_root = FOLDERS["backup"]
         self.metadata_file = os.path.join(self.backup_root, "backup_metadata.json")
         self.cache_file = os.path.join(self.backup_root, "backup_cache.pkl")
+        self.catalog_file = os.path.join(self.backup_root, "backup_catalog.db")
+        self._blob_store = BackupBlobStore(self.backup_root)
+        # Enregistrements du catalogue : resynchronisation et créations sérialisées
+        self._catalog_lock = threading.RLock()
+        self._catalog = open_catalog(self.catalog_file) if config_manager.get('backup_catalog', True) else None
         self._load_metadata()
         
         # Initialisation du cache
@@ -92,10 +104,19 @@ class UnifiedBackupManager:
         self._load_persistent_cache()
         
         self._initialized = True
+        
+        # Catalogue : resynchronisation avec les dossiers en arrière-plan (fichiers
+        # ajoutés ou supprimés hors du gestionnaire)
+        if self._catalog is not None:
+            threading.Thread(target=self.rescan_backups, name="backup-catalog-rescan", daemon=True).start()
         log_message("DEBUG", "UnifiedBackupManager initialisé avec système de cache persistant (singleton)", category="backup")
     
     def _load_metadata(self):
         """Charge les métadonnées des sauvegardes"""
+        if self._catalog is not None:
+            self._import_json_metadata()
+            self.metadata = CatalogMetadata(self._catalog)
+            return
         try:
             if os.path.exists(self.metadata_file):
                 with open(self.metadata_file, 'r', encoding='utf-8') as f:
@@ -106,8 +127,23 @@ class UnifiedBackupManager:
             log_message("ATTENTION", f"Erreur chargement métadonnées backups: {e}", category="backup_metadata")
             self.metadata = {}
     
+    def _import_json_metadata(self):
+        """Importe une seule fois l'ancien backup_metadata.json dans le catalogue"""
+        if self._catalog.get_info('json_imported') or not os.path.exists(self.metadata_file):
+            return
+        try:
+            with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            self._catalog.upsert_many([dict(m, id=backup_id) for backup_id, m in legacy.items()])
+            self._catalog.set_info('json_imported', datetime.datetime.now().isoformat())
+            log_message("INFO", f"Catalogue des sauvegardes créé depuis le JSON : {len(legacy)} entrées", category="backup_metadata")
+        except Exception as e:
+            log_message("ATTENTION", f"Erreur import métadonnées JSON dans le catalogue: {e}", category="backup_metadata")
+    
     def _save_metadata(self):
         """Sauvegarde les métadonnées"""
+        if self._catalog is not None:
+            return  # Chaque modification du catalogue est déjà enregistrée
         try:
             with open(self.metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(self.metadata, f, indent=2, ensure_ascii=False)
@@ -117,6 +153,8 @@ class UnifiedBackupManager:
     def _rebuild_metadata_index(self):
         """Reconstruit l'index des métadonnées par backup_path pour accès O(1)"""
         self._metadata_index = {}
+        if self._catalog is not None:
+            return  # Le catalogue est indexé par backup_path
         for backup_id, metadata in self.metadata.items():
             backup_path = metadata.get('backup_path')
             if backup_path:
@@ -125,6 +163,12 @@ class UnifiedBackupManager:
         log_message("DEBUG", f"Index métadonnées reconstruit : {len(self._metadata_index)} entrées", 
                    category="backup_cache")
     
+    def _find_backup_id(self, backup_path: str) -> Optional[str]:
+        """Identifiant de la sauvegarde stockée à backup_path (catalogue ou index)"""
+        if self._catalog is not None:
+            return self._catalog.id_for_path(backup_path)
+        return self._metadata_index.get(backup_path)
+    
     def _invalidate_cache(self):
         """Invalide le cache des sauvegardes"""
         self._cache_data = None
@@ -271,8 +315,12 @@ class UnifiedBackupManager:
             backup_filename = f"{file_name}_{timestamp_str}{original_ext}"
             backup_path = os.path.join(backup_folder, backup_filename)
         
-            # Copier le fichier
-            shutil.copy2(source_path, backup_path)
+            # Copier le fichier (lien vers le blob du contenu si la déduplication est active)
+            blob_digest = None
+            if config_manager.get('backup_deduplication', True):
+                blob_digest = self._blob_store.store(source_path, backup_path)
+            else:
+                shutil.copy2(source_path, backup_path)
         
             # Appliquer la rotation si nécessaire
             if backup_type in self.ROTATION_CONFIG:
@@ -294,9 +342,10 @@ class UnifiedBackupManager:
                 'source_filename': os.path.basename(source_path),
                 'backup_filename': backup_filename
             }
+            if blob_digest:
+                backup_metadata['blob'] = blob_digest
         
-            self.metadata[backup_id] = backup_metadata
-            self._save_metadata()
+            self._register_backup(backup_id, backup_metadata)
         
             result['success'] = True
             result['backup_path'] = backup_path
@@ -327,23 +376,30 @@ class UnifiedBackupManager:
                 if os.path.isfile(file_path):
                     backup_files.append({
                         'path': file_path,
-                        'name': file,
-                        'mtime': os.path.getmtime(file_path)
+                        'name': file
                     })
             
-            # Trier par date de modification (plus ancien en premier)
-            backup_files.sort(key=lambda x: x['mtime'])
+            # Trier par horodatage du nom (plus ancien en premier) : les liens vers un
+            # même blob partagent la date de modification du premier contenu sauvegardé
+            backup_files.sort(key=lambda x: x['name'])
             
             # Supprimer les fichiers excédentaires
             while len(backup_files) >= max_files:
                 oldest_file = backup_files.pop(0)
                 try:
+                    backup_id = self._find_backup_id(oldest_file['path'])
+                    blob_digest = self.metadata.get(backup_id, {}).get('blob') if backup_id else None
+                    
                     os.remove(oldest_file['path'])
                     log_message("DEBUG", f"Rotation: suppression de {oldest_file['name']}", category="backup_rotation")
                     
                     # Supprimer des métadonnées si présent
                     self._remove_from_metadata(oldest_file['path'])
                     
+                    # Libérer le blob si cette sauvegarde était sa dernière référence
+                    if self._blob_store.release(blob_digest):
+                        log_message("DEBUG", f"Rotation: blob {blob_digest[:12]} libéré", category="backup_rotation")
+                    
                 except Exception as e:
                     log_message("ATTENTION", f"Erreur suppression rotation {oldest_file['name']}: {e}", category="backup_rotation")
             
@@ -357,17 +413,34 @@ class UnifiedBackupManager:
         except Exception as e:
             log_message("ERREUR", f"Erreur rotation {backup_type}: {e}", category="backup_rotation")
     
+    def _register_backup(self, backup_id: str, backup_metadata: Dict):
+        """Enregistre les métadonnées d'une nouvelle sauvegarde
+        
+        Une entrée déjà créée pour le même fichier (resynchronisation du catalogue
+        passée entre la copie et cet enregistrement) est remplacée : une seule
+        entrée par chemin de sauvegarde.
+        """
+        backup_path = backup_metadata['backup_path']
+        with self._catalog_lock:
+            previous_id = self._find_backup_id(backup_path)
+            if previous_id and previous_id != backup_id and previous_id in self.metadata:
+                del self.metadata[previous_id]
+            self.metadata[backup_id] = backup_metadata
+            if self._catalog is None:
+                self._metadata_index[backup_path] = backup_id
+            self._save_metadata()
+    
     def _remove_from_metadata(self, backup_path: str):
         """Supprime une entrée des métadonnées par chemin (optimisé avec index)"""
         try:
             # Utiliser l'index pour trouver rapidement le backup_id (O(1))
-            backup_id = self._metadata_index.get(backup_path)
+            backup_id = self._find_backup_id(backup_path)
             
             if backup_id:
                 # Supprimer des métadonnées et de l'index
                 if backup_id in self.metadata:
                     del self.metadata[backup_id]
-                del self._metadata_index[backup_path]
+                self._metadata_index.pop(backup_path, None)
                 self._save_metadata()
                 log_message("DEBUG", f"Métadonnées supprimées pour {backup_path}", category="backup_metadata")
                 
@@ -377,6 +450,15 @@ class UnifiedBackupManager:
     def list_all_backups(self, game_filter: str = None, type_filter: str = None) -> List[Dict]:
         """Liste toutes les sauvegardes avec cache mémoire pour optimiser les performances"""
         
+        # Catalogue : requête indexée, sans parcours des dossiers
+        if self._catalog is not None:
+            try:
+                game_name = game_filter if game_filter and game_filter != "Tous" else None
+                return self._catalog.query(game_name=game_name, backup_type=type_filter)
+            except Exception as e:
+                log_message("ERREUR", f"Erreur lecture catalogue des sauvegardes: {e}", category="backup_listing")
+                return []
+        
         # Vérifier si le cache est valide et qu'on demande toutes les sauvegardes (pas de filtres)
         if self._is_cache_valid() and game_filter is None and type_filter is None:
             log_message("DEBUG", "Utilisation du cache pour list_all_backups", category="backup_cache")
@@ -391,46 +473,20 @@ class UnifiedBackupManager:
                 return backups
             
             # Scanner la structure hiérarchique: Game_name/file_name/backup_type/
-            for game_name in os.listdir(self.backup_root):
-                if game_filter and game_filter != "Tous" and game_name != game_filter:
-                    continue
-                    
-                game_path = os.path.join(self.backup_root, game_name)
-                if not os.path.isdir(game_path) or game_name.startswith('.'):
-                    continue
-                
-                # Parcourir les fichiers
-                for file_name in os.listdir(game_path):
-                    file_path = os.path.join(game_path, file_name)
-                    if not os.path.isdir(file_path):
-                        continue
-                    
-                    # Parcourir les types de backup
-                    for backup_type in os.listdir(file_path):
-                        if type_filter and backup_type != type_filter:
-                            continue
-                            
-                        type_path = os.path.join(file_path, backup_type)
-                        if not os.path.isdir(type_path):
-                            continue
-                        
-                        # Scanner les fichiers de sauvegarde
-                        for backup_file in os.listdir(type_path):
-                            backup_full_path = os.path.join(type_path, backup_file)
-                            if not os.path.isfile(backup_full_path):
-                                continue
-                            
-                            backup_info = self._get_or_create_backup_info_hierarchical(
-                                backup_full_path, game_name, file_name, backup_type
-                            )
-                            if backup_info:
-                                backups.append(backup_info)
+            for backup_full_path, game_name, file_name, backup_type in self._iter_backup_files(game_filter, type_filter):
+                backup_info = self._get_or_create_backup_info_hierarchical(
+                    backup_full_path, game_name, file_name, backup_type
+                )
+                if backup_info:
+                    backups.append(backup_info)
             
             # Trier par date de création (plus récent en premier)
             backups.sort(key=lambda x: x['created'], reverse=True)
             
             # Sauvegarder dans le cache SI pas de filtres (cache complet uniquement)
             if game_filter is None and type_filter is None:
+                # Blobs des sauvegardes supprimées depuis l'interface
+                self._blob_store.collect_garbage()
                 self._cache_data = backups.copy()
                 self._cache_timestamp = time.time()
                 elapsed = time.time() - start_time
@@ -444,6 +500,144 @@ class UnifiedBackupManager:
         
         return backups
     
+    def _iter_backup_files(self, game_filter: str = None, type_filter: str = None):
+        """Parcourt Game_name/file_name/backup_type/ : (chemin, jeu, fichier, type) de chaque sauvegarde"""
+        for game_name in os.listdir(self.backup_root):
+            if game_filter and game_filter != "Tous" and game_name != game_filter:
+                continue
+                
+            game_path = os.path.join(self.backup_root, game_name)
+            if not os.path.isdir(game_path) or game_name.startswith('.'):
+                continue
+            
+            # Parcourir les fichiers
+            for file_name in os.listdir(game_path):
+                file_path = os.path.join(game_path, file_name)
+                if not os.path.isdir(file_path):
+                    continue
+                
+                # Parcourir les types de backup
+                for backup_type in os.listdir(file_path):
+                    if type_filter and backup_type != type_filter:
+                        continue
+                        
+                    type_path = os.path.join(file_path, backup_type)
+                    if not os.path.isdir(type_path):
+                        continue
+                    
+                    # Scanner les fichiers de sauvegarde
+                    for backup_file in os.listdir(type_path):
+                        backup_full_path = os.path.join(type_path, backup_file)
+                        if os.path.isfile(backup_full_path):
+                            yield backup_full_path, game_name, file_name, backup_type
+    
+    def rescan_backups(self) -> Dict[str, int]:
+        """Resynchronise le catalogue avec les dossiers de sauvegarde
+        
+        Les fichiers sans métadonnées sont enregistrés, les entrées dont le fichier
+        a disparu sont retirées.
+        
+        Returns:
+            dict: nombre d'entrées ajoutées et retirées
+        """
+        stats = {'added': 0, 'removed': 0}
+        if self._catalog is None or not os.path.exists(self.backup_root):
+            return stats
+        
+        try:
+            start_time = time.time()
+            known = self._catalog.paths()
+            found = set()
+            for backup_full_path, game_name, file_name, backup_type in self._iter_backup_files():
+                found.add(backup_full_path)
+                if backup_full_path not in known:
+                    # Sous verrou : une sauvegarde en cours de création est enregistrée
+                    # par create_backup, sans second identifiant pour le même chemin
+                    with self._catalog_lock:
+                        if self._catalog.id_for_path(backup_full_path):
+                            continue
+                        if self._get_or_create_backup_info_hierarchical(backup_full_path, game_name, file_name, backup_type):
+                            stats['added'] += 1
+            
+            with self._catalog_lock:
+                missing = [backup_id for path, backup_id in known.items()
+                           if path not in found and not os.path.exists(path)]
+                if missing:
+                    stats['removed'] = self._catalog.delete_many(missing)
+            
+            # Blobs des sauvegardes supprimées depuis l'interface
+            self._blob_store.collect_garbage()
+            
+            log_message("DEBUG", f"Catalogue resynchronisé en {time.time() - start_time:.2f}s : "
+                        f"{stats['added']} ajoutée(s), {stats['removed']} retirée(s)", category="backup_cache")
+        except Exception as e:
+            log_message("ATTENTION", f"Erreur resynchronisation du catalogue: {e}", category="backup_listing")
+        
+        return stats
+    
+    def list_backups_page(self, game_filter: str = None, type_filter: str = None, file_filter: str = None,
+                          since: str = None, until: str = None, offset: int = 0, limit: int = None,
+                          sort_by: str = 'created', descending: bool = True) -> Dict[str, any]:
+        """Page de sauvegardes filtrées, plus récentes en premier par défaut
+        
+        Args:
+            game_filter / type_filter / file_filter: filtres exacts ("Tous" = pas de filtre jeu)
+            since / until: bornes de date ISO (since incluse, until exclue)
+            offset / limit: pagination (limit None = jusqu'à la fin)
+            sort_by / descending: tri appliqué avant la pagination ('created', 'game_name',
+                'file_name', 'type' ou 'size') : les pages successives restent ordonnées
+        
+        Returns:
+            dict: 'backups' (la page) et 'total' (nombre de sauvegardes correspondant aux filtres)
+        """
+        game_name = game_filter if game_filter and game_filter != "Tous" else None
+        
+        if self._catalog is not None:
+            try:
+                filters = dict(game_name=game_name, file_name=file_filter, backup_type=type_filter, since=since, until=until)
+                return {
+                    'backups': self._catalog.query(limit=limit, offset=offset, sort_by=sort_by,
+                                                   descending=descending, **filters),
+                    'total': self._catalog.count(**filters)
+                }
+            except Exception as e:
+                log_message("ERREUR", f"Erreur lecture catalogue des sauvegardes: {e}", category="backup_listing")
+                return {'backups': [], 'total': 0}
+        
+        # Sans catalogue : filtrage en mémoire de la liste complète (en cache)
+        backups = [
+            b for b in self.list_all_backups()
+            if (not game_name or b['game_name'] == game_name)
+            and (not type_filter or b['type'] == type_filter)
+            and (not file_filter or b.get('file_name') == file_filter)
+            and (not since or b['created'] >= since)
+            and (not until or b['created'] < until)
+        ]
+        if sort_by != 'created' or not descending:
+            backups.sort(key=lambda b: b.get('created', ''), reverse=True)
+            backups.sort(key=lambda b: self._backup_sort_key(b, sort_by), reverse=descending)
+        end = None if limit is None else offset + limit
+        return {'backups': backups[offset:end], 'total': len(backups)}
+    
+    @staticmethod
+    def _backup_sort_key(backup: Dict, sort_by: str):
+        """Clé de tri en mémoire, équivalente au tri du catalogue"""
+        value = backup.get(sort_by)
+        if sort_by == 'size':
+            return value or 0
+        value = value or ''
+        return value.lower() if sort_by != 'created' else value
+    
+    def list_backup_games(self) -> List[str]:
+        """Noms des jeux ayant au moins une sauvegarde"""
+        if self._catalog is not None:
+            try:
+                return self._catalog.games()
+            except Exception as e:
+                log_message("ATTENTION", f"Erreur lecture des jeux du catalogue: {e}", category="backup_listing")
+                return []
+        return sorted(set(b['game_name'] for b in self.list_all_backups()))
+    
     def _get_or_create_backup_info_hierarchical(self, backup_path: str, game_name: str, 
                                               file_name: str, backup_type: str) -> Optional[Dict]:
         """Crée les infos de backup pour la structure hiérarchique (optimisé avec index)"""
@@ -451,7 +645,7 @@ class UnifiedBackupManager:
             backup_filename = os.path.basename(backup_path)
             
             # Chercher dans l'index des métadonnées (O(1) au lieu de O(n))
-            backup_id_from_index = self._metadata_index.get(backup_path)
+            backup_id_from_index = self._find_backup_id(backup_path)
             if backup_id_from_index:
                 metadata = self.metadata.get(backup_id_from_index)
                 if metadata:
@@ -459,12 +653,13 @@ class UnifiedBackupManager:
             
             # Si pas de métadonnées trouvées, chercher par pattern dans les métadonnées existantes
             # pour les sauvegardes récentes qui pourraient ne pas être dans l'index
-            for backup_id, metadata in self.metadata.items():
-                if (metadata.get('backup_path') == backup_path and 
-                    metadata.get('game_name') == game_name and 
-                    metadata.get('file_name') == file_name and 
-                    metadata.get('type') == backup_type):
-                    return metadata
+            if self._catalog is None:
+                for backup_id, metadata in self.metadata.items():
+                    if (metadata.get('backup_path') == backup_path and 
+                        metadata.get('game_name') == game_name and 
+                        metadata.get('file_name') == file_name and 
+                        metadata.get('type') == backup_type):
+                        return metadata
             
             # Créer de nouvelles métadonnées seulement si aucune n'existe
             stats = os.stat(backup_path)
@@ -490,7 +685,8 @@ class UnifiedBackupManager:
             
             # Sauvegarder dans les métadonnées ET l'index
             self.metadata[backup_id] = backup_info
-            self._metadata_index[backup_path] = backup_id
+            if self._catalog is None:
+                self._metadata_index[backup_path] = backup_id
             return backup_info
             
         except Exception as e:
@@ -514,11 +710,19 @@ class UnifiedBackupManager:
             log_message("ATTENTION", f"Erreur reconstruction nom source: {e}", category="backup_filename")
             return f"{file_name}.rpy"
     
-    def get_backup_statistics(self) -> Dict[str, any]:
+    def get_backup_statistics(self, game_filter: str = None, type_filter: str = None) -> Dict[str, any]:
         """Calcule les statistiques des sauvegardes avec structure hiérarchique"""
+        game_name = game_filter if game_filter and game_filter != "Tous" else None
+        if self._catalog is not None:
+            try:
+                return self._catalog.statistics(game_name=game_name, backup_type=type_filter)
+            except Exception as e:
+                log_message("ERREUR", f"Erreur calcul statistiques du catalogue: {e}", category="backup_stats")
+        
         stats = {
             'total_backups': 0,
             'total_size': 0,
+            'total_files': 0,
             'by_game': {},
             'by_type': {},
             'by_file': {},
@@ -527,8 +731,9 @@ class UnifiedBackupManager:
         }
         
         try:
-            all_backups = self.list_all_backups()
+            all_backups = self.list_backups_page(game_filter=game_name, type_filter=type_filter)['backups']
             stats['total_backups'] = len(all_backups)
+            stats['total_files'] = len(set((b['game_name'], b.get('file_name')) for b in all_backups))
             
             for backup in all_backups:
                 # Taille totale
@@ -573,7 +778,7 @@ class UnifiedBackupManager:
             # Parcourir tous les jeux
             for game_name in os.listdir(self.backup_root):
                 game_path = os.path.join(self.backup_root, game_name)
-                if not os.path.isdir(game_path):
+                if not os.path.isdir(game_path) or game_name.startswith('.'):
                     continue
                 
                 # Parcourir tous les fichiers
@@ -614,7 +819,7 @@ class UnifiedBackupManager:
     def create_zip_backup(self, source_path: str, backup_type: str = BackupType.SECURITY,
                          description: str = None, override_game_name: str = None, 
                          override_file_name: str = None, include_patterns: list = None,
-                         exclude_patterns: list = None) -> Dict[str, any]:
+                         exclude_patterns: list = None, parallel: bool = None) -> Dict[str, any]:
         """Crée une sauvegarde ZIP complète d'un dossier ou fichier
         
         Args:
@@ -625,6 +830,8 @@ class UnifiedBackupManager:
             override_file_name: Nom de fichier à utiliser au lieu de l'extraction automatique
             include_patterns: Patterns d'inclusion (ex: ["**.rpy", "**.png"])
             exclude_patterns: Patterns d'exclusion (ex: ["**~", "**.bak"])
+            parallel: Compression parallèle, formats déjà compressés stockés tels quels
+                (None = option backup_zip_parallel)
         """
         result = {
             'success': False,
@@ -632,7 +839,9 @@ class UnifiedBackupManager:
             'backup_id': None,
             'error': None,
             'files_count': 0,
-            'total_size': 0
+            'total_size': 0,
+            'elapsed': 0.0,
+            'throughput_mb_s': 0.0
         }
         
         try:
@@ -678,27 +887,24 @@ class UnifiedBackupManager:
             # Créer l'archive ZIP
             files_count = 0
             total_size = 0
+            start_time = time.time()
+            if parallel is None:
+                parallel = config_manager.get('backup_zip_parallel', True)
             
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                if os.path.isfile(source_path):
-                    # Fichier unique
-                    if self._should_include_file(os.path.basename(source_path), include_patterns, exclude_patterns):
-                        zipf.write(source_path, os.path.basename(source_path))
-                        files_count = 1
-                        total_size = os.path.getsize(source_path)
-                else:
-                    # Dossier complet
-                    for root, dirs, files in os.walk(source_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            
-                            # Vérifier les patterns d'inclusion/exclusion
-                            if self._should_include_file(file, include_patterns, exclude_patterns):
-                                # Chemin relatif dans l'archive
-                                arcname = os.path.relpath(file_path, source_path)
-                                zipf.write(file_path, arcname)
-                                files_count += 1
-                                total_size += os.path.getsize(file_path)
+            if parallel:
+                files_count, total_size, zip_stats = self._write_zip_parallel(
+                    zip_path, source_path, include_patterns, exclude_patterns
+                )
+            else:
+                zip_stats = None
+                files_count, total_size = self._write_zip_serial(
+                    zip_path, source_path, include_patterns, exclude_patterns
+                )
+            
+            elapsed = time.time() - start_time
+            throughput = (total_size / (1024 * 1024)) / elapsed if elapsed > 0 else 0.0
+            result['elapsed'] = elapsed
+            result['throughput_mb_s'] = throughput
             
             # Créer les métadonnées
             backup_id = f"{game_name}_{file_name}_{timestamp_str}_{backup_type}_zip"
@@ -722,8 +928,7 @@ class UnifiedBackupManager:
                 'exclude_patterns': exclude_patterns
             }
             
-            self.metadata[backup_id] = backup_metadata
-            self._save_metadata()
+            self._register_backup(backup_id, backup_metadata)
             
             result['success'] = True
             result['backup_path'] = zip_path
@@ -732,6 +937,10 @@ class UnifiedBackupManager:
             result['total_size'] = total_size
             
             log_message("INFO", f"Backup ZIP créé: {game_name}/{file_name}/{backup_type}/{zip_filename} ({files_count} fichiers, {total_size} bytes)", category="backup_zip")
+            mode_info = ""
+            if zip_stats:
+                mode_info = f" | {zip_stats['deflated']} compressé(s), {zip_stats['stored']} stocké(s), {zip_stats['workers']} threads"
+            log_message("INFO", f"Backup ZIP: {elapsed:.2f}s, {throughput:.1f} Mo/s{mode_info}", category="backup_zip")
             
             # Invalider le cache après création d'une sauvegarde
             self._invalidate_cache()
@@ -742,6 +951,60 @@ class UnifiedBackupManager:
         
         return result
     
+    def _write_zip_serial(self, zip_path: str, source_path: str, include_patterns: list, exclude_patterns: list):
+        """Archive ZIP compressée membre par membre ; retourne (nombre de fichiers, taille totale)"""
+        files_count = 0
+        total_size = 0
+        
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            if os.path.isfile(source_path):
+                # Fichier unique
+                if self._should_include_file(os.path.basename(source_path), include_patterns, exclude_patterns):
+                    zipf.write(source_path, os.path.basename(source_path))
+                    files_count = 1
+                    total_size = os.path.getsize(source_path)
+            else:
+                # Dossier complet
+                for root, dirs, files in os.walk(source_path):
+                    for file in files:
+                        file_path = os.path.join(root, file)
+                        
+                        # Vérifier les patterns d'inclusion/exclusion
+                        if self._should_include_file(file, include_patterns, exclude_patterns):
+                            # Chemin relatif dans l'archive
+                            arcname = os.path.relpath(file_path, source_path)
+                            zipf.write(file_path, arcname)
+                            files_count += 1
+                            total_size += os.path.getsize(file_path)
+        
+        return files_count, total_size
+    
+    def _write_zip_parallel(self, zip_path: str, source_path: str, include_patterns: list, exclude_patterns: list):
+        """Archive ZIP compressée en parallèle (formats déjà compressés stockés tels quels)
+        
+        Returns:
+            tuple: (nombre de fichiers, taille totale, statistiques de l'écriture)
+        """
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            writer = ParallelZipWriter(zipf)
+            try:
+                if os.path.isfile(source_path):
+                    # Fichier unique
+                    if self._should_include_file(os.path.basename(source_path), include_patterns, exclude_patterns):
+                        writer.add(source_path, os.path.basename(source_path))
+                else:
+                    # Dossier complet (une seule lecture des attributs par fichier)
+                    for root, dirs, files in os.walk(source_path):
+                        for file in files:
+                            if self._should_include_file(file, include_patterns, exclude_patterns):
+                                file_path = os.path.join(root, file)
+                                writer.add(file_path, os.path.relpath(file_path, source_path), os.stat(file_path))
+            finally:
+                stats = writer.close()
+        
+        stats['workers'] = writer.max_workers
+        return stats['files'], stats['bytes_in'], stats
+    
     def _should_include_file(self, filename: str, include_patterns: list, exclude_patterns: list) -> bool:
         """Vérifie si un fichier doit être inclus selon les patterns"""
         try:
@@ -7,12 +7,26 @@ Optimise les performances en évitant les rechargements inutiles
 import os
 import json
 import hashlib
-import pickle
 import time
+import zlib
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from infrastructure.logging.logging import log_message
 from infrastructure.config.config import config_manager
+from core.models.cache.file_pack import PackedFilesView, compress_text, open_file_pack, write_file_pack
+
+# Version du format du cache de recherche de chaînes (JSON compressé + empreinte des fichiers game/)
+STRING_SEARCH_CACHE_VERSION = 2
+
+# Version du format du cache des résultats de cohérence (par fichier, validé par sha1 du contenu)
+COHERENCE_RESULTS_CACHE_VERSION = 1
+
+# Version du format de l'index des blocs strings (old -> new) par projet et langue
+STRING_TRANSLATION_INDEX_VERSION = 1
+
+# Version du format du corpus anti-doublons (chaînes old / _() déjà présentes dans tl/<langue>)
+TRANSLATION_CORPUS_VERSION = 1
 
 class PersistentCacheManager:
     """Gestionnaire de cache persistant avec invalidation intelligente"""
@@ -96,100 +110,195 @@ class PersistentCacheManager:
         except Exception:
             return False
     
-    def get_game_files_cache(self, project_path: str) -> Optional[Dict[str, str]]:
-        """Récupère le cache des fichiers game/ pour un projet"""
-        project_key = self._get_project_key(project_path)
-        cache_file = self._get_cache_file_path(project_key, 'game_files')
+    def _get_memory_entry(self, project_key: str) -> Dict[str, Any]:
+        if project_key not in self._memory_cache:
+            self._memory_cache[project_key] = {}
+        return self._memory_cache[project_key]
+    
+    def _close_game_files_view(self, project_key: str):
+        """Ferme le pack mappé d'un projet (indispensable sous Windows avant de le remplacer)"""
+        view = self._memory_cache.get(project_key, {}).pop('game_files', None)
+        if view is not None:
+            view.close()
+    
+    def _read_game_file(self, file_path: str) -> str:
+        # Même lecture que le nettoyeur (UTF-8, erreurs ignorées)
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    
+    def _refresh_game_files(self, view: PackedFilesView, source_folder: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Validation fichier par fichier d'un pack.
         
-        # Vérifier le cache mémoire d'abord
-        if project_key in self._memory_cache and 'game_files' in self._memory_cache[project_key]:
-            log_message("DEBUG", f"Cache game files hit (memory): {os.path.basename(project_path)}", category="cache_manager")
-            return self._memory_cache[project_key]['game_files']
+        Returns:
+            None si tout est à jour, sinon la liste complète des entrées à réécrire
+            (blocs inchangés réutilisés, fichiers modifiés/ajoutés relus, supprimés retirés)
+        """
+        records = []
+        changed = False
         
-        # Vérifier le cache disque
-        if self._is_cache_valid(cache_file, project_path):
+        for file_path, entry in view.entries.items():
             try:
-                with open(cache_file, 'rb') as f:
-                    cache_data = pickle.load(f)
-                
-                # Mettre en cache mémoire
-                if project_key not in self._memory_cache:
-                    self._memory_cache[project_key] = {}
-                self._memory_cache[project_key]['game_files'] = cache_data
-                
-                log_message("INFO", f"Cache game files chargé depuis disque: {os.path.basename(project_path)} ({len(cache_data)} fichiers)", category="cache_manager")
-                return cache_data
-                
-            except Exception as e:
-                log_message("ATTENTION", f"Erreur lecture cache game files: {e}", category="cache_manager")
+                stat = os.stat(file_path)
+            except OSError:
+                changed = True  # Fichier supprimé
+                continue
+            
+            if stat.st_mtime == entry['mtime'] and stat.st_size == entry['size']:
+                records.append({**entry, 'blob': None})
+                continue
+            
+            packed = compress_text(self._read_game_file(file_path))
+            if packed['sha1'] == entry['sha1']:
+                # Simple changement de date : bloc conservé
+                packed['blob'] = None
+            records.append({'path': file_path, 'mtime': stat.st_mtime, 'size': stat.st_size, **packed})
+            changed = True
+        
+        if source_folder and os.path.isdir(source_folder):
+            for root, dirs, files in os.walk(source_folder):
+                if 'tl' in dirs:
+                    dirs.remove('tl')
+                for file in files:
+                    if not file.endswith('.rpy'):
+                        continue
+                    file_path = os.path.join(root, file)
+                    if file_path in view.entries:
+                        continue
+                    try:
+                        stat = os.stat(file_path)
+                        records.append({'path': file_path, 'mtime': stat.st_mtime, 'size': stat.st_size,
+                                        **compress_text(self._read_game_file(file_path))})
+                        changed = True
+                    except Exception as e:
+                        log_message("ATTENTION", f"Impossible de lire {file_path}: {e}", category="cache_manager")
         
-        return None
+        if not changed:
+            return None
+        
+        # Blocs réutilisés copiés avant la fermeture du mapping
+        for record in records:
+            if record['blob'] is None:
+                record['blob'] = view.read_blob(record['path'])
+        return records
     
-    def set_game_files_cache(self, project_path: str, cache_data: Dict[str, str]):
-        """Sauvegarde le cache des fichiers game/ pour un projet"""
+    def _write_game_files_pack(self, project_key: str, project_path: str, records: List[Dict[str, Any]]) -> Optional[PackedFilesView]:
+        """Écrit le pack d'un projet et le remet en cache mémoire"""
+        cache_file = self._get_cache_file_path(project_key, 'game_files')
+        self._close_game_files_view(project_key)
+        write_file_pack(str(cache_file), records, {
+            'project_path': project_path,
+            'cache_type': 'game_files',
+            'created': time.time()
+        })
+        
+        # Métadonnées JSON de l'ancien format (validation tout-ou-rien) devenues inutiles
+        legacy_metadata = cache_file.with_suffix('.meta')
+        if legacy_metadata.exists():
+            legacy_metadata.unlink()
+        
+        view = open_file_pack(str(cache_file))
+        if view is not None:
+            self._get_memory_entry(project_key)['game_files'] = view
+        return view
+    
+    def get_game_files_cache(self, project_path: str, source_folder: Optional[str] = None) -> Optional[Mapping]:
+        """
+        Récupère le cache des fichiers game/ pour un projet (vue chemin -> contenu chargée à la demande).
+        Chaque fichier est revalidé (mtime/taille, puis sha1) ; source_folder permet aussi
+        d'intégrer les fichiers .rpy apparus depuis la création du cache.
+        """
         project_key = self._get_project_key(project_path)
         cache_file = self._get_cache_file_path(project_key, 'game_files')
         
         try:
-            # Sauvegarder le cache
-            with open(cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
+            view = self._memory_cache.get(project_key, {}).get('game_files')
+            if view is not None:
+                log_message("DEBUG", f"Cache game files hit (memory): {os.path.basename(project_path)}", category="cache_manager")
+            elif self._is_cache_valid(cache_file, project_path):
+                view = open_file_pack(str(cache_file))
+                if view is None:
+                    log_message("DEBUG", f"Cache game files ignoré (ancien format): {cache_file.name}", category="cache_manager")
+                    return None
+                self._get_memory_entry(project_key)['game_files'] = view
+            else:
+                return None
             
-            # Sauvegarder les métadonnées
-            metadata = {
-                'project_path': project_path,
-                'cache_type': 'game_files',
-                'file_count': len(cache_data),
-                'created': time.time(),
-                'file_timestamps': {}
-            }
-            
-            # Enregistrer les timestamps des fichiers
-            for file_path in cache_data.keys():
-                if os.path.exists(file_path):
-                    metadata['file_timestamps'][file_path] = os.path.getmtime(file_path)
+            records = self._refresh_game_files(view, source_folder)
+            if records is not None:
+                view = self._write_game_files_pack(project_key, project_path, records)
+                if view is None:
+                    return None
+                log_message("INFO", f"Cache game files mis à jour fichier par fichier: {os.path.basename(project_path)} ({len(view)} fichiers)", category="cache_manager")
+            else:
+                log_message("INFO", f"Cache game files chargé depuis disque: {os.path.basename(project_path)} ({len(view)} fichiers)", category="cache_manager")
+            return view
             
-            metadata_file = cache_file.with_suffix('.meta')
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+        except Exception as e:
+            log_message("ATTENTION", f"Erreur lecture cache game files: {e}", category="cache_manager")
+            self._close_game_files_view(project_key)
+            return None
+    
+    def set_game_files_cache(self, project_path: str, cache_data: Dict[str, str]):
+        """Sauvegarde le cache des fichiers game/ pour un projet"""
+        project_key = self._get_project_key(project_path)
+        
+        try:
+            records = []
+            for file_path, content in cache_data.items():
+                if not os.path.exists(file_path):
+                    continue
+                stat = os.stat(file_path)
+                packed = compress_text(content)
+                records.append({'path': file_path, 'mtime': stat.st_mtime, 'size': stat.st_size, **packed})
             
-            # Mettre en cache mémoire
-            if project_key not in self._memory_cache:
-                self._memory_cache[project_key] = {}
-            self._memory_cache[project_key]['game_files'] = cache_data
+            view = self._write_game_files_pack(project_key, project_path, records)
+            if view is not None:
+                # Contenus déjà en mémoire : pas de décompression au prochain accès
+                view.preload(cache_data)
             
-            log_message("INFO", f"Cache game files sauvegardé: {os.path.basename(project_path)} ({len(cache_data)} fichiers)", category="cache_manager")
+            log_message("INFO", f"Cache game files sauvegardé: {os.path.basename(project_path)} ({len(records)} fichiers)", category="cache_manager")
             
         except Exception as e:
             log_message("ERREUR", f"Erreur sauvegarde cache game files: {e}", category="cache_manager")
     
+    def _current_game_files_fingerprint(self, project_key: str) -> Optional[str]:
+        view = self._memory_cache.get(project_key, {}).get('game_files')
+        return view.fingerprint if view is not None else None
+    
     def get_string_search_cache(self, project_path: str) -> Optional[Dict[str, bool]]:
-        """Récupère le cache de recherche de chaînes pour un projet"""
+        """
+        Récupère le cache de recherche de chaînes pour un projet.
+        Les résultats ne sont valides que pour les contenus game/ sur lesquels ils ont été calculés.
+        """
         project_key = self._get_project_key(project_path)
         cache_file = self._get_cache_file_path(project_key, 'string_search')
+        fingerprint = self._current_game_files_fingerprint(project_key)
         
         # Vérifier le cache mémoire d'abord
-        if project_key in self._memory_cache and 'string_search' in self._memory_cache[project_key]:
-            return self._memory_cache[project_key]['string_search']
-        
-        # Vérifier le cache disque
-        if self._is_cache_valid(cache_file, project_path):
+        cached = self._memory_cache.get(project_key, {}).get('string_search')
+        if cached is None and self._is_cache_valid(cache_file, project_path):
             try:
                 with open(cache_file, 'rb') as f:
-                    cache_data = pickle.load(f)
-                
-                # Mettre en cache mémoire
-                if project_key not in self._memory_cache:
-                    self._memory_cache[project_key] = {}
-                self._memory_cache[project_key]['string_search'] = cache_data
-                
-                log_message("DEBUG", f"Cache string search chargé: {len(cache_data)} recherches", category="cache_manager")
-                return cache_data
-                
+                    payload = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+                if payload.get('version') == STRING_SEARCH_CACHE_VERSION:
+                    cached = (payload.get('fingerprint'), payload.get('results', {}))
+                    self._get_memory_entry(project_key)['string_search'] = cached
             except Exception as e:
-                log_message("ATTENTION", f"Erreur lecture cache string search: {e}", category="cache_manager")
+                # Ancien format pickle ou fichier corrompu : recalcul
+                log_message("DEBUG", f"Cache string search ignoré: {e}", category="cache_manager")
+        
+        if cached is None:
+            return None
+        
+        cached_fingerprint, results = cached
+        if fingerprint is not None and cached_fingerprint != fingerprint:
+            log_message("DEBUG", "Cache string search périmé (fichiers game/ modifiés)", category="cache_manager")
+            return None
         
-        return None
+        log_message("DEBUG", f"Cache string search chargé: {len(results)} recherches", category="cache_manager")
+        # Copie : l'appelant complète et vide son dictionnaire librement
+        return dict(results)
     
     def set_string_search_cache(self, project_path: str, cache_data: Dict[str, bool]):
         """Sauvegarde le cache de recherche de chaînes pour un projet"""
@@ -197,31 +306,153 @@ class PersistentCacheManager:
         cache_file = self._get_cache_file_path(project_key, 'string_search')
         
         try:
-            # Sauvegarder le cache
-            with open(cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
+            fingerprint = self._current_game_files_fingerprint(project_key)
+            results = dict(cache_data)
+            payload = {
+                'version': STRING_SEARCH_CACHE_VERSION,
+                'fingerprint': fingerprint,
+                'results': results
+            }
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                f.write(zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'), 1))
+            os.replace(temp_file, cache_file)
             
             # Mettre en cache mémoire
-            if project_key not in self._memory_cache:
-                self._memory_cache[project_key] = {}
-            self._memory_cache[project_key]['string_search'] = cache_data
+            self._get_memory_entry(project_key)['string_search'] = (fingerprint, results)
             
-            log_message("DEBUG", f"Cache string search sauvegardé: {len(cache_data)} recherches", category="cache_manager")
+            log_message("DEBUG", f"Cache string search sauvegardé: {len(results)} recherches", category="cache_manager")
             
         except Exception as e:
             log_message("ERREUR", f"Erreur sauvegarde cache string search: {e}", category="cache_manager")
     
+    def get_coherence_results_cache(self, project_path: str, fingerprint: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les résultats de cohérence mis en cache : {chemin: {'sha1', 'result'}}.
+        Vide si les options ou les exclusions ont changé (empreinte différente).
+        """
+        project_key = self._get_project_key(project_path)
+        cache_file = self._get_cache_file_path(project_key, 'coherence')
+        if not cache_file.exists():
+            return {}
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                payload = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+        except Exception as e:
+            log_message("DEBUG", f"Cache cohérence ignoré: {e}", category="cache_manager")
+            return {}
+        
+        if payload.get('version') != COHERENCE_RESULTS_CACHE_VERSION or payload.get('fingerprint') != fingerprint:
+            log_message("DEBUG", "Cache cohérence périmé (options ou exclusions modifiées)", category="cache_manager")
+            return {}
+        
+        entries = payload.get('files', {})
+        log_message("DEBUG", f"Cache cohérence chargé: {len(entries)} fichiers", category="cache_manager")
+        return entries
+    
+    def set_coherence_results_cache(self, project_path: str, fingerprint: str, entries: Dict[str, Dict[str, Any]]):
+        """Sauvegarde les résultats de cohérence par fichier (les fichiers disparus sont retirés)"""
+        project_key = self._get_project_key(project_path)
+        cache_file = self._get_cache_file_path(project_key, 'coherence')
+        
+        try:
+            files = {path: entry for path, entry in entries.items() if os.path.exists(path)}
+            payload = {
+                'version': COHERENCE_RESULTS_CACHE_VERSION,
+                'fingerprint': fingerprint,
+                'files': files
+            }
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                f.write(zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'), 1))
+            os.replace(temp_file, cache_file)
+            
+            log_message("DEBUG", f"Cache cohérence sauvegardé: {len(files)} fichiers", category="cache_manager")
+            
+        except Exception as e:
+            log_message("ERREUR", f"Erreur sauvegarde cache cohérence: {e}", category="cache_manager")
+    
+    def _get_language_cache_path(self, project_path: str, language: str, cache_type: str) -> Path:
+        """Fichier de cache propre à une langue d'un projet ({clé projet}_tl_{type}_{clé langue}.cache)"""
+        language_key = hashlib.md5(language.encode('utf-8')).hexdigest()[:8]
+        return self._get_cache_file_path(self._get_project_key(project_path), f"tl_{cache_type}_{language_key}")
+    
+    def _load_language_cache(self, project_path: str, language: str, cache_type: str, version: int) -> Dict[str, Dict[str, Any]]:
+        """Entrées par fichier d'un cache de langue ({} si absent, illisible ou d'une autre version)"""
+        cache_file = self._get_language_cache_path(project_path, language, cache_type)
+        if not cache_file.exists():
+            return {}
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                payload = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+        except Exception as e:
+            log_message("DEBUG", f"Cache {cache_type} ignoré: {e}", category="cache_manager")
+            return {}
+        
+        if payload.get('version') != version or payload.get('language') != language:
+            return {}
+        return payload.get('files', {})
+    
+    def _save_language_cache(self, project_path: str, language: str, cache_type: str, version: int,
+                             files: Dict[str, Dict[str, Any]]):
+        """Écrit un cache de langue (fichier temporaire puis renommage atomique)"""
+        cache_file = self._get_language_cache_path(project_path, language, cache_type)
+        payload = {
+            'version': version,
+            'language': language,
+            'files': files
+        }
+        temp_file = cache_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'), 1))
+        os.replace(temp_file, cache_file)
+    
+    def get_string_translation_index(self, project_path: str, language: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère l'index des traductions de chaînes d'une langue :
+        {chemin relatif: {'mtime_ns', 'size', 'entries': [[old, new, ligne], ...]}}.
+        Chaque fichier est revalidé par l'appelant (mtime/taille).
+        """
+        return self._load_language_cache(project_path, language, 'strings', STRING_TRANSLATION_INDEX_VERSION)
+    
+    def set_string_translation_index(self, project_path: str, language: str, files: Dict[str, Dict[str, Any]]):
+        """Sauvegarde l'index des traductions de chaînes d'une langue"""
+        try:
+            self._save_language_cache(project_path, language, 'strings', STRING_TRANSLATION_INDEX_VERSION, files)
+            log_message("DEBUG", f"Index des chaînes sauvegardé: {len(files)} fichiers ({language})", category="cache_manager")
+        except Exception as e:
+            log_message("ERREUR", f"Erreur sauvegarde index des chaînes: {e}", category="cache_manager")
+    
+    def get_translation_corpus(self, project_path: str, language: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère le corpus anti-doublons d'une langue :
+        {chemin relatif: {'mtime_ns', 'size', 'strings', 'old_texts'}}.
+        Chaque fichier est revalidé par l'appelant (mtime/taille).
+        """
+        return self._load_language_cache(project_path, language, 'corpus', TRANSLATION_CORPUS_VERSION)
+    
+    def set_translation_corpus(self, project_path: str, language: str, files: Dict[str, Dict[str, Any]]):
+        """Sauvegarde le corpus anti-doublons d'une langue"""
+        try:
+            self._save_language_cache(project_path, language, 'corpus', TRANSLATION_CORPUS_VERSION, files)
+            log_message("DEBUG", f"Corpus anti-doublons sauvegardé: {len(files)} fichiers ({language})", category="cache_manager")
+        except Exception as e:
+            log_message("ERREUR", f"Erreur sauvegarde corpus anti-doublons: {e}", category="cache_manager")
+    
     def clear_project_cache(self, project_path: str):
         """Efface le cache pour un projet spécifique"""
         project_key = self._get_project_key(project_path)
         
         try:
-            # Effacer le cache mémoire
+            # Effacer le cache mémoire (en libérant le pack mappé)
             if project_key in self._memory_cache:
+                self._close_game_files_view(project_key)
                 del self._memory_cache[project_key]
             
             # Effacer les fichiers de cache
-            for cache_type in ['game_files', 'string_search']:
+            for cache_type in ['game_files', 'string_search', 'coherence']:
                 cache_file = self._get_cache_file_path(project_key, cache_type)
                 if cache_file.exists():
                     cache_file.unlink()
@@ -230,6 +461,10 @@ class PersistentCacheManager:
                 if metadata_file.exists():
                     metadata_file.unlink()
             
+            # Caches par langue (index des chaînes, corpus anti-doublons)
+            for cache_file in self.cache_dir.glob(f"{project_key}_tl_*.cache"):
+                cache_file.unlink()
+            
             log_message("INFO", f"Cache effacé pour le projet: {os.path.basename(project_path)}", category="cache_manager")
             
         except Exception as e:
@@ -243,6 +478,8 @@ class PersistentCacheManager:
             
             for cache_file in self.cache_dir.glob("*.cache"):
                 if current_time - cache_file.stat().st_mtime > self.cache_ttl:
+                    project_key = cache_file.stem.split('_', 1)[0]
+                    self._close_game_files_view(project_key)
                     cache_file.unlink()
                     cleaned_count += 1
                     
@@ -0,0 +1,168 @@
+# core/models/cache/file_pack.py
+"""
+Format « pack » versionné pour mettre en cache le contenu de fichiers texte
+
+Structure du fichier :
+- En-tête binaire : signature, version du format, taille de la table
+- Table des entrées (JSON) : chemin, mtime, taille, sha1, position et longueur du bloc
+- Blocs de contenu compressés (zlib), lus à la demande via mmap
+
+Chaque entrée est validée et invalidée individuellement : un fichier modifié
+ne remet plus en cause tout le cache.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Mapping
+from typing import Dict, Iterable, Optional
+
+__all__ = ['PackedFilesView', 'compress_text', 'write_file_pack', 'open_file_pack']
+
+PACK_MAGIC = b'RXPK'
+PACK_VERSION = 1
+_HEADER = struct.Struct('<4sHI')  # signature, version, taille de la table JSON
+
+# Compression rapide : le cache doit rester plus rapide à écrire que les fichiers à relire
+_COMPRESSION_LEVEL = 1
+
+
+def compress_text(text: str) -> Dict[str, object]:
+    """Prépare une entrée : bloc compressé + empreinte du contenu"""
+    data = text.encode('utf-8', errors='surrogatepass')
+    return {
+        'sha1': hashlib.sha1(data).hexdigest(),
+        'blob': zlib.compress(data, _COMPRESSION_LEVEL)
+    }
+
+
+def write_file_pack(pack_path: str, records: Iterable[Dict[str, object]], metadata: Optional[Dict] = None) -> None:
+    """
+    Écrit un pack (fichier temporaire puis renommage atomique).
+
+    Args:
+        records: entrées {'path', 'mtime', 'size', 'sha1', 'blob'}
+        metadata: informations libres enregistrées dans l'en-tête
+    """
+    entries = []
+    blobs = []
+    offset = 0
+    for record in records:
+        blob = record['blob']
+        entries.append({
+            'path': record['path'],
+            'mtime': record['mtime'],
+            'size': record['size'],
+            'sha1': record['sha1'],
+            'offset': offset,
+            'length': len(blob)
+        })
+        blobs.append(blob)
+        offset += len(blob)
+
+    table = json.dumps({'metadata': metadata or {}, 'entries': entries}, ensure_ascii=False).encode('utf-8')
+    temp_path = f"{pack_path}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(table)))
+            f.write(table)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(temp_path, pack_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        raise
+
+
+def open_file_pack(pack_path: str) -> Optional['PackedFilesView']:
+    """Ouvre un pack ; None s'il est absent, d'un autre format (ancien pickle) ou d'une autre version"""
+    try:
+        with open(pack_path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            magic, version, table_size = _HEADER.unpack(header)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                return None
+            table = json.loads(f.read(table_size).decode('utf-8'))
+    except (OSError, ValueError, struct.error):
+        return None
+    return PackedFilesView(pack_path, table.get('entries', []), table.get('metadata', {}), _HEADER.size + table_size)
+
+
+class PackedFilesView(Mapping):
+    """
+    Vue lecture seule chemin -> contenu d'un pack.
+    Le contenu n'est décompressé qu'au premier accès à chaque fichier, puis conservé.
+    """
+
+    def __init__(self, pack_path: str, entries: Iterable[Dict], metadata: Dict, data_offset: int):
+        self.pack_path = pack_path
+        self.metadata = metadata
+        self.entries: Dict[str, Dict] = {entry['path']: entry for entry in entries}
+        self._data_offset = data_offset
+        self._file = None
+        self._mmap = None
+        self._decoded: Dict[str, str] = {}
+
+    # --- Mapping ---
+    def __getitem__(self, path: str) -> str:
+        text = self._decoded.get(path)
+        if text is None:
+            if path not in self.entries:
+                raise KeyError(path)
+            text = zlib.decompress(self.read_blob(path)).decode('utf-8', errors='surrogatepass')
+            self._decoded[path] = text
+        return text
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, path) -> bool:
+        return path in self.entries
+
+    # --- accès bas niveau ---
+    def read_blob(self, path: str) -> bytes:
+        """Bloc compressé d'une entrée (copie, utilisable après close())"""
+        entry = self.entries[path]
+        if self._mmap is None:
+            self._file = open(self.pack_path, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = self._data_offset + entry['offset']
+        return self._mmap[start:start + entry['length']]
+
+    def preload(self, contents: Dict[str, str]) -> None:
+        """Renseigne des contenus déjà en mémoire (évite de les décompresser)"""
+        for path, text in contents.items():
+            if path in self.entries:
+                self._decoded[path] = text
+
+    @property
+    def fingerprint(self) -> str:
+        """Empreinte de l'ensemble des contenus (indépendante des mtime)"""
+        digest = hashlib.sha1()
+        for path in sorted(self.entries):
+            digest.update(path.encode('utf-8', errors='surrogatepass'))
+            digest.update(b'\0')
+            digest.update(self.entries[path]['sha1'].encode('ascii'))
+            digest.update(b'\n')
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        """Libère le mapping (nécessaire sous Windows avant de remplacer ou supprimer le pack)"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,223 @@
+# core/services/extraction/block_manifest.py
+# Block Manifest Module
+# Created for RenExtract
+
+"""
+Manifeste des empreintes par bloc de traduction.
+
+Un fichier tl est découpé en blocs : un bloc par « translate <langue> <id>: »
+et, dans les blocs « translate <langue> strings: », un bloc par couple old/new.
+Après une reconstruction, l'empreinte de chaque bloc du fichier enregistré est
+persistée à côté des fichiers d'extraction. Une ré-extraction incrémentale ne
+traite ensuite que les blocs nouveaux ou modifiés : les blocs inchangés sont
+déjà traduits dans le fichier et restent tels quels.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+
+from infrastructure.config.constants import FOLDERS
+from infrastructure.helpers.unified_functions import extract_game_name
+from infrastructure.logging.logging import log_message
+
+__all__ = [
+    'split_translate_blocks',
+    'compute_block_hashes',
+    'BlockHashBuilder',
+    'get_block_manifest_path',
+    'load_block_manifest',
+    'save_block_manifest',
+    'find_changed_line_indices'
+]
+
+MANIFEST_VERSION = 1
+
+_TRANSLATE_HEADER_RE = re.compile(r'^translate\s+(\S+)\s+([^\s:]+)\s*:')
+_OLD_LINE_RE = re.compile(r'^old\s+')
+
+
+class _BlockSplitter:
+    """Découpage incrémental : reçoit les lignes une à une et signale les blocs fermés"""
+
+    def __init__(self):
+        self.current_key = '__preamble__'
+        self.current_start = 0
+        self.in_strings = False
+        self.occurrences = {}
+
+    def _close(self, end):
+        if end <= self.current_start:
+            return None
+        count = self.occurrences.get(self.current_key, 0) + 1
+        self.occurrences[self.current_key] = count
+        key = self.current_key if count == 1 else f"{self.current_key}#{count}"
+        return (key, self.current_start, end)
+
+    def feed(self, idx, line):
+        """Traite la ligne idx ; retourne le bloc (clé, début, fin) fermé par cette ligne, sinon None"""
+        stripped = line.strip()
+        header = _TRANSLATE_HEADER_RE.match(stripped)
+        if header:
+            closed = self._close(idx)
+            language, identifier = header.group(1), header.group(2)
+            self.in_strings = identifier == 'strings'
+            self.current_key = f"{language}:{identifier}"
+            self.current_start = idx
+            return closed
+        if self.in_strings and _OLD_LINE_RE.match(stripped):
+            closed = self._close(idx)
+            self.current_key = f"strings:{stripped[4:].strip()}"
+            self.current_start = idx
+            return closed
+        return None
+
+    def finish(self, total):
+        return self._close(total)
+
+
+def split_translate_blocks(lines):
+    """
+    Découpe les lignes d'un fichier tl en blocs.
+
+    Returns:
+        list: [(clé_du_bloc, index_début, index_fin_exclu), ...] couvrant toutes les lignes
+    """
+    splitter = _BlockSplitter()
+    blocks = []
+    for idx, line in enumerate(lines):
+        closed = splitter.feed(idx, line)
+        if closed:
+            blocks.append(closed)
+    closed = splitter.finish(len(lines))
+    if closed:
+        blocks.append(closed)
+    return blocks
+
+
+def _update_block_digest(digest, line):
+    stripped = line.rstrip()
+    # Commentaires ignorés : numéros de ligne source, texte VO, marqueur de reconstruction
+    if not stripped or stripped.lstrip().startswith('#'):
+        return
+    digest.update(stripped.encode('utf-8', errors='surrogatepass'))
+    digest.update(b'\n')
+
+
+def _hash_block(lines):
+    digest = hashlib.sha1()
+    for line in lines:
+        _update_block_digest(digest, line)
+    return digest.hexdigest()
+
+
+def compute_block_hashes(lines):
+    """Empreintes des blocs : OrderedDict clé -> sha1 (lignes vides et commentaires ignorés)"""
+    hashes = OrderedDict()
+    for key, start, end in split_translate_blocks(lines):
+        hashes[key] = _hash_block(lines[start:end])
+    return hashes
+
+
+class BlockHashBuilder:
+    """
+    Calcule les empreintes de blocs au fil de l'écriture, sans garder le fichier en mémoire.
+    Résultat identique à compute_block_hashes() sur les mêmes lignes.
+    """
+
+    def __init__(self):
+        self._splitter = _BlockSplitter()
+        self._digest = hashlib.sha1()
+        self._count = 0
+        self.hashes = OrderedDict()
+
+    def add_line(self, line):
+        closed = self._splitter.feed(self._count, line)
+        if closed:
+            self.hashes[closed[0]] = self._digest.hexdigest()
+        if closed or self._splitter.current_start == self._count:
+            # La ligne courante ouvre un nouveau bloc
+            self._digest = hashlib.sha1()
+        _update_block_digest(self._digest, line)
+        self._count += 1
+
+    def finish(self):
+        closed = self._splitter.finish(self._count)
+        if closed:
+            self.hashes[closed[0]] = self._digest.hexdigest()
+        return self.hashes
+
+
+def get_block_manifest_path(original_path):
+    """Chemin du manifeste, à côté des fichiers de référence de l'extraction"""
+    from core.services.extraction.extraction import get_file_base_name
+
+    file_base = get_file_base_name(original_path)
+    game_name = extract_game_name(original_path)
+    reference_folder = os.path.join(FOLDERS["temporaires"], game_name, file_base, "fichiers_a_ne_pas_traduire")
+    return os.path.join(reference_folder, f'{file_base}_block_manifest.json')
+
+
+def load_block_manifest(original_path):
+    """Charge le manifeste (None s'il est absent, illisible ou d'une autre version)"""
+    manifest_path = get_block_manifest_path(original_path)
+    if not os.path.exists(manifest_path):
+        return None
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != MANIFEST_VERSION:
+            log_message("DEBUG", f"Manifeste de blocs ignoré (version {manifest.get('version')})", category="extraction")
+            return None
+        return manifest
+    except Exception as e:
+        log_message("ATTENTION", f"Manifeste de blocs illisible {manifest_path}: {e}", category="extraction")
+        return None
+
+
+def save_block_manifest(original_path, lines=None, block_hashes=None):
+    """
+    Enregistre les empreintes des blocs (contenu tel qu'écrit sur disque).
+    Accepte soit les lignes, soit des empreintes déjà calculées (BlockHashBuilder).
+    """
+    manifest_path = get_block_manifest_path(original_path)
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        if block_hashes is None:
+            block_hashes = compute_block_hashes(lines)
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'source_file': original_path,
+            'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'blocks': block_hashes
+        }
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        log_message("DEBUG", f"Manifeste de blocs sauvegardé: {len(block_hashes)} blocs -> {manifest_path}", category="persistence")
+        return manifest_path
+    except Exception as e:
+        log_message("ATTENTION", f"Impossible de sauvegarder le manifeste de blocs: {e}", category="persistence")
+        return None
+
+
+def find_changed_line_indices(lines, manifest):
+    """
+    Compare les blocs de lines au manifeste.
+
+    Returns:
+        tuple: (indices des lignes des blocs nouveaux/modifiés, nb blocs inchangés, nb blocs à extraire)
+    """
+    known = (manifest or {}).get('blocks', {})
+    active_indices = []
+    unchanged_count = 0
+    changed_count = 0
+    for key, start, end in split_translate_blocks(lines):
+        if known.get(key) == _hash_block(lines[start:end]):
+            unchanged_count += 1
+            continue
+        changed_count += 1
+        active_indices.extend(range(start, end))
+    return active_indices, unchanged_count, changed_count
@@ -13,7 +13,14 @@ import json
 from collections import OrderedDict
 from infrastructure.config.constants import SPECIAL_CODES, FOLDERS
 from infrastructure.logging.logging import log_message
+from infrastructure.logging.tracing import trace_run, trace_span, worker_span
+from infrastructure.helpers.process_pool import attach_worker_records, iter_process_map
 from infrastructure.helpers.unified_functions import extract_game_name
+from core.services.extraction.line_lexer import tokenize_line, leading_literal
+from core.services.extraction.block_manifest import load_block_manifest, find_changed_line_indices
+
+# Codes spéciaux précompilés avec leur premier caractère obligatoire (pré-filtre par ligne)
+_SPECIAL_CODE_PATTERNS = [(re.compile(pattern), leading_literal(pattern)) for pattern in SPECIAL_CODES]
 
 def validate_file_safely(filepath, max_size_mb=50):
     """
@@ -71,11 +78,18 @@ class TextExtractor:
     """
     Classe principale pour l'extraction, implémentant la logique complète et l'ordre de protection.
     """
-    def __init__(self):
-        """Initialise l'extracteur avec préfixes personnalisés"""
+    def __init__(self, settings=None):
+        """
+        Initialise l'extracteur avec préfixes personnalisés.
+        
+        Args:
+            settings: Instantané optionnel des paramètres (voir build_extraction_settings).
+                      Fourni en mode lot pour éviter de relire la configuration à chaque fichier.
+        """
         self.file_content = []
         self.original_path = None
         self.extraction_time = 0
+        self.settings = settings
         
         # Charger les préfixes personnalisés
         self._load_placeholder_prefixes()
@@ -92,6 +106,15 @@ class TextExtractor:
 
     def _load_placeholder_prefixes(self):
         """Charge les patterns courts et initialise les générateurs"""
+        if self.settings:
+            # Patterns déjà validés par build_extraction_settings : pas de relecture de la config
+            from core.services.extraction.placeholder_generator import SimplePlaceholderGenerator
+            self.code_generator = SimplePlaceholderGenerator(self.settings['code_prefix'])
+            self.asterisk_generator = SimplePlaceholderGenerator(self.settings['asterisk_prefix'])
+            self.tilde_generator = SimplePlaceholderGenerator(self.settings['tilde_prefix'])
+            self.empty_prefix = "RENPY_EMPTY"
+            return
+
         try:
             from infrastructure.config.config import config_manager
             from core.services.extraction.placeholder_generator import SimplePlaceholderGenerator
@@ -128,16 +151,22 @@ class TextExtractor:
 
     def _load_extraction_settings(self):
         """Charge SEULEMENT le paramètre doublons (le reste est obligatoire)"""
+        if self.settings:
+            self.detect_duplicates = bool(self.settings.get('detect_duplicates', True))
+            self.incremental = bool(self.settings.get('incremental', False))
+            return
+
         try:
             from infrastructure.config.config import config_manager
             
             # Seul paramètre configurable
             self.detect_duplicates = config_manager.get('extraction_detect_duplicates', True)
-            
+            self.incremental = bool(config_manager.get('extraction_incremental', False))
             
         except Exception as e:
             log_message("ATTENTION", f"Erreur chargement paramètre doublons, utilisation valeur par défaut: {e}", category="extraction_options")
             self.detect_duplicates = True
+            self.incremental = False
 
     def load_file_content(self, file_content, original_path):
         if not file_content or not isinstance(file_content, list):
@@ -177,6 +206,7 @@ class TextExtractor:
         self.empty_count = 0
         self.asterix_metadata = {}
         self.tilde_metadata = {}  # NOUVEAU
+        self.incremental_stats = None
 
     def _extract_tags_as_prefixes_suffixes(self):
         """
@@ -331,110 +361,14 @@ class TextExtractor:
         Extrait les segments entre guillemets simples/doubles en respectant les échappements.
         Exemple: \" ou \\" ne ferment pas un dialogue.
         """
-        segments = []
-        i = 0
-        line_len = len(line)
-
-        while i < line_len:
-            if line[i] not in ('"', "'"):
-                i += 1
-                continue
-
-            quote_char = line[i]
-            start_quote_idx = i
-            i += 1
-            content_chars = []
-
-            while i < line_len:
-                ch = line[i]
-
-                # Conserver la sequence echappee (ex: \", \\) comme texte.
-                if ch == '\\' and i + 1 < line_len:
-                    content_chars.append(line[i:i + 2])
-                    i += 2
-                    continue
-
-                if ch == quote_char:
-                    segments.append({
-                        'content': ''.join(content_chars),
-                        'quote_char': quote_char,
-                        'start_quote_idx': start_quote_idx,
-                        'end_quote_idx': i
-                    })
-                    i += 1
-                    break
-
-                content_chars.append(ch)
-                i += 1
-            else:
-                # Guillemet ouvrant sans fermeture: on arrete proprement.
-                break
-
-        return segments
+        return tokenize_line(line).quoted_segments()
 
     def _extract_asterisk_groups_with_stack(self, line):
         """
         Extrait les groupes d'astérisques en utilisant une logique de pile.
-        Similaire à _extract_bracketed_tags mais pour les astérisques.
+        Dérivé du flux de tokens de la ligne (voir line_lexer).
         """
-        groups = []
-        i = 0
-        
-        while i < len(line):
-            if line[i] == '*':
-                # Début d'un groupe potentiel
-                asterisk_count = 1
-                start_pos = i
-                
-                # Avancer tant qu'on trouve des astérisques consécutifs
-                j = i + 1
-                while j < len(line) and line[j] == '*':
-                    asterisk_count += 1
-                    j += 1
-                
-                # Maintenant chercher la fermeture avec le même nombre d'astérisques
-                content_start = j
-                stack_level = asterisk_count
-                current_pos = j
-                
-                while current_pos < len(line) and stack_level > 0:
-                    if line[current_pos] == '*':
-                        # Compter les astérisques consécutifs
-                        consecutive_asterisks = 0
-                        temp_pos = current_pos
-                        while temp_pos < len(line) and line[temp_pos] == '*':
-                            consecutive_asterisks += 1
-                            temp_pos += 1
-                        
-                        # Si on a le même nombre d'astérisques, c'est une fermeture
-                        if consecutive_asterisks >= asterisk_count:
-                            # Extraire le contenu
-                            content = line[content_start:current_pos]
-                            full_group = line[start_pos:current_pos + asterisk_count]
-                            
-                            groups.append({
-                                'full_text': full_group,
-                                'content': content,
-                                'asterisk_count': asterisk_count,
-                                'start_pos': start_pos,
-                                'end_pos': current_pos + asterisk_count
-                            })
-                            
-                            # Continuer après ce groupe
-                            i = current_pos + asterisk_count - 1
-                            break
-                        else:
-                            # Pas assez d'astérisques, continuer
-                            current_pos = temp_pos
-                    else:
-                        current_pos += 1
-                else:
-                    # Pas de fermeture trouvée, ignorer ce groupe
-                    pass
-            
-            i += 1
-        
-        return groups
+        return tokenize_line(line).asterisk_groups()
 
     def _build_asterix_mapping_with_stack(self):
         """Protection des astérisques avec pattern court"""
@@ -573,102 +507,30 @@ class TextExtractor:
         Extrait les groupes de tildes en utilisant une logique de pile.
         Similaire à _extract_asterisk_groups_with_stack mais pour les tildes.
         """
-        groups = []
-        i = 0
-        
-        while i < len(line):
-            if line[i] == '~':
-                # Début d'un groupe potentiel
-                tilde_count = 1
-                start_pos = i
-                
-                # Avancer tant qu'on trouve des tildes consécutifs
-                j = i + 1
-                while j < len(line) and line[j] == '~':
-                    tilde_count += 1
-                    j += 1
-                
-                # Maintenant chercher la fermeture avec le même nombre de tildes
-                content_start = j
-                stack_level = tilde_count
-                current_pos = j
-                
-                while current_pos < len(line) and stack_level > 0:
-                    if line[current_pos] == '~':
-                        # Compter les tildes consécutifs
-                        consecutive_tildes = 0
-                        temp_pos = current_pos
-                        while temp_pos < len(line) and line[temp_pos] == '~':
-                            consecutive_tildes += 1
-                            temp_pos += 1
-                        
-                        # Si on a le même nombre de tildes, c'est une fermeture
-                        if consecutive_tildes >= tilde_count:
-                            # Extraire le contenu
-                            content = line[content_start:current_pos]
-                            full_group = line[start_pos:current_pos + tilde_count]
-                            
-                            groups.append({
-                                'full_text': full_group,
-                                'content': content,
-                                'tilde_count': tilde_count,
-                                'start_pos': start_pos,
-                                'end_pos': current_pos + tilde_count
-                            })
-                            
-                            # Continuer après ce groupe
-                            i = current_pos + tilde_count - 1
-                            break
-                        else:
-                            # Pas assez de tildes, continuer
-                            current_pos = temp_pos
-                    else:
-                        current_pos += 1
-                else:
-                    # Pas de fermeture trouvée, ignorer ce groupe
-                    pass
-            
-            i += 1
-        
-        return groups
+        return tokenize_line(line).tilde_groups()
 
     def _extract_orphan_tildes(self, line):
         """
         Extrait les séquences de tildes orphelins (2+ tildes consécutifs non structurés)
         """
-        orphans = []
-        i = 0
-        
-        while i < len(line):
-            if line[i] == '~':
-                # Compter les tildes consécutifs
-                tilde_count = 0
-                start_pos = i
-                
-                while i < len(line) and line[i] == '~':
-                    tilde_count += 1
-                    i += 1
-                
-                # Garder seulement les séquences de 2+ tildes
-                # (les simples ~ sont probablement des erreurs typo)
-                if tilde_count >= 2:
-                    tilde_text = '~' * tilde_count
-                    orphans.append({
-                        'text': tilde_text,
-                        'count': tilde_count,
-                        'start_pos': start_pos,
-                        'end_pos': i
-                    })
-            else:
-                i += 1
-        
-        return orphans
+        return tokenize_line(line).orphan_tildes()
 
-    def extract_texts(self):
+    def extract_texts(self, incremental=None):
         """
         Exécute le processus d'extraction complet avec protections obligatoires + doublons configurables.
         VERSION MISE À JOUR avec système de tildes.
+        
+        Args:
+            incremental: Ne traiter que les blocs nouveaux/modifiés depuis la dernière reconstruction
+                         (None = paramètre 'extraction_incremental')
         """
+        with trace_run("extraction", file=os.path.basename(self.original_path or '')) as span:
+            result = self._extract_texts(incremental)
+            span.set(lines=len(self.file_content), extracted=self.extracted_count, duplicates=result.get('duplicate_count', 0))
+            return result
+
+    def _extract_texts(self, incremental):
+        """Étapes de l'extraction (voir extract_texts)"""
         start_time = time.time()
         log_message("INFO", f"📤 Début de l'extraction", category="extraction")
         
@@ -677,30 +539,50 @@ class TextExtractor:
         
         log_message("INFO", f"  - Détection doublons: {'✅ ACTIVÉE' if self.detect_duplicates else '❌ DÉSACTIVÉE'}", category="extraction")
         
+        # MODE INCRÉMENTAL : les étapes ne voient que les lignes des blocs nouveaux/modifiés
+        full_content = None
+        active_indices = None
+        use_incremental = self.incremental if incremental is None else incremental
+        if use_incremental:
+            with trace_span("extraction.incremental_selection"):
+                active_indices = self._select_incremental_lines()
+            if active_indices is not None:
+                full_content = self.file_content
+                self.file_content = [full_content[i] for i in active_indices]
+                self._seed_code_mapping_from_previous_extraction()
+        
         # ÉTAPE 1: Protection des codes/variables 
-        self._build_code_mapping()
+        with trace_span("extraction.code_mapping"):
+            self._build_code_mapping()
         
         # ÉTAPE 2: Protection des textes vides 
-        self._apply_empty_text_protection()
+        with trace_span("extraction.empty_protection"):
+            self._apply_empty_text_protection()
         
         # ÉTAPE 3: Protection des astérisques avec pile 
-        self._build_asterix_mapping_with_stack()
+        with trace_span("extraction.asterix_mapping"):
+            self._build_asterix_mapping_with_stack()
         
         # Étape 3bis: Protection des tildes en 2 passes
-        self._build_tilde_mapping_two_pass()
+        with trace_span("extraction.tilde_mapping"):
+            self._build_tilde_mapping_two_pass()
         
         # ÉTAPE 4: Extraction avec doublons (CONFIGURABLE)
-        if self.detect_duplicates:
-            log_message("DEBUG", "Étape Final: Extraction des dialogues", category="dialogue_extraction")
-            self._extract_dialogue_and_handle_duplicates()
-        else:
-            log_message("DEBUG", "Étape Final: Extraction des dialogues", category="dialogue_extraction")
-            self._extract_dialogue_simple()
+        with trace_span("extraction.dialogues", duplicates=self.detect_duplicates):
+            if self.detect_duplicates:
+                log_message("DEBUG", "Étape Final: Extraction des dialogues", category="dialogue_extraction")
+                self._extract_dialogue_and_handle_duplicates()
+            else:
+                log_message("DEBUG", "Étape Final: Extraction des dialogues", category="dialogue_extraction")
+                self._extract_dialogue_simple()
         
+        if full_content is not None:
+            self._merge_incremental_lines(full_content, active_indices)
         
         # ÉTAPE 5: Sauvegarde
         self.extraction_time = time.time() - start_time
-        result = self._save_extraction_files()
+        with trace_span("extraction.save_files"):
+            result = self._save_extraction_files()
         
         # Mise à jour des compteurs
         self.extracted_count = len(self.extracted_texts)
@@ -713,6 +595,7 @@ class TextExtractor:
         result['tilde_count'] = self.tilde_count  # NOUVEAU
         result['empty_count'] = self.empty_count
         result['duplicate_count'] = len(self.duplicate_manager.duplicate_texts_for_translation)
+        result['incremental'] = self.incremental_stats
 
         # STATISTIQUES FINALES
         doublons_count = len(self.duplicate_manager.duplicate_texts_for_translation) if self.detect_duplicates else 0
@@ -720,6 +603,85 @@ class TextExtractor:
         
         return result
 
+    def _select_incremental_lines(self):
+        """
+        Compare les blocs du fichier au manifeste de la dernière reconstruction.
+        Retourne les indices des lignes à extraire, ou None pour une extraction complète.
+        """
+        if not self.original_path or not os.path.exists(self.original_path):
+            return None
+
+        manifest = load_block_manifest(self.original_path)
+        if not manifest:
+            log_message("INFO", "  - Mode incrémental: aucun manifeste de blocs, extraction complète", category="extraction")
+            return None
+
+        active_indices, unchanged_count, changed_count = find_changed_line_indices(self.file_content, manifest)
+        if unchanged_count == 0:
+            log_message("INFO", "  - Mode incrémental: aucun bloc inchangé, extraction complète", category="extraction")
+            return None
+
+        self.incremental_stats = {
+            'unchanged_blocks': unchanged_count,
+            'extracted_blocks': changed_count,
+            'extracted_lines': len(active_indices)
+        }
+        log_message("INFO", f"  - Mode incrémental: {changed_count} bloc(s) nouveaux/modifiés, {unchanged_count} inchangé(s) conservé(s)", category="extraction")
+        return active_indices
+
+    def _seed_code_mapping_from_previous_extraction(self):
+        """
+        Réutilise la numérotation des placeholders de code de l'extraction précédente :
+        une balise déjà connue garde son placeholder, les nouvelles prennent la suite.
+        """
+        try:
+            import copy
+
+            file_base = get_file_base_name(self.original_path)
+            game_name = extract_game_name(self.original_path)
+            mapping_file = os.path.join(FOLDERS["temporaires"], game_name, file_base,
+                                        "fichiers_a_ne_pas_traduire", f'{file_base}_invisible_mapping.txt')
+            if not os.path.exists(mapping_file):
+                return
+
+            previous = OrderedDict()
+            with open(mapping_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # Les codes sont écrits en premier, avant les sections astérisques/tildes
+                    if line.startswith('# ==='):
+                        break
+                    if " => " not in line:
+                        continue
+                    ph, tag = line.rstrip('\r\n').split(" => ", 1)
+                    # Les vides sont écrits inversés (texte => placeholder)
+                    if ph.startswith(self.empty_prefix) or tag.startswith(self.empty_prefix):
+                        continue
+                    previous[tag] = ph
+
+            # Vérifier que les placeholders suivent le pattern actuel (sinon le pattern a changé)
+            probe = copy.copy(self.code_generator)
+            if any(probe.next_placeholder() != ph for ph in previous.values()):
+                log_message("INFO", "  - Mode incrémental: pattern de code modifié, nouvelle numérotation", category="extraction")
+                return
+
+            self.code_generator = probe
+            self.mapping.update(previous)
+            log_message("DEBUG", f"Numérotation reprise: {len(previous)} placeholders de code existants", category="code_protection")
+        except Exception as e:
+            log_message("ATTENTION", f"Impossible de reprendre la numérotation des placeholders: {e}", category="extraction")
+
+    def _merge_incremental_lines(self, full_content, active_indices):
+        """Réinjecte les lignes traitées dans le fichier complet et réindexe les positions"""
+        merged = full_content[:]
+        for local_idx, file_idx in enumerate(active_indices):
+            merged[file_idx] = self.file_content[local_idx]
+        self.file_content = merged
+
+        self.line_to_content_indices = {active_indices[k]: v for k, v in self.line_to_content_indices.items()}
+        self.original_lines_with_translations = OrderedDict(
+            (active_indices[k], v) for k, v in self.original_lines_with_translations.items()
+        )
+
     def _should_process_line(self, stripped_line):
         """
         Détermine si une ligne doit être traitée pour les protections.
@@ -804,7 +766,7 @@ class TextExtractor:
                     continue
                     
                 # Balises crochétées
-                for tag in re.findall(r'\[[^\]]+\]', line):
+                for tag in tokenize_line(line).delimited('[', ']'):
                     all_tags.add(tag)
             
             sorted_tags = sorted(all_tags, key=len, reverse=True)
@@ -821,25 +783,28 @@ class TextExtractor:
                 if not self._should_process_line(stripped):
                     continue
                     
-                temp_line = line
+                tokens = tokenize_line(line)
 
                 # Balises HTML
-                for tag in re.findall(r'<[^>]+>', line):
+                for tag in tokens.delimited('<', '>'):
                     if tag not in self.mapping:
                         placeholder = self.code_generator.next_placeholder()
                         self.mapping[tag] = placeholder
                         log_message("DEBUG", f"Étape 1 - Balise HTML protégée: '{tag}' -> {placeholder}", category="code_protection")
                         
                 # Balises accolades
-                for tag in re.findall(r'\{[^}]+\}', line):
+                for tag in tokens.delimited('{', '}'):
                     if tag not in self.mapping:
                         placeholder = self.code_generator.next_placeholder()
                         self.mapping[tag] = placeholder
                         log_message("DEBUG", f"Étape 1 - Balise accolade protégée: '{tag}' -> {placeholder}", category="code_protection")
                         
                 # Codes spéciaux - VERSION CORRIGÉE
-                for pattern in SPECIAL_CODES:
-                    for match in re.finditer(pattern, line):
+                for pattern, literal in _SPECIAL_CODE_PATTERNS:
+                    # Premier caractère absent de la ligne : aucune correspondance possible
+                    if literal and literal not in line:
+                        continue
+                    for match in pattern.finditer(line):
                         code = match.group(0)
                         
                         # CORRECTION: Ne pas inclure la guillemet dans la protection
@@ -857,8 +822,8 @@ class TextExtractor:
                                 log_message("DEBUG", f"Étape 1 - Code spécial protégé: '{code}' -> {placeholder}", category="code_protection")
                                 
                 # Guillemets échappés
-                for match in re.finditer(r'\\"', line):
-                    code = match.group(0)
+                if '\\"' in line:
+                    code = '\\"'
                     if code not in self.mapping:
                         placeholder = self.code_generator.next_placeholder()
                         self.mapping[code] = placeholder
@@ -866,14 +831,27 @@ class TextExtractor:
 
             # Phase 3: Appliquer les remplacements
             sorted_map_items = sorted(self.mapping.items(), key=lambda item: len(item[0]), reverse=True)
+            key_first_chars = {original[0] for original in self.mapping if original}
             for i, line in enumerate(self.file_content):
                 stripped = line.strip()
                 if not self._should_process_line(stripped):
                     continue
                     
+                # Une clé ne peut apparaître que si son premier caractère est présent :
+                # les lignes sans aucun de ces caractères sont laissées telles quelles
+                present_chars = set(line)
+                if present_chars.isdisjoint(key_first_chars):
+                    continue
+
                 temp_line = line
                 for original, placeholder in sorted_map_items:
-                    temp_line = temp_line.replace(original, placeholder)
+                    if original[:1] not in present_chars:
+                        continue
+                    replaced = temp_line.replace(original, placeholder)
+                    if replaced != temp_line:
+                        # Le placeholder inséré peut introduire de nouveaux caractères
+                        present_chars.update(placeholder)
+                        temp_line = replaced
                 self.file_content[i] = temp_line
                 
             pattern_info = self.code_generator.get_pattern_info()
@@ -886,21 +864,7 @@ class TextExtractor:
         """
         Extrait les variables crochetées en utilisant une logique de pile.
         """
-        tags = []
-        i = 0
-        while i < len(line):
-            if line[i] == '[':
-                bracket_count = 1
-                for j in range(i + 1, len(line)):
-                    if line[j] == '[': bracket_count += 1
-                    elif line[j] == ']': bracket_count -= 1
-                    
-                    if bracket_count == 0:
-                        tags.append(line[i : j + 1])
-                        i = j 
-                        break
-            i += 1
-        return tags
+        return tokenize_line(line).bracketed_tags()
 
     def _apply_empty_text_protection(self):
         """Protection des textes vides (garde le système classique car invisible)"""
@@ -1250,7 +1214,10 @@ class TextExtractor:
             'asterix_count': asterix_count,
             'tilde_count': tilde_count,
             'empty_count': empty_count,
-            'duplicate_count': duplicate_count
+            'duplicate_count': duplicate_count,
+            
+            # Extraction incrémentale (None = extraction complète)
+            'incremental': self.incremental_stats
         }
         
         positions_file = os.path.join(reference_folder, f'{file_base}_positions.json')
@@ -1327,8 +1294,11 @@ class TextExtractor:
         try:
             from infrastructure.config.config import config_manager
             
-            # Récupérer la limite configurée
-            line_limit = config_manager.get('extraction_line_limit')
+            # Récupérer la limite configurée (ou celle de l'instantané en mode lot)
+            if self.settings:
+                line_limit = self.settings.get('line_limit')
+            else:
+                line_limit = config_manager.get('extraction_line_limit')
             
             # Si pas de limite ou limite très élevée, sauvegarder en un seul fichier
             if not line_limit or line_limit <= 0 or len(texts) <= line_limit:
@@ -1383,7 +1353,206 @@ class TextExtractor:
                     f.write(line)
             return [single_file]
 
-def extraire_textes_organised(file_content, original_path):
-    extractor = TextExtractor
+def extraire_textes_organised(file_content, original_path, settings=None):
+    extractor = TextExtractor(settings=settings)
     extractor.load_file_content(file_content, original_path)
     return extractor.extract_texts()
+
+
+# ==================== EXTRACTION PAR LOT (MULTI-PROCESSUS) ====================
+
+def build_extraction_settings():
+    """
+    Construit un instantané validé et sérialisable des paramètres d'extraction.
+    Calculé une seule fois puis transmis tel quel à chaque worker.
+    """
+    try:
+        from infrastructure.config.config import config_manager
+
+        is_valid, errors = config_manager.validate_protection_prefixes()
+        if not is_valid:
+            log_message("ATTENTION", f"Patterns invalides détectés, utilisation des valeurs par défaut. Erreurs: {errors}", category="extraction")
+            config_manager.reset_protection_placeholders()
+
+        line_limit = config_manager.get('extraction_line_limit')
+        return {
+            'code_prefix': config_manager.get_protection_placeholder("code_prefix"),
+            'asterisk_prefix': config_manager.get_protection_placeholder("asterisk_prefix"),
+            'tilde_prefix': config_manager.get_protection_placeholder("tilde_prefix"),
+            'detect_duplicates': bool(config_manager.get('extraction_detect_duplicates', True)),
+            'incremental': bool(config_manager.get('extraction_incremental', False)),
+            'line_limit': int(line_limit) if line_limit else None
+        }
+    except Exception as e:
+        log_message("ERREUR", f"Erreur construction paramètres d'extraction, utilisation valeurs par défaut: {e}", category="extraction")
+        return {
+            'code_prefix': "(01)",
+            'asterisk_prefix': "(B1)",
+            'tilde_prefix': "(C1)",
+            'detect_duplicates': True,
+            'incremental': False,
+            'line_limit': None
+        }
+
+
+def find_files_for_batch_extraction(tl_folder, excluded_files=None):
+    """
+    Liste triée des fichiers .rpy d'un dossier game/tl/<langue> à extraire.
+    Les fichiers *_characters.rpy générés par l'extraction elle-même sont ignorés.
+    """
+    excluded = set()
+    if excluded_files:
+        if isinstance(excluded_files, str):
+            excluded_files = excluded_files.split(',')
+        excluded = {name.strip().lower() for name in excluded_files if name.strip()}
+
+    rpy_files = []
+    for root, dirs, files in os.walk(tl_folder):
+        dirs.sort()
+        for file in sorted(files):
+            lower = file.lower()
+            if not lower.endswith('.rpy') or lower.endswith('_characters.rpy'):
+                continue
+            if lower in excluded:
+                continue
+            rpy_files.append(os.path.join(root, file))
+    return rpy_files
+
+
+def _read_rpy_lines(filepath):
+    """Lit un fichier .rpy (UTF-8 puis repli latin-1, comme FileManager)"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.readlines()
+    except UnicodeDecodeError:
+        with open(filepath, 'r', encoding='latin-1') as f:
+            return f.readlines()
+
+
+def _extract_file_worker(task):
+    """Worker (processus séparé) : extrait un fichier avec l'instantané de paramètres"""
+    filepath, settings = task
+    start_time = time.time()
+    try:
+        with worker_span("extraction.file", file=os.path.basename(filepath)):
+            extractor = TextExtractor(settings=settings)
+            extractor.load_file_content(_read_rpy_lines(filepath), filepath)
+            result = extractor.extract_texts()
+        file_result = {
+            'file': filepath,
+            'success': True,
+            'result': result,
+            'extraction_time': time.time() - start_time
+        }
+    except Exception as e:
+        file_result = {
+            'file': filepath,
+            'success': False,
+            'error': str(e),
+            'extraction_time': time.time() - start_time
+        }
+    # Spans et messages de log du processus worker, rapatriés avec le résultat
+    return attach_worker_records(file_result)
+
+
+def iter_extract_texts_batch(files, settings=None, max_workers=None):
+    """
+    Extrait une liste de fichiers sur un pool de processus.
+    Les résultats par fichier sont produits dans l'ordre de la liste d'entrée,
+    au fur et à mesure qu'ils sont disponibles.
+    """
+    if settings is None:
+        settings = build_extraction_settings()
+    tasks = [(filepath, settings) for filepath in files]
+    yield from iter_process_map(_extract_file_worker, tasks, max_workers,
+                                label="Extraction parallèle", category="extraction")
+
+
+def extract_texts_batch(tl_folder, max_workers=None, progress_callback=None, excluded_files=None):
+    """
+    Extrait tous les fichiers .rpy d'un dossier game/tl/<langue> en parallèle.
+    
+    Args:
+        tl_folder: Dossier de traduction à extraire
+        max_workers: Nombre de processus (défaut : nombre de cœurs)
+        progress_callback: Appelé pour chaque fichier terminé, dans l'ordre :
+                           progress_callback(index, total, file_result)
+        excluded_files: Noms de fichiers à ignorer (liste ou chaîne séparée par des virgules)
+    
+    Returns:
+        dict: Résumé fusionné + résultats par fichier (dans l'ordre des fichiers)
+    """
+    start_time = time.time()
+    summary = {
+        'tl_folder': tl_folder,
+        'files': [],
+        'total_files': 0,
+        'success_count': 0,
+        'error_count': 0,
+        'extracted_count': 0,
+        'asterix_count': 0,
+        'tilde_count': 0,
+        'empty_count': 0,
+        'duplicate_count': 0,
+        'files_to_open': [],
+        'extraction_time': 0
+    }
+
+    if not tl_folder or not os.path.isdir(tl_folder):
+        log_message("ERREUR", f"Dossier de traduction introuvable: {tl_folder}", category="extraction")
+        return summary
+
+    files = find_files_for_batch_extraction(os.path.abspath(tl_folder), excluded_files)
+    summary['total_files'] = len(files)
+    if not files:
+        log_message("ATTENTION", f"Aucun fichier .rpy à extraire dans {tl_folder}", category="extraction")
+        return summary
+
+    # Les dossiers temporaires sont nommés d'après le nom de base : un seul fichier par nom,
+    # les suivants sont refusés avant l'envoi aux workers (écritures concurrentes sinon)
+    base_names = {}
+    rejected = {}
+    for filepath in files:
+        base_name = get_file_base_name(filepath)
+        key = base_name.lower()  # systèmes de fichiers insensibles à la casse
+        if key in base_names:
+            rejected[filepath] = {
+                'file': filepath,
+                'success': False,
+                'error': f"nom de base '{base_name}' déjà utilisé par {base_names[key]} (dossier de sortie partagé)",
+                'extraction_time': 0
+            }
+        else:
+            base_names[key] = filepath
+
+    settings = build_extraction_settings()
+    log_message("INFO", f"📤 Extraction par lot: {len(files)} fichiers dans {tl_folder}", category="extraction")
+
+    def ordered_results():
+        """Résultats dans l'ordre des fichiers, fichiers refusés compris"""
+        extracted = iter_extract_texts_batch([f for f in files if f not in rejected], settings, max_workers)
+        for filepath in files:
+            yield rejected[filepath] if filepath in rejected else next(extracted)
+
+    with trace_run("extraction_batch", files=len(files), workers=max_workers or os.cpu_count() or 1):
+        for index, file_result in enumerate(ordered_results(), 1):
+            summary['files'].append(file_result)
+            if file_result['success']:
+                result = file_result['result']
+                summary['success_count'] += 1
+                for key in ('extracted_count', 'asterix_count', 'tilde_count', 'empty_count', 'duplicate_count'):
+                    summary[key] += result.get(key, 0)
+                summary['files_to_open'].extend(result.get('files_to_open', []))
+            else:
+                summary['error_count'] += 1
+                log_message("ERREUR", f"Extraction échouée pour {file_result['file']}: {file_result['error']}", category="extraction")
+
+            if progress_callback:
+                try:
+                    progress_callback(index, len(files), file_result)
+                except Exception as e:
+                    log_message("DEBUG", f"Erreur callback progression extraction par lot: {e}", category="extraction")
+
+    summary['extraction_time'] = time.time() - start_time
+    log_message("INFO", f"✅ Extraction par lot terminée en {summary['extraction_time']:.2f}s: {summary['success_count']}/{len(files)} fichiers | Dialogues: {summary['extracted_count']} | Erreurs: {summary['error_count']}", category="extraction")
+    return summary
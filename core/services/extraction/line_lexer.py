@@ -0,0 +1,238 @@
+# core/services/extraction/line_lexer.py
+# Line Lexer Module
+# Created for RenExtract
+
+"""
+Lexer mono-passe des lignes Ren'Py pour l'extraction.
+
+Une seule recherche (en C via re) repère tous les caractères significatifs
+d'une ligne : guillemets, échappements, {tags}, [variables], <balises>,
+séquences d'astérisques et de tildes. Les vues utilisées par les étapes de
+protection (segments entre guillemets, groupes * et ~, tildes orphelins,
+balises) sont ensuite dérivées de ce flux de tokens, sans rescanner le texte.
+Chaque vue reproduit exactement le résultat des anciens scanners caractère
+par caractère de TextExtractor.
+"""
+
+import bisect
+from functools import lru_cache
+import re
+
+__all__ = ['LineTokens', 'tokenize_line', 'leading_literal']
+
+# Séquences d'astérisques/tildes regroupées, autres caractères significatifs isolés
+_TOKEN_RE = re.compile(r'\*+|~+|["\'\\\[\]{}<>]')
+
+_REGEX_METACHARS = set('.^$*+?{}[]\\|()')
+
+
+def leading_literal(pattern):
+    """
+    Retourne le premier caractère littéral imposé par un pattern regex,
+    ou None s'il ne peut pas être déterminé simplement.
+    Sert de pré-filtre : si ce caractère est absent d'une ligne, le pattern ne peut pas y correspondre.
+    """
+    if not pattern:
+        return None
+    first = pattern[0]
+    if first == '\\':
+        if len(pattern) > 1 and not pattern[1].isalnum():
+            return pattern[1]
+        return None
+    if first in _REGEX_METACHARS:
+        return None
+    return first
+
+
+class LineTokens:
+    """Flux de tokens d'une ligne et vues dérivées (calculées à la demande)"""
+
+    __slots__ = ('line', 'tokens', 'chars', '_positions', '_views')
+
+    def __init__(self, line):
+        self.line = line
+        # (position, caractère, longueur de la séquence)
+        self.tokens = [(m.start(), m.group()[0], m.end() - m.start()) for m in _TOKEN_RE.finditer(line)]
+        self.chars = {char for _, char, _ in self.tokens}
+        self._positions = {}
+        self._views = {}
+
+    # --- accès internes ---
+    def _positions_of(self, char):
+        positions = self._positions.get(char)
+        if positions is None:
+            positions = [pos for pos, tok_char, _ in self.tokens if tok_char == char]
+            self._positions[char] = positions
+        return positions
+
+    def _runs_of(self, char):
+        return [(pos, length) for pos, tok_char, length in self.tokens if tok_char == char]
+
+    # --- vues publiques (copies : les appelants peuvent trier/modifier) ---
+    def quoted_segments(self):
+        """Segments entre guillemets simples/doubles en respectant les échappements"""
+        if 'quotes' not in self._views:
+            self._views['quotes'] = self._build_quoted_segments()
+        return list(self._views['quotes'])
+
+    def asterisk_groups(self):
+        """Groupes *texte* (même nombre d'astérisques à l'ouverture et à la fermeture)"""
+        if 'asterisks' not in self._views:
+            self._views['asterisks'] = self._build_symbol_groups('*', 'asterisk_count')
+        return list(self._views['asterisks'])
+
+    def tilde_groups(self):
+        """Groupes ~texte~ (même logique que les astérisques)"""
+        if 'tildes' not in self._views:
+            self._views['tildes'] = self._build_symbol_groups('~', 'tilde_count')
+        return list(self._views['tildes'])
+
+    def orphan_tildes(self):
+        """Séquences de 2+ tildes consécutifs"""
+        if 'orphans' not in self._views:
+            self._views['orphans'] = [
+                {'text': '~' * length, 'count': length, 'start_pos': pos, 'end_pos': pos + length}
+                for pos, length in self._runs_of('~') if length >= 2
+            ]
+        return list(self._views['orphans'])
+
+    def bracketed_tags(self):
+        """Variables [..] avec imbrication (logique de pile)"""
+        if 'brackets' not in self._views:
+            self._views['brackets'] = self._build_bracketed_tags()
+        return list(self._views['brackets'])
+
+    def delimited(self, open_char, close_char):
+        """
+        Équivalent de re.findall(r'\\{open}[^{close}]+\\{close}', line) : segments
+        non vides, non chevauchants, de open_char jusqu'au premier close_char.
+        """
+        key = ('delimited', open_char)
+        if key not in self._views:
+            self._views[key] = self._build_delimited(open_char, close_char)
+        return list(self._views[key])
+
+    # --- construction des vues ---
+    def _build_quoted_segments(self):
+        line = self.line
+        line_len = len(line)
+        segments = []
+        events = [(pos, char) for pos, char, _ in self.tokens if char in ('"', "'", '\\')]
+        idx = 0
+        while idx < len(events):
+            pos, char = events[idx]
+            if char == '\\':
+                idx += 1
+                continue
+
+            quote_char = char
+            start_quote_idx = pos
+            idx += 1
+            skip_until = -1
+            closed = False
+            while idx < len(events):
+                pos, char = events[idx]
+                idx += 1
+                if pos < skip_until:
+                    continue
+                if char == '\\' and pos + 1 < line_len:
+                    skip_until = pos + 2
+                    continue
+                if char == quote_char:
+                    segments.append({
+                        'content': line[start_quote_idx + 1:pos],
+                        'quote_char': quote_char,
+                        'start_quote_idx': start_quote_idx,
+                        'end_quote_idx': pos
+                    })
+                    closed = True
+                    break
+            if not closed:
+                # Guillemet ouvrant sans fermeture: on arrete proprement.
+                break
+            # Les événements restants sont situés après la fermeture
+        return segments
+
+    def _build_symbol_groups(self, symbol, count_key):
+        line = self.line
+        runs = self._runs_of(symbol)
+        groups = []
+        run_idx = 0
+        # Position courante du scan (peut se trouver au milieu d'une séquence)
+        current = runs[0][0] if runs else 0
+        while run_idx < len(runs):
+            run_start, run_len = runs[run_idx]
+            run_end = run_start + run_len
+            if current < run_start:
+                current = run_start
+            if current >= run_end:
+                run_idx += 1
+                continue
+
+            count = run_end - current
+            start_pos = current
+            closing = None
+            for next_idx in range(run_idx + 1, len(runs)):
+                if runs[next_idx][1] >= count:
+                    closing = next_idx
+                    break
+
+            if closing is None:
+                # Pas de fermeture : on réessaie depuis le caractère suivant
+                current += 1
+                continue
+
+            close_start = runs[closing][0]
+            groups.append({
+                'full_text': line[start_pos:close_start + count],
+                'content': line[run_end:close_start],
+                count_key: count,
+                'start_pos': start_pos,
+                'end_pos': close_start + count
+            })
+            current = close_start + count
+            run_idx = closing
+        return groups
+
+    def _build_bracketed_tags(self):
+        line = self.line
+        opens = self._positions_of('[')
+        events = [(pos, char) for pos, char, _ in self.tokens if char in ('[', ']')]
+        tags = []
+        resume = 0
+        for open_pos in opens:
+            if open_pos < resume:
+                continue
+            depth = 0
+            for pos, char in events[bisect.bisect_left(events, (open_pos, '')):]:
+                depth += 1 if char == '[' else -1
+                if depth == 0:
+                    tags.append(line[open_pos:pos + 1])
+                    resume = pos + 1
+                    break
+        return tags
+
+    def _build_delimited(self, open_char, close_char):
+        line = self.line
+        closes = self._positions_of(close_char)
+        segments = []
+        resume = 0
+        for open_pos in self._positions_of(open_char):
+            if open_pos < resume:
+                continue
+            close_idx = bisect.bisect_right(closes, open_pos)
+            if close_idx >= len(closes):
+                break
+            close_pos = closes[close_idx]
+            if close_pos == open_pos + 1:
+                # Contenu vide : le pattern échoue à cette position
+                continue
+            segments.append(line[open_pos:close_pos + 1])
+            resume = close_pos + 1
+        return segments
+
+
+@lru_cache(maxsize=512)
+def tokenize_line(line):
+    """Tokenise une ligne (résultat mis en cache : les étapes successives relisent souvent la même ligne)"""
+    return LineTokens(line)
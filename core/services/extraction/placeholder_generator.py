@@ -266,6 +266,31 @@ class SimplePlaceholderGenerator:
         except Exception:
             return False
     
+    def get_placeholder_regex(self):
+        """
+        Retourne l'expression régulière (source) reconnaissant tous les placeholders
+        que ce générateur peut produire, quel que soit le compteur.
+        """
+        prefix = re.escape(getattr(self, 'prefix', '') or '')
+        if self.pattern_type == 'alpha_numeric_paren':
+            return rf"\({re.escape(self.format_info.get('letter', 'B'))}\d+\)"
+        if self.pattern_type == 'only_paren_numeric':
+            return r"\(\d+\)"
+        if self.pattern_type == 'dash_numeric':
+            return rf"{prefix}-\d+"
+        if self.pattern_type == 'paren_numeric':
+            return rf"{prefix}\(\d+\)"
+        if self.pattern_type == 'bracket_numeric':
+            return rf"{prefix}\[\d+\]"
+        if self.pattern_type == 'dot_numeric':
+            return rf"{prefix}\.\d+"
+        if self.pattern_type == 'direct_numeric':
+            return rf"{prefix}\d+"
+        if self.pattern_type == 'underscore_alpha':
+            return rf"{prefix}_(?:[A-Z]|\d+)"
+        # underscore_numeric et simple_prefix : PREFIXE_001
+        return rf"{prefix}_\d+"
+
     def get_pattern_info(self):
         """Retourne les informations sur le pattern détecté"""
         return {
@@ -6,16 +6,105 @@
 Module de reconstruction des fichiers traduits
 """
 
+import itertools
 import os
 import re
 import time
 import json
 from collections import OrderedDict
 from core.services.extraction.extraction import get_file_base_name
+from core.services.extraction.block_manifest import BlockHashBuilder, save_block_manifest
 from infrastructure.config.constants import FOLDERS
 from infrastructure.logging.logging import log_message
+from infrastructure.logging.tracing import trace_run, trace_span
 from infrastructure.helpers.unified_functions import extract_game_name
 
+class PlaceholderIndex:
+    """
+    Index compilé placeholder -> (type, valeur), construit une fois par reconstruction.
+    
+    Une seule regex combine les formes des trois générateurs (code, astérisque, tilde)
+    et les placeholders littéraux hors forme (vides, ancien pattern) : chaque ligne est
+    restaurée en une passe de substitution avec une recherche O(1) par placeholder.
+    Les valeurs contenant elles-mêmes des placeholders sont développées récursivement.
+    """
+
+    MAX_DEPTH = 10
+
+    def __init__(self, typed_mappings, generators):
+        """
+        Args:
+            typed_mappings: [(type, {placeholder: valeur}), ...] — en cas de doublon, le dernier l'emporte
+            generators: [(type, SimplePlaceholderGenerator), ...]
+        """
+        self.values = {}
+        self.kinds = {}
+        for kind, mapping in typed_mappings:
+            for placeholder, value in mapping.items():
+                self.values[placeholder] = value
+                self.kinds[placeholder] = kind
+
+        # Ordre historique (plus long d'abord) conservé pour les cas de repli
+        self.sorted_keys = sorted(self.values, key=len, reverse=True)
+        self.depth_exceeded = False
+        self._expanded = {}
+        self._fallback_cache = {}
+
+        shape_sources = []
+        for kind, generator in generators:
+            try:
+                shape_sources.append((kind, generator.get_placeholder_regex()))
+            except Exception as e:
+                log_message("DEBUG", f"Forme de placeholder indisponible pour {kind}: {e}", category="reconstruction")
+        self.shape_re = re.compile('|'.join(f'(?P<{kind}>{source})' for kind, source in shape_sources)) if shape_sources else None
+
+        literals = [key for key in self.sorted_keys if not (self.shape_re and self.shape_re.fullmatch(key))]
+        parts = [re.escape(key) for key in literals] + [source for _, source in shape_sources]
+        self.pattern = re.compile('|'.join(f'(?:{part})' for part in parts)) if (self.values and parts) else None
+
+    def kind_of(self, placeholder):
+        """Type d'un placeholder : index d'abord, puis forme des générateurs (None si inconnu)"""
+        kind = self.kinds.get(placeholder)
+        if kind is None and self.shape_re:
+            match = self.shape_re.fullmatch(placeholder)
+            if match:
+                kind = match.lastgroup
+        return kind
+
+    def restore(self, text, depth=0):
+        """Remplace tous les placeholders de text par leur valeur en une passe"""
+        if not self.pattern or not text:
+            return text
+        return self.pattern.sub(lambda match: self._resolve(match.group(0), depth), text)
+
+    def _resolve(self, token, depth):
+        if token in self.values:
+            expanded = self._expanded.get(token)
+            if expanded is None:
+                expanded = self._expand(self.values[token], depth)
+                self._expanded[token] = expanded
+            return expanded
+
+        # Correspondance de forme qui n'est pas un placeholder connu (ex: chiffres collés) :
+        # repli sur l'ancien remplacement séquentiel, limité à ce fragment
+        cached = self._fallback_cache.get(token)
+        if cached is None:
+            cached = token
+            for key in self.sorted_keys:
+                if key in cached:
+                    cached = cached.replace(key, self.values[key])
+            self._fallback_cache[token] = cached
+        return cached
+
+    def _expand(self, value, depth):
+        if depth >= self.MAX_DEPTH:
+            self.depth_exceeded = True
+            return value
+        if not value or not self.pattern.search(value):
+            return value
+        return self.restore(value, depth + 1)
+
+
 class FileReconstructor:
     """
     Classe principale pour la reconstruction.
@@ -26,6 +115,7 @@ class FileReconstructor:
         MODIFIÉ: Charge les préfixes personnalisés
         """
         self.file_content = []
+        self.placeholders_path = None
         self.original_path = None
         self.reconstruction_time = 0
         
@@ -96,9 +186,15 @@ class FileReconstructor:
         reference_folder = os.path.join(FOLDERS["temporaires"], game_name, file_base, "fichiers_a_ne_pas_traduire")
         placeholders_path = os.path.join(reference_folder, f'{file_base}_with_placeholders.rpy')
         
+        self.placeholders_path = None
         if os.path.exists(placeholders_path):
-            with open(placeholders_path, 'r', encoding='utf-8') as f:
-                self.file_content = f.readlines()
+            if self.streaming_mode:
+                # Lu ligne à ligne pendant l'écriture (voir _iter_source_lines)
+                self.placeholders_path = placeholders_path
+                self.file_content = []
+            else:
+                with open(placeholders_path, 'r', encoding='utf-8') as f:
+                    self.file_content = f.readlines()
         else:
             self.file_content = file_content[:]
             log_message("ATTENTION", "Fichier with_placeholders.rpy non trouvé, utilisation du fichier original", category="reconstruction_io")
@@ -123,13 +219,24 @@ class FileReconstructor:
         self.content_quote_chars = []
         self.asterix_metadata = {}
         self.tilde_metadata = {}  # NOUVEAU
+        self._placeholder_index = None
 
     def reconstruct_file(self, save_mode='new_file'):
         start_time = time.time()
         try:
-            self._load_data_for_reconstruction()
-            reconstructed_content = self._rebuild_content()
-            save_path = self._save_reconstructed_file(reconstructed_content, save_mode)
+            with trace_run("reconstruction", file=os.path.basename(self.original_path or ''),
+                           streaming=bool(self.streaming_mode)):
+                with trace_span("reconstruction.load_data"):
+                    self._load_data_for_reconstruction()
+                if self.streaming_mode:
+                    # Lignes produites à la demande et écrites au fil de l'eau
+                    reconstructed_content = self._iter_rebuilt_lines(self._iter_source_lines())
+                else:
+                    with trace_span("reconstruction.rebuild"):
+                        reconstructed_content = self._rebuild_content()
+                # En streaming, la reconstruction des lignes est comptée dans l'écriture
+                with trace_span("reconstruction.save"):
+                    save_path = self._save_reconstructed_file(reconstructed_content, save_mode)
             self.reconstruction_time = time.time() - start_time
             log_message("INFO", f"✅ Reconstruction réussie en {self.reconstruction_time:.2f}s", category="reconstruction")
             return {'save_path': save_path}
@@ -203,28 +310,23 @@ class FileReconstructor:
                 self.tilde_metadata = {}
 
         # Chargement des traductions avec support multi-fichiers
-        raw_translations = self._load_translation_files(translate_folder, f'{file_base}_dialogue.txt')
-        self.translations = [line.rstrip('\n\r') for line in raw_translations]
+        self.translations = [line.rstrip('\n\r') for line in self._iter_translation_lines(translate_folder, f'{file_base}_dialogue.txt')]
         
         doublons_files = self._find_translation_files(translate_folder, f'{file_base}_doublons.txt')
         if doublons_files:
-            raw_duplicates = self._load_translation_files(translate_folder, f'{file_base}_doublons.txt')
-            self.duplicate_translations = [line.rstrip('\n\r') for line in raw_duplicates]
+            self.duplicate_translations = [line.rstrip('\n\r') for line in self._iter_translation_lines(translate_folder, f'{file_base}_doublons.txt')]
 
         # Chargement unifié astérisques et tildes avec support multi-fichiers
         asterix_files = self._find_translation_files(translate_folder, f'{file_base}_asterix.txt')
         if asterix_files:
-            raw_asterix_lines = self._load_translation_files(translate_folder, f'{file_base}_asterix.txt')
-            all_lines = [line.rstrip('\n\r') for line in raw_asterix_lines]
+            asterix_lines = (line.rstrip('\n\r') for line in self._iter_translation_lines(translate_folder, f'{file_base}_asterix.txt'))
             
-            # Séparer astérisques et tildes selon les compteurs d'extraction
+            # Séparer astérisques et tildes selon les compteurs d'extraction (lecture arrêtée après les tildes)
             asterix_count = len(self.asterix_mapping)
             tilde_count = len(self.tilde_mapping)
             
-            if asterix_count > 0:
-                self.asterix_translations = all_lines[:asterix_count]
-            if tilde_count > 0:
-                self.tilde_translations = all_lines[asterix_count:asterix_count + tilde_count]
+            self.asterix_translations = list(itertools.islice(asterix_lines, asterix_count))
+            self.tilde_translations = list(itertools.islice(asterix_lines, tilde_count))
 
         # Calculer le total de lignes chargées
         total_dialogue = len(self.translations)
@@ -292,25 +394,28 @@ class FileReconstructor:
 
     def _load_translation_files(self, folder, base_filename):
         """Charge tous les fichiers de traduction comme un seul contenu"""
+        return list(self._iter_translation_lines(folder, base_filename))
+
+    def _iter_translation_lines(self, folder, base_filename):
+        """Lit les fichiers de traduction (principal puis _2, _3...) ligne à ligne, sans les concaténer en mémoire"""
         try:
-            files = self._find_translation_files(folder, base_filename)
-            
-            if not files:
-                return []
-            
-            all_lines = []
-            for file_path in files:
+            for file_path in self._find_translation_files(folder, base_filename):
+                line_count = 0
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()  # Garder les retours à la ligne originaux
-                    all_lines.extend(lines)
-                    log_message("DEBUG", f"Fichier chargé: {file_path} ({len(lines)} lignes)", category="reconstruction")
-            
-            # Log supprimé : sera regroupé avec le log final de reconstruction
-            return all_lines
-            
+                    for line in f:  # Garder les retours à la ligne originaux
+                        line_count += 1
+                        yield line
+                log_message("DEBUG", f"Fichier chargé: {file_path} ({line_count} lignes)", category="reconstruction")
         except Exception as e:
             log_message("ERREUR", f"Erreur chargement fichiers traduction: {e}", category="reconstruction")
-            return []
+
+    def _iter_source_lines(self):
+        """Lignes du fichier avec placeholders : lues à la demande en mode streaming, sinon depuis la mémoire"""
+        if self.placeholders_path:
+            with open(self.placeholders_path, 'r', encoding='utf-8') as f:
+                yield from f
+        else:
+            yield from self.file_content
 
     def _classify_placeholder_by_content(self, placeholder, tag):
         """
@@ -347,77 +452,38 @@ class FileReconstructor:
         except Exception as e:
             return 'code'  # Fallback sécurisé
 
+    def _get_placeholder_index(self):
+        """Index compilé courant (construit à la demande si la reconstruction n'a pas commencé)"""
+        if self._placeholder_index is None:
+            self._placeholder_index = self._build_placeholder_index()
+        return self._placeholder_index
+
+    def _build_placeholder_index(self):
+        """Construit l'index placeholder -> type/valeur (une fois par reconstruction)"""
+        return PlaceholderIndex(
+            [('code', self.mapping), ('empty', self.empty_mapping),
+             ('asterisk', self.asterix_mapping), ('tilde', self.tilde_mapping)],
+            [('code', self.code_generator), ('asterisk', self.asterisk_generator), ('tilde', self.tilde_generator)]
+        )
+
     def _is_code_placeholder(self, placeholder):
         """Détermine si un placeholder est un code généré par notre système"""
         try:
-            # Test par pattern du générateur
-            pattern_info = self.code_generator.get_pattern_info()
-            pattern_type = pattern_info.get('type', '')
-            
-            if pattern_type == 'underscore_numeric':
-                # Pattern comme RENPY_CODE_001 ou (01) -> (02)
-                prefix = pattern_info.get('prefix', '')
-                if prefix and placeholder.startswith(f"{prefix}_"):
-                    return True
-            elif pattern_type == 'only_paren_numeric':
-                # Pattern comme (01) -> (02)
-                return re.match(r'^\(\d+\)$', placeholder) is not None
-            elif pattern_type == 'alpha_numeric_paren':
-                # Pattern comme (B01) -> (B02) mais pour codes (pas normal)
-                return re.match(r'^\([A-Z]\d+\)$', placeholder) is not None
-            elif pattern_type == 'simple_prefix':
-                # Pattern simple comme CODE -> CODE_001
-                prefix = pattern_info.get('prefix', '')
-                if prefix and placeholder.startswith(f"{prefix}_"):
-                    return True
-                    
-            return False
+            return self._get_placeholder_index().kind_of(placeholder) == 'code'
         except Exception:
             return False
 
     def _is_asterisk_placeholder(self, placeholder):
         """Détermine si un placeholder est un astérisque généré par notre système"""
         try:
-            pattern_info = self.asterisk_generator.get_pattern_info()
-            pattern_type = pattern_info.get('type', '')
-            
-            if pattern_type == 'alpha_numeric_paren':
-                # Pattern comme (B01) -> (B02)
-                letter = pattern_info.get('format_info', {}).get('letter', 'B')
-                return placeholder.startswith(f"({letter}") and placeholder.endswith(')')
-            elif pattern_type == 'underscore_numeric':
-                # Pattern comme RENPY_ASTERISK_001
-                prefix = pattern_info.get('prefix', '')
-                if prefix and placeholder.startswith(f"{prefix}_"):
-                    return True
-            elif pattern_type == 'only_paren_numeric':
-                # Si les astérisques utilisent (01) -> (02) (cas rare)
-                return re.match(r'^\(\d+\)$', placeholder) is not None
-                
-            return False
+            return self._get_placeholder_index().kind_of(placeholder) == 'asterisk'
         except Exception:
             return False
 
     def _is_tilde_placeholder(self, placeholder):
         """Détermine si un placeholder est un tilde généré par notre système"""
         try:
-            pattern_info = self.tilde_generator.get_pattern_info()
-            pattern_type = pattern_info.get('type', '')
-            
-            if pattern_type == 'alpha_numeric_paren':
-                # Pattern comme (C01) -> (C02)
-                letter = pattern_info.get('format_info', {}).get('letter', 'C')
-                return placeholder.startswith(f"({letter}") and placeholder.endswith(')')
-            elif pattern_type == 'underscore_numeric':
-                # Pattern comme RENPY_TILDE_001
-                prefix = pattern_info.get('prefix', '')
-                if prefix and placeholder.startswith(f"{prefix}_"):
-                    return True
-            elif pattern_type == 'only_paren_numeric':
-                # Si les tildes utilisent (01) -> (02) (cas rare)
-                return re.match(r'^\(\d+\)$', placeholder) is not None
-                
-            return False
+            return self._get_placeholder_index().kind_of(placeholder) == 'tilde'
         except Exception:
             return False
 
@@ -429,12 +495,21 @@ class FileReconstructor:
                 "NARRATOR" in placeholder.upper())
 
     def _rebuild_content(self):
-        output_lines = self.file_content[:]
-        
+        return list(self._iter_rebuilt_lines(self.file_content))
+
+    def _iter_rebuilt_lines(self, source_lines):
+        """
+        Reconstruit les lignes une à une (générateur) : la mémoire utilisée ne dépend
+        que du nombre de textes extraits, pas de la taille du fichier.
+        """
         translation_map = self._build_translation_map()
         self._restore_asterisks()
         self._restore_tildes_two_pass()
         
+        # Index compilé une seule fois, après restauration des astérisques/tildes traduits
+        self._placeholder_index = self._build_placeholder_index()
+        placeholder_index = self._placeholder_index
+        
         # Logs de restauration pour codes et vides (restaurés automatiquement lors du nettoyage)
         codes_count = len(self.mapping)
         vides_count = len(self.empty_mapping)
@@ -443,75 +518,56 @@ class FileReconstructor:
 
         # PRÉ-CALCULER TOUS les mappings pour éviter TOUTES les recherches O(n)
         line_idx_to_meta_idx = {line_idx: i for i, line_idx in enumerate(self.original_lines.keys())}
-
-        for line_idx, content_indices in self.line_to_content_indices.items():
-            original_line = self.original_lines.get(line_idx)
-            if not original_line: continue
-            
-            # Récupérer les préfixes/suffixes pour cette ligne spécifique
-            meta_idx = line_idx_to_meta_idx.get(line_idx)
-            prefixes = self.content_prefixes[meta_idx] if meta_idx is not None and meta_idx < len(self.content_prefixes) else [""] * len(content_indices)
-            suffixes = self.content_suffixes[meta_idx] if meta_idx is not None and meta_idx < len(self.content_suffixes) else [""] * len(content_indices)
-            quote_chars = self.content_quote_chars[meta_idx] if meta_idx is not None and meta_idx < len(self.content_quote_chars) else ['"'] * len(content_indices)
-            line_suffix = self.suffixes[meta_idx] if meta_idx is not None and meta_idx < len(self.suffixes) else ""
-            
-            # Reconstruire les contenus complets (avec préfixes/suffixes)
-            full_new_contents = []
-            for i, content_idx in enumerate(content_indices):
-                original_text = self.all_contents_linear[content_idx]
-                
-                # Gérer le marqueur spécial ◦
-                if original_text == "◦":
-                    translated_text = translation_map.get(original_text, "")
-                    if translated_text == "◦" or not translated_text:
-                        translated_text = ""
-                else:
-                    translated_text = translation_map.get(original_text, original_text)
-                
-                prefix = prefixes[i] if i < len(prefixes) else ""
-                suffix = suffixes[i] if i < len(suffixes) else ""
-                full_new_contents.append(f"{prefix}{translated_text}{suffix}")
-
-            rebuilt_line = self._reassemble_line_optimized(line_idx, original_line, full_new_contents, line_suffix, quote_chars)
-            output_lines[line_idx] = rebuilt_line
-        
-        # NETTOYAGE ITÉRATIF des placeholders pour gérer les imbrications
-        all_mappings = {**self.mapping, **self.empty_mapping, **self.asterix_mapping, **self.tilde_mapping}
-        sorted_keys = sorted(all_mappings.keys(), key=len, reverse=True)
-        
-        # Restaurer les placeholders sur TOUTES les lignes avec approche itérative
-        # MAIS ignorer les lignes commentées pour éviter de casser leur syntaxe
-        max_iterations = 10
-        for iteration in range(max_iterations):
-            replacements_made = False
-            
-            for i, line in enumerate(output_lines):
-                # NE PAS modifier les lignes commentées (elles ne sont pas extraites donc pas traduites)
-                if line.strip().startswith('#'):
-                    continue
-                
-                original_line = line
-                
-                # Appliquer tous les remplacements sur cette ligne
-                for key in sorted_keys:
-                    if key in line:
-                        line = line.replace(key, all_mappings[key])
-                
-                # Vérifier si des changements ont été faits
-                if line != original_line:
-                    replacements_made = True
-                    output_lines[i] = line
+        empty_corrections = 0
+
+        for line_idx, line in enumerate(source_lines):
+            content_indices = self.line_to_content_indices.get(line_idx)
+            if content_indices is not None:
+                original_line = self.original_lines.get(line_idx)
+                if original_line:
+                    line = self._rebuild_dialogue_line(line_idx, original_line, content_indices, translation_map, line_idx_to_meta_idx)
+            
+            # NETTOYAGE des placeholders : une passe par ligne, imbrications développées par l'index
+            # MAIS ignorer les lignes commentées (elles ne sont pas extraites donc pas traduites)
+            if not line.strip().startswith('#'):
+                line = placeholder_index.restore(line)
+                # POST-TRAITEMENT: Corriger les placeholders empty restants
+                line, corrections = self._post_process_empty_line(line)
+                empty_corrections += corrections
+            yield line
+        
+        if placeholder_index.depth_exceeded:
+            log_message("ATTENTION", f"Nettoyage des placeholders interrompu après {PlaceholderIndex.MAX_DEPTH} niveaux d'imbrication", category="placeholder_cleanup")
+        if empty_corrections > 0:
+            log_message("INFO", f"✅ Post-traitement terminé: {empty_corrections} corrections appliquées", category="postprocess")
+
+    def _rebuild_dialogue_line(self, line_idx, original_line, content_indices, translation_map, line_idx_to_meta_idx):
+        """Reconstruit une ligne extraite avec ses traductions"""
+        # Récupérer les préfixes/suffixes pour cette ligne spécifique
+        meta_idx = line_idx_to_meta_idx.get(line_idx)
+        prefixes = self.content_prefixes[meta_idx] if meta_idx is not None and meta_idx < len(self.content_prefixes) else [""] * len(content_indices)
+        suffixes = self.content_suffixes[meta_idx] if meta_idx is not None and meta_idx < len(self.content_suffixes) else [""] * len(content_indices)
+        quote_chars = self.content_quote_chars[meta_idx] if meta_idx is not None and meta_idx < len(self.content_quote_chars) else ['"'] * len(content_indices)
+        line_suffix = self.suffixes[meta_idx] if meta_idx is not None and meta_idx < len(self.suffixes) else ""
+        
+        # Reconstruire les contenus complets (avec préfixes/suffixes)
+        full_new_contents = []
+        for i, content_idx in enumerate(content_indices):
+            original_text = self.all_contents_linear[content_idx]
+            
+            # Gérer le marqueur spécial ◦
+            if original_text == "◦":
+                translated_text = translation_map.get(original_text, "")
+                if translated_text == "◦" or not translated_text:
+                    translated_text = ""
+            else:
+                translated_text = translation_map.get(original_text, original_text)
             
-            # Si aucun remplacement n'a été fait, on peut arrêter
-            if not replacements_made:
-                break
-        else:
-            log_message("ATTENTION", f"Nettoyage des placeholders interrompu après {max_iterations} itérations", category="placeholder_cleanup")
-        
-        # POST-TRAITEMENT: Corriger les placeholders empty restants
-        output_lines = self._post_process_empty_placeholders(output_lines)
-                
-        return output_lines
+            prefix = prefixes[i] if i < len(prefixes) else ""
+            suffix = suffixes[i] if i < len(suffixes) else ""
+            full_new_contents.append(f"{prefix}{translated_text}{suffix}")
+
+        return self._reassemble_line_optimized(line_idx, original_line, full_new_contents, line_suffix, quote_chars)
 
     def _comment_original_file(self):
         """Commente toutes les lignes non-vides du fichier original, même celles déjà commentées"""
@@ -549,62 +605,6 @@ class FileReconstructor:
             log_message("ERREUR", f"Impossible de commenter le fichier original: {str(e)}", e, category="reconstruction_comment")
             return False
 
-    def _reassemble_line_optimized(self, line_idx, original_line, new_contents, line_suffix, quote_chars=None):
-        """
-        VERSION OPTIMISÉE : Réassemble une ligne avec line_idx déjà connu.
-        Les préfixes/suffixes sont déjà intégrés dans new_contents.
-        """
-        rebuilt = original_line
-        
-        # Restaurer les placeholders de structure en premier (inchangé)
-        rebuilt = rebuilt.replace("RENPY_NARRATOR", '"" "')
-        rebuilt = rebuilt.replace("RENPY_EMPTY03", '" "')
-        rebuilt = rebuilt.replace("RENPY_EMPTY01", '""')
-        rebuilt = rebuilt.replace("RENPY_EMPTY02", '" "')
-        
-        # Trouver le préfixe de la ligne (locuteur, indentation), guillemet simple ou double.
-        first_quote_positions = [pos for pos in (rebuilt.find('"'), rebuilt.find("'")) if pos != -1]
-        first_quote_pos = min(first_quote_positions) if first_quote_positions else -1
-        if first_quote_pos == -1:
-            return original_line
-        
-        line_prefix = rebuilt[:first_quote_pos]
-        
-        # Les {tags} sont déjà intégrés dans new_contents par _rebuild_content()
-        # Plus besoin de récupérer les préfixes/suffixes ici
-        
-        # Construire la partie dialogue avec les {tags} restaurés
-        dialogue_part = ""
-        
-        if "RENPY_NARRATOR" in original_line:
-            # Cas narrateur
-            dialogue_part = f'"" "{new_contents[0]}"'
-            
-        elif "RENPY_EMPTY03" in original_line:
-            # Cas contenus multiples
-            dialogue_part = f'"{new_contents[0]}" "{new_contents[1]}"'
-            
-        else:
-            # Cas dialogue normal
-            parts = []
-            for idx, content in enumerate(new_contents):
-                quote_char = quote_chars[idx] if quote_chars and idx < len(quote_chars) else '"'
-                parts.append(f'{quote_char}{content}{quote_char}')
-            dialogue_part = " ".join(parts)
-        
-        # Assembler la ligne finale
-        final_line = f"{line_prefix}{dialogue_part}{line_suffix}"
-        if original_line.endswith('\n') and not final_line.endswith('\n'):
-            final_line += '\n'
-        
-        # Restaurer tous les placeholders de code, empty et astérisques restants
-        all_mappings = {**self.mapping, **self.empty_mapping, **self.asterix_mapping}
-        sorted_keys = sorted(all_mappings.keys(), key=len, reverse=True)
-        for key in sorted_keys:
-            final_line = final_line.replace(key, all_mappings[key])
-            
-        return final_line
-
     def _build_translation_map(self):
         """Mappe les traductions par INDEX au lieu de par ordre de fichier"""
         translation_map = {}
@@ -771,11 +771,7 @@ class FileReconstructor:
             if original_line.endswith('\n') and not final_line.endswith('\n'):
                 final_line += '\n'
 
-            all_mappings = {**self.mapping, **self.empty_mapping, **self.asterix_mapping, **self.tilde_mapping}
-            sorted_keys = sorted(all_mappings.keys(), key=len, reverse=True)
-            for key in sorted_keys:
-                final_line = final_line.replace(key, all_mappings[key])
-            return final_line
+            return self._get_placeholder_index().restore(final_line)
 
         # Trouver le préfixe de la ligne (locuteur, indentation)
         first_quote_positions = [pos for pos in (rebuilt.find('"'), rebuilt.find("'")) if pos != -1]
@@ -812,12 +808,8 @@ class FileReconstructor:
             final_line += '\n'
         
         # Restaurer tous les placeholders de code, empty, astérisques ET tildes restants
-        all_mappings = {**self.mapping, **self.empty_mapping, **self.asterix_mapping, **self.tilde_mapping}
-        sorted_keys = sorted(all_mappings.keys(), key=len, reverse=True)
-        for key in sorted_keys:
-            final_line = final_line.replace(key, all_mappings[key])
-            
-        return final_line
+        # (une passe via l'index compilé au lieu d'un tri + replace par clé à chaque ligne)
+        return self._get_placeholder_index().restore(final_line)
 
     def _post_process_empty_placeholders(self, content):
         """
@@ -827,37 +819,9 @@ class FileReconstructor:
         processed_content = []
         corrections_made = 0
         
-        # Construire les placeholders avec préfixes personnalisés
-        empty_01_placeholder = f"{self.empty_prefix}_01"
-        empty_02_placeholder = f"{self.empty_prefix}_02"
-        narrator_placeholder = f"{self.empty_prefix}_NARRATOR"
-        sep_placeholder = f"{self.empty_prefix}_SEP03"
-        
         for line in content:
-            # NE PAS modifier les lignes commentées
-            if line.strip().startswith('#'):
-                processed_content.append(line)
-                continue
-            
-            original_line = line
-            
-            # Corriger les placeholders avec préfixes personnalisés
-            if empty_01_placeholder in line:
-                line = line.replace(empty_01_placeholder, '""')
-                corrections_made += 1
-            
-            if empty_02_placeholder in line:
-                line = line.replace(empty_02_placeholder, '" "')
-                corrections_made += 1
-                
-            if narrator_placeholder in line:
-                line = line.replace(narrator_placeholder, '"" "')
-                corrections_made += 1
-                
-            if sep_placeholder in line:
-                line = line.replace(sep_placeholder, '" "')
-                corrections_made += 1
-                
+            line, corrections = self._post_process_empty_line(line)
+            corrections_made += corrections
             processed_content.append(line)
         
         if corrections_made > 0:
@@ -865,16 +829,42 @@ class FileReconstructor:
         
         return processed_content
 
+    def _post_process_empty_line(self, line):
+        """Corrige les placeholders EMPTY restants d'une ligne ; retourne (ligne, nombre de corrections)"""
+        # NE PAS modifier les lignes commentées
+        if line.strip().startswith('#'):
+            return line, 0
+        
+        corrections_made = 0
+        # Placeholders avec préfixes personnalisés
+        for placeholder, value in (
+            (f"{self.empty_prefix}_01", '""'),
+            (f"{self.empty_prefix}_02", '" "'),
+            (f"{self.empty_prefix}_NARRATOR", '"" "'),
+            (f"{self.empty_prefix}_SEP03", '" "'),
+        ):
+            if placeholder in line:
+                line = line.replace(placeholder, value)
+                corrections_made += 1
+        
+        return line, corrections_made
+
     def _load_reconstruction_settings(self):
         """Charge les paramètres pour la reconstruction"""
         try:
             from infrastructure.config.config import config_manager
             self.detect_duplicates = config_manager.get('extraction_detect_duplicates', True)
+            self.streaming_mode = config_manager.get('reconstruction_streaming', True)
         except Exception as e:
             log_message("ATTENTION", f"Erreur chargement paramètre reconstruction: {e}", category="reconstruction_options")
             self.detect_duplicates = True
+            self.streaming_mode = True
 
     def _save_reconstructed_file(self, content, save_mode):
+        """
+        Écrit les lignes reconstruites (liste ou générateur) au fil de l'eau dans un fichier
+        temporaire, puis le renomme atomiquement : jamais de fichier à moitié écrit.
+        """
         if save_mode == 'overwrite':
             save_path = self.original_path
         else:
@@ -884,36 +874,48 @@ class FileReconstructor:
         from datetime import datetime
         reconstruction_marker = f"# Fichier reconstruit après traduction par RenExtract le {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
 
-        # Préserver exactement les lignes vides finales du fichier reconstruit.
-        # On insère le marqueur AVANT les lignes vides terminales pour ne pas
-        # modifier la structure de fin de fichier attendue.
-        trailing_empty_count = 0
-        for line in reversed(content):
-            if line.strip() == "":
-                trailing_empty_count += 1
-            else:
-                break
+        # Empreintes des blocs traduits calculées pendant l'écriture (overwrite uniquement)
+        block_hashes = BlockHashBuilder() if save_mode == 'overwrite' else None
+        temp_path = f"{save_path}.tmp"
 
-        if trailing_empty_count > 0:
-            content_without_trailing = content[:-trailing_empty_count]
-            trailing_lines = content[-trailing_empty_count:]
-        else:
-            content_without_trailing = content[:]
-            trailing_lines = []
-
-        # Uniformiser toutes les fins de ligne en CRLF pour compatibilité Ren'Py/Windows.
-        normalized_content = [
-            line.replace('\r\n', '\n').replace('\r', '\n').replace('\n', '\r\n')
-            for line in content_without_trailing
-        ]
-        normalized_content.append(reconstruction_marker.replace('\n', '\r\n'))
-        normalized_content.extend(
-            line.replace('\r\n', '\n').replace('\r', '\n').replace('\n', '\r\n')
-            for line in trailing_lines
-        )
-
-        with open(save_path, "w", encoding="utf-8", newline='') as wf:
-            wf.writelines(normalized_content)
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline='') as wf:
+                def write_line(line):
+                    # Uniformiser toutes les fins de ligne en CRLF pour compatibilité Ren'Py/Windows.
+                    normalized = line.replace('\r\n', '\n').replace('\r', '\n').replace('\n', '\r\n')
+                    wf.write(normalized)
+                    if block_hashes is not None:
+                        block_hashes.add_line(normalized)
+
+                # Préserver exactement les lignes vides finales du fichier reconstruit.
+                # On insère le marqueur AVANT les lignes vides terminales : les lignes vides
+                # sont donc retenues jusqu'à la prochaine ligne non vide.
+                pending_empty = []
+                for line in content:
+                    if line.strip() == "":
+                        pending_empty.append(line)
+                        continue
+                    for empty_line in pending_empty:
+                        write_line(empty_line)
+                    pending_empty.clear()
+                    write_line(line)
+
+                write_line(reconstruction_marker)
+                for empty_line in pending_empty:
+                    write_line(empty_line)
+
+            os.replace(temp_path, save_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            raise
+        
+        # Empreintes des blocs traduits : la prochaine extraction incrémentale les conservera
+        if block_hashes is not None:
+            save_block_manifest(self.original_path, block_hashes=block_hashes.finish())
         
         # Commenter l'original si nouveau fichier
         if save_mode == 'new_file':
@@ -19,6 +19,8 @@ import tempfile
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 from infrastructure.logging.logging import log_message
+from infrastructure.logging.tracing import trace_run, trace_span, worker_span
+from infrastructure.helpers.process_pool import attach_worker_records, iter_process_map
 from infrastructure.config.constants import (
     FOLDERS,
     LEGACY_DEFAULT_LANGUAGE_STARTUP_FILENAME,
@@ -26,9 +28,12 @@ from infrastructure.config.constants import (
     ensure_folders_exist,
 )
 from infrastructure.helpers.unified_functions import get_last_game_directory, set_last_game_directory
+from infrastructure.helpers.process_runner import ProcessRunner
 from core.models.backup.unified_backup_manager import UnifiedBackupManager, BackupType
 from core.tools.sdk_manager import get_sdk_manager
 from core.tools.python_manager import get_python_manager
+from core.services.tools.string_index import MultiStringMatcher
+from core.services.translation.translation_corpus import collect_old_texts
 
 class UnifiedCleaner:
     """
@@ -38,6 +43,13 @@ class UnifiedCleaner:
     AVEC UN SEUL BACKUP PAR FICHIER
     """
 
+    # En dessous de ce nombre de chaînes à vérifier, les recherches directes (en C) restent plus rapides
+    # qu'un parcours de l'automate en Python
+    BATCH_SEARCH_MIN_QUERIES = 300
+    
+    # En dessous de ce nombre de fichiers, le démarrage des processus coûte plus qu'il ne rapporte
+    PARALLEL_MIN_FILES = 20
+
     def __init__(self):
         """Initialise le nettoyeur unifié"""
         self.backup_suffix = ".backup_unified_cleanup"
@@ -49,6 +61,7 @@ class UnifiedCleaner:
         # Cache pour optimiser les recherches de chaînes
         self.game_files_cache = {}  # Cache des fichiers game/
         self.string_search_cache = {}  # Cache des résultats de recherche
+        self.normalized_files_cache = {}  # Contenu normalisé (_deep_normalize) par fichier, le temps d'un nettoyage
         self.last_game_folder_path = None  # Pour détecter les changements de projet
 
     def generate_lint_file(self, renpy_sdk_path: str, project_path: str) -> Optional[str]:
@@ -130,8 +143,7 @@ class UnifiedCleaner:
             # Environnement
             env = os.environ.copy()
             env['PYTHONIOENCODING'] = 'utf-8'
-            
-            import subprocess
+            traceback_abs = os.path.abspath(traceback_path)
             
             for cmd_index, cmd in enumerate(commands_to_try, 1):
                 log_message("INFO", f"Tentative {cmd_index}/{len(commands_to_try)}", category="renpy_generator_clean_tl")
@@ -139,40 +151,24 @@ class UnifiedCleaner:
                 try:
                     work_dir = project_path if cmd_index == 2 else os.path.dirname(renpy_exe)
                     
-                    # ✅ NOUVEAU : Lancer Ren'Py en arrière-plan pour surveiller traceback.txt
-                    import threading
-                    import time
-                    
+                    # Ren'Py lancé avec lecture continue des sorties et surveillance de traceback.txt
                     traceback_detected = False
+                    timed_out = False
                     
-                    def monitor_traceback():
-                        nonlocal traceback_detected
-                        while True:
-                            if os.path.exists(traceback_path):
+                    with ProcessRunner(cmd, cwd=work_dir, env=env, watch_dirs=[project_path]) as runner:
+                        for event in runner.events():
+                            if event.kind == 'file' and event.data == traceback_abs:
                                 traceback_detected = True
                                 log_message("ERREUR", f"traceback.txt détecté pendant l'exécution Ren'Py", category="renpy_generator_clean_tl")
                                 break
-                            time.sleep(0.5)  # Vérifier toutes les 500ms
-                    
-                    # Démarrer la surveillance
-                    monitor_thread = threading.Thread(target=monitor_traceback, daemon=True)
-                    monitor_thread.start()
-                    
-                    # ✅ CORRECTION : Masquer la fenêtre console sur Windows
-                    from infrastructure.helpers.subprocess_helper import get_subprocess_flags
-                    creationflags = get_subprocess_flags()
+                            if event.kind == 'tick' and event.data > 180:
+                                timed_out = True
+                                break
                     
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        cwd=work_dir,
-                        timeout=180,
-                        env=env,
-                        creationflags=creationflags
-                    )
+                    if timed_out:
+                        log_message("ATTENTION", f"Tentative {cmd_index} : Timeout", category="renpy_generator_clean_tl")
+                        continue
                     
-                    # Log du résultat de la commande
                     # ✅ Vérifier si traceback.txt a été généré pendant l'exécution
                     if traceback_detected or os.path.exists(traceback_path):
                         log_message("ERREUR", f"traceback.txt détecté - Erreur Ren'Py lors de la génération lint", category="renpy_generator_clean_tl")
@@ -205,9 +201,6 @@ class UnifiedCleaner:
                                 except Exception:
                                     continue
                     
-                except subprocess.TimeoutExpired:
-                    log_message("ATTENTION", f"Tentative {cmd_index} : Timeout", category="renpy_generator_clean_tl")
-                    continue
                 except Exception as e:
                     log_message("ERREUR", f"Tentative {cmd_index} échouée : {e}", category="renpy_generator_clean_tl")
                     continue
@@ -473,7 +466,7 @@ Statistics:
             return []
 
     def unified_clean(self, lint_file_path: str, game_folder_path: str, tl_folder_path: str, 
-                     selected_languages: List[str]) -> Dict[str, any]:
+                     selected_languages: List[str], max_workers: Optional[int] = None) -> Dict[str, any]:
         """
         Nettoyage unifié avec UN SEUL BACKUP par fichier
         
@@ -482,10 +475,19 @@ Statistics:
             game_folder_path: Chemin vers le dossier game
             tl_folder_path: Chemin vers le dossier tl racine
             selected_languages: Liste des langues sélectionnées à traiter
+            max_workers: Processus pour le mode parallèle (défaut : nombre de cœurs, 1 = séquentiel)
             
         Returns:
             Dict avec les résultats consolidés du nettoyage
         """
+        with trace_run("cleanup", languages=len(selected_languages)) as span:
+            results = self._unified_clean(lint_file_path, game_folder_path, tl_folder_path, selected_languages, max_workers)
+            span.set(files=results['total_files_processed'], blocks_removed=results['total_orphan_blocks_removed'])
+            return results
+
+    def _unified_clean(self, lint_file_path: str, game_folder_path: str, tl_folder_path: str,
+                       selected_languages: List[str], max_workers: Optional[int]) -> Dict[str, any]:
+        """Étapes du nettoyage unifié (voir unified_clean)"""
         # Réinitialiser le cache des backups pour chaque nettoyage
         self.backed_up_files.clear()
         
@@ -498,11 +500,12 @@ Statistics:
             backup_manager = UnifiedBackupManager()
             
             # Créer une sauvegarde ZIP complète du dossier tl
-            backup_result = backup_manager.create_zip_backup(
-                tl_folder_path,
-                BackupType.CLEANUP,
-                f"Sauvegarde ZIP complète avant nettoyage ({len(selected_languages)} langues)"
-            )
+            with trace_span("cleanup.zip_backup"):
+                backup_result = backup_manager.create_zip_backup(
+                    tl_folder_path,
+                    BackupType.CLEANUP,
+                    f"Sauvegarde ZIP complète avant nettoyage ({len(selected_languages)} langues)"
+                )
             
             if backup_result['success']:
                 log_message("INFO", f"✅ Sauvegarde ZIP complète créée avant nettoyage: {backup_result['files_count']} fichiers", category="renpy_generator_clean_tl")
@@ -526,7 +529,24 @@ Statistics:
         }
         
         try:
+            # Lint parsé une seule fois pour tous les fichiers de toutes les langues
+            with trace_span("cleanup.parse_lint"):
+                orphan_ids = self._load_orphan_ids(lint_file_path)
             
+            # Fichiers de chaque langue listés d'avance (ordre déterministe)
+            excluded_files = self._get_excluded_files()
+            log_message("INFO", f"Fichiers exclus du nettoyage (config): {excluded_files if excluded_files else 'Aucun'}", category="renpy_generator_clean_tl")
+            language_files = {}
+            for language in selected_languages:
+                language_folder = os.path.join(tl_folder_path, language)
+                if os.path.exists(language_folder):
+                    language_files[language] = self._list_language_files(language_folder, excluded_files)
+            
+            # Mode parallèle : tous les fichiers de toutes les langues sur un pool de processus
+            parallel_results = None
+            if self._should_clean_in_parallel(language_files, max_workers):
+                with trace_span("cleanup.parallel_pool", files=sum(len(paths) for paths in language_files.values())):
+                    parallel_results = self._clean_languages_parallel(language_files, lint_file_path, game_folder_path, orphan_ids, max_workers)
             
             for language in selected_languages:
                 language_folder = os.path.join(tl_folder_path, language)
@@ -552,7 +572,13 @@ Statistics:
                 
                 try:
                     # Nettoyer le dossier de langue avec backup unifié
-                    cleanup_result = self._clean_language_folder_unified(language_folder, lint_file_path, game_folder_path)
+                    with trace_span("cleanup.language", language=language):
+                        cleanup_result = self._clean_language_folder_unified(
+                            language_folder, lint_file_path, game_folder_path,
+                            orphan_ids=orphan_ids,
+                            file_paths=language_files.get(language),
+                            file_results=parallel_results.get(language) if parallel_results else None
+                        )
                     
                     # Convertir le résultat au format attendu
                     lang_result['lint_cleanup'] = {
@@ -623,8 +649,17 @@ Statistics:
             results['errors'].append(error_msg)
             return results
 
-    def _clean_language_folder_unified(self, language_folder: str, lint_file_path: str, game_folder_path: str) -> Dict[str, any]:
-        """Nettoie tous les fichiers d'un dossier de langue avec un seul backup par fichier"""
+    def _clean_language_folder_unified(self, language_folder: str, lint_file_path: str, game_folder_path: str,
+                                       orphan_ids: Optional[set] = None, file_paths: Optional[List[str]] = None,
+                                       file_results: Optional[List[Dict]] = None) -> Dict[str, any]:
+        """
+        Nettoie tous les fichiers d'un dossier de langue avec un seul backup par fichier
+        
+        Args:
+            orphan_ids: IDs orphelins du lint déjà parsés (sinon parsés par fichier)
+            file_paths: Fichiers déjà listés (sinon parcours du dossier)
+            file_results: Résultats déjà calculés par le mode parallèle (agrégés tels quels)
+        """
         results = {
             'success': True,
             'files_processed': 0,
@@ -637,30 +672,32 @@ Statistics:
         }
         
         try:
-            # Récupérer les fichiers à exclure de la configuration
-            excluded_files = self._get_excluded_files()
-            log_message("INFO", f"Fichiers exclus du nettoyage (config): {excluded_files if excluded_files else 'Aucun'}", category="renpy_generator_clean_tl")
-            
-            for root, dirs, files in os.walk(language_folder):
-                for file in files:
-                    if file.endswith('.rpy'):
-                        # Vérifier si le fichier doit être exclu
-                        if self._should_exclude_file(file, excluded_files):
-                            continue
-                        
-                        file_path = os.path.join(root, file)
-                        result = self._clean_file_unified(file_path, lint_file_path, game_folder_path)
-                        
-                        results['files_processed'] += 1
-                        results['file_results'].append(result)
-                        
-                        if result['success']:
-                            results['files_cleaned'] += 1
-                            results['total_orphan_blocks_removed'] += result['total_blocks_removed']
-                            results['lint_blocks_removed'] += result.get('lint_blocks_removed', 0)
-                            results['string_blocks_removed'] += result.get('string_blocks_removed', 0)
-                        else:
-                            results['errors'].append(result['error'])
+            if file_paths is None:
+                # Récupérer les fichiers à exclure de la configuration
+                excluded_files = self._get_excluded_files()
+                log_message("INFO", f"Fichiers exclus du nettoyage (config): {excluded_files if excluded_files else 'Aucun'}", category="renpy_generator_clean_tl")
+                file_paths = self._list_language_files(language_folder, excluded_files)
+            
+            if file_results is None:
+                # Toutes les chaînes old de la langue vérifiées en un seul parcours des sources du jeu
+                self._prefetch_string_searches(file_paths, game_folder_path)
+                file_results = (self._clean_file_unified(file_path, lint_file_path, game_folder_path, orphan_ids)
+                                for file_path in file_paths)
+            
+            for result in file_results:
+                if result.get('backup_path'):
+                    self.backed_up_files[result['file_path']] = result['backup_path']
+                
+                results['files_processed'] += 1
+                results['file_results'].append(result)
+                
+                if result['success']:
+                    results['files_cleaned'] += 1
+                    results['total_orphan_blocks_removed'] += result['total_blocks_removed']
+                    results['lint_blocks_removed'] += result.get('lint_blocks_removed', 0)
+                    results['string_blocks_removed'] += result.get('string_blocks_removed', 0)
+                else:
+                    results['errors'].append(result['error'])
             
             return results
             
@@ -670,6 +707,75 @@ Statistics:
             results['errors'].append(str(e))
             return results
 
+    def _list_language_files(self, language_folder: str, excluded_files: List[str]) -> List[str]:
+        """Fichiers .rpy à nettoyer d'un dossier de langue, triés (ordre identique d'une exécution à l'autre)"""
+        file_paths = []
+        for root, dirs, files in os.walk(language_folder):
+            dirs.sort()
+            for file in sorted(files):
+                if file.endswith('.rpy'):
+                    # Vérifier si le fichier doit être exclu
+                    if self._should_exclude_file(file, excluded_files):
+                        continue
+                    file_paths.append(os.path.join(root, file))
+        return file_paths
+
+    def _load_orphan_ids(self, lint_file_path: str) -> Optional[set]:
+        """IDs orphelins du lint (ensemble), ou None si le lint est absent"""
+        if not lint_file_path or not os.path.exists(lint_file_path):
+            return None
+        orphan_ids = set(self._parse_lint_file(lint_file_path))
+        log_message("INFO", f"Lint analysé une seule fois : {len(orphan_ids)} IDs orphelins", category="renpy_generator_clean_tl")
+        return orphan_ids
+
+    def _should_clean_in_parallel(self, language_files: Dict[str, List[str]], max_workers: Optional[int]) -> bool:
+        """Le mode parallèle n'est utilisé que s'il est activé et que le volume le justifie"""
+        try:
+            from infrastructure.config.config import config_manager
+            if not config_manager.get('cleanup_parallel', True):
+                return False
+        except Exception:
+            pass
+        
+        total_files = sum(len(paths) for paths in language_files.values())
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        return workers > 1 and total_files >= self.PARALLEL_MIN_FILES
+
+    def _clean_languages_parallel(self, language_files: Dict[str, List[str]], lint_file_path: str,
+                                  game_folder_path: str, orphan_ids: Optional[set],
+                                  max_workers: Optional[int]) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Nettoie les fichiers de toutes les langues sur un pool de processus.
+        
+        Les chaînes old sont résolues d'abord dans ce processus (une passe sur game/) : les
+        workers reçoivent uniquement les IDs orphelins et les résultats de recherche, en lecture seule.
+        
+        Returns:
+            {langue: [résultat par fichier, dans l'ordre des fichiers]}
+        """
+        tasks = [(language, file_path) for language, paths in language_files.items() for file_path in paths]
+        if not tasks:
+            return {}
+        
+        all_files = [file_path for _, file_path in tasks]
+        with trace_span("cleanup.string_searches", files=len(all_files)):
+            self._prefetch_string_searches(all_files, game_folder_path, resolve_all=True)
+        
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        workers = max(1, min(int(workers), len(tasks)))
+        log_message("INFO", f"⚡ Nettoyage parallèle : {len(tasks)} fichiers, {len(language_files)} langues, {workers} processus", category="renpy_generator_clean_tl")
+        
+        results_by_language = {language: [] for language in language_files}
+        worker_tasks = [(file_path, lint_file_path, game_folder_path) for _, file_path in tasks]
+        file_results = iter_process_map(_clean_file_worker, worker_tasks, workers,
+                                        initializer=_init_clean_worker,
+                                        initargs=(game_folder_path, orphan_ids, dict(self.string_search_cache)),
+                                        label="Nettoyage parallèle", category="renpy_generator_clean_tl")
+        # Résultats dans l'ordre des tâches, donc agrégation déterministe
+        for (language, _), result in zip(tasks, file_results):
+            results_by_language[language].append(result)
+        return results_by_language
+
     def _get_excluded_files(self) -> List[str]:
         """Récupère la liste des fichiers à exclure depuis la configuration"""
         try:
@@ -743,7 +849,8 @@ Statistics:
         # Retourner None pour indiquer qu'aucune sauvegarde individuelle n'est nécessaire
         return None
 
-    def _clean_file_unified(self, file_path: str, lint_file_path: str, game_folder_path: str) -> Dict[str, any]:
+    def _clean_file_unified(self, file_path: str, lint_file_path: str, game_folder_path: str,
+                            orphan_ids: Optional[set] = None) -> Dict[str, any]:
         """
         Nettoie un fichier avec les deux méthodes en créant un seul backup
         VERSION CORRIGÉE - Sans modification des chemins comme dans le système de cohérence
@@ -752,6 +859,7 @@ Statistics:
             file_path: Chemin du fichier à nettoyer (utilisé tel quel)
             lint_file_path: Chemin vers lint.txt
             game_folder_path: Chemin vers le dossier game
+            orphan_ids: IDs orphelins déjà parsés (sinon le lint est parsé ici)
             
         Returns:
             Dict avec les résultats consolidés du nettoyage
@@ -781,9 +889,10 @@ Statistics:
             string_blocks_removed = 0
             
             # Étape 1: Nettoyage basé sur lint.txt
-            if os.path.exists(lint_file_path):
+            if orphan_ids is not None or os.path.exists(lint_file_path):
                 try:
-                    orphan_ids = self._parse_lint_file(lint_file_path)
+                    if orphan_ids is None:
+                        orphan_ids = self._parse_lint_file(lint_file_path)
                     if orphan_ids:
                         current_lines, removed_blocks = self._clean_blocks_with_lint(current_lines, orphan_ids)
                         lint_blocks_removed = len(removed_blocks)
@@ -915,6 +1024,9 @@ Statistics:
         if not orphan_ids:
             return lines, []
         
+        if not isinstance(orphan_ids, (set, frozenset)):
+            orphan_ids = set(orphan_ids)
+        
         # Détecter tous les blocs translate
         blocks = self._detect_translate_blocks_for_lint(lines)
                 
@@ -1307,6 +1419,43 @@ Statistics:
             log_message("ATTENTION", f"Erreur lors de la recherche de '{search_text[:50]}...' : {e}", category="renpy_generator_clean_tl")
             return True  # En cas d'erreur, on conserve le bloc par sécurité
     
+    def _prefetch_string_searches(self, file_paths: List[str], game_folder_path: str, resolve_all: bool = False):
+        """
+        Résout en une passe toutes les chaînes old des fichiers d'une langue :
+        automate construit sur les chaînes, un seul parcours des fichiers game/,
+        résultats versés dans string_search_cache (même sémantique que _string_exists_in_game).
+        
+        resolve_all: résoudre aussi les petits lots (recherches directes) pour que
+        string_search_cache soit complet avant l'envoi aux workers.
+        """
+        try:
+            if (self.last_game_folder_path != game_folder_path or 
+                not self.game_files_cache):
+                self._load_game_files_cache(game_folder_path)
+            
+            # Lignes old servies par le corpus de la langue (seuls les fichiers modifiés sont relus)
+            queries = set()
+            for old_texts in collect_old_texts(file_paths).values():
+                for old_text in old_texts:
+                    if old_text not in self.string_search_cache:
+                        queries.add(old_text)
+            
+            if len(queries) < self.BATCH_SEARCH_MIN_QUERIES or not self.game_files_cache:
+                if resolve_all:
+                    for query in queries:
+                        self._string_exists_in_game(query, game_folder_path)
+                return
+            
+            found = MultiStringMatcher(queries).find_present(self.game_files_cache.values())
+            for query in queries:
+                self.string_search_cache[query] = query in found
+            
+            log_message("INFO", f"🔎 Recherche groupée: {len(queries)} chaînes vérifiées en une passe ({len(found)} présentes, {len(queries) - len(found)} orphelines)", category="renpy_generator_clean_tl")
+            
+        except Exception as e:
+            # Les recherches individuelles prendront le relais
+            log_message("ATTENTION", f"Recherche groupée des chaînes impossible: {e}", category="renpy_generator_clean_tl")
+    
     def _load_game_files_cache(self, game_folder_path: str):
         """Charge tous les fichiers .rpy du dossier game/ en mémoire pour des recherches rapides"""
         try:
@@ -1314,7 +1463,8 @@ Statistics:
             
             # Essayer de charger depuis le cache persistant
             project_path = os.path.dirname(game_folder_path)  # Remonter au dossier projet
-            cached_data = cache_manager.get_game_files_cache(project_path)
+            # Vue revalidée fichier par fichier (fichiers modifiés relus, nouveaux fichiers ajoutés)
+            cached_data = cache_manager.get_game_files_cache(project_path, game_folder_path)
             
             if cached_data:
                 # Cache persistant trouvé, l'utiliser
@@ -1327,8 +1477,9 @@ Statistics:
             # Pas de cache persistant, charger depuis le disque
             log_message("INFO", f"🔄 Chargement du cache des fichiers game/ ({game_folder_path})", category="renpy_generator_clean_tl")
             
-            self.game_files_cache.clear()
-            self.string_search_cache.clear()
+            # Nouveaux dictionnaires : la vue du cache persistant est partagée, ne pas la modifier
+            self.game_files_cache = {}
+            self.string_search_cache = {}
             self.last_game_folder_path = game_folder_path
             
             files_loaded = 0
@@ -1354,7 +1505,7 @@ Statistics:
             
         except Exception as e:
             log_message("ERREUR", f"Erreur lors du chargement du cache: {e}", category="renpy_generator_clean_tl")
-            self.game_files_cache.clear()
+            self.game_files_cache = {}
     
     def _clear_cache(self):
         """Nettoie le cache pour libérer la mémoire"""
@@ -1369,8 +1520,9 @@ Statistics:
                 project_path = os.path.dirname(self.last_game_folder_path)
                 cache_manager.set_string_search_cache(project_path, self.string_search_cache)
             
-            self.game_files_cache.clear()
-            self.string_search_cache.clear()
+            self.game_files_cache = {}
+            self.string_search_cache = {}
+            self.normalized_files_cache = {}
             self.last_game_folder_path = None
             
             log_message("DEBUG", f"🧹 Cache nettoyé: {cache_size} fichiers, {search_cache_size} recherches", category="renpy_generator_clean_tl")
@@ -1381,8 +1533,10 @@ Statistics:
     def _search_in_file(self, search_text: str, file_path: str) -> bool:
         """Cherche une chaîne dans un fichier avec gestion robuste des échappements"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.game_files_cache.get(file_path)
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
             if not content.strip():
                 return False
@@ -1406,7 +1560,10 @@ Statistics:
             
             # MÉTHODE 3 : Recherche floue (ignorer différences d'échappement)
             normalized_search = self._deep_normalize(search_text)
-            normalized_content = self._deep_normalize(content)
+            normalized_content = self.normalized_files_cache.get(file_path)
+            if normalized_content is None:
+                normalized_content = self._deep_normalize(content)
+                self.normalized_files_cache[file_path] = normalized_content
             
             if normalized_search in normalized_content:
                 return True
@@ -1640,10 +1797,33 @@ Statistics:
         
         return normalized_lines
 
+# ===== NETTOYAGE PARALLÈLE (WORKERS) =====
+
+_worker_cleaner = None
+_worker_orphan_ids = None
+
+
+def _init_clean_worker(game_folder_path: str, orphan_ids: Optional[set], string_search_results: Dict[str, bool]):
+    """Initialise le nettoyeur d'un processus worker avec les données partagées en lecture seule"""
+    global _worker_cleaner, _worker_orphan_ids
+    _worker_cleaner = UnifiedCleaner()
+    _worker_cleaner.string_search_cache = string_search_results
+    _worker_orphan_ids = orphan_ids
+
+
+def _clean_file_worker(task: Tuple[str, str, str]) -> Dict[str, any]:
+    """Worker (processus séparé) : nettoie un fichier avec les IDs orphelins et recherches déjà résolus"""
+    file_path, lint_file_path, game_folder_path = task
+    with worker_span("cleanup.file", file=os.path.basename(file_path)):
+        result = _worker_cleaner._clean_file_unified(file_path, lint_file_path, game_folder_path, _worker_orphan_ids)
+    # Spans et messages de log du processus worker, rapatriés avec le résultat
+    return attach_worker_records(result)
+
+
 # ===== FONCTIONS UTILITAIRES SIMPLIFIÉES =====
 
 def unified_clean_all_translations(lint_file_path: str, game_folder_path: str, tl_folder_path: str, 
-                                  selected_languages: List[str]) -> Dict[str, any]:
+                                  selected_languages: List[str], max_workers: Optional[int] = None) -> Dict[str, any]:
     """
     Fonction utilitaire pour le nettoyage unifié de toutes les traductions
     
@@ -1652,12 +1832,13 @@ def unified_clean_all_translations(lint_file_path: str, game_folder_path: str, t
         game_folder_path: Chemin vers le dossier game
         tl_folder_path: Chemin vers le dossier tl racine
         selected_languages: Liste des langues sélectionnées à traiter
+        max_workers: Processus pour le mode parallèle (défaut : nombre de cœurs, 1 = séquentiel)
         
     Returns:
         Dict avec les résultats consolidés du nettoyage
     """
     cleaner = UnifiedCleaner()
-    return cleaner.unified_clean(lint_file_path, game_folder_path, tl_folder_path, selected_languages)
+    return cleaner.unified_clean(lint_file_path, game_folder_path, tl_folder_path, selected_languages, max_workers)
 
 def scan_available_languages(tl_folder_path: str) -> List[str]:
     """
@@ -12,13 +12,18 @@ Système unifié de vérification de cohérence
 """
 
 import os
+import io
 import re
 import glob
+import json
 import time
+import hashlib
 import webbrowser
 from urllib.parse import quote
 from datetime import datetime
 from infrastructure.logging.logging import log_message
+from infrastructure.logging.tracing import trace_run, trace_span, trace_counter, worker_span
+from infrastructure.helpers.process_pool import attach_worker_records, iter_process_map
 from infrastructure.config.constants import (
     LEGACY_DEFAULT_LANGUAGE_STARTUP_FILENAME,
     RENEXTRACT_DEFAULT_LANGUAGE_STARTUP_FILENAME,
@@ -27,11 +32,26 @@ from infrastructure.config.config import config_manager
 from infrastructure.config.constants import FOLDERS, ensure_folders_exist
 from infrastructure.helpers.unified_functions import extract_game_name
 from core.services.reporting.coherence_html_report_generator import create_html_coherence_report
+from core.services.tools.coherence_rules import CoherenceRuleEngine
 from ui.shared.project_widgets import ProjectLanguageSelector
 
 class UnifiedCoherenceChecker:
     """Vérificateur de cohérence unifié avec options configurables"""
     
+    # En dessous de ce nombre de fichiers à analyser, le démarrage d'un pool coûte plus qu'il ne rapporte
+    PARALLEL_MIN_FILES = 20
+    
+    # À incrémenter quand la logique des contrôles change (invalide les résultats en cache)
+    RESULTS_CACHE_VERSION = 3
+    
+    # Attributs d'options transmis aux workers et intégrés à l'empreinte du cache
+    OPTION_ATTRIBUTES = (
+        'check_variables', 'check_tags', 'check_tags_content', 'check_escape_sequences',
+        'check_line_structure', 'check_untranslated', 'untranslated_threshold_percent',
+        'check_ellipsis', 'check_percentages', 'check_quotations', 'check_parentheses',
+        'check_syntax', 'check_deepl_ellipsis', 'check_isolated_percent', 'check_length_difference'
+    )
+    
     def __init__(self):
         """Initialisation nettoyée du checker de cohérence"""
         self.start_time = None
@@ -39,6 +59,7 @@ class UnifiedCoherenceChecker:
         self.files_analyzed = 0
         self.results_by_file = {}
         self.project_path = None  # 🆕 Stocke le chemin du projet pour les exclusions
+        self._line_exclusions = None  # Exclusions du projet figées pour la durée d'une analyse
         
         # Chargement des options depuis la config (avec valeurs par défaut True)
         # Note : Les 4 options critiques (variables, tags, escape_sequences, line_structure) 
@@ -74,20 +95,32 @@ class UnifiedCoherenceChecker:
         # Exclusions de fichiers depuis la config
         self.excluded_files = config_manager.get('coherence_excluded_files')
         
+        # Règles de cohérence (balises, variables, placeholders...) appliquées selon les options
+        self.rule_engine = CoherenceRuleEngine()
+        self.rule_engine.configure(self)
+        
         log_message("DEBUG", f"Options cohérence: variables={self.check_variables}, tags={self.check_tags}, untranslated={self.check_untranslated}, ellipsis={self.check_ellipsis}, escape={self.check_escape_sequences}, percent={self.check_percentages}, quotes={self.check_quotations}, parens={self.check_parentheses}, syntax={self.check_syntax}, deepl={self.check_deepl_ellipsis}, isolated={self.check_isolated_percent}, length={self.check_length_difference}, structure={self.check_line_structure}", category="coherence_options")
         log_message("DEBUG", f"Fichiers exclus: {config_manager.get('coherence_excluded_files')}", category="coherence_options")
     
-    def analyze_path(self, path, return_details=False):
+    def analyze_path(self, path, return_details=False, max_workers=None):
         """
         Analyse un fichier ou un dossier avec la logique unifiée
         
         Args:
             path (str): Chemin du fichier .rpy ou dossier tl
             return_details (bool): Si True, retourne les détails pour l'interface
+            max_workers (int): Processus pour le mode parallèle (défaut : nombre de cœurs, 1 = séquentiel)
             
         Returns:
             str ou dict: Chemin du rapport ou détails selon return_details
         """
+        with trace_run("coherence", path=os.path.basename(os.path.normpath(path)) if path else '') as span:
+            result = self._analyze_path(path, return_details, max_workers)
+            span.set(files=self.files_analyzed, issues=self.total_issues)
+            return result
+
+    def _analyze_path(self, path, return_details, max_workers):
+        """Étapes de l'analyse (voir analyze_path)"""
         # MODIFICATION N°1 : On mémorise le chemin d'origine ici
         self.original_analysis_path = path
         
@@ -114,30 +147,14 @@ class UnifiedCoherenceChecker:
                 return None if not return_details else {'error': 'Aucun fichier trouvé'}
             
             # Analyser tous les fichiers avec la même logique
-            excluded_files = []
-            for file_path in files_to_analyze:
-                if self._should_exclude_file(file_path):
-                    excluded_files.append(os.path.basename(file_path))
-                    continue
-                    
-                file_results = self._analyze_single_file(file_path)
-                if file_results['issues']:
-                    # relative_path = os.path.relpath(file_path, analysis_root)
-                    self.results_by_file[file_path] = file_results
-                    # self.results_by_file[relative_path] = file_results
-                    self.total_issues += len(file_results['issues'])
-                
-                self.files_analyzed += 1
-            
-            # Log des fichiers exclus sur une seule ligne
-            if excluded_files:
-                log_message("DEBUG", f"Fichiers système exclus automatiquement: {', '.join(excluded_files)}", category="file_exclusion")
+            self._analyze_files(files_to_analyze, max_workers)
             
             # Générer le rapport unifié
             execution_time = time.time() - self.start_time
             
             # MODIFICATION N°2 : On retire 'analysis_root' de l'appel
-            rapport_path = self._create_unified_report(execution_time)
+            with trace_span("coherence.report"):
+                rapport_path = self._create_unified_report(execution_time)
             
             # Auto-ouverture gérée dans _create_unified_report() pour éviter la duplication
             
@@ -186,6 +203,157 @@ class UnifiedCoherenceChecker:
             log_message("ERREUR", f"Erreur recherche fichiers dans '{folder_path}': {e}", category="file_search")
             return []
 
+    def _analyze_files(self, files_to_analyze, max_workers=None):
+        """
+        Analyse une liste de fichiers et agrège les résultats (results_by_file, total_issues, files_analyzed).
+        
+        - Résultats par fichier réutilisés depuis le cache s'il a le même contenu (sha1),
+          les mêmes options et les mêmes exclusions de lignes
+        - Fichiers restants analysés sur un pool de processus si le volume le justifie
+        - Agrégation dans l'ordre des fichiers, quel que soit le mode
+        """
+        excluded_files = []
+        candidates = []
+        for file_path in files_to_analyze:
+            if self._should_exclude_file(file_path):
+                excluded_files.append(os.path.basename(file_path))
+                continue
+            candidates.append(file_path)
+        
+        # Log des fichiers exclus sur une seule ligne
+        if excluded_files:
+            log_message("DEBUG", f"Fichiers système exclus automatiquement: {', '.join(excluded_files)}", category="file_exclusion")
+        
+        self.rule_engine.configure(self)
+        self._line_exclusions = self._load_line_exclusions()
+        try:
+            use_cache = config_manager.get('coherence_results_cache', True)
+            fingerprint = self._get_analysis_fingerprint()
+            cached_entries = self._load_cached_results(fingerprint) if use_cache else {}
+            
+            results = {}
+            digests = {}
+            pending = []  # (chemin, contenu) à analyser
+            with trace_span("coherence.read_sources", files=len(candidates)):
+                for file_path in candidates:
+                    digest, content = self._read_analysis_source(file_path)
+                    cached = cached_entries.get(file_path)
+                    if digest and cached and cached.get('sha1') == digest:
+                        results[file_path] = cached['result']
+                        continue
+                    digests[file_path] = digest
+                    pending.append((file_path, content))
+            
+            if candidates:
+                log_message("DEBUG", f"Cohérence : {len(candidates) - len(pending)} fichier(s) repris du cache, {len(pending)} à analyser", category="coherence_analysis")
+                trace_counter("coherence.cached_files", len(candidates) - len(pending))
+            
+            with trace_span("coherence.analyze_files", files=len(pending)):
+                analyzed = None
+                if self._should_analyze_in_parallel(len(pending), max_workers):
+                    analyzed = self._analyze_files_parallel(pending, max_workers)
+                if analyzed is None:
+                    analyzed = [self._analyze_single_file(file_path, content) for file_path, content in pending]
+            
+            for (file_path, _), file_results in zip(pending, analyzed):
+                results[file_path] = file_results
+                # Fichier illisible : pas de mise en cache, nouvelle tentative au prochain passage
+                if digests[file_path]:
+                    cached_entries[file_path] = {'sha1': digests[file_path], 'result': file_results}
+            
+            if use_cache and pending:
+                self._save_cached_results(fingerprint, cached_entries)
+        finally:
+            self._line_exclusions = None
+        
+        for file_path in candidates:
+            file_results = results[file_path]
+            if file_results['issues']:
+                self.results_by_file[file_path] = file_results
+                self.total_issues += len(file_results['issues'])
+            
+            self.files_analyzed += 1
+
+    def _read_analysis_source(self, file_path):
+        """Lit un fichier à analyser : (sha1 du contenu brut, texte), ou (None, None) si illisible"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            return hashlib.sha1(data).hexdigest(), data.decode('utf-8')
+        except Exception:
+            # L'erreur sera rapportée (FILE_ERROR) par _analyze_single_file
+            return None, None
+
+    def get_options_snapshot(self):
+        """Options de contrôle actives (transmises aux workers, intégrées à l'empreinte du cache)"""
+        return {name: getattr(self, name) for name in self.OPTION_ATTRIBUTES}
+
+    def _apply_options_snapshot(self, snapshot):
+        for name, value in snapshot.items():
+            setattr(self, name, value)
+        self.rule_engine.configure(self)
+
+    def _load_line_exclusions(self):
+        """Exclusions de lignes du projet courant (lues une fois par analyse)"""
+        if not self.project_path:
+            return []
+        try:
+            return config_manager.get_coherence_exclusions(self.project_path) or []
+        except Exception as e:
+            log_message("ATTENTION", f"Exclusions de cohérence illisibles: {e}", category="coherence_analysis")
+            return []
+
+    def _get_analysis_fingerprint(self):
+        """Empreinte des options et des exclusions : tout changement invalide les résultats en cache"""
+        exclusions = [
+            (excl.get('file', ''), excl.get('line', 0), excl.get('text', '').strip())
+            for excl in (self._line_exclusions or [])
+        ]
+        payload = {
+            'version': self.RESULTS_CACHE_VERSION,
+            'options': self.get_options_snapshot(),
+            'exclusions': sorted(exclusions, key=repr)
+        }
+        return hashlib.sha1(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def _load_cached_results(self, fingerprint):
+        try:
+            from core.models.cache.cache_manager import cache_manager
+            return cache_manager.get_coherence_results_cache(self.project_path or '', fingerprint)
+        except Exception as e:
+            log_message("DEBUG", f"Cache cohérence indisponible: {e}", category="coherence_analysis")
+            return {}
+
+    def _save_cached_results(self, fingerprint, entries):
+        try:
+            from core.models.cache.cache_manager import cache_manager
+            cache_manager.set_coherence_results_cache(self.project_path or '', fingerprint, entries)
+        except Exception as e:
+            log_message("DEBUG", f"Cache cohérence non sauvegardé: {e}", category="coherence_analysis")
+
+    def _should_analyze_in_parallel(self, file_count, max_workers):
+        """Le mode parallèle n'est utilisé que s'il est activé et que le volume le justifie"""
+        if not config_manager.get('coherence_parallel', True):
+            return False
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        return workers > 1 and file_count >= self.PARALLEL_MIN_FILES
+
+    def _analyze_files_parallel(self, pending, max_workers):
+        """
+        Analyse les fichiers sur un pool de processus.
+        
+        Returns:
+            Résultats dans l'ordre de pending, donc rapport déterministe
+        """
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        workers = max(1, min(int(workers), len(pending)))
+        log_message("INFO", f"⚡ Analyse de cohérence parallèle : {len(pending)} fichiers, {workers} processus", category="coherence_analysis")
+        
+        return list(iter_process_map(_analyze_file_worker, pending, workers,
+                                     initializer=_init_coherence_worker,
+                                     initargs=(self.get_options_snapshot(), self.project_path, self._line_exclusions),
+                                     label="Analyse de cohérence parallèle", category="coherence_analysis"))
+
     def _should_exclude_file(self, file_path):
         """Vérifie si un fichier doit être exclu de l'analyse - VERSION AVEC EXCLUSION AUTOMATIQUE"""
         filename = os.path.basename(file_path).lower()
@@ -220,8 +388,13 @@ class UnifiedCoherenceChecker:
         
         return False
     
-    def _analyze_single_file(self, file_path):
-        """Analyse un fichier unique avec gestion correcte des lignes voice"""
+    def _analyze_single_file(self, file_path, content=None):
+        """
+        Analyse un fichier unique avec gestion correcte des lignes voice
+        
+        Args:
+            content (str): Contenu déjà lu (sinon lecture du fichier)
+        """
         results = {
             'file_path': file_path,
             'issues': [],
@@ -229,8 +402,12 @@ class UnifiedCoherenceChecker:
         }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+            else:
+                # newline=None : mêmes fins de ligne que la lecture en mode texte
+                lines = io.StringIO(content, newline=None).readlines()
             
             old_line = None
             old_line_num = 0
@@ -406,84 +583,9 @@ class UnifiedCoherenceChecker:
             })
             return issues  # Arrêt immédiat si non traduit
         
-        # 2. Vérifier les balises {} (si activé) - PRIORITÉ HAUTE
-        if self.check_tags:
-            tag_issues = self._check_tags_coherence(old_text, new_text, old_line_num, new_line_num)
-            if tag_issues:
-                return tag_issues  # Arrêt dès qu'on trouve une erreur de balise
-        
-        # 2bis. Vérifier la traduction du contenu entre balises (si activé)
-        if self.check_tags_content:
-            tag_content_issues = self._check_tags_content_translation(old_text, new_text, old_line_num, new_line_num)
-            if tag_content_issues:
-                return tag_content_issues  # Arrêt dès qu'on trouve du contenu non traduit
-        
-        # 3. Vérifier les variables [] (si activé) - PRIORITÉ HAUTE
-        if self.check_variables:
-            var_issues = self._check_variables_coherence(old_text, new_text, old_line_num, new_line_num)
-            if var_issues:
-                return var_issues  # Arrêt dès qu'on trouve une erreur de variable
-        
-        # 4. Vérifier les séquences d'échappement (si activé) - PRIORITÉ MOYENNE
-        if self.check_escape_sequences:
-            escape_issues = self._check_escape_sequences_coherence(old_text, new_text, old_line_num, new_line_num)
-            if escape_issues:
-                return escape_issues
-        
-        # 5. ⭐ Vérifier les placeholders (OBLIGATOIRE - NON CONFIGURABLE) - PRIORITÉ HAUTE
-        placeholder_issues = self._check_placeholders_coherence(old_text, new_text, old_line_num, new_line_num)
-        if placeholder_issues:
-            return placeholder_issues
-        
-        # 6. Vérifier les pourcentages (si activé) - PRIORITÉ MOYENNE
-        if self.check_percentages:
-            percent_issues = self._check_percentages_coherence(old_text, new_text, old_line_num, new_line_num)
-            if percent_issues:
-                return percent_issues
-        
-        # 7. Vérifier les guillemets (si activé) - PRIORITÉ MOYENNE
-        if self.check_quotations:
-            quote_issues = self._check_quotations_coherence(old_text, new_text, old_line_num, new_line_num)
-            if quote_issues:
-                return quote_issues
-        
-        # 8. Vérifier les parenthèses (si activé) - PRIORITÉ BASSE
-        if self.check_parentheses:
-            paren_issues = self._check_parentheses_coherence(old_text, new_text, old_line_num, new_line_num)
-            if paren_issues:
-                return paren_issues
-        
-        # 9. Vérifier la syntaxe (si activé) - PRIORITÉ BASSE
-        if self.check_syntax:
-            syntax_issues = self._check_syntax_coherence(old_text, new_text, old_line_num, new_line_num)
-            if syntax_issues:
-                return syntax_issues
-        
-        # 10. Vérifier les ellipses DeepL (si activé) - PRIORITÉ BASSE
-        if self.check_deepl_ellipsis:
-            deepl_issues = self._check_deepl_ellipsis_coherence(old_text, new_text, old_line_num, new_line_num)
-            if deepl_issues:
-                return deepl_issues
-        
-        # 11. Vérifier les pourcentages isolés (si activé) - PRIORITÉ BASSE
-        if self.check_isolated_percent:
-            isolated_issues = self._check_isolated_percent_coherence(old_text, new_text, old_line_num, new_line_num)
-            if isolated_issues:
-                return isolated_issues
-        
-        # 12. Vérifier la structure des lignes (si activé) - PRIORITÉ TRÈS BASSE
-        if self.check_line_structure:
-            structure_issues = self._check_line_structure_coherence(old_text, new_text, old_line_num, new_line_num)
-            if structure_issues:
-                return structure_issues
-        
-        # 13. Vérifier la différence de longueur (si activé) - PRIORITÉ INDICATIVE
-        if self.check_length_difference:
-            length_issues = self._check_length_difference_coherence(old_text, new_text, old_line_num, new_line_num)
-            if length_issues:
-                return length_issues
-        
-        return issues  # Aucune erreur trouvée
+        # 2 à 13. Règles de cohérence actives, par priorité (balises, variables, échappements,
+        # placeholders obligatoires, pourcentages, guillemets... jusqu'à la différence de longueur)
+        return self.rule_engine.run(old_text, new_text, new_line_num)
     
     def _is_excluded_line(self, file_path, line_num, old_text):
         """
@@ -510,7 +612,9 @@ class UnifiedCoherenceChecker:
         if not self.project_path:
             return False
         
-        exclusions = config_manager.get_coherence_exclusions(self.project_path)
+        exclusions = self._line_exclusions
+        if exclusions is None:
+            exclusions = config_manager.get_coherence_exclusions(self.project_path)
         if not exclusions:
             return False
         
@@ -626,538 +730,6 @@ class UnifiedCoherenceChecker:
         
         return False
     
-    def _check_variables_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie la cohérence des variables []"""
-        issues = []
-        
-        try:
-            old_vars = re.findall(r'\[[^\]]*\]', old_text)
-            new_vars = re.findall(r'\[[^\]]*\]', new_text)
-            
-            # Normaliser les variables (enlever les fonctions !t, !u, etc.)
-            old_vars_norm = [self._normalize_variable(var) for var in old_vars]
-            new_vars_norm = [self._normalize_variable(var) for var in new_vars]
-            
-            if sorted(old_vars_norm) != sorted(new_vars_norm):
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'VARIABLE_MISMATCH',
-                    'description': f"Variables incohérentes => Attendu: {old_vars}, Présent: {new_vars}",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_tags_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie la cohérence des balises {}"""
-        issues = []
-        
-        try:
-            old_tags = re.findall(r'\{[^}]*\}', old_text)
-            new_tags = re.findall(r'\{[^}]*\}', new_text)
-            
-            if old_tags != new_tags:
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'TAG_MISMATCH',
-                    'description': f"Balises incohérentes => Attendu: {old_tags}, Présent: {new_tags}",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_tags_content_translation(self, old_text, new_text, old_line_num, new_line_num):
-        """
-        Vérifie si le contenu entre les balises Ren'Py a bien été traduit.
-        
-        Exemple:
-        OLD: {b}you{/b} are welcome
-        NEW: {b}you{/b} êtes les bienvenus  ❌ "you" n'a pas été traduit
-        NEW: {b}vous{/b} êtes les bienvenus  ✅ "you" → "vous"
-        """
-        issues = []
-        
-        try:
-            # Pattern pour extraire les paires de balises avec leur contenu
-            # Format: {tag}contenu{/tag}
-            tag_pattern = r'\{([a-zA-Z_][a-zA-Z0-9_]*)[^}]*\}(.*?)\{/\1\}'
-            
-            old_contents = {}  # {tag: [contenus]}
-            new_contents = {}  # {tag: [contenus]}
-            
-            # Extraire tous les contenus entre balises dans OLD
-            for match in re.finditer(tag_pattern, old_text):
-                tag_name = match.group(1)
-                content = match.group(2).strip()
-                if content:  # Ignorer les contenus vides
-                    if tag_name not in old_contents:
-                        old_contents[tag_name] = []
-                    old_contents[tag_name].append(content)
-            
-            # Extraire tous les contenus entre balises dans NEW
-            for match in re.finditer(tag_pattern, new_text):
-                tag_name = match.group(1)
-                content = match.group(2).strip()
-                if content:  # Ignorer les contenus vides
-                    if tag_name not in new_contents:
-                        new_contents[tag_name] = []
-                    new_contents[tag_name].append(content)
-            
-            # Balises purement techniques (identifiants de jeu, pas du texte à traduire)
-            technical_tag_names = frozenset({'ctml', 'id'})
-
-            # Comparer les contenus pour chaque type de balise
-            for tag_name in old_contents:
-                if tag_name.lower() in technical_tag_names:
-                    continue
-                if tag_name not in new_contents:
-                    continue  # Balise absente, sera détecté par _check_tags_coherence
-                
-                old_tag_contents = old_contents[tag_name]
-                new_tag_contents = new_contents[tag_name]
-                
-                # Comparer chaque occurrence
-                for i, old_content in enumerate(old_tag_contents):
-                    if i >= len(new_tag_contents):
-                        break  # Plus de contenus correspondants dans NEW
-                    
-                    new_content = new_tag_contents[i]
-                    
-                    # Identifiants techniques (ex. day1_phonetruck) : inchangés volontairement
-                    if re.fullmatch(r'[a-z][a-z0-9_]*', old_content, re.I) and (
-                        '_' in old_content or any(ch.isdigit() for ch in old_content)
-                    ):
-                        continue
-                    
-                    # Vérifier si le contenu est identique (pas traduit)
-                    # Ignorer la casse et les espaces pour la comparaison
-                    if old_content.lower().strip() == new_content.lower().strip():
-                        # Vérifier que ce n'est pas un mot identique en anglais/français
-                        # (ex: "ok", "menu", "stop", etc.)
-                        common_words = {'ok', 'menu', 'stop', 'start', 'pause', 'no', 'yes', 
-                                      'save', 'load', 'auto', 'skip', 'quit', 'back', 'roll'}
-                        
-                        if old_content.lower().strip() not in common_words:
-                            issues.append({
-                                'line': new_line_num,
-                                'type': 'TAG_CONTENT_UNTRANSLATED',
-                                'description': f"Contenu de balise non traduit => {{{tag_name}}} : \"{old_content}\" → \"{new_content}\"",
-                                'old_content': old_text,
-                                'new_content': new_text
-                            })
-            
-        except Exception as e:
-            # Ne pas faire échouer l'analyse entière pour cette vérification
-            log_message("DEBUG", f"Erreur vérification contenu balises ligne {new_line_num}: {e}", category="coherence")
-            pass
-        
-        return issues
-    
-    def _check_placeholders_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """
-        Vérifie que les placeholders de protection sont correctement restaurés.
-        
-        LOGIQUE OBLIGATOIRE (non configurable):
-        - Erreur si placeholder détecté dans NEW (peu importe OLD)
-        - Les placeholders doivent DISPARAÎTRE après traduction/reconstruction
-        - Formats détectés: RENPY_CODE_*, RENPY_ASTERIX_*, RENPY_TILDE_*, RENPY_EMPTY
-        
-        Types d'erreurs:
-        1. Placeholder dans OLD mais supprimé pendant traduction → Erreur
-        2. Placeholder dans NEW uniquement (ajouté) → Erreur  
-        3. Placeholder dans OLD ET NEW (non restauré) → Erreur
-        """
-        issues = []
-        
-        try:
-            # Détecter tous les placeholders RENPY dans OLD et NEW
-            old_placeholders = re.findall(r'RENPY_[A-Z_]+_?\d*', old_text)
-            new_placeholders = re.findall(r'RENPY_[A-Z_]+_?\d*', new_text)
-            
-            # CAS 1 : Placeholder dans OLD mais pas dans NEW
-            # (Supprimé pendant traduction - erreur critique)
-            old_set = set(old_placeholders)
-            new_set = set(new_placeholders)
-            removed_placeholders = old_set - new_set
-            
-            if removed_placeholders:
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'PLACEHOLDER_REMOVED',
-                    'description': f"Placeholder(s) supprimé(s) pendant traduction (critique) : {', '.join(sorted(removed_placeholders))}",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-                return issues  # Erreur critique, arrêt immédiat
-            
-            # CAS 2 & 3 : Placeholder dans NEW (ajouté OU non restauré)
-            # Dans tous les cas c'est une erreur
-            if new_placeholders:
-                # Déterminer si c'est un ajout ou une non-restauration
-                if old_placeholders:
-                    # Placeholders présents dans OLD et NEW = non restauré
-                    description = f"Placeholder(s) non restauré(s) après reconstruction : {', '.join(sorted(new_set))}"
-                else:
-                    # Placeholders seulement dans NEW = ajouté par erreur
-                    description = f"Placeholder(s) ajouté(s) par erreur : {', '.join(sorted(new_set))}"
-                
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'UNRESTORED_PLACEHOLDER',
-                    'description': description,
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_escape_sequences_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie la cohérence des séquences d'échappement \\n, \\t, \\r, \\\\"""
-        issues = []
-        
-        try:
-            # Compter les séquences d'échappement
-            escape_patterns = [r'\\n', r'\\t', r'\\r', r'\\\\']
-            
-            for pattern in escape_patterns:
-                old_count = len(re.findall(pattern, old_text))
-                new_count = len(re.findall(pattern, new_text))
-                
-                if old_count != new_count:
-                    escape_name = {
-                        r'\\n': 'retours à la ligne',
-                        r'\\t': 'tabulations',
-                        r'\\r': 'retours chariot',
-                        r'\\\\': 'backslashes échappés'
-                    }.get(pattern, pattern)
-                    
-                    issues.append({
-                        'line': new_line_num,
-                        'type': 'ESCAPE_SEQUENCE_MISMATCH',
-                        'description': f"Séquences d'échappement {escape_name} incohérentes => Attendu: {old_count}, Présent: {new_count}",
-                        'old_content': old_text,
-                        'new_content': new_text
-                    })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_percentages_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie la cohérence des pourcentages % et %% (1 seule erreur fusionnée)"""
-        issues = []
-        
-        try:
-            def count_isolated_percents(text):
-                """Compte les pourcentages isolés en excluant les variables Ren'Py %(lettres)s et les %% échappés"""
-                # 1. Remplacer toutes les variables Ren'Py %(nom)s, %(nom)d, etc. par un placeholder
-                # Pattern: %(lettres ou chiffres ou underscore)lettre (s, d, i, f, etc.)
-                text_no_vars = re.sub(r'%\([a-zA-Z0-9_]+\)[a-zA-Z]', '__RENPY_VAR__', text)
-                
-                # 2. Remplacer tous les %% échappés par un placeholder
-                text_no_escaped = text_no_vars.replace('%%', '__DOUBLE_PERCENT__')
-                
-                # 3. Compter les % restants (pourcentages isolés)
-                isolated_count = text_no_escaped.count('%')
-                
-                return isolated_count
-            
-            # Compter les pourcentages isolés (hors variables Ren'Py et %% échappés)
-            old_isolated = count_isolated_percents(old_text)
-            new_isolated = count_isolated_percents(new_text)
-            
-            # Double % échappé
-            old_double_percent = old_text.count('%%')
-            new_double_percent = new_text.count('%%')
-            
-            # Fusionner les vérifications
-            isolated_mismatch = old_isolated != new_isolated
-            double_mismatch = old_double_percent != new_double_percent
-            
-            if isolated_mismatch or double_mismatch:
-                # Construire une description détaillée
-                details = []
-                if isolated_mismatch:
-                    details.append(f"Variables % (Attendu: {old_isolated}, Présent: {new_isolated})")
-                if double_mismatch:
-                    details.append(f"Échappés %% (Attendu: {old_double_percent}, Présent: {new_double_percent})")
-                
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'PERCENTAGE_MISMATCH',
-                    'description': f"Pourcentages incohérents => {', '.join(details)}",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_quotations_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """
-        Vérifie la cohérence du NOMBRE TOTAL de guillemets (tous types confondus).
-        
-        Types de guillemets comptés :
-        - Guillemets droits : " (échappés \" et non échappés)
-        - Guillemets simples : ' (sauf élisions françaises : l', d', c', etc.)
-        - Guillemets français : « »
-        - Guillemets typographiques anglais : " " (curly quotes)
-        - Apostrophes typographiques : ' (curly apostrophe)
-        - Chevrons ASCII : << >>
-        
-        Accepte les substitutions de style (ex: 'simple' → \"échappé\" ou → « français »).
-        """
-        issues = []
-        
-        try:
-            # Compter TOUS les types de guillemets dans OLD
-            old_total = 0
-            old_total += old_text.count('\\"')  # Guillemets échappés \"
-            old_total += len(re.findall(r'(?<!\\)"', old_text))  # Guillemets droits non échappés "
-            # Guillemets simples ' : TOUS sauf élisions françaises (lettre'lettre comme c'est, l'eau)
-            # Compte 'texte' mais ignore c'est, l'eau, d'accord
-            old_single_quotes = old_text.count("'")
-            # Soustraire les élisions (lettre ' lettre)
-            old_elisions = len(re.findall(r"[a-zA-ZÀ-ÿ]'[a-zA-ZÀ-ÿ]", old_text))
-            old_total += (old_single_quotes - old_elisions)
-            old_total += old_text.count('«')  # Guillemets français (chevrons) ouvrants «
-            old_total += old_text.count('»')  # Guillemets français (chevrons) fermants »
-            old_total += old_text.count('"')  # Guillemets typographiques anglais ouvrants " (curly quotes)
-            old_total += old_text.count('"')  # Guillemets typographiques anglais fermants " (curly quotes)
-            old_total += old_text.count(''')  # Apostrophes typographiques ' (curly apostrophe)
-            old_total += len(re.findall(r'(?<![<>])<<(?![<>])', old_text))  # Chevrons ASCII ouvrants <<
-            old_total += len(re.findall(r'(?<![<>])>>(?![<>])', old_text))  # Chevrons ASCII fermants >>
-            
-            # Compter TOUS les types de guillemets dans NEW
-            new_total = 0
-            new_total += new_text.count('\\"')  # Guillemets échappés \"
-            new_total += len(re.findall(r'(?<!\\)"', new_text))  # Guillemets droits non échappés "
-            # Guillemets simples ' : TOUS sauf élisions françaises (lettre'lettre comme c'est, l'eau)
-            # Compte 'texte' mais ignore c'est, l'eau, d'accord
-            new_single_quotes = new_text.count("'")
-            # Soustraire les élisions (lettre ' lettre)
-            new_elisions = len(re.findall(r"[a-zA-ZÀ-ÿ]'[a-zA-ZÀ-ÿ]", new_text))
-            new_total += (new_single_quotes - new_elisions)
-            new_total += new_text.count('«')  # Guillemets français (chevrons) ouvrants «
-            new_total += new_text.count('»')  # Guillemets français (chevrons) fermants »
-            new_total += new_text.count('"')  # Guillemets typographiques anglais ouvrants " (curly quotes)
-            new_total += new_text.count('"')  # Guillemets typographiques anglais fermants " (curly quotes)
-            new_total += new_text.count(''')  # Apostrophes typographiques ' (curly apostrophe)
-            new_total += len(re.findall(r'(?<![<>])<<(?![<>])', new_text))  # Chevrons ASCII ouvrants <<
-            new_total += len(re.findall(r'(?<![<>])>>(?![<>])', new_text))  # Chevrons ASCII fermants >>
-            
-            # Vérifier que le nombre TOTAL de guillemets est cohérent
-            if old_total != new_total:
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'QUOTES_MISMATCH',
-                    'description': f"Nombre de guillemets incohérent => Attendu: {old_total}, Présent: {new_total}",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_parentheses_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """
-        Vérifie la cohérence des parenthèses () UNIQUEMENT (1 seule erreur fusionnée).
-        
-        Note : Les crochets [] et accolades {} sont déjà vérifiés par :
-        - check_variables (pour [variable])
-        - check_tags (pour {balise})
-        """
-        issues = []
-        
-        try:
-            # Vérifier SEULEMENT les parenthèses ()
-            old_open_parens = old_text.count('(')
-            new_open_parens = new_text.count('(')
-            old_close_parens = old_text.count(')')
-            new_close_parens = new_text.count(')')
-            
-            # Fusionner les vérifications en 1 seule erreur
-            open_mismatch = old_open_parens != new_open_parens
-            close_mismatch = old_close_parens != new_close_parens
-            
-            if open_mismatch or close_mismatch:
-                # Construire une description détaillée
-                details = []
-                if open_mismatch:
-                    details.append(f"Ouvrantes ( (Attendu: {old_open_parens}, Présent: {new_open_parens})")
-                if close_mismatch:
-                    details.append(f"Fermantes ) (Attendu: {old_close_parens}, Présent: {new_close_parens})")
-                
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'PARENTHESES_MISMATCH',
-                    'description': f"Parenthèses () incohérentes => {', '.join(details)}",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_syntax_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie la syntaxe Ren'Py et structure des lignes"""
-        issues = []
-        
-        try:
-            # Séquences d'échappement malformées
-            malformed_escapes = re.findall(r'\\(?![ntr\\"])', new_text)
-            if malformed_escapes:
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'MALFORMED_ESCAPE_SEQUENCE',
-                    'description': f"Séquences d'échappement malformées détectées: {malformed_escapes}",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_deepl_ellipsis_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie les ellipses DeepL [...] → ..."""
-        issues = []
-        
-        try:
-            # Ellipses DeepL [...]
-            old_deepl_ellipsis = len(re.findall(r'\[\.\.\.\]', old_text))
-            new_deepl_ellipsis = len(re.findall(r'\[\.\.\.\]', new_text))
-            
-            if old_deepl_ellipsis != new_deepl_ellipsis:
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'DEEPL_ELLIPSIS_MISMATCH',
-                    'description': f"Ellipses DeepL [...] incohérentes => Attendu: {old_deepl_ellipsis}, Présent: {new_deepl_ellipsis} (devrait être transformées en ...)",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_isolated_percent_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie les pourcentages isolés % → %%"""
-        issues = []
-        
-        try:
-            # Pourcentages isolés (pas dans %% ou %variable)
-            old_isolated = len(re.findall(r'(?<!%)%(?!%|[a-zA-Z])', old_text))
-            new_isolated = len(re.findall(r'(?<!%)%(?!%|[a-zA-Z])', new_text))
-            
-            if old_isolated != new_isolated:
-                issues.append({
-                    'line': new_line_num,
-                    'type': 'ISOLATED_PERCENT_MISMATCH',
-                    'description': f"Pourcentages isolés % incohérents => Attendu: {old_isolated}, Présent: {new_isolated} (devraient être échappés en %%)",
-                    'old_content': old_text,
-                    'new_content': new_text
-                })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    
-    def _check_length_difference_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """
-        Vérifie la différence de longueur entre OLD et NEW (indicatif, non critique).
-        
-        Signale si la traduction est significativement plus courte ou plus longue que l'original.
-        Seuil : 250% de différence de longueur (ratio > 2.5).
-        """
-        issues = []
-        
-        try:
-            old_length = len(old_text.strip())
-            new_length = len(new_text.strip())
-            
-            # Ignorer les lignes OLD trop courtes (moins de 10 caractères)
-            if old_length < 10:
-                return issues
-            
-            # Calculer le ratio de différence
-            if old_length > 0 and new_length > 0:
-                length_ratio = max(old_length, new_length) / min(old_length, new_length)
-                
-                # Seuil : 250% de différence (ratio > 2.5)
-                if length_ratio > 2.5:
-                    length_diff_percent = abs((new_length - old_length) / old_length) * 100
-                    
-                    if new_length > old_length:
-                        status = f"⬆️ +{length_diff_percent:.0f}% plus longue"
-                    else:
-                        status = f"⬇️ -{length_diff_percent:.0f}% plus courte"
-                    
-                    issues.append({
-                        'line': new_line_num,
-                        'type': 'LENGTH_DIFFERENCE_WARNING',
-                        'description': f"Différence de longueur importante {status} => ANCIEN: {old_length} caractères, NOUVEAU: {new_length} caractères (ratio: {length_ratio:.1f})",
-                        'old_content': old_text,
-                        'new_content': new_text
-                    })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _check_line_structure_coherence(self, old_text, new_text, old_line_num, new_line_num):
-        """Vérifie la structure des lignes old/new"""
-        issues = []
-        
-        try:
-            # Vérifier les caractères spéciaux non échappés
-            special_chars = ['{', '}', '[', ']', '%']
-            for char in special_chars:
-                old_count = old_text.count(char)
-                new_count = new_text.count(char)
-                if old_count != new_count:
-                    issues.append({
-                        'line': new_line_num,
-                        'type': 'SPECIAL_CHAR_MISMATCH',
-                        'description': f"Caractère spécial '{char}' incohérent => Attendu: {old_count}, Présent: {new_count}",
-                        'old_content': old_text,
-                        'new_content': new_text
-                    })
-        
-        except Exception:
-            pass
-        
-        return issues
-    
-    def _normalize_variable(self, variable):
-        """Normalise une variable en enlevant les fonctions de traduction"""
-        # Enlever les fonctions !t, !u, !l, !c
-        normalized = re.sub(r'![tulc]', '', variable)
-        return normalized
-    
     def _extract_line_content(self, line):
         """Extrait le contenu d'une ligne (enlève # old, etc.)"""
         line = line.strip()
@@ -1528,23 +1100,7 @@ def check_coherence_unified(target_path, return_details=False, selection_info=No
             checker.results_by_file = {}
             checker.total_issues = 0
             checker.files_analyzed = 0
-            excluded_files = []
-            
-            for file_path in files_to_analyze:
-                if checker._should_exclude_file(file_path):
-                    excluded_files.append(os.path.basename(file_path))
-                    continue
-                    
-                file_results = checker._analyze_single_file(file_path)  # VOTRE MÉTHODE EXISTANTE
-                if file_results['issues']:
-                    checker.results_by_file[file_path] = file_results
-                    checker.total_issues += len(file_results['issues'])
-                
-                checker.files_analyzed += 1
-            
-            # Log des fichiers exclus sur une seule ligne
-            if excluded_files:
-                log_message("DEBUG", f"Fichiers système exclus automatiquement: {', '.join(excluded_files)}", category="file_exclusion")
+            checker._analyze_files(files_to_analyze)
             
             # Générer le rapport avec vos méthodes existantes
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -1681,6 +1237,28 @@ def remove_custom_exclusion(project_path, file_path, line, text):
     """
     return config_manager.remove_coherence_exclusion(project_path, file_path, line, text)
 
+# ===== ANALYSE PARALLÈLE (WORKERS) =====
+
+_worker_checker = None
+
+
+def _init_coherence_worker(options_snapshot, project_path, line_exclusions):
+    """Initialise le vérificateur d'un processus worker avec les options et exclusions du processus principal"""
+    global _worker_checker
+    _worker_checker = UnifiedCoherenceChecker()
+    _worker_checker._apply_options_snapshot(options_snapshot)
+    _worker_checker.project_path = project_path
+    _worker_checker._line_exclusions = line_exclusions
+
+
+def _analyze_file_worker(task):
+    """Worker (processus séparé) : analyse un fichier dont le contenu a déjà été lu"""
+    file_path, content = task
+    with worker_span("coherence.file", file=os.path.basename(file_path)):
+        file_results = _worker_checker._analyze_single_file(file_path, content)
+    # Spans et messages de log du processus worker, rapatriés avec le résultat (retirés avant la mise en cache)
+    return attach_worker_records(file_results)
+
 def _find_project_root(target_path):
     """Trouve la racine du projet Ren'Py depuis un chemin"""
     try:
@@ -0,0 +1,367 @@
+# core/services/tools/coherence_rules.py
+"""
+Moteur de règles de cohérence OLD/NEW
+- Chaque texte est analysé une seule fois dans un relevé de caractéristiques partagé
+  (variables, balises, placeholders, échappements, guillemets, parenthèses, longueur...)
+- Les règles actives ne font plus que comparer deux relevés
+- Règles ordonnées par priorité : la première règle en erreur arrête la vérification de la ligne
+- Ajout d'une règle : une fonction (old, new) -> [(type, description)], sans nouveau parcours du texte
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from infrastructure.logging.logging import log_message
+
+__all__ = ['TextFeatures', 'CoherenceRule', 'CoherenceRuleEngine', 'get_text_features', 'text_feature', 'DEFAULT_RULES']
+
+_VARIABLE_RE = re.compile(r'\[[^\]]*\]')
+_VARIABLE_FUNCTION_RE = re.compile(r'![tulc]')
+_TAG_RE = re.compile(r'\{[^}]*\}')
+_TAG_PAIR_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)[^}]*\}(.*?)\{/\1\}')
+_PLACEHOLDER_RE = re.compile(r'RENPY_[A-Z_]+_?\d*')
+_RENPY_FORMAT_VAR_RE = re.compile(r'%\([a-zA-Z0-9_]+\)[a-zA-Z]')
+_ISOLATED_PERCENT_RE = re.compile(r'(?<!%)%(?!%|[a-zA-Z])')
+_MALFORMED_ESCAPE_RE = re.compile(r'\\(?![ntr\\"])')
+_ELISION_RE = re.compile(r"[a-zA-ZÀ-ÿ]['’][a-zA-ZÀ-ÿ]")
+_ASCII_CHEVRONS_RE = re.compile(r'(?<![<>])(?:<<|>>)(?![<>])')
+_TECHNICAL_IDENTIFIER_RE = re.compile(r'[a-z][a-z0-9_]*', re.I)
+
+# Séquences d'échappement comptées (littéral, libellé)
+_ESCAPE_SEQUENCES = (
+    ('\\n', 'retours à la ligne'),
+    ('\\t', 'tabulations'),
+    ('\\r', 'retours chariot'),
+    ('\\\\', 'backslashes échappés'),
+)
+
+# Guillemets comptés un par un (droits, français, typographiques)
+_QUOTE_CHARS = ('"', '«', '»', '“', '”')
+
+# Balises purement techniques (identifiants de jeu, pas du texte à traduire)
+_TECHNICAL_TAG_NAMES = frozenset({'ctml', 'id'})
+
+# Mots identiques en anglais/français dans les balises (ex: {b}OK{/b})
+_COMMON_TAG_WORDS = frozenset({'ok', 'menu', 'stop', 'start', 'pause', 'no', 'yes',
+                               'save', 'load', 'auto', 'skip', 'quit', 'back', 'roll'})
+
+# Caractères spéciaux Ren'Py dont le nombre doit être conservé
+_SPECIAL_CHARS = ('{', '}', '[', ']', '%')
+
+_COUNTED_CHARS = frozenset(_SPECIAL_CHARS + _QUOTE_CHARS + ("'", '’', '(', ')'))
+
+_NO_ESCAPES = (0,) * len(_ESCAPE_SEQUENCES)
+
+_SIGNATURE_CHARS = _SPECIAL_CHARS + ('(', ')')
+
+
+# Caractéristiques supplémentaires déclarées par des règles externes : nom -> fonction(texte)
+_EXTRA_FEATURES: Dict[str, Callable[[str], object]] = {}
+
+
+def text_feature(func):
+    """Déclare une caractéristique supplémentaire (nom de la fonction), calculée une fois par texte"""
+    _EXTRA_FEATURES[func.__name__] = func
+    get_text_features.cache_clear()
+    return func
+
+
+class TextFeatures:
+    """
+    Relevé des caractéristiques d'un texte, calculé en une fois et partagé par toutes les règles.
+    Chaque extraction n'est lancée que si le caractère qui la déclenche est présent dans le texte.
+    """
+
+    __slots__ = ('text', 'length', 'char_counts', 'variables', 'normalized_variables', 'tags',
+                 'tag_contents', 'placeholders', 'escape_counts', 'malformed_escapes',
+                 'double_percents', 'format_percents', 'isolated_percents', 'deepl_ellipses',
+                 'quote_count', 'signature', 'extra')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.length = len(text.strip())
+        # Un seul parcours pour savoir quels caractères suivis sont présents, comptage de ceux-là seulement
+        present = _COUNTED_CHARS.intersection(text)
+        counts = {char: text.count(char) for char in present}
+        self.char_counts = counts
+
+        if '[' in present:
+            self.variables = _VARIABLE_RE.findall(text)
+            self.normalized_variables = sorted(_VARIABLE_FUNCTION_RE.sub('', var) for var in self.variables)
+            self.deepl_ellipses = text.count('[...]')
+        else:
+            self.variables = self.normalized_variables = []
+            self.deepl_ellipses = 0
+
+        if '{' in present:
+            self.tags = _TAG_RE.findall(text)
+            self.tag_contents = {}
+            for match in _TAG_PAIR_RE.finditer(text):
+                content = match.group(2).strip()
+                if content:
+                    self.tag_contents.setdefault(match.group(1), []).append(content)
+        else:
+            self.tags = []
+            self.tag_contents = {}
+
+        self.placeholders = _PLACEHOLDER_RE.findall(text) if 'RENPY_' in text else []
+
+        if '\\' in text:
+            self.escape_counts = tuple(text.count(sequence) for sequence, _ in _ESCAPE_SEQUENCES)
+            self.malformed_escapes = _MALFORMED_ESCAPE_RE.findall(text)
+        else:
+            self.escape_counts = _NO_ESCAPES
+            self.malformed_escapes = []
+
+        if '%' in present:
+            self.double_percents = text.count('%%')
+            # Pourcentages hors variables Ren'Py %(nom)s et hors %% échappés
+            without_vars = _RENPY_FORMAT_VAR_RE.sub('__RENPY_VAR__', text) if '%(' in text else text
+            self.format_percents = without_vars.count('%') - 2 * without_vars.count('%%')
+            self.isolated_percents = len(_ISOLATED_PERCENT_RE.findall(text))
+        else:
+            self.double_percents = self.format_percents = self.isolated_percents = 0
+
+        # Guillemets de tous types, hors apostrophes d'élision (c'est, l'eau)
+        quotes = 0
+        for quote in present.intersection(_QUOTE_CHARS):
+            quotes += counts[quote]
+        if "'" in present or '’' in present:
+            quotes += counts.get("'", 0) + counts.get('’', 0) - len(_ELISION_RE.findall(text))
+        if '<<' in text or '>>' in text:
+            quotes += len(_ASCII_CHEVRONS_RE.findall(text))
+        self.quote_count = quotes
+
+        # Tout ce que comparent les règles « à égalité » : deux signatures égales garantissent qu'aucune n'échoue
+        self.signature = (
+            self.tags, self.normalized_variables, self.escape_counts, self.format_percents,
+            self.double_percents, self.isolated_percents, self.deepl_ellipses, self.quote_count,
+            tuple(counts.get(char, 0) for char in _SIGNATURE_CHARS)
+        )
+
+        self.extra = {name: compute(text) for name, compute in _EXTRA_FEATURES.items()}
+
+
+@lru_cache(maxsize=4096)
+def get_text_features(text: str) -> TextFeatures:
+    """Relevé partagé d'un texte (les textes récurrents ne sont analysés qu'une fois)"""
+    return TextFeatures(text)
+
+
+# ===== RÈGLES =====
+# Signature : (old: TextFeatures, new: TextFeatures) -> [(type, description), ...]
+# Une règle externe qui a besoin d'une nouvelle mesure la déclare avec @text_feature
+# et la lit dans old.extra / new.extra.
+
+def _rule_tags(old, new):
+    if old.tags != new.tags:
+        return [('TAG_MISMATCH', f"Balises incohérentes => Attendu: {old.tags}, Présent: {new.tags}")]
+    return []
+
+
+def _rule_tags_content(old, new):
+    issues = []
+    new_contents = new.tag_contents
+    for tag_name, old_tag_contents in old.tag_contents.items():
+        if tag_name.lower() in _TECHNICAL_TAG_NAMES or tag_name not in new_contents:
+            continue  # Balise absente : relève de la règle des balises
+        for old_content, new_content in zip(old_tag_contents, new_contents[tag_name]):
+            # Identifiants techniques (ex. day1_phonetruck) : inchangés volontairement
+            if _TECHNICAL_IDENTIFIER_RE.fullmatch(old_content) and (
+                '_' in old_content or any(ch.isdigit() for ch in old_content)
+            ):
+                continue
+            if old_content.lower() == new_content.lower() and old_content.lower() not in _COMMON_TAG_WORDS:
+                issues.append(('TAG_CONTENT_UNTRANSLATED',
+                               f"Contenu de balise non traduit => {{{tag_name}}} : \"{old_content}\" → \"{new_content}\""))
+    return issues
+
+
+def _rule_variables(old, new):
+    if old.normalized_variables != new.normalized_variables:
+        return [('VARIABLE_MISMATCH', f"Variables incohérentes => Attendu: {old.variables}, Présent: {new.variables}")]
+    return []
+
+
+def _rule_escape_sequences(old, new):
+    issues = []
+    for (_, name), old_count, new_count in zip(_ESCAPE_SEQUENCES, old.escape_counts, new.escape_counts):
+        if old_count != new_count:
+            issues.append(('ESCAPE_SEQUENCE_MISMATCH',
+                           f"Séquences d'échappement {name} incohérentes => Attendu: {old_count}, Présent: {new_count}"))
+    return issues
+
+
+def _rule_placeholders(old, new):
+    """Les placeholders de protection doivent avoir disparu de NEW après reconstruction"""
+    old_set = set(old.placeholders)
+    new_set = set(new.placeholders)
+    removed = old_set - new_set
+    if removed:
+        return [('PLACEHOLDER_REMOVED',
+                 f"Placeholder(s) supprimé(s) pendant traduction (critique) : {', '.join(sorted(removed))}")]
+    if new_set:
+        if old_set:
+            description = f"Placeholder(s) non restauré(s) après reconstruction : {', '.join(sorted(new_set))}"
+        else:
+            description = f"Placeholder(s) ajouté(s) par erreur : {', '.join(sorted(new_set))}"
+        return [('UNRESTORED_PLACEHOLDER', description)]
+    return []
+
+
+def _rule_percentages(old, new):
+    details = []
+    if old.format_percents != new.format_percents:
+        details.append(f"Variables % (Attendu: {old.format_percents}, Présent: {new.format_percents})")
+    if old.double_percents != new.double_percents:
+        details.append(f"Échappés %% (Attendu: {old.double_percents}, Présent: {new.double_percents})")
+    if details:
+        return [('PERCENTAGE_MISMATCH', f"Pourcentages incohérents => {', '.join(details)}")]
+    return []
+
+
+def _rule_quotations(old, new):
+    if old.quote_count != new.quote_count:
+        return [('QUOTES_MISMATCH', f"Nombre de guillemets incohérent => Attendu: {old.quote_count}, Présent: {new.quote_count}")]
+    return []
+
+
+def _rule_parentheses(old, new):
+    details = []
+    old_open, new_open = old.char_counts.get('(', 0), new.char_counts.get('(', 0)
+    old_close, new_close = old.char_counts.get(')', 0), new.char_counts.get(')', 0)
+    if old_open != new_open:
+        details.append(f"Ouvrantes ( (Attendu: {old_open}, Présent: {new_open})")
+    if old_close != new_close:
+        details.append(f"Fermantes ) (Attendu: {old_close}, Présent: {new_close})")
+    if details:
+        return [('PARENTHESES_MISMATCH', f"Parenthèses () incohérentes => {', '.join(details)}")]
+    return []
+
+
+def _rule_syntax(old, new):
+    if new.malformed_escapes:
+        return [('MALFORMED_ESCAPE_SEQUENCE', f"Séquences d'échappement malformées détectées: {new.malformed_escapes}")]
+    return []
+
+
+def _rule_deepl_ellipsis(old, new):
+    if old.deepl_ellipses != new.deepl_ellipses:
+        return [('DEEPL_ELLIPSIS_MISMATCH',
+                 f"Ellipses DeepL [...] incohérentes => Attendu: {old.deepl_ellipses}, Présent: {new.deepl_ellipses} (devrait être transformées en ...)")]
+    return []
+
+
+def _rule_isolated_percent(old, new):
+    if old.isolated_percents != new.isolated_percents:
+        return [('ISOLATED_PERCENT_MISMATCH',
+                 f"Pourcentages isolés % incohérents => Attendu: {old.isolated_percents}, Présent: {new.isolated_percents} (devraient être échappés en %%)")]
+    return []
+
+
+def _rule_line_structure(old, new):
+    issues = []
+    for char in _SPECIAL_CHARS:
+        old_count, new_count = old.char_counts.get(char, 0), new.char_counts.get(char, 0)
+        if old_count != new_count:
+            issues.append(('SPECIAL_CHAR_MISMATCH', f"Caractère spécial '{char}' incohérent => Attendu: {old_count}, Présent: {new_count}"))
+    return issues
+
+
+def _rule_length_difference(old, new):
+    """Indicatif : ratio de longueur > 2.5, lignes OLD de moins de 10 caractères ignorées"""
+    old_length, new_length = old.length, new.length
+    if old_length < 10 or new_length == 0:
+        return []
+    length_ratio = max(old_length, new_length) / min(old_length, new_length)
+    if length_ratio <= 2.5:
+        return []
+    length_diff_percent = abs((new_length - old_length) / old_length) * 100
+    if new_length > old_length:
+        status = f"⬆️ +{length_diff_percent:.0f}% plus longue"
+    else:
+        status = f"⬇️ -{length_diff_percent:.0f}% plus courte"
+    return [('LENGTH_DIFFERENCE_WARNING',
+             f"Différence de longueur importante {status} => ANCIEN: {old_length} caractères, NOUVEAU: {new_length} caractères (ratio: {length_ratio:.1f})")]
+
+
+class CoherenceRule:
+    """
+    Règle de cohérence : fonction de comparaison + option qui l'active (None = toujours active).
+    covered_by_signature : la règle ne compare que des éléments de TextFeatures.signature,
+    elle est donc sautée quand les signatures OLD et NEW sont identiques.
+    """
+
+    def __init__(self, name: str, check: Callable[[TextFeatures, TextFeatures], List[Tuple[str, str]]],
+                 option: Optional[str] = None, covered_by_signature: bool = False):
+        self.name = name
+        self.check = check
+        self.option = option
+        self.covered_by_signature = covered_by_signature
+
+    def __repr__(self):
+        return f"CoherenceRule({self.name!r}, option={self.option!r})"
+
+
+# Ordre = priorité (la première règle en erreur l'emporte)
+DEFAULT_RULES = (
+    CoherenceRule('tags', _rule_tags, 'check_tags', covered_by_signature=True),
+    CoherenceRule('tags_content', _rule_tags_content, 'check_tags_content'),
+    CoherenceRule('variables', _rule_variables, 'check_variables', covered_by_signature=True),
+    CoherenceRule('escape_sequences', _rule_escape_sequences, 'check_escape_sequences', covered_by_signature=True),
+    CoherenceRule('placeholders', _rule_placeholders),  # ⭐ Obligatoire, non configurable
+    CoherenceRule('percentages', _rule_percentages, 'check_percentages', covered_by_signature=True),
+    # 'quotations' (_rule_quotations) n'est pas enregistrée : l'ancien contrôle ne produisait
+    # jamais de résultat, le moteur reste à parité de sortie avec lui
+    CoherenceRule('parentheses', _rule_parentheses, 'check_parentheses', covered_by_signature=True),
+    CoherenceRule('syntax', _rule_syntax, 'check_syntax'),
+    CoherenceRule('deepl_ellipsis', _rule_deepl_ellipsis, 'check_deepl_ellipsis', covered_by_signature=True),
+    CoherenceRule('isolated_percent', _rule_isolated_percent, 'check_isolated_percent', covered_by_signature=True),
+    CoherenceRule('line_structure', _rule_line_structure, 'check_line_structure', covered_by_signature=True),
+    CoherenceRule('length_difference', _rule_length_difference, 'check_length_difference'),
+)
+
+
+class CoherenceRuleEngine:
+    """Applique les règles actives, dans l'ordre, sur les relevés OLD/NEW d'une ligne"""
+
+    def __init__(self, rules: Iterable[CoherenceRule] = DEFAULT_RULES):
+        self.rules: List[CoherenceRule] = list(rules)
+        self._active: Tuple[CoherenceRule, ...] = tuple(self.rules)
+        self._unsigned: Tuple[CoherenceRule, ...] = self._active
+
+    def register(self, rule: CoherenceRule, before: Optional[str] = None):
+        """Ajoute une règle (en fin de liste ou avant la règle nommée) ; appeler configure() ensuite"""
+        names = [existing.name for existing in self.rules]
+        index = names.index(before) if before in names else len(self.rules)
+        self.rules.insert(index, rule)
+
+    def configure(self, options) -> None:
+        """Retient les règles actives d'après les options (attributs booléens de l'objet options)"""
+        self._active = tuple(rule for rule in self.rules
+                             if rule.option is None or getattr(options, rule.option, True))
+        # Règles encore à évaluer quand les signatures OLD/NEW sont identiques (cas le plus courant)
+        self._unsigned = tuple(rule for rule in self._active if not rule.covered_by_signature)
+
+    def run(self, old_text: str, new_text: str, line_num: int) -> List[Dict[str, object]]:
+        """Issues de la première règle active en erreur (liste vide si la ligne est cohérente)"""
+        old = get_text_features(old_text)
+        new = get_text_features(new_text)
+        rules = self._unsigned if old.signature == new.signature else self._active
+        for rule in rules:
+            try:
+                found = rule.check(old, new)
+            except Exception as e:
+                # Une règle en échec ne doit pas interrompre l'analyse du fichier
+                log_message("DEBUG", f"Erreur règle {rule.name} ligne {line_num}: {e}", category="coherence")
+                continue
+            if found:
+                return [{
+                    'line': line_num,
+                    'type': issue_type,
+                    'description': description,
+                    'old_content': old_text,
+                    'new_content': new_text
+                } for issue_type, description in found]
+        return []
@@ -0,0 +1,146 @@
+# core/services/tools/log_tail.py
+"""
+Lecture en continu (« tail -f ») du log de dialogues écrit par le jeu
+- Lecture à partir d'un offset en octets : coût proportionnel aux octets ajoutés
+- Ligne incomplète conservée jusqu'à l'écriture de sa fin
+- Détection de la troncature (log vidé) et du remplacement du fichier
+- Attente des changements : inotify (Linux), notifications de dossier (Windows),
+  sinon intervalle de scrutation adaptatif
+"""
+
+import os
+import threading
+import time
+from typing import List, Optional
+
+from infrastructure.helpers.change_notifier import create_change_notifier
+
+__all__ = ['LogTailReader', 'LogChangeWatcher']
+
+# Octets relus juste avant l'offset pour vérifier que le début du fichier n'a pas changé
+_ANCHOR_SIZE = 64
+
+
+class LogTailReader:
+    """Lit les lignes ajoutées à un fichier depuis la lecture précédente"""
+
+    def __init__(self, path: str, encoding: str = 'utf-8'):
+        self.path = path
+        self.encoding = encoding
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reprend la lecture au début du fichier (après un vidage volontaire du log)"""
+        with self._lock:
+            self._reset_state()
+
+    def _reset_state(self):
+        self.offset = 0
+        self._partial = b''
+        self._anchor = b''
+        self._identity = None
+
+    @staticmethod
+    def _file_identity(stat_result):
+        # st_ino est renseigné aussi sous Windows (index de fichier NTFS)
+        return (stat_result.st_dev, stat_result.st_ino)
+
+    def read_new_lines(self) -> Optional[List[str]]:
+        """
+        Lignes complètes ajoutées depuis le dernier appel (sans fin de ligne).
+
+        Returns:
+            Liste des nouvelles lignes, ou None si le fichier a été tronqué ou remplacé
+            (l'état est alors remis à zéro ; l'appel suivant relit depuis le début)
+        """
+        with self._lock:
+            try:
+                stat_result = os.stat(self.path)
+            except OSError:
+                # Fichier absent (supprimé entre deux sessions) : on repartira de zéro
+                if self.offset or self._partial:
+                    self._reset_state()
+                return []
+
+            identity = self._file_identity(stat_result)
+            if self._identity is not None and identity != self._identity:
+                self._reset_state()
+                self._identity = identity
+                return None
+            self._identity = identity
+
+            size = stat_result.st_size
+            if size < self.offset:
+                self._reset_state()
+                self._identity = identity
+                return None
+            if size == self.offset:
+                return []
+
+            try:
+                with open(self.path, 'rb') as f:
+                    anchor_start = self.offset - len(self._anchor)
+                    f.seek(anchor_start)
+                    if self._anchor and f.read(len(self._anchor)) != self._anchor:
+                        # Vidé puis réécrit plus long entre deux lectures
+                        self._reset_state()
+                        self._identity = identity
+                        return None
+                    data = f.read()
+            except OSError:
+                return []
+
+            if not data:
+                return []
+            self.offset += len(data)
+            self._anchor = (self._anchor + data)[-_ANCHOR_SIZE:]
+
+            chunks = (self._partial + data).split(b'\n')
+            self._partial = chunks.pop()
+            return [chunk.rstrip(b'\r').decode(self.encoding, errors='replace') for chunk in chunks]
+
+
+class LogChangeWatcher:
+    """
+    Attend une modification du fichier surveillé.
+
+    wait() rend la main dès qu'un changement est signalé par le système, et au plus
+    tard après l'intervalle courant : sans notification disponible, l'intervalle
+    repart au minimum après de l'activité puis s'allonge pendant les périodes calmes.
+    """
+
+    def __init__(self, path: str, min_interval: float = 0.1, max_interval: float = 1.0, backoff: float = 1.5):
+        self.path = path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self._notifier = create_change_notifier([os.path.dirname(os.path.abspath(path))])
+
+    @property
+    def uses_notifications(self) -> bool:
+        return self._notifier is not None
+
+    def wait(self, had_activity: bool = False):
+        """Attend le prochain changement ; had_activity : la lecture précédente a trouvé des lignes"""
+        if had_activity:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+
+        if self._notifier is not None:
+            # Avec notifications, l'intervalle ne sert que de filet de sécurité
+            try:
+                self._notifier.wait(self.max_interval)
+                return
+            except Exception:
+                self._notifier.close()
+                self._notifier = None
+        time.sleep(self.interval)
+
+    def close(self):
+        if self._notifier is not None:
+            self._notifier.close()
+            self._notifier = None
+
@@ -0,0 +1,167 @@
+# core/services/tools/pending_journal.py
+"""
+Journal des modifications en attente de l'éditeur temps réel
+- Instantané JSON (format historique renextract_pending_modifications.json) + journal
+  JSONL en ajout seul : une modification = une ligne ajoutée, plus de réécriture complète
+- Écritures transmises au système à chaque ajout, fsync groupés (au plus une fois par
+  intervalle) : un crash de l'application ne perd rien, une coupure au pire l'intervalle
+- Compaction périodique : instantané réécrit (fichier temporaire + remplacement
+  atomique) puis journal vidé
+- Relecture : instantané puis rejeu du journal ; une dernière ligne tronquée est ignorée
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable
+
+from infrastructure.logging.logging import log_message
+
+__all__ = ['PendingModificationsJournal', 'journal_path_for', 'load_pending_state']
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def journal_path_for(snapshot_path: str) -> str:
+    """Chemin du journal associé à un instantané JSON"""
+    base, ext = os.path.splitext(snapshot_path)
+    return (base if ext.lower() == '.json' else snapshot_path) + JOURNAL_SUFFIX
+
+
+def _replay(state: Dict[str, Any], journal_path: str) -> int:
+    """Applique les enregistrements du journal à state ; retourne le nombre d'enregistrements"""
+    if not os.path.exists(journal_path):
+        return 0
+    count = 0
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Ligne tronquée par un arrêt brutal pendant l'écriture
+                log_message("ATTENTION", f"Enregistrement illisible ignoré dans {os.path.basename(journal_path)}", category="realtime_editor")
+                continue
+            op = record.get('op')
+            if op == 'set':
+                state[record['key']] = record['entry']
+            elif op == 'del':
+                state.pop(record['key'], None)
+            count += 1
+    return count
+
+
+def load_pending_state(snapshot_path: str) -> Dict[str, Any]:
+    """
+    Modifications en attente enregistrées : instantané JSON puis rejeu de son journal.
+    Les erreurs de lecture de l'instantané sont propagées (comme json.load).
+    """
+    state: Dict[str, Any] = {}
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+        if content:
+            state = json.loads(content)
+    _replay(state, journal_path_for(snapshot_path))
+    return state
+
+
+class PendingModificationsJournal:
+    """
+    Persistance incrémentale d'un dictionnaire clé -> modification en attente.
+
+    set()/delete() ajoutent une ligne au journal ; compact() réécrit l'instantané avec
+    l'état fourni et vide le journal. La compaction est demandée (needs_compaction)
+    quand le journal dépasse compact_every enregistrements.
+    """
+
+    def __init__(self, snapshot_path: str, sync_interval: float = 1.0, compact_every: int = 1000):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path_for(snapshot_path)
+        self.sync_interval = sync_interval
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._file = None
+        self._records = 0
+        self._dirty = False
+        self._last_sync = 0.0
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._records >= self.compact_every
+
+    def _append(self, records: Iterable[Dict[str, Any]]):
+        data = "".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records)
+        if not data:
+            return
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.journal_path, 'a', encoding='utf-8')
+            self._file.write(data)
+            # Données transmises au système : rien n'est perdu si l'application plante
+            self._file.flush()
+            self._records += data.count("\n")
+            self._dirty = True
+            now = time.monotonic()
+            if now - self._last_sync >= self.sync_interval:
+                self._sync_locked(now)
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        self._append([{'op': 'set', 'key': key, 'entry': entry}])
+
+    def delete(self, key: str):
+        self._append([{'op': 'del', 'key': key}])
+
+    def sync(self):
+        """Force l'écriture sur disque des enregistrements en attente de fsync"""
+        with self._lock:
+            self._sync_locked(time.monotonic())
+
+    def _sync_locked(self, now: float):
+        if self._file is not None and self._dirty:
+            try:
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                log_message("ATTENTION", f"fsync du journal impossible: {e}", category="realtime_editor")
+            self._dirty = False
+        self._last_sync = now
+
+    def compact(self, state: Dict[str, Any]):
+        """Réécrit l'instantané avec state (écriture atomique) puis vide le journal"""
+        with self._lock:
+            temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                if state:
+                    json.dump(state, f, indent=2, ensure_ascii=False, default=str)
+                else:
+                    f.write('{}')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+
+            # L'instantané contient tout : le journal repart de zéro
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            with open(self.journal_path, 'w', encoding='utf-8'):
+                pass
+            self._records = 0
+            self._dirty = False
+            self._last_sync = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._sync_locked(time.monotonic())
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove_files(self):
+        """Supprime instantané et journal (fin de session sans modification en attente)"""
+        self.close()
+        for path in (self.snapshot_path, self.journal_path):
+            if os.path.exists(path):
+                os.remove(path)
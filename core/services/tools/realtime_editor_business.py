@@ -15,10 +15,15 @@ import threading
 import time
 import re
 import json
+import shutil
 from typing import Dict, List, Optional, Callable, Any
 from pathlib import Path
 
 from infrastructure.logging.logging import log_message
+from core.services.tools.log_tail import LogTailReader, LogChangeWatcher
+from core.services.tools.string_translation_index import StringTranslationIndex
+from core.services.tools.tl_file_cache import tl_file_cache
+from core.services.tools.pending_journal import PendingModificationsJournal, load_pending_state
 from infrastructure.config.config import config_manager
 from core.models.backup.unified_backup_manager import UnifiedBackupManager, BackupType
 
@@ -51,7 +56,12 @@ class RealTimeEditorBusiness:
         self.current_project_path = None
         self.current_language = None
         self.pending_modifications_file = None
-        self.last_dialogue_line = 0
+        # Journal en ajout seul des modifications en attente (instantané JSON + JSONL)
+        self._pending_journal: Optional[PendingModificationsJournal] = None
+        # Lecture incrémentale du log de dialogues (offset en octets) + menu en cours de lecture
+        self.dialogue_log_tail: Optional[LogTailReader] = None
+        self._log_menu_choices: Optional[List[Dict]] = None
+        self._dialogue_log_lock = threading.RLock()
         self.pending_modifications = {}
         # Compteur d'éditions depuis la dernière sauvegarde auto (pour "tous les X modifications")
         self._autosave_edit_count = 0
@@ -60,7 +70,8 @@ class RealTimeEditorBusiness:
         self.dialogue_callback: Optional[Callable] = None
         self.status_callback: Optional[Callable] = None
         self.error_callback: Optional[Callable] = None
-        self.string_translation_cache: Optional[Dict[str, Any]] = None
+        # Index persistant des blocs strings (old -> new) de la langue surveillée
+        self.string_translation_index: Optional[StringTranslationIndex] = None
         # Callback appelé quand une sauvegarde auto doit être déclenchée (tous les X modifications)
         self.autosave_trigger_callback: Optional[Callable] = None
         log_message("INFO", "RealTimeEditorBusiness initialisé", category="realtime_editor")
@@ -82,62 +93,55 @@ class RealTimeEditorBusiness:
                 log_message("ATTENTION", f"Erreur callback status: {e}", category="realtime_editor")
         log_message("INFO", f"Status: {message}", category="realtime_editor")
 
-    def _build_string_translation_cache(self):
-        """Scanne tous les fichiers de traduction une fois et construit un cache en mémoire."""
-        self._update_status("Création du cache de traductions...")
-        log_message("INFO", "Début de la construction du cache de traductions.", "realtime_editor")
-        cache: Dict[str, Any] = {}
-        
-        try:
-            game_dir = os.path.join(self.current_project_path, "game")
-            target_path_segment = os.path.join("tl", self.current_language)
-
-            for root, _, files in os.walk(game_dir):
-                if target_path_segment in root:
-                    for filename in files:
-                        if filename.endswith('.rpy'):
-                            filepath = os.path.join(root, filename)
-                            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                                lines = f.readlines()
-
-                            for i, line in enumerate(lines):
-                                if line.strip().startswith('old '):
-                                    old_match = re.search(r'old\s+"((?:\\.|[^"])*)"', line)
-                                    if old_match:
-                                        old_text = old_match.group(1)
-                                        if i + 1 < len(lines):
-                                            next_line = lines[i + 1]
-                                            new_match = re.search(r'new\s+"((?:\\.|[^"])*)"', next_line)
-                                            if new_match:
-                                                translated_text = new_match.group(1)
-                                                rel_path = os.path.relpath(filepath, self.current_project_path)
-                                                cache[old_text] = {
-                                                    'translated_text': translated_text,
-                                                    'tl_file': rel_path,
-                                                    'tl_line': i + 2
-                                                }
-        except Exception as e:
-            log_message("ERREUR", f"Erreur lors de la création du cache: {e}", "realtime_editor")
+    def _open_string_translation_index(self, project_path: str, language: str):
+        """Restaure l'index des chaînes enregistré (rapide) puis le met à jour en arrière-plan"""
+        index = StringTranslationIndex(project_path, language)
+        known = index.load()
+        self.string_translation_index = index
+        if known:
+            log_message("INFO", f"Index des chaînes restauré ({known} entrées), vérification des fichiers modifiés...", "realtime_editor")
 
-        self.string_translation_cache = cache
-        self._update_status(f"Cache créé ({len(cache)} entrées). Surveillance prête.")
-        log_message("INFO", f"Cache de traductions construit avec {len(cache)} entrées.", "realtime_editor")
+        def refresh_worker():
+            try:
+                stats = index.refresh()
+                self._update_status(f"Index des traductions prêt ({stats['strings']} entrées). Surveillance prête.")
+                log_message("INFO", f"Index des chaînes à jour: {stats['strings']} entrées | {stats['parsed']} fichier(s) relu(s), "
+                            f"{stats['unchanged']} inchangé(s), {stats['removed']} retiré(s)", "realtime_editor")
+            except Exception as e:
+                log_message("ERREUR", f"Erreur lors de la mise à jour de l'index des chaînes: {e}", "realtime_editor")
+
+        threading.Thread(target=refresh_worker, daemon=True).start()
+
+    def _remember_saved_translation(self, tl_file_path: str, base_project: str, original_text: str,
+                                    translated_text: str, tl_line: int):
+        """Tient l'index des chaînes et le cache des lignes à jour après l'écriture d'un fichier tl"""
+        self._remember_saved_translations(tl_file_path, base_project, [(original_text, translated_text, tl_line)])
+
+    def _remember_saved_translations(self, tl_file_path: str, base_project: str, saved: List[tuple]):
+        """Idem pour plusieurs traductions (original, traduction, ligne) écrites en une fois dans le fichier"""
+        tl_file_cache.invalidate(tl_file_path)
+        index = self.string_translation_index
+        if index is None:
+            return
+        index.update_file(tl_file_path)
+        rel_path = os.path.relpath(tl_file_path, base_project)
+        for original_text, translated_text, tl_line in saved:
+            if original_text:
+                index.remember(original_text, translated_text, rel_path, tl_line)
 
     def _find_string_translation_in_project(self, original_text: str) -> Dict[str, Any]:
-        """Recherche la traduction d'un string en utilisant le cache en mémoire."""
-        # Si le cache n'est pas encore prêt, on attend un tout petit peu.
-        if self.string_translation_cache is None:
-            time.sleep(0.5) # Petite attente pour que le cache finisse de se construire
-
-        # Si toujours pas prêt (très gros projet), on fait une recherche normale en fallback
-        if self.string_translation_cache is None:
-            log_message("ATTENTION", "Cache non disponible, recherche en temps réel effectuée.", "realtime_editor")
-            # Ici on pourrait appeler l'ancienne fonction de recherche si on voulait un fallback
-            return {'translated_text': original_text, 'tl_file': None, 'tl_line': 0}
-
-        # On cherche dans le cache. C'est quasi-instantané.
+        """Recherche la traduction d'un string dans l'index (jamais bloquant une fois l'index restauré)"""
         default_value = {'translated_text': original_text, 'tl_file': None, 'tl_line': 0}
-        return self.string_translation_cache.get(original_text, default_value)
+        index = self.string_translation_index
+        if index is None:
+            return default_value
+
+        # Première ouverture du projet (aucun index enregistré) : attendre la construction au plus 0,5 s
+        if not index.ready.is_set() and not index.ready.wait(0.5):
+            log_message("ATTENTION", "Index des chaînes en cours de construction, traduction non trouvée.", "realtime_editor")
+            return default_value
+
+        return index.get(original_text) or default_value
 
     def save_choice_translation(self, choice_info: Dict, new_translation: str, project_path: str = None) -> Dict[str, Any]:
         """Sauvegarde la traduction d'un choix (string)"""
@@ -196,6 +200,7 @@ class RealTimeEditorBusiness:
             # Écrire le fichier
             with open(tl_file_path, 'w', encoding='utf-8') as f:
                 f.writelines(lines)
+            self._remember_saved_translation(tl_file_path, base_project, None, None, tl_line)
             
             result['success'] = True
             result['modified_file'] = tl_file_path
@@ -212,11 +217,13 @@ class RealTimeEditorBusiness:
     # ===================================================================
     # NOUVELLE FONCTION AJOUTÉE
     # ===================================================================
-    def detect_multiple_dialogue_group(self, lines: List[str], target_line: int) -> Dict[str, Any]:
+    def detect_multiple_dialogue_group(self, lines: List[str], target_line: int,
+                                       block_starts: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         Version 3 - Robuste et définitive - Testée avec le fichier fourni.
         Cette version identifie tous les blocs 'multiple', les partitionne en groupes
         de la bonne taille, puis localise le groupe auquel appartient le dialogue actuel.
+        block_starts : débuts des blocs translate déjà connus (cache des fichiers tl)
         """
         log_message("DEBUG", f"=== DÉBUT DÉTECTION MULTIPLE (v3 - DÉFINITIVE) - Ligne {target_line} ===", category="realtime_editor")
 
@@ -279,7 +286,7 @@ class RealTimeEditorBusiness:
             }
 
         # --- Logique principale ---
-        all_block_starts = get_block_starts(lines)
+        all_block_starts = block_starts if block_starts is not None else get_block_starts(lines)
         tagged_blocks = []
         for i, start_line in enumerate(all_block_starts):
             end_line = all_block_starts[i + 1] if i + 1 < len(all_block_starts) else len(lines)
@@ -339,13 +346,12 @@ class RealTimeEditorBusiness:
                 if not os.path.exists(full_tl_path):
                     return {'is_multiple': False}
             
-            with open(full_tl_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            cached_file = tl_file_cache.get(full_tl_path)
             
             target_line_index = tl_line - 1
             
             # Appel de votre nouvelle fonction de détection
-            multiple_result = self.detect_multiple_dialogue_group(lines, target_line_index)
+            multiple_result = self.detect_multiple_dialogue_group(cached_file.lines, target_line_index, cached_file.block_starts)
             
             if not multiple_result['is_multiple']:
                 return {'is_multiple': False}
@@ -379,17 +385,18 @@ class RealTimeEditorBusiness:
         """
         Version améliorée qui gère la migration automatique des anciens formats
         """
+        if self._pending_journal is not None:
+            self._pending_journal.close()
         self.pending_modifications_file = os.path.join(project_path, "renextract_pending_modifications.json")
-        
+        journal = PendingModificationsJournal(self.pending_modifications_file)
+
         # VÉRIFIER s'il reste des données d'une session précédente (= crash détecté)
-        if os.path.exists(self.pending_modifications_file):
+        if os.path.exists(self.pending_modifications_file) or os.path.exists(journal.journal_path):
             try:
-                # Tenter la migration si nécessaire
+                # Tenter la migration si nécessaire (instantané), puis rejouer le journal
                 self._migrate_legacy_pending_file(self.pending_modifications_file)
-                
-                with open(self.pending_modifications_file, 'r', encoding='utf-8') as f:
-                    previous_data = json.load(f)
-                
+                previous_data = load_pending_state(self.pending_modifications_file)
+
                 if previous_data:  # Il y avait des modifications non sauvées
                     # CRÉER le fichier de récupération
                     recovery_file = self.pending_modifications_file.replace('.json', '_recovery.json')
@@ -402,8 +409,36 @@ class RealTimeEditorBusiness:
         
         # Réinitialiser pour la nouvelle session
         self.pending_modifications = {}
-        with open(self.pending_modifications_file, 'w', encoding='utf-8') as f:
-            json.dump({}, f)
+        self._pending_journal = journal
+        journal.compact({})
+
+    def _journal_pending(self, key: str):
+        """Ajoute l'état courant d'une clé (modifiée ou supprimée) au journal des modifications en attente"""
+        journal = self._pending_journal
+        if journal is None:
+            return
+        if key in self.pending_modifications:
+            journal.set(key, self.pending_modifications[key])
+        else:
+            journal.delete(key)
+        if journal.needs_compaction:
+            journal.compact(self.pending_modifications)
+
+    def persist_pending_modifications(self, keys: Optional[List[str]] = None):
+        """
+        Persiste les modifications en attente.
+
+        Args:
+            keys: clés modifiées ou supprimées à ajouter au journal ; None = réécrire
+                  l'instantané complet (compaction)
+        """
+        if self._pending_journal is None:
+            return
+        if keys is None:
+            self._pending_journal.compact(self.pending_modifications)
+        else:
+            for key in keys:
+                self._journal_pending(key)
 
     def save_speaker_dialogue_translation(self, dialogue_info: Dict, speaker_text: str, dialogue_text: str, project_path: str = None) -> Dict[str, Any]:
         """
@@ -425,20 +460,7 @@ class RealTimeEditorBusiness:
                 result['errors'].append("Informations dialogue incomplètes")
                 return result
 
-            # Résoudre le chemin complet
-            candidates = []
-            if os.path.isabs(tl_rel):
-                candidates.append(tl_rel)
-            else:
-                candidates.append(os.path.join(base_project, tl_rel))
-                candidates.append(os.path.join(base_project, "game", tl_rel))
-
-            tl_file_path = None
-            for cand in candidates:
-                if os.path.exists(cand):
-                    tl_file_path = cand
-                    break
-
+            tl_file_path = self._resolve_tl_file_path(tl_rel, base_project)
             if not tl_file_path:
                 result['errors'].append("Fichier de traduction non trouvé")
                 return result
@@ -462,14 +484,10 @@ class RealTimeEditorBusiness:
                 return result
 
             # 4) Modifier la ligne en remplaçant les deux segments
-            original_line = lines[target_index]
-            new_line = self._rebuild_speaker_dialogue_line(original_line, speaker_text, dialogue_text)
-            
-            if new_line is None:
-                result['errors'].append("Impossible de reconstruire la ligne")
+            applied = self._apply_speaker_dialogue_edit(lines, target_index, speaker_text, dialogue_text)
+            if 'error' in applied:
+                result['errors'].append(applied['error'])
                 return result
-                
-            lines[target_index] = new_line
 
             # 5) Écrire le fichier
             with open(tl_file_path, 'w', encoding='utf-8') as f:
@@ -481,21 +499,16 @@ class RealTimeEditorBusiness:
                 try:
                     with open(log_file_path, 'w', encoding='utf-8') as f:
                         f.write("")
-                    self.last_dialogue_line = 0
+                    self._reset_dialogue_log_tail()
                 except Exception as e:
                     log_message("ATTENTION", f"Erreur vidage fichier log: {e}", category="realtime_editor")
             
-            # ✅ Mettre à jour le cache de traductions avec la nouvelle valeur
+            # ✅ Mettre à jour l'index des traductions avec la nouvelle valeur
             original_text = dialogue_info.get('original_text', '')
-            if original_text and self.string_translation_cache is not None:
-                rel_path = os.path.relpath(tl_file_path, base_project)
-                # Pour les dialogues locuteur + dialogue, on stocke les deux parties séparées par un espace
-                combined_translation = f'"{speaker_text}" "{dialogue_text}"'
-                self.string_translation_cache[original_text] = {
-                    'translated_text': combined_translation,
-                    'tl_file': rel_path,
-                    'tl_line': target_index + 1
-                }
+            # Pour les dialogues locuteur + dialogue, on stocke les deux parties séparées par un espace
+            combined_translation = f'"{speaker_text}" "{dialogue_text}"'
+            self._remember_saved_translation(tl_file_path, base_project, original_text, combined_translation, target_index + 1)
+            if original_text:
                 log_message("DEBUG", f"Cache mis à jour pour locuteur + dialogue: {original_text[:50]}...", category="realtime_editor")
             
             result['success'] = True
@@ -510,6 +523,211 @@ class RealTimeEditorBusiness:
             log_message("ERREUR", f"Erreur sauvegarde locuteur + dialogue: {e}", category="realtime_editor")
             return result
 
+    # --- Application des modifications sur les lignes en mémoire ---
+    def _resolve_tl_file_path(self, tl_rel: str, base_project: str) -> Optional[str]:
+        """Chemin existant du fichier tl (absolu, relatif au projet ou au dossier game)"""
+        if not tl_rel:
+            return None
+        if os.path.isabs(tl_rel):
+            candidates = [tl_rel]
+        else:
+            candidates = [os.path.join(base_project, tl_rel), os.path.join(base_project, "game", tl_rel)]
+        return next((cand for cand in candidates if os.path.exists(cand)), None)
+
+    def _apply_simple_edit(self, lines: List[str], target_index: int, new_translation: str) -> Dict[str, Any]:
+        """
+        Remplace le texte de la ligne ciblée dans les lignes en mémoire (bloc strings ou bloc dialogue).
+
+        Returns:
+            dict: line_index (ligne réellement modifiée, 0-based) ou error
+        """
+        line = lines[target_index]
+
+        def _replace_first_quoted_text(s: str, replacement: str) -> str | None:
+            """Remplace le segment entre guillemets approprié par replacement avec échappement correct."""
+            
+            # Échapper correctement le remplacement
+            escaped_replacement = self._escape_quotes_properly(replacement)
+            
+            # Triples guillemets en priorité
+            matches_triple = list(re.finditer(r'\"\"\"(.*?)\"\"\"', s, re.DOTALL))
+            if matches_triple:
+                # Prendre le dernier match pour les triples guillemets
+                last_match = matches_triple[-1]
+                start, end = last_match.span(1)
+                return s[:start] + escaped_replacement.replace('\"\"\"', '\\\"\\\"\\\"') + s[end:]
+            
+            # Simples guillemets - chercher tous les matches (gère les échappements \")
+            matches_simple = list(re.finditer(r'\"((?:\\.|[^\"])*)\"', s))
+            if matches_simple:
+                if len(matches_simple) == 1:
+                    # Un seul segment, le remplacer
+                    match = matches_simple[0]
+                    start, end = match.span(1)
+                    return s[:start] + escaped_replacement + s[end:]
+                else:
+                    # Plusieurs segments - prendre le dernier (le dialogue)
+                    last_match = matches_simple[-1]
+                    start, end = last_match.span(1)
+                    return s[:start] + escaped_replacement + s[end:]
+            
+            # ✅ NOUVEAU : Gérer les guillemets simples (apostrophes) comme fallback
+            matches_single_quote = list(re.finditer(r"'((?:\\.|[^'])*)'", s))
+            if matches_single_quote:
+                last_match = matches_single_quote[-1]
+                start, end = last_match.span(1)
+                # Échapper les apostrophes dans le remplacement
+                escaped_for_single = escaped_replacement.replace("'", "\\'")
+                return s[:start] + escaped_for_single + s[end:]
+            
+            # ✅ NOUVEAU : Si la ligne contient "old" et "new", essayer de remplacer dans "new"
+            if 'old' in s.lower() and 'new' in s.lower():
+                # Pattern pour trouver "new" suivi de guillemets
+                new_match = re.search(r'new\s+\"((?:\\.|[^\"])*)\"', s)
+                if new_match:
+                    start, end = new_match.span(1)
+                    return s[:start] + escaped_replacement + s[end:]
+            
+            return None
+
+        # Choisir la stratégie selon le format
+        # Cas A : bloc strings (ligne avec 'new ')
+        if 'new ' in line:
+            if '\"\"\"' in line:
+                # Remplacement entre triples guillemets après 'new'
+                def repl(m):
+                    escaped_replacement = self._escape_quotes_properly(new_translation)
+                    return m.group(1) + escaped_replacement.replace('\"\"\"', '\\\"\\\"\\\"') + m.group(3)
+                new_line = re.sub(r'(new\s+\"\"\")(.+?)(\"\"\"\s*)', repl, line, count=1, flags=re.DOTALL)
+            else:
+                # Remplacement entre guillemets simples
+                escaped_replacement = self._escape_quotes_properly(new_translation)
+                new_line = re.sub(r'(new\s+\")((?:\\.|[^\"])*)(\"\s*)', r'\1' + escaped_replacement + r'\3', line, count=1)
+            lines[target_index] = new_line
+            return {'line_index': target_index}
+        else:
+            # Cas B : bloc translate dialogue
+            edit_index = target_index
+
+            # Si la ligne cible est commentée (souvent la VO), avancer à la 1re ligne utile
+            if line.strip().startswith('#'):
+                for j in range(target_index + 1, min(len(lines), target_index + 8)):
+                    sj = lines[j].strip()
+                    if sj and not sj.startswith('#') and ('"' in sj or "'" in sj):
+                        edit_index = j
+                        break
+
+            # ✅ AMÉLIORATION : Si la ligne trouvée n'a toujours pas de guillemets, chercher plus loin
+            edit_line = lines[edit_index]
+            if not ('"' in edit_line or "'" in edit_line):
+                # Chercher dans les lignes suivantes (jusqu'à 10 lignes)
+                for j in range(edit_index + 1, min(len(lines), edit_index + 11)):
+                    candidate = lines[j].strip()
+                    if candidate and not candidate.startswith('#') and ('"' in candidate or "'" in candidate):
+                        edit_index = j
+                        edit_line = lines[edit_index]
+                        break
+            
+            replaced = _replace_first_quoted_text(edit_line, new_translation)
+            
+            if replaced is None:
+                # ✅ AMÉLIORATION : Log détaillé pour diagnostiquer le problème
+                log_message("ERREUR", 
+                    f"Format de ligne non reconnu à la ligne {edit_index + 1}:\n"
+                    f"Ligne originale: {repr(edit_line[:200])}\n"
+                    f"Ligne cible: {repr(line[:200])}\n"
+                    f"Index cible: {target_index + 1}, Index édition: {edit_index + 1}",
+                    category="realtime_editor"
+                )
+                return {'error': f"Format de ligne non reconnu (ligne {edit_index + 1}): {edit_line.strip()[:100]}"}
+
+            lines[edit_index] = replaced
+            return {'line_index': edit_index}
+
+    def _apply_speaker_dialogue_edit(self, lines: List[str], target_index: int, speaker_text: str, dialogue_text: str) -> Dict[str, Any]:
+        """Remplace locuteur et dialogue de la ligne ciblée (nombre de lignes inchangé)"""
+        new_line = self._rebuild_speaker_dialogue_line(lines[target_index], speaker_text, dialogue_text)
+        if new_line is None:
+            return {'error': "Impossible de reconstruire la ligne"}
+        lines[target_index] = new_line
+        return {'line_index': target_index}
+
+    def _apply_split_edit(self, lines: List[str], target_index: int, part1_text: str, part2_text: str) -> Dict[str, Any]:
+        """
+        Met à jour un dialogue déjà divisé (2 lignes → 2) ou divise la ligne (1 ligne → 2).
+
+        Returns:
+            dict: line_index, start, old_count, new_count (plage de lignes remplacée)
+        """
+        has_next_new = (target_index + 1 < len(lines) and
+                        lines[target_index + 1].strip().startswith('new '))
+        if has_next_new:
+            # Cas: Déjà split, on met à jour les deux parties
+            self._update_split_lines(lines, target_index, part1_text, part2_text)
+            return {'line_index': target_index, 'start': target_index, 'old_count': 2, 'new_count': 2}
+        # Cas: Ligne simple, on la divise en deux
+        self._create_split_lines(lines, target_index, part1_text, part2_text)
+        return {'line_index': target_index, 'start': target_index, 'old_count': 1, 'new_count': 2}
+
+    def _apply_merge_edit(self, lines: List[str], target_index: int, merged_text: str) -> Dict[str, Any]:
+        """
+        Remplace le bloc de dialogue contenant la ligne ciblée par une seule ligne.
+
+        Returns:
+            dict: fallback_simple si le bloc n'a qu'une ligne, sinon line_index, start,
+                  old_count, new_count et removed_lines (indices d'origine supprimés)
+        """
+        dialogue_block = self._find_merge_dialogue_block(lines, target_index)
+        if len(dialogue_block) < 2:
+            return {'fallback_simple': True}
+
+        # Extraire le locuteur de la première ligne du bloc
+        first_line_index = dialogue_block[0]
+        speaker = self._extract_speaker_from_line(lines[first_line_index].strip())
+        escaped_text = self._escape_quotes_properly(merged_text)
+        if speaker:
+            new_line = f'    {speaker} "{escaped_text}"\n'
+        else:
+            new_line = f'    "{escaped_text}"\n'
+
+        # Remplacer la première ligne et supprimer les suivantes (en ordre inverse pour préserver les indices)
+        lines[first_line_index] = new_line
+        for line_index in sorted(dialogue_block[1:], reverse=True):
+            if line_index < len(lines):
+                lines.pop(line_index)
+
+        span = dialogue_block[-1] - first_line_index + 1
+        return {'line_index': first_line_index, 'start': first_line_index, 'old_count': span,
+                'new_count': span - (len(dialogue_block) - 1), 'removed_lines': dialogue_block[1:]}
+
+    def _apply_pending_edit(self, lines: List[str], target_index: int, modification_data: Dict) -> Dict[str, Any]:
+        """
+        Applique une modification en attente sur les lignes en mémoire.
+
+        Returns:
+            dict: comme les _apply_*_edit, plus translation (valeur retenue pour l'index des chaînes)
+        """
+        mod_type = modification_data['type']
+        content = modification_data.get('content', '')
+
+        if mod_type == 'split':
+            applied = self._apply_split_edit(lines, target_index, content['part1'], content['part2'])
+            translation = f"{content['part1']} {content['part2']}"
+        elif mod_type == 'speaker_dialogue':
+            applied = self._apply_speaker_dialogue_edit(lines, target_index, content['speaker'], content['dialogue'])
+            translation = f'"{content["speaker"]}" "{content["dialogue"]}"'
+        elif mod_type == 'merge':
+            applied = self._apply_merge_edit(lines, target_index, content)
+            if applied.get('fallback_simple'):
+                applied = self._apply_simple_edit(lines, target_index, content)
+            translation = content
+        else:
+            translation = str(content) if isinstance(content, dict) else content
+            applied = self._apply_simple_edit(lines, target_index, translation)
+
+        applied['translation'] = translation
+        return applied
+
     def _escape_quotes_properly(self, text: str) -> str:
         """
         Échappe correctement les guillemets en évitant le double échappement.
@@ -572,20 +790,7 @@ class RealTimeEditorBusiness:
                 result['errors'].append("Informations dialogue incomplètes")
                 return result
 
-            # Résoudre le chemin complet
-            candidates = []
-            if os.path.isabs(tl_rel):
-                candidates.append(tl_rel)
-            else:
-                candidates.append(os.path.join(base_project, tl_rel))
-                candidates.append(os.path.join(base_project, "game", tl_rel))
-
-            tl_file_path = None
-            for cand in candidates:
-                if os.path.exists(cand):
-                    tl_file_path = cand
-                    break
-
+            tl_file_path = self._resolve_tl_file_path(tl_rel, base_project)
             if not tl_file_path:
                 result['errors'].append("Fichier de traduction non trouvé")
                 return result
@@ -608,17 +813,8 @@ class RealTimeEditorBusiness:
                 result['errors'].append("Ligne de traduction hors limites")
                 return result
 
-            # 4) Analyser la situation actuelle
-            current_line = lines[target_index].strip()
-            has_next_new = (target_index + 1 < len(lines) and 
-                        lines[target_index + 1].strip().startswith('new '))
-
-            if has_next_new:
-                # Cas: Déjà split, on met à jour les deux parties
-                self._update_split_lines(lines, target_index, part1_text, part2_text)
-            else:
-                # Cas: Ligne simple, on la divise en deux
-                self._create_split_lines(lines, target_index, part1_text, part2_text)
+            # 4) Mettre à jour les deux parties ou diviser la ligne
+            self._apply_split_edit(lines, target_index, part1_text, part2_text)
 
             # 5) Écrire le fichier
             with open(tl_file_path, 'w', encoding='utf-8') as f:
@@ -630,21 +826,16 @@ class RealTimeEditorBusiness:
                 try:
                     with open(log_file_path, 'w', encoding='utf-8') as f:
                         f.write("")
-                    self.last_dialogue_line = 0
+                    self._reset_dialogue_log_tail()
                 except Exception as e:
                     log_message("ATTENTION", f"Erreur vidage fichier log: {e}", category="realtime_editor")
             
-            # ✅ Mettre à jour le cache de traductions avec la nouvelle valeur combinée
+            # ✅ Mettre à jour l'index des traductions avec la nouvelle valeur combinée
             original_text = dialogue_info.get('original_text', '')
-            if original_text and self.string_translation_cache is not None:
-                rel_path = os.path.relpath(tl_file_path, base_project)
-                # Pour les dialogues split, on stocke les deux parties concaténées avec un espace
-                combined_translation = f"{part1_text} {part2_text}"
-                self.string_translation_cache[original_text] = {
-                    'translated_text': combined_translation,
-                    'tl_file': rel_path,
-                    'tl_line': target_index + 1
-                }
+            # Pour les dialogues split, on stocke les deux parties concaténées avec un espace
+            combined_translation = f"{part1_text} {part2_text}"
+            self._remember_saved_translation(tl_file_path, base_project, original_text, combined_translation, target_index + 1)
+            if original_text:
                 log_message("DEBUG", f"Cache mis à jour pour dialogue split: {original_text[:50]}...", category="realtime_editor")
             
             result['success'] = True
@@ -777,15 +968,7 @@ class RealTimeEditorBusiness:
             tl_rel = dialogue_info.get('tl_file')
             tl_line_no = int(dialogue_info.get('tl_line', 0))
             
-            # Résoudre le chemin et charger le fichier
-            candidates = []
-            if os.path.isabs(tl_rel):
-                candidates.append(tl_rel)
-            else:
-                candidates.append(os.path.join(base_project, tl_rel))
-                candidates.append(os.path.join(base_project, "game", tl_rel))
-            
-            tl_file_path = next((p for p in candidates if os.path.exists(p)), None)
+            tl_file_path = self._resolve_tl_file_path(tl_rel, base_project)
             if not tl_file_path:
                 result['errors'].append("Fichier de traduction non trouvé")
                 return result
@@ -807,34 +990,12 @@ class RealTimeEditorBusiness:
                 result['errors'].append("Ligne cible hors limites")
                 return result
             
-            # LOGIQUE CORRIGÉE : Identifier le bloc de dialogue complet à fusionner
-            dialogue_block = self._find_merge_dialogue_block(lines, target_index)
-            
-            if len(dialogue_block) < 2:
+            # Identifier le bloc de dialogue complet, le remplacer par une seule ligne
+            applied = self._apply_merge_edit(lines, target_index, merged_text)
+            if applied.get('fallback_simple'):
                 # C'est une modification simple, pas une fusion
-                # On utilise la logique de save_translation pour ce cas
                 return self.save_translation(dialogue_info, merged_text, project_path)
-
-            # Extraire le locuteur de la première ligne du bloc
-            first_line_index = dialogue_block[0]
-            speaker = self._extract_speaker_from_line(lines[first_line_index].strip())
-            
-            # CORRECTION : Échapper correctement le texte fusionné
-            escaped_text = self._escape_quotes_properly(merged_text)
-            
-            # Construire la nouvelle ligne avec le bon locuteur
-            if speaker:
-                new_line = f'    {speaker} "{escaped_text}"\n'
-            else:
-                new_line = f'    "{escaped_text}"\n'
-            
-            # CORRECTION PRINCIPALE : Remplacer la première ligne et supprimer les suivantes
-            lines[first_line_index] = new_line
-            
-            # Supprimer toutes les lignes suivantes du bloc (en ordre inverse pour préserver les indices)
-            for line_index in sorted(dialogue_block[1:], reverse=True):
-                if line_index < len(lines):
-                    lines.pop(line_index)
+            first_line_index = applied['line_index']
             
             # Sauvegarder
             with open(tl_file_path, 'w', encoding='utf-8') as f:
@@ -845,23 +1006,18 @@ class RealTimeEditorBusiness:
             if os.path.exists(log_file_path):
                 with open(log_file_path, 'w', encoding='utf-8') as f:
                     f.write("")
-                self.last_dialogue_line = 0
+                self._reset_dialogue_log_tail()
             
-            # ✅ Mettre à jour le cache de traductions avec la nouvelle valeur fusionnée
+            # ✅ Mettre à jour l'index des traductions avec la nouvelle valeur fusionnée
             original_text = dialogue_info.get('original_text', '')
-            if original_text and self.string_translation_cache is not None:
-                rel_path = os.path.relpath(tl_file_path, base_project)
-                self.string_translation_cache[original_text] = {
-                    'translated_text': merged_text,
-                    'tl_file': rel_path,
-                    'tl_line': first_line_index + 1
-                }
+            self._remember_saved_translation(tl_file_path, base_project, original_text, merged_text, first_line_index + 1)
+            if original_text:
                 log_message("DEBUG", f"Cache mis à jour pour dialogue fusionné: {original_text[:50]}...", category="realtime_editor")
             
             result['success'] = True
             result['modified_file'] = tl_file_path
-            result['removed_lines'] = dialogue_block[1:]  # Lignes supprimées
-            log_message("INFO", f"Traduction fusionnée: {len(dialogue_block)} lignes → 1 ligne", category="realtime_editor")
+            result['removed_lines'] = applied['removed_lines']  # Lignes supprimées
+            log_message("INFO", f"Traduction fusionnée: {len(applied['removed_lines']) + 1} lignes → 1 ligne", category="realtime_editor")
             
         except Exception as e:
             result['errors'].append(f"Erreur fusion: {e}")
@@ -925,8 +1081,7 @@ class RealTimeEditorBusiness:
         result = {'success': False, 'recovered_count': 0, 'errors': [], 'legacy_converted': 0}
         
         try:
-            with open(recovery_file_path, 'r', encoding='utf-8') as f:
-                recovery_data = json.load(f)
+            recovery_data = load_pending_state(recovery_file_path)
             
             converted_data = {}
             legacy_count = 0
@@ -988,9 +1143,7 @@ class RealTimeEditorBusiness:
             result['success'] = True
             
             # Sauvegarder dans le fichier actuel avec le nouveau format
-            if self.pending_modifications_file:
-                with open(self.pending_modifications_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.pending_modifications, f, indent=2, ensure_ascii=False)
+            self.persist_pending_modifications()
             
             log_message("INFO", f"Récupération: {result['recovered_count']} modifications rechargées ({legacy_count} converties)", category="realtime_editor")
             
@@ -1072,8 +1225,7 @@ class RealTimeEditorBusiness:
             recovery_file = os.path.join(project_path, "renextract_pending_modifications_recovery.json")
             
             if os.path.exists(recovery_file):
-                with open(recovery_file, 'r', encoding='utf-8') as f:
-                    recovery_data = json.load(f)
+                recovery_data = load_pending_state(recovery_file)
                 
                 result['available'] = True
                 result['count'] = len(recovery_data)
@@ -1117,10 +1269,8 @@ class RealTimeEditorBusiness:
                         except Exception as e:
                             log_message("ATTENTION", f"Erreur callback sauvegarde auto: {e}", category="realtime_editor")
             
-            # Sauvegarder dans le fichier
-            if self.pending_modifications_file:
-                with open(self.pending_modifications_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.pending_modifications, f, indent=2, ensure_ascii=False)
+            # Ajouter la modification au journal (une ligne, sans réécrire les autres)
+            self._journal_pending(key)
             
             log_message("DEBUG", f"Modification en attente ajoutée: {key} (type: {modification_data['type']})", category="realtime_editor")
             return True
@@ -1427,28 +1577,31 @@ class RealTimeEditorBusiness:
 
             # Toujours reprendre à zéro pour une détection propre
             # Cela évite les problèmes de synchronisation avec d'anciens logs
-            self.last_dialogue_line = 0
+            self._reset_dialogue_log_tail(log_file_path)
             log_message("INFO", "Surveillance démarrée - lecture depuis le début du fichier log", category="realtime_editor")
 
             self.monitoring_active = True
 
-            # On lance la création du cache dans un thread séparé
-            self.string_translation_cache = None
-            cache_thread = threading.Thread(target=self._build_string_translation_cache, daemon=True)
-            cache_thread.start()
+            # Index des chaînes : restauré depuis le disque, fichiers modifiés relus en arrière-plan
+            self._open_string_translation_index(project_path, language)
             
             # --- LA PARTIE CORRIGÉE ---
             
             # Le worker pour la surveillance des dialogues
             def monitor_worker():
-                log_message("DEBUG", "Thread de surveillance démarré", category="realtime_editor")
-                while self.monitoring_active:
-                    try:
-                        self._check_for_dialogues(log_file_path)
-                        time.sleep(0.2)
-                    except Exception as e:
-                        log_message("ERREUR", f"Erreur dans le thread de surveillance: {e}", category="realtime_editor")
-                        break
+                # Réveil sur notification système (inotify / Windows) ou intervalle adaptatif
+                watcher = LogChangeWatcher(log_file_path)
+                log_message("DEBUG", f"Thread de surveillance démarré (notifications: {'oui' if watcher.uses_notifications else 'non'})", category="realtime_editor")
+                try:
+                    while self.monitoring_active:
+                        try:
+                            had_activity = self._check_for_dialogues(log_file_path)
+                            watcher.wait(had_activity)
+                        except Exception as e:
+                            log_message("ERREUR", f"Erreur dans le thread de surveillance: {e}", category="realtime_editor")
+                            break
+                finally:
+                    watcher.close()
                 log_message("DEBUG", "Thread de surveillance arrêté", category="realtime_editor")
             
             # LA LIGNE MANQUANTE : On doit créer l'attribut .monitoring_thread ici
@@ -1482,6 +1635,10 @@ class RealTimeEditorBusiness:
             # Nettoyer les fichiers temporaires
             self._cleanup_temporary_files(result)
             
+            # Enregistrer l'index des chaînes mis à jour par les sauvegardes de la session
+            if self.string_translation_index is not None:
+                self.string_translation_index.save()
+            
             result['success'] = True
             self._update_status("Surveillance arrêtée")
             
@@ -1501,17 +1658,16 @@ class RealTimeEditorBusiness:
         """
         try:
             # 1. Nettoyer le fichier JSON des modifications en attente
-            if self.pending_modifications_file and os.path.exists(self.pending_modifications_file):
+            if self._pending_journal is not None and os.path.exists(self.pending_modifications_file):
                 try:
-                    # Vérifier si le fichier est vide ou ne contient que {}
-                    with open(self.pending_modifications_file, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                    
-                    if not content or content == '{}':
-                        os.remove(self.pending_modifications_file)
+                    if not self.pending_modifications:
+                        self._pending_journal.remove_files()
                         result['cleaned_files'].append(os.path.basename(self.pending_modifications_file))
                         log_message("INFO", f"Fichier JSON vide supprimé: {os.path.basename(self.pending_modifications_file)}", category="realtime_editor")
                     else:
+                        # Instantané complet : la récupération n'a plus besoin du journal
+                        self._pending_journal.compact(self.pending_modifications)
+                        self._pending_journal.close()
                         log_message("DEBUG", f"Fichier JSON conservé (contient des modifications): {os.path.basename(self.pending_modifications_file)}", category="realtime_editor")
                         
                 except Exception as e:
@@ -1530,7 +1686,7 @@ class RealTimeEditorBusiness:
             
             # 3. Réinitialiser les variables
             self.pending_modifications = {}
-            self.last_dialogue_line = 0
+            self._reset_dialogue_log_tail()
             
             if result['cleaned_files']:
                 log_message("INFO", f"Nettoyage terminé: {len(result['cleaned_files'])} fichier(s) supprimé(s)", category="realtime_editor")
@@ -1552,47 +1708,25 @@ class RealTimeEditorBusiness:
             
             base_project = project_path or self.current_project_path
             saved_count = 0
-            
+
             # Itérer sur une copie pour pouvoir supprimer des éléments
-            for key, mod_entry in list(self.pending_modifications.items()):
+            entries = list(self.pending_modifications.items())
+
+            # Regroupement par fichier : une sauvegarde et une écriture atomique par fichier
+            batch_results = {}
+            if config_manager.get('realtime_batch_flush', True):
+                batch_results = self._save_pending_batch(entries, base_project)
+
+            for key, mod_entry in entries:
                 try:
                     dialogue_info = mod_entry['dialogue_info']
                     modification_data = mod_entry['modification_data']
                     mod_type = modification_data['type']
-                    
-                    # Dispatcher selon le type de modification
-                    if mod_type == 'simple':
-                        save_result = self.save_translation(
-                            dialogue_info, 
-                            modification_data['content'], 
-                            base_project
-                        )
-                    elif mod_type == 'split':
-                        save_result = self.save_split_translation(
-                            dialogue_info,
-                            modification_data['content']['part1'],
-                            modification_data['content']['part2'],
-                            base_project
-                        )
-                    elif mod_type == 'speaker_dialogue':
-                        save_result = self.save_speaker_dialogue_translation(
-                            dialogue_info,
-                            modification_data['content']['speaker'],
-                            modification_data['content']['dialogue'],
-                            base_project
-                        )
-                    elif mod_type == 'merge':
-                        save_result = self.save_merge_translation(
-                            dialogue_info,
-                            modification_data['content'],
-                            base_project
-                        )
-                    else:
-                        content = modification_data.get('content', '')
-                        if isinstance(content, dict):
-                            content = str(content)
-                        save_result = self.save_translation(dialogue_info, content, base_project)
-                    
+
+                    save_result = batch_results.get(key)
+                    if save_result is None:
+                        save_result = self._save_pending_modification(dialogue_info, modification_data, base_project)
+
                     if save_result['success']:
                         saved_count += 1
                         result['details'].append({
@@ -1624,16 +1758,11 @@ class RealTimeEditorBusiness:
             
             # Réécrire le fichier JSON avec les modifications restantes (celles qui ont échoué)
             # Si toutes les modifications ont été sauvegardées avec succès, vider complètement le fichier
-            if self.pending_modifications_file:
+            # (compaction : instantané réécrit, journal vidé)
+            if self._pending_journal is not None:
+                self._pending_journal.compact(self.pending_modifications)
                 if len(self.pending_modifications) == 0:
-                    # Toutes les modifications ont été sauvegardées avec succès, vider le fichier
-                    with open(self.pending_modifications_file, 'w', encoding='utf-8') as f:
-                        f.write('{}')  # Fichier JSON vide
                     log_message("INFO", "Fichier de modifications en attente vidé après sauvegarde complète", category="realtime_editor")
-                else:
-                    # Il reste des modifications qui ont échoué, les garder dans le fichier
-                    with open(self.pending_modifications_file, 'w', encoding='utf-8') as f:
-                        json.dump(self.pending_modifications, f, indent=2, ensure_ascii=False)
             
             result['success'] = True
             result['saved_count'] = saved_count
@@ -1648,34 +1777,253 @@ class RealTimeEditorBusiness:
         
         return result
 
-    def _check_for_dialogues(self, log_file_path: str):
-        """Version finale qui gère le nouveau format de log pour les menus."""
+    def _save_pending_modification(self, dialogue_info: Dict, modification_data: Dict, base_project: str) -> Dict[str, Any]:
+        """Sauvegarde unitaire d'une modification en attente (dispatch selon son type)"""
+        mod_type = modification_data['type']
+        # Dispatcher selon le type de modification
+        if mod_type == 'simple':
+            return self.save_translation(
+                dialogue_info, 
+                modification_data['content'], 
+                base_project
+            )
+        elif mod_type == 'split':
+            return self.save_split_translation(
+                dialogue_info,
+                modification_data['content']['part1'],
+                modification_data['content']['part2'],
+                base_project
+            )
+        elif mod_type == 'speaker_dialogue':
+            return self.save_speaker_dialogue_translation(
+                dialogue_info,
+                modification_data['content']['speaker'],
+                modification_data['content']['dialogue'],
+                base_project
+            )
+        elif mod_type == 'merge':
+            return self.save_merge_translation(
+                dialogue_info,
+                modification_data['content'],
+                base_project
+            )
+        else:
+            content = modification_data.get('content', '')
+            if isinstance(content, dict):
+                content = str(content)
+            return self.save_translation(dialogue_info, content, base_project)
+
+    def _save_pending_batch(self, entries: List[tuple], base_project: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Sauvegarde groupée des modifications en attente.
+
+        Les modifications sont regroupées par fichier ; chaque fichier est sauvegardé une
+        fois (backup REALTIME_EDIT), modifié en mémoire de bas en haut puis écrit en une
+        seule fois (fichier temporaire + remplacement atomique).
+
+        Returns:
+            dict: clé -> résultat au format de save_translation (modifications traitées)
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        by_file: Dict[str, List[tuple]] = {}
+
+        for key, mod_entry in entries:
+            try:
+                dialogue_info = mod_entry['dialogue_info']
+                tl_line_no = int(dialogue_info.get('tl_line', 0) or 0)
+                if not base_project or not dialogue_info.get('tl_file') or tl_line_no <= 0:
+                    continue  # Erreur détaillée par la sauvegarde unitaire
+                tl_file_path = self._resolve_tl_file_path(dialogue_info['tl_file'], base_project)
+                if not tl_file_path:
+                    results[key] = {'success': False, 'errors': ["Fichier de traduction non trouvé"]}
+                    continue
+                by_file.setdefault(tl_file_path, []).append((tl_line_no - 1, key, mod_entry))
+            except Exception as e:
+                results[key] = {'success': False, 'errors': [f"Erreur sauvegarde: {e}"]}
+
+        for tl_file_path, edits in by_file.items():
+            results.update(self._apply_pending_file_batch(tl_file_path, edits, base_project))
+
+        # Vider le fichier log une seule fois pour forcer la recapture des nouveaux dialogues
+        if any(r.get('success') for r in results.values()):
+            log_file_path = os.path.join(base_project, "renextract_dialogue_log.txt")
+            if os.path.exists(log_file_path):
+                try:
+                    with open(log_file_path, 'w', encoding='utf-8') as f:
+                        f.write("")
+                    self._reset_dialogue_log_tail()
+                except Exception as e:
+                    log_message("ATTENTION", f"Erreur vidage fichier log: {e}", category="realtime_editor")
+
+        return results
+
+    def _apply_pending_file_batch(self, tl_file_path: str, edits: List[tuple], base_project: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Applique les modifications (index d'origine, clé, entrée) d'un fichier et l'écrit une fois.
+
+        Les numéros de ligne des modifications en attente se rapportent tous au fichier
+        d'origine : elles sont appliquées de la plus basse à la plus haute dans le fichier,
+        et chaque plage remplacée (division, fusion) décale les lignes déjà retenues
+        qui la suivent. Une modification située dans une plage dont le nombre de lignes
+        a changé, ou déjà appliquée dans une plage remplacée ensuite, est laissée en
+        attente (conflit).
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        file_name = os.path.basename(tl_file_path)
+
+        backup_result = self.backup_manager.create_backup(
+            tl_file_path,
+            BackupType.REALTIME_EDIT,
+            "Sauvegarde avant sauvegarde en lot temps réel"
+        )
+        backup_created = bool(backup_result.get('success'))
+        if not backup_created:
+            log_message("ATTENTION", f"Échec backup: {backup_result.get('error')}", category="realtime_editor")
+
         try:
-            if not os.path.exists(log_file_path): return
-            
-            with open(log_file_path, 'r', encoding='utf-8') as f:
+            with open(tl_file_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
-            
-            if len(lines) <= self.last_dialogue_line: return
-            
-            in_menu, menu_choices, current_line_index = False, [], self.last_dialogue_line
-            previous_effective_line = None  # Pour filtrer les doublons consécutifs
-            
-            while current_line_index < len(lines):
-                line = lines[current_line_index].strip()
+        except Exception as e:
+            for _, key, _ in edits:
+                results[key] = {'success': False, 'errors': [f"Erreur lecture {file_name}: {e}"]}
+            return results
+
+        applied_ranges = []  # (début, lignes remplacées, nouvelles lignes) dans l'ordre d'application
+        saved = {}  # clé -> [ligne modifiée (0-based, coordonnées courantes), original, traduction]
+        origins = {key: original_index for original_index, key, _ in edits}
+
+        for original_index, key, mod_entry in sorted(edits, key=lambda edit: edit[0], reverse=True):
+            # Position actuelle de la ligne d'origine après les plages déjà remplacées
+            target_index = original_index
+            conflict = False
+            for start, old_count, new_count in applied_ranges:
+                if target_index >= start + old_count:
+                    target_index += new_count - old_count
+                elif target_index >= start and old_count != new_count:
+                    conflict = True
+                    break
+            if conflict:
+                results[key] = {'success': False, 'errors': [
+                    f"Ligne {original_index + 1} déjà modifiée par une division/fusion en attente, modification conservée"]}
+                continue
+            if target_index < 0 or target_index >= len(lines):
+                results[key] = {'success': False, 'errors': ["Ligne de traduction hors limites"]}
+                continue
+
+            try:
+                applied = self._apply_pending_edit(lines, target_index, mod_entry['modification_data'])
+            except Exception as e:
+                applied = {'error': f"Erreur sauvegarde: {e}"}
+            if 'error' in applied:
+                results[key] = {'success': False, 'errors': [applied['error']]}
+                continue
+
+            if 'start' in applied:
+                start, old_count, new_count = applied['start'], applied['old_count'], applied['new_count']
+                # Modifications déjà appliquées dans la plage remplacée : écrasées par celle-ci
+                for overwritten_key in [k for k, entry in saved.items() if start <= entry[0] < start + old_count]:
+                    del saved[overwritten_key]
+                    results[overwritten_key] = {'success': False, 'errors': [
+                        f"Ligne {origins[overwritten_key] + 1} remplacée par une division/fusion en attente, modification conservée"]}
+                if old_count != new_count:
+                    applied_ranges.append((start, old_count, new_count))
+                    for entry in saved.values():
+                        if entry[0] >= start + old_count:
+                            entry[0] += new_count - old_count
+            saved[key] = [applied['line_index'], mod_entry['dialogue_info'].get('original_text', ''), applied['translation']]
+
+        if not saved:
+            return results
+
+        # Écriture unique : fichier temporaire dans le même dossier puis remplacement atomique
+        temp_path = f"{tl_file_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            try:
+                shutil.copymode(tl_file_path, temp_path)
+            except OSError:
+                pass
+            os.replace(temp_path, tl_file_path)
+        except Exception as e:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            log_message("ERREUR", f"Erreur écriture en lot {file_name}: {e}", category="realtime_editor")
+            for key in saved:
+                results[key] = {'success': False, 'errors': [f"Erreur écriture: {e}"]}
+            return results
+
+        self._remember_saved_translations(
+            tl_file_path, base_project,
+            [(original_text, translation, line_index + 1) for line_index, original_text, translation in saved.values()])
+
+        for key, (line_index, _, _) in saved.items():
+            results[key] = {'success': True, 'errors': [], 'backup_created': backup_created,
+                            'modified_file': tl_file_path, 'modified_line': line_index + 1}
+
+        log_message("INFO", f"Sauvegarde en lot {file_name}: {len(saved)} modification(s), 1 écriture", category="realtime_editor")
+        return results
+
+    def _reset_dialogue_log_tail(self, log_file_path: str = None):
+        """Reprend la lecture du log de dialogues au début (log vidé ou nouvelle session)"""
+        with self._dialogue_log_lock:
+            if log_file_path and (self.dialogue_log_tail is None or self.dialogue_log_tail.path != log_file_path):
+                self.dialogue_log_tail = LogTailReader(log_file_path)
+            elif self.dialogue_log_tail is not None:
+                self.dialogue_log_tail.reset()
+            self._log_menu_choices = None
+
+    def _check_for_dialogues(self, log_file_path: str) -> bool:
+        """
+        Traite les lignes ajoutées au log depuis la lecture précédente (format avec menus).
+        Seuls les octets ajoutés sont lus ; une ligne incomplète ou un menu dont MENU_END
+        n'est pas encore écrit sont repris à la lecture suivante.
+        
+        Returns:
+            True si de nouvelles lignes ont été lues
+        """
+        try:
+            with self._dialogue_log_lock:
+                if self.dialogue_log_tail is None or self.dialogue_log_tail.path != log_file_path:
+                    self._reset_dialogue_log_tail(log_file_path)
+                
+                lines = self.dialogue_log_tail.read_new_lines()
+                if lines is None:
+                    # Log vidé ou remplacé : relecture depuis le début, menu en cours abandonné
+                    self._log_menu_choices = None
+                    lines = self.dialogue_log_tail.read_new_lines() or []
+                if not lines:
+                    return False
+                
+                self._process_dialogue_log_lines(lines)
+                return True
+                            
+        except Exception as e:
+            log_message("ERREUR", f"Erreur vérification dialogues: {e}", category="realtime_editor")
+            return False
+
+    def _process_dialogue_log_lines(self, lines: List[str]):
+        """Interprète les nouvelles lignes du log (dialogues, menus MENU_START/CHOICE|/MENU_END)"""
+        menu_choices = self._log_menu_choices
+        in_menu = menu_choices is not None
+        previous_effective_line = None  # Pour filtrer les doublons consécutifs
+        
+        try:
+            for raw_line in lines:
+                line = raw_line.strip()
                 if not line:
-                    current_line_index += 1
                     continue
                 
                 # Filtrer les lignes placeholders provenant d'anciens modules (v1) encore présents
                 # Exemple: "{0}|{1}|{2}|{3}|{4}"
                 if line == "{0}|{1}|{2}|{3}|{4}":
-                    current_line_index += 1
                     continue
                 
                 # Filtrer les doublons consécutifs exacts (certaines versions loggent deux fois la même ligne)
                 if previous_effective_line is not None and line == previous_effective_line:
-                    current_line_index += 1
                     continue
                 
                 if line == "MENU_START":
@@ -1688,7 +2036,7 @@ class RealTimeEditorBusiness:
                             'choice_count': len(menu_choices),
                             'grid_rows': (len(menu_choices) + 1) // 2, 'grid_cols': 2
                         })
-                    menu_choices = []
+                    menu_choices = None
                 # Dans la section menu de _check_for_dialogues
                 elif in_menu and line.startswith("CHOICE|"):
                     original_text = line[7:]
@@ -1716,13 +2064,10 @@ class RealTimeEditorBusiness:
                         else:
                             self._notify_dialogue(dialogue_info)
                 
-                current_line_index += 1
                 previous_effective_line = line
-            
-            self.last_dialogue_line = len(lines)
-                            
-        except Exception as e:
-            log_message("ERREUR", f"Erreur vérification dialogues: {e}", category="realtime_editor")
+        finally:
+            # Menu sans MENU_END pour l'instant : complété à la lecture suivante
+            self._log_menu_choices = menu_choices if in_menu else None
 
     def get_pending_modifications_summary(self) -> Dict[str, Any]:
         """
@@ -1773,10 +2118,9 @@ class RealTimeEditorBusiness:
             # Vider le cache en mémoire
             self.pending_modifications = {}
             
-            # Vider le fichier JSON
-            if self.pending_modifications_file:
-                with open(self.pending_modifications_file, 'w', encoding='utf-8') as f:
-                    f.write('{}')  # Fichier JSON vide
+            # Vider le fichier JSON et son journal
+            if self._pending_journal is not None:
+                self._pending_journal.compact({})
                 log_message("INFO", "Toutes les modifications en attente ont été vidées", category="realtime_editor")
             
             return True
@@ -1810,8 +2154,7 @@ class RealTimeEditorBusiness:
                             source_file_path = os.path.join(self.current_project_path, source_file)
                         
                         if os.path.exists(source_file_path):
-                            with open(source_file_path, 'r', encoding='utf-8') as f:
-                                lines = f.readlines()
+                            lines = tl_file_cache.get_lines(source_file_path)
                             
                             if 0 <= source_line - 1 < len(lines):
                                 source_line_content = lines[source_line - 1]
@@ -1850,8 +2193,7 @@ class RealTimeEditorBusiness:
                 if not os.path.exists(tl_file_path):
                     return displayed_text, displayed_text
             
-            with open(tl_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            lines = tl_file_cache.get_lines(tl_file_path)
             
             target_index = tl_line - 1
             if target_index < 0 or target_index >= len(lines):
@@ -1972,8 +2314,7 @@ class RealTimeEditorBusiness:
                 if not os.path.exists(tl_file_path):
                     return None
             
-            with open(tl_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            lines = tl_file_cache.get_lines(tl_file_path)
             
             target_line = dialogue_info.get('tl_line', 0) - 1
             if target_line < 0 or target_line >= len(lines):
@@ -2062,20 +2403,7 @@ class RealTimeEditorBusiness:
                 result['errors'].append("Informations dialogue incomplètes")
                 return result
 
-            # Normaliser le chemin
-            candidates = []
-            if os.path.isabs(tl_rel):
-                candidates.append(tl_rel)
-            else:
-                candidates.append(os.path.join(base_project, tl_rel))
-                candidates.append(os.path.join(base_project, "game", tl_rel))
-
-            tl_file_path = None
-            for cand in candidates:
-                if os.path.exists(cand):
-                    tl_file_path = cand
-                    break
-
+            tl_file_path = self._resolve_tl_file_path(tl_rel, base_project)
             if not tl_file_path:
                 result['errors'].append("Fichier de traduction non trouvé")
                 return result
@@ -2101,109 +2429,12 @@ class RealTimeEditorBusiness:
                 result['errors'].append("Ligne de traduction hors limites")
                 return result
 
-            line = lines[target_index]
-
-            def _replace_first_quoted_text(s: str, replacement: str) -> str | None:
-                """Remplace le segment entre guillemets approprié par replacement avec échappement correct."""
-                
-                # Échapper correctement le remplacement
-                escaped_replacement = self._escape_quotes_properly(replacement)
-                
-                # Triples guillemets en priorité
-                matches_triple = list(re.finditer(r'\"\"\"(.*?)\"\"\"', s, re.DOTALL))
-                if matches_triple:
-                    # Prendre le dernier match pour les triples guillemets
-                    last_match = matches_triple[-1]
-                    start, end = last_match.span(1)
-                    return s[:start] + escaped_replacement.replace('\"\"\"', '\\\"\\\"\\\"') + s[end:]
-                
-                # Simples guillemets - chercher tous les matches (gère les échappements \")
-                matches_simple = list(re.finditer(r'\"((?:\\.|[^\"])*)\"', s))
-                if matches_simple:
-                    if len(matches_simple) == 1:
-                        # Un seul segment, le remplacer
-                        match = matches_simple[0]
-                        start, end = match.span(1)
-                        return s[:start] + escaped_replacement + s[end:]
-                    else:
-                        # Plusieurs segments - prendre le dernier (le dialogue)
-                        last_match = matches_simple[-1]
-                        start, end = last_match.span(1)
-                        return s[:start] + escaped_replacement + s[end:]
-                
-                # ✅ NOUVEAU : Gérer les guillemets simples (apostrophes) comme fallback
-                matches_single_quote = list(re.finditer(r"'((?:\\.|[^'])*)'", s))
-                if matches_single_quote:
-                    last_match = matches_single_quote[-1]
-                    start, end = last_match.span(1)
-                    # Échapper les apostrophes dans le remplacement
-                    escaped_for_single = escaped_replacement.replace("'", "\\'")
-                    return s[:start] + escaped_for_single + s[end:]
-                
-                # ✅ NOUVEAU : Si la ligne contient "old" et "new", essayer de remplacer dans "new"
-                if 'old' in s.lower() and 'new' in s.lower():
-                    # Pattern pour trouver "new" suivi de guillemets
-                    new_match = re.search(r'new\s+\"((?:\\.|[^\"])*)\"', s)
-                    if new_match:
-                        start, end = new_match.span(1)
-                        return s[:start] + escaped_replacement + s[end:]
-                
-                return None
-
-            # 4) Choisir la stratégie selon le format
-            # Cas A : bloc strings (ligne avec 'new ')
-            if 'new ' in line:
-                if '\"\"\"' in line:
-                    # Remplacement entre triples guillemets après 'new'
-                    def repl(m):
-                        escaped_replacement = self._escape_quotes_properly(new_translation)
-                        return m.group(1) + escaped_replacement.replace('\"\"\"', '\\\"\\\"\\\"') + m.group(3)
-                    new_line = re.sub(r'(new\s+\"\"\")(.+?)(\"\"\"\s*)', repl, line, count=1, flags=re.DOTALL)
-                else:
-                    # Remplacement entre guillemets simples
-                    escaped_replacement = self._escape_quotes_properly(new_translation)
-                    new_line = re.sub(r'(new\s+\")((?:\\.|[^\"])*)(\"\s*)', r'\1' + escaped_replacement + r'\3', line, count=1)
-                lines[target_index] = new_line
-                modified_index = target_index
-            else:
-                # Cas B : bloc translate dialogue
-                edit_index = target_index
-
-                # Si la ligne cible est commentée (souvent la VO), avancer à la 1re ligne utile
-                if line.strip().startswith('#'):
-                    for j in range(target_index + 1, min(len(lines), target_index + 8)):
-                        sj = lines[j].strip()
-                        if sj and not sj.startswith('#') and ('"' in sj or "'" in sj):
-                            edit_index = j
-                            break
-
-                # ✅ AMÉLIORATION : Si la ligne trouvée n'a toujours pas de guillemets, chercher plus loin
-                edit_line = lines[edit_index]
-                if not ('"' in edit_line or "'" in edit_line):
-                    # Chercher dans les lignes suivantes (jusqu'à 10 lignes)
-                    for j in range(edit_index + 1, min(len(lines), edit_index + 11)):
-                        candidate = lines[j].strip()
-                        if candidate and not candidate.startswith('#') and ('"' in candidate or "'" in candidate):
-                            edit_index = j
-                            edit_line = lines[edit_index]
-                            break
-                
-                replaced = _replace_first_quoted_text(edit_line, new_translation)
-                
-                if replaced is None:
-                    # ✅ AMÉLIORATION : Log détaillé pour diagnostiquer le problème
-                    log_message("ERREUR", 
-                        f"Format de ligne non reconnu à la ligne {edit_index + 1}:\n"
-                        f"Ligne originale: {repr(edit_line[:200])}\n"
-                        f"Ligne cible: {repr(line[:200])}\n"
-                        f"Index cible: {target_index + 1}, Index édition: {edit_index + 1}",
-                        category="realtime_editor"
-                    )
-                    result['errors'].append(f"Format de ligne non reconnu (ligne {edit_index + 1}): {edit_line.strip()[:100]}")
-                    return result
-
-                lines[edit_index] = replaced
-                modified_index = edit_index
+            # 4) Remplacer le texte (bloc strings ou bloc translate dialogue)
+            applied = self._apply_simple_edit(lines, target_index, new_translation)
+            if 'error' in applied:
+                result['errors'].append(applied['error'])
+                return result
+            modified_index = applied['line_index']
 
             # 5) Écrire le fichier
             with open(tl_file_path, 'w', encoding='utf-8') as f:
@@ -2216,21 +2447,16 @@ class RealTimeEditorBusiness:
                     with open(log_file_path, 'w', encoding='utf-8') as f:
                         f.write("")
                     # Réinitialiser le compteur de lignes pour le monitoring
-                    self.last_dialogue_line = 0
+                    self._reset_dialogue_log_tail()
                     log_message("DEBUG", "Fichier log vidé après sauvegarde pour forcer recapture", category="realtime_editor")
                 except Exception as e:
                     log_message("ATTENTION", f"Erreur vidage fichier log: {e}", category="realtime_editor")
                     # Ne pas faire échouer la sauvegarde à cause de cela
             
-            # ✅ Mettre à jour le cache de traductions avec la nouvelle valeur
+            # ✅ Mettre à jour l'index des traductions avec la nouvelle valeur
             original_text = dialogue_info.get('original_text', '')
-            if original_text and self.string_translation_cache is not None:
-                rel_path = os.path.relpath(tl_file_path, base_project)
-                self.string_translation_cache[original_text] = {
-                    'translated_text': new_translation,
-                    'tl_file': rel_path,
-                    'tl_line': modified_index + 1
-                }
+            self._remember_saved_translation(tl_file_path, base_project, original_text, new_translation, modified_index + 1)
+            if original_text:
                 log_message("DEBUG", f"Cache mis à jour pour: {original_text[:50]}...", category="realtime_editor")
             
             result['success'] = True
@@ -2402,9 +2628,9 @@ class RealTimeEditorBusiness:
                 self.stop_monitoring()
             
             # NOUVEAU: Nettoyer le fichier JSON temporaire
-            if self.pending_modifications_file and os.path.exists(self.pending_modifications_file):
+            if self._pending_journal is not None:
                 try:
-                    os.remove(self.pending_modifications_file)
+                    self._pending_journal.remove_files()
                     log_message("DEBUG", "Fichier JSON temporaire supprimé", category="realtime_editor")
                 except Exception as e:
                     log_message("ATTENTION", f"Erreur suppression fichier JSON: {e}", category="realtime_editor")
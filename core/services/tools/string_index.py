@@ -0,0 +1,95 @@
+# core/services/tools/string_index.py
+"""
+Recherche groupée de chaînes dans les sources du jeu (automate d'Aho–Corasick)
+- Automate construit une fois sur l'ensemble des chaînes recherchées
+- Un seul parcours des fichiers game/ répond à toutes les recherches
+- Sémantique identique à « chaîne in contenu » pour chaque fichier
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+__all__ = ['MultiStringMatcher']
+
+
+class MultiStringMatcher:
+    """Automate d'Aho–Corasick : quelles chaînes parmi N apparaissent dans un ensemble de textes"""
+
+    def __init__(self, patterns: Iterable[str]):
+        # Chaînes vides ignorées (toujours présentes, traitées par l'appelant)
+        self.patterns: List[str] = list(dict.fromkeys(p for p in patterns if p))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[List[int]] = [[]]
+        self._fail: List[int] = [0]
+        self._output_link: List[int] = [0]
+        self._build()
+
+    def _build(self):
+        goto, outputs = self._goto, self._outputs
+        for pattern_id, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    goto.append({})
+                    outputs.append([])
+                    next_node = len(goto) - 1
+                    goto[node][char] = next_node
+                node = next_node
+            outputs[node].append(pattern_id)
+
+        node_count = len(goto)
+        fail = [0] * node_count
+        # Lien vers le plus proche suffixe qui termine une chaîne (0 = aucun)
+        output_link = [0] * node_count
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                candidate = goto[state].get(char, 0)
+                fail[child] = candidate if candidate != child else 0
+                output_link[child] = fail[child] if outputs[fail[child]] else output_link[fail[child]]
+        self._fail = fail
+        self._output_link = output_link
+
+    def find_present(self, texts: Iterable[str]) -> Set[str]:
+        """Retourne les chaînes présentes dans au moins un des textes (arrêt anticipé si toutes trouvées)"""
+        goto, fail, outputs, output_link = self._goto, self._fail, self._outputs, self._output_link
+        patterns = self.patterns
+        # Transitions déterministes complétées à la demande (évite de remonter les liens d'échec à chaque caractère)
+        delta = [dict(transitions) for transitions in goto]
+        # Noeuds dont la chaîne de sorties n'a pas encore été relevée
+        pending = [bool(outputs[n] or output_link[n]) for n in range(len(goto))]
+        found: Set[str] = set()
+        remaining = len(patterns)
+        if not remaining:
+            return found
+
+        for text in texts:
+            node = 0
+            for char in text:
+                next_node = delta[node].get(char)
+                if next_node is None:
+                    state = node
+                    while state and char not in goto[state]:
+                        state = fail[state]
+                    next_node = goto[state].get(char, 0)
+                    delta[node][char] = next_node
+                node = next_node
+                if pending[node]:
+                    pending[node] = False
+                    state = node
+                    while state:
+                        for pattern_id in outputs[state]:
+                            pattern = patterns[pattern_id]
+                            if pattern not in found:
+                                found.add(pattern)
+                                remaining -= 1
+                        state = output_link[state]
+                    if not remaining:
+                        return found
+        return found
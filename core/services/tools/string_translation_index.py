@@ -0,0 +1,193 @@
+# core/services/tools/string_translation_index.py
+"""
+Index des traductions de chaînes (blocs « translate <langue> strings: ») d'un projet
+- old -> (new, fichier tl, ligne du new), pour une langue
+- Index persistant (cache_manager) : rechargé en quelques millisecondes
+- Mise à jour par fichier : seuls les fichiers dont mtime/taille ont changé sont relus
+- Mise à jour ciblée après l'écriture d'un fichier tl par l'éditeur temps réel
+"""
+
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from infrastructure.logging.logging import log_message
+
+__all__ = ['StringTranslationIndex']
+
+_OLD_RE = re.compile(r'old\s+"((?:\\.|[^"])*)"')
+_NEW_RE = re.compile(r'new\s+"((?:\\.|[^"])*)"')
+
+
+def _parse_string_entries(file_path: str) -> List[List[Any]]:
+    """Paires old/new d'un fichier : [[old, new, ligne du new (1-based)], ...]"""
+    entries = []
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        lines = f.readlines()
+
+    for i, line in enumerate(lines):
+        if not line.lstrip().startswith('old ') or i + 1 >= len(lines):
+            continue
+        old_match = _OLD_RE.search(line)
+        if not old_match:
+            continue
+        new_match = _NEW_RE.search(lines[i + 1])
+        if new_match:
+            entries.append([old_match.group(1), new_match.group(1), i + 2])
+    return entries
+
+
+class StringTranslationIndex:
+    """
+    Index old -> traduction d'une langue d'un projet.
+
+    load() restaure l'index persistant (sans accès aux fichiers tl), refresh()
+    relit uniquement les fichiers modifiés depuis et enregistre l'index.
+    Les recherches ne bloquent jamais : elles utilisent l'état courant.
+    """
+
+    def __init__(self, project_path: str, language: str):
+        self.project_path = project_path
+        self.language = language
+        self.tl_dir = os.path.join(project_path, "game", "tl", language)
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._lookup: Dict[str, Dict[str, Any]] = {}
+        # Valeurs sauvegardées pendant la session (dialogues hors blocs strings compris)
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.ready = threading.Event()
+
+    # --- persistance ---
+    def load(self) -> int:
+        """Restaure l'index enregistré ; retourne le nombre de chaînes connues"""
+        try:
+            from core.models.cache.cache_manager import cache_manager
+            files = cache_manager.get_string_translation_index(self.project_path, self.language)
+        except Exception as e:
+            log_message("DEBUG", f"Index des chaînes non chargé: {e}", category="realtime_editor")
+            files = {}
+
+        with self._lock:
+            self._files = files
+            self._rebuild_lookup()
+            if files:
+                self.ready.set()
+            return len(self._lookup)
+
+    def save(self):
+        """Enregistre l'index s'il a changé"""
+        with self._lock:
+            if not self._dirty:
+                return
+            files = dict(self._files)
+            self._dirty = False
+        try:
+            from core.models.cache.cache_manager import cache_manager
+            cache_manager.set_string_translation_index(self.project_path, self.language, files)
+        except Exception as e:
+            log_message("ATTENTION", f"Index des chaînes non sauvegardé: {e}", category="realtime_editor")
+
+    # --- mise à jour ---
+    def _relative_path(self, file_path: str) -> str:
+        return os.path.relpath(file_path, self.project_path)
+
+    def _scan_tl_files(self) -> Dict[str, os.stat_result]:
+        found = {}
+        for root, _, files in os.walk(self.tl_dir):
+            for filename in files:
+                if filename.endswith('.rpy'):
+                    file_path = os.path.join(root, filename)
+                    try:
+                        found[self._relative_path(file_path)] = os.stat(file_path)
+                    except OSError:
+                        continue
+        return found
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Met l'index à jour d'après les fichiers présents.
+
+        Returns:
+            dict: fichiers relus, inchangés, retirés et nombre de chaînes indexées
+        """
+        stats = {'parsed': 0, 'unchanged': 0, 'removed': 0, 'strings': 0}
+        current = self._scan_tl_files()
+
+        with self._lock:
+            known = dict(self._files)
+
+        files = {}
+        for rel_path, stat_result in current.items():
+            entry = known.get(rel_path)
+            if entry and entry.get('mtime_ns') == stat_result.st_mtime_ns and entry.get('size') == stat_result.st_size:
+                files[rel_path] = entry
+                stats['unchanged'] += 1
+                continue
+            try:
+                entries = _parse_string_entries(os.path.join(self.project_path, rel_path))
+            except Exception as e:
+                log_message("ATTENTION", f"Lecture impossible pour l'index des chaînes {rel_path}: {e}", category="realtime_editor")
+                continue
+            files[rel_path] = {'mtime_ns': stat_result.st_mtime_ns, 'size': stat_result.st_size, 'entries': entries}
+            stats['parsed'] += 1
+        stats['removed'] = len(set(known) - set(current))
+
+        with self._lock:
+            # Un fichier mis à jour par update_file() pendant le parcours garde sa version récente
+            for rel_path, entry in self._files.items():
+                if rel_path in files and entry is not known.get(rel_path):
+                    files[rel_path] = entry
+            if stats['parsed'] or stats['removed'] or files.keys() != self._files.keys():
+                self._dirty = True
+            self._files = files
+            self._rebuild_lookup()
+            stats['strings'] = len(self._lookup)
+        self.ready.set()
+        self.save()
+        return stats
+
+    def update_file(self, file_path: str):
+        """Relit un fichier tl qui vient d'être écrit (ignoré s'il est hors de la langue indexée)"""
+        abs_path = os.path.abspath(file_path)
+        if not abs_path.startswith(os.path.abspath(self.tl_dir) + os.sep) or not abs_path.endswith('.rpy'):
+            return
+        rel_path = self._relative_path(abs_path)
+        try:
+            stat_result = os.stat(abs_path)
+            entries = _parse_string_entries(abs_path)
+        except Exception as e:
+            log_message("ATTENTION", f"Mise à jour de l'index des chaînes impossible ({rel_path}): {e}", category="realtime_editor")
+            return
+
+        with self._lock:
+            self._files[rel_path] = {'mtime_ns': stat_result.st_mtime_ns, 'size': stat_result.st_size, 'entries': entries}
+            self._dirty = True
+            self._rebuild_lookup()
+
+    def remember(self, original_text: str, translated_text: str, tl_file: str, tl_line: int):
+        """Mémorise une traduction sauvegardée pendant la session (prioritaire sur l'index)"""
+        with self._lock:
+            self._overrides[original_text] = {
+                'translated_text': translated_text,
+                'tl_file': tl_file,
+                'tl_line': tl_line
+            }
+
+    def _rebuild_lookup(self):
+        # Ordre des chemins fixe : à chaîne identique, le dernier fichier l'emporte
+        lookup = {}
+        for rel_path in sorted(self._files):
+            for old_text, new_text, line_number in self._files[rel_path]['entries']:
+                lookup[old_text] = {'translated_text': new_text, 'tl_file': rel_path, 'tl_line': line_number}
+        self._lookup = lookup
+
+    # --- recherche ---
+    def get(self, original_text: str) -> Optional[Dict[str, Any]]:
+        """Traduction connue de original_text (copie), ou None"""
+        info = self._overrides.get(original_text) or self._lookup.get(original_text)
+        return dict(info) if info else None
+
+    def __len__(self) -> int:
+        return len(self._lookup)
@@ -0,0 +1,108 @@
+# core/services/tools/tl_file_cache.py
+"""
+Cache partagé des lignes des fichiers .rpy lus par l'éditeur temps réel
+- Lignes identiques à open(..., encoding='utf-8').readlines()
+- Index des débuts de blocs « translate » calculé une fois par version du fichier
+- Validation par date de modification (ns) et taille à chaque accès
+- LRU borné en nombre de fichiers et en octets ; invalidation explicite après
+  chaque écriture de l'éditeur
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+__all__ = ['CachedTextFile', 'TlFileCache', 'tl_file_cache']
+
+
+class CachedTextFile:
+    """Version d'un fichier en cache (les lignes sont partagées : lecture seule)"""
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'lines', '_block_starts')
+
+    def __init__(self, path: str, mtime_ns: int, size: int, lines: List[str]):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.lines = lines
+        self._block_starts: Optional[List[int]] = None
+
+    @property
+    def block_starts(self) -> List[int]:
+        """Indices (0-based) des lignes « translate ... » du fichier"""
+        if self._block_starts is None:
+            self._block_starts = [i for i, line in enumerate(self.lines) if line.strip().startswith('translate ')]
+        return self._block_starts
+
+
+class TlFileCache:
+    """
+    LRU de fichiers texte validé par mtime/taille.
+
+    get() relit le fichier seulement s'il a changé depuis la dernière lecture ;
+    les erreurs de lecture (fichier absent, encodage) sont propagées comme open().
+    """
+
+    def __init__(self, max_files: int = 16, max_bytes: int = 64 * 1024 * 1024):
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._files: 'OrderedDict[str, CachedTextFile]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path: str) -> CachedTextFile:
+        key = self._key(path)
+        stat_result = os.stat(path)
+        with self._lock:
+            entry = self._files.get(key)
+            if entry and entry.mtime_ns == stat_result.st_mtime_ns and entry.size == stat_result.st_size:
+                self._files.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry
+
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        entry = CachedTextFile(path, stat_result.st_mtime_ns, stat_result.st_size, lines)
+
+        with self._lock:
+            self.stats['misses'] += 1
+            self._discard_locked(key)
+            if stat_result.st_size <= self.max_bytes:
+                self._files[key] = entry
+                self._bytes += entry.size
+                while len(self._files) > self.max_files or self._bytes > self.max_bytes:
+                    _, evicted = self._files.popitem(last=False)
+                    self._bytes -= evicted.size
+        return entry
+
+    def get_lines(self, path: str) -> List[str]:
+        """Lignes du fichier (liste partagée : la copier avant de la modifier)"""
+        return self.get(path).lines
+
+    def invalidate(self, path: str = None):
+        """Oublie un fichier (après écriture) ou tout le cache"""
+        with self._lock:
+            if path is None:
+                self._files.clear()
+                self._bytes = 0
+            else:
+                self._discard_locked(self._key(path))
+
+    def _discard_locked(self, key: str):
+        entry = self._files.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {'files': len(self._files), 'bytes': self._bytes, **self.stats}
+
+
+# Instance partagée entre la logique métier et l'onglet de l'éditeur
+tl_file_cache = TlFileCache()
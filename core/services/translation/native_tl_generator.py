@@ -0,0 +1,756 @@
+# core/services/translation/native_tl_generator.py
+"""
+Génération native des fichiers de traduction Ren'Py (sans lancer le jeu ni le SDK)
+- Analyse des scripts game/**/*.rpy : dialogues regroupés comme Ren'Py (voice / nvl clear
+  + réplique), étiquettes courantes, menus, blocs if/while/init
+- Identifiants compatibles Ren'Py : <label>_<md5[:8] du code>, suffixes _1, _2... en cas
+  de collision, identifiants explicites (id ...)
+- Chaînes _() / __() et choix de menu dans les blocs « translate <langue> strings »
+- Traductions déjà présentes dans tl/<langue> ignorées (identifiants et chaînes old)
+- Analyse des fichiers en parallèle (processus), fichiers tl au format du SDK
+- Comparaison avec une sortie de référence (SDK) pour valider un projet
+"""
+
+import ast
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from infrastructure.logging.logging import log_message
+from infrastructure.logging.tracing import worker_span
+from infrastructure.helpers.process_pool import attach_worker_records, iter_process_map
+
+__all__ = ['NativeTranslationGenerator', 'parse_script_file', 'collect_existing_translations',
+           'compare_tl_folders', 'validate_native_generation']
+
+PARALLEL_MIN_FILES = 20
+
+# Mots-clés d'instructions : une ligne qui commence par l'un d'eux n'est pas une réplique
+_STATEMENT_KEYWORDS = frozenset((
+    'label', 'menu', 'if', 'elif', 'else', 'while', 'python', 'init', 'early', 'define', 'default',
+    'image', 'transform', 'screen', 'style', 'translate', 'show', 'scene', 'hide', 'with', 'call',
+    'jump', 'return', 'pass', 'pause', 'play', 'queue', 'stop', 'voice', 'window', 'camera',
+    'layeredimage', 'testcase', 'rpy', 'at', 'onlayer', 'expression', 'nvl'
+))
+# Blocs dont les instructions sont du script Ren'Py (les autres sont ignorés)
+_SCRIPT_BLOCKS = frozenset(('label', 'if', 'elif', 'else', 'while', 'init'))
+
+_NAME_RE = re.compile(r'[^\W\d]\w*')
+_WORD_RE = re.compile(r'\S+')
+_ATTRIBUTE_RE = re.compile(r'-?[\w]+')
+_LABEL_RE = re.compile(r'(?:label|menu)\s+(\.?[^\W\d][\w.]*)(.*)$', re.S)
+_STRING_LITERAL_RE = re.compile(
+    r'r?(?:"""(?:\\.|[^\\])*?"""|\'\'\'(?:\\.|[^\\])*?\'\'\''
+    r'|"(?:\\.|[^\\"])*"|\'(?:\\.|[^\\\'])*\'|`(?:\\.|[^\\`])*`)', re.S)
+# Même motif que le scanner de chaînes de Ren'Py (renpy/translation/scanstrings.py)
+_TRANSLATABLE_RE = re.compile(r"""(?x)
+\b__?\s*\(\s*[uU]?(
+\"\"\"(?:\\.|\"{1,2}|[^\\"])*?\"\"\"
+|'''(?:\\.|\'{1,2}|[^\\'])*?'''
+|"(?:\\.|[^\\"])*"
+|'(?:\\.|[^\\'])*'
+)\s*\)""")
+_TRANSLATE_ID_RE = re.compile(r'^\s*translate\s+(\w+)\s+(\w+)\s*:', re.M)
+_OLD_RE = re.compile(r'^\s*old\s+(r?(?:"(?:\\.|[^\\"])*"|\'(?:\\.|[^\\\'])*\'))', re.M)
+
+
+# --- Chaînes : mêmes règles que le lexer et le générateur de Ren'Py ---
+def _dequote(match) -> str:
+    c = match.group(1)
+    if c[0] == 'u' and match.group(2):
+        return chr(int(match.group(2), 16))
+    return {'{': '{{', '[': '[[', '%': '%%', 'n': '\n'}.get(c, c)
+
+
+def renpy_string_value(literal: str) -> str:
+    """Valeur d'une chaîne du script (espaces fusionnés, échappements Ren'Py)"""
+    raw = literal.startswith('r')
+    if raw:
+        literal = literal[1:]
+    quote_len = 3 if literal[:3] in ('"""', "'''") else 1
+    s = literal[quote_len:-quote_len]
+    if not raw:
+        s = re.sub(r'[ \n]+', ' ', s)
+        s = re.sub(r'\\(u([0-9a-fA-F]{1,4})|.)', _dequote, s)
+    return s
+
+
+def encode_say_string(s: str) -> str:
+    """Chaîne de réplique telle que Ren'Py la réécrit dans les fichiers tl"""
+    s = s.replace("\\", "\\\\")
+    s = s.replace("\n", "\\n")
+    s = s.replace("\"", "\\\"")
+    s = re.sub(r'(?<= ) ', '\\ ', s)
+    return "\"" + s + "\""
+
+
+def quote_unicode(s: str) -> str:
+    """Échappement des chaînes old/new"""
+    for char, escaped in (("\\", "\\\\"), ("\"", "\\\""), ("\a", "\\a"), ("\b", "\\b"), ("\f", "\\f"),
+                          ("\n", "\\n"), ("\r", "\\r"), ("\t", "\\t"), ("\v", "\\v")):
+        s = s.replace(char, escaped)
+    return s
+
+
+# --- Lignes logiques et arbre des blocs ---
+def _logical_lines(text: str):
+    """(ligne, indentation, texte) des lignes logiques : chaînes et parenthèses sur plusieurs lignes réunies, commentaires retirés"""
+    lines = text.lstrip('\ufeff').replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    i, count = 0, len(lines)
+    while i < count:
+        start = i
+        indent = len(lines[i].expandtabs()) - len(lines[i].expandtabs().lstrip(' '))
+        parts = []
+        quote, depth = None, 0
+        while True:
+            line = lines[i]
+            k, length = 0, len(line)
+            while k < length:
+                c = line[k]
+                if quote:
+                    if c == '\\':
+                        k += 2
+                        continue
+                    if line.startswith(quote, k):
+                        k += len(quote)
+                        quote = None
+                        continue
+                elif c == '#':
+                    line = line[:k]
+                    break
+                elif c in '"\'`':
+                    quote = c * 3 if line.startswith(c * 3, k) else c
+                    k += len(quote)
+                    continue
+                elif c in '([{':
+                    depth += 1
+                elif c in ')]}':
+                    depth = max(0, depth - 1)
+                k += 1
+            parts.append(line)
+            i += 1
+            if (quote or depth) and i < count:
+                continue
+            break
+        logical = '\n'.join(parts).strip()
+        if logical:
+            yield start + 1, indent, logical
+
+
+class _Node:
+    __slots__ = ('line', 'indent', 'text', 'children')
+
+    def __init__(self, line: int, indent: int, text: str):
+        self.line = line
+        self.indent = indent
+        self.text = text
+        self.children: List['_Node'] = []
+
+
+def _build_tree(text: str) -> Tuple[_Node, List[Tuple[int, str]]]:
+    root = _Node(0, -1, '')
+    stack = [root]
+    flat = []
+    for line, indent, logical in _logical_lines(text):
+        flat.append((line, logical))
+        while stack[-1].indent >= indent:
+            stack.pop()
+        node = _Node(line, indent, logical)
+        stack[-1].children.append(node)
+        stack.append(node)
+    return root, flat
+
+
+# --- Répliques ---
+def _skip_ws(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in ' \t\n':
+        pos += 1
+    return pos
+
+
+def _match_balanced(text: str, pos: int) -> int:
+    """Fin (exclue) du groupe (...) ou [...] commençant à pos, chaînes comprises"""
+    closing = {'(': ')', '[': ']', '{': '}'}
+    stack = []
+    while pos < len(text):
+        c = text[pos]
+        if c in '"\'`':
+            m = _STRING_LITERAL_RE.match(text, pos)
+            if not m:
+                return -1
+            pos = m.end()
+            continue
+        if c in closing:
+            stack.append(closing[c])
+        elif c in ')]}':
+            if not stack or stack.pop() != c:
+                return -1
+            if not stack:
+                return pos + 1
+        pos += 1
+    return -1
+
+
+def _simple_expression(text: str, pos: int) -> int:
+    """Fin d'une expression simple (nom, chaîne ou parenthèses, suivis de .nom / (...) / [...]) ou -1"""
+    m = _NAME_RE.match(text, pos) or _STRING_LITERAL_RE.match(text, pos)
+    if m:
+        pos = m.end()
+    elif pos < len(text) and text[pos] == '(':
+        pos = _match_balanced(text, pos)
+        if pos < 0:
+            return -1
+    else:
+        return -1
+    while pos < len(text):
+        if text[pos] == '.':
+            m = _NAME_RE.match(text, pos + 1)
+            if not m:
+                break
+            pos = m.end()
+        elif text[pos] in '([':
+            end = _match_balanced(text, pos)
+            if end < 0:
+                return -1
+            pos = end
+        else:
+            break
+    return pos
+
+
+def _split_arguments(source: str) -> List[str]:
+    """Arguments de premier niveau de « (a, b=1) »"""
+    inner = source[1:-1]
+    args, depth, current, pos = [], 0, [], 0
+    while pos < len(inner):
+        c = inner[pos]
+        if c in '"\'`':
+            m = _STRING_LITERAL_RE.match(inner, pos)
+            end = m.end() if m else len(inner)
+            current.append(inner[pos:end])
+            pos = end
+            continue
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            args.append(''.join(current))
+            current = []
+            pos += 1
+            continue
+        current.append(c)
+        pos += 1
+    if ''.join(current).strip():
+        args.append(''.join(current))
+    return [a.strip() for a in args if a.strip()]
+
+
+def _arguments_code(source: str) -> str:
+    """Équivalent de ArgumentInfo.get_code()"""
+    code = []
+    for arg in _split_arguments(source):
+        if arg.startswith('**'):
+            code.append('**' + arg[2:].strip())
+        elif arg.startswith('*'):
+            code.append('*' + arg[1:].strip())
+        else:
+            m = re.match(r'([^\W\d]\w*)\s*=(?!=)\s*(.*)$', arg, re.S)
+            code.append(f"{m.group(1)}={m.group(2).strip()}" if m else arg)
+    return "(" + ", ".join(code) + ")"
+
+
+def _parse_attributes(text: str, pos: int) -> Tuple[List[str], int]:
+    attributes = []
+    while True:
+        pos = _skip_ws(text, pos)
+        m = _ATTRIBUTE_RE.match(text, pos)
+        if not m or m.group(0) == '-':
+            return attributes, pos
+        attributes.append(m.group(0))
+        pos = m.end()
+
+
+def parse_say(text: str, interact: bool = True) -> Optional[List[Dict[str, Any]]]:
+    """
+    Réplique d'une ligne logique, ou None si la ligne n'est pas une réplique.
+
+    Returns:
+        Liste (une entrée par paragraphe d'une chaîne triple) de dicts code / explicit_id
+    """
+    first = _WORD_RE.match(text)
+    if not first:
+        return None
+    word = re.match(r'[^\W\d]\w*', text)
+    if word and word.group(0) in _STATEMENT_KEYWORDS:
+        if word.group(0) != 'nvl' or re.match(r'nvl\s+(clear|show|hide|menu)\b', text):
+            return None
+
+    pos = 0
+    who = None
+    attributes: List[str] = []
+    temporary: Optional[List[str]] = None
+    what_match = _STRING_LITERAL_RE.match(text, pos)
+    if what_match:
+        # « "Nom" "texte" » : la première chaîne est le locuteur
+        after = _skip_ws(text, what_match.end())
+        second = _STRING_LITERAL_RE.match(text, after)
+        if second:
+            who = what_match.group(0)
+            what_match = second
+    else:
+        end = _simple_expression(text, pos)
+        if end < 0:
+            return None
+        who = text[pos:end]
+        attributes, pos = _parse_attributes(text, end)
+        if pos < len(text) and text[pos] == '@':
+            temporary, pos = _parse_attributes(text, pos + 1)
+        pos = _skip_ws(text, pos)
+        what_match = _STRING_LITERAL_RE.match(text, pos)
+        if not what_match:
+            return None
+
+    literal = what_match.group(0)
+    pos = what_match.end()
+    with_, explicit_id, arguments = None, None, None
+    while True:
+        pos = _skip_ws(text, pos)
+        if pos >= len(text):
+            break
+        m = _NAME_RE.match(text, pos)
+        keyword = m.group(0) if m else None
+        if keyword == 'nointeract':
+            interact = False
+            pos = m.end()
+        elif keyword == 'with':
+            start = _skip_ws(text, m.end())
+            end = _simple_expression(text, start)
+            if end < 0:
+                return None
+            with_ = text[start:end]
+            pos = end
+        elif keyword == 'id':
+            name = _NAME_RE.match(text, _skip_ws(text, m.end()))
+            if not name:
+                return None
+            explicit_id = name.group(0)
+            pos = name.end()
+        elif text[pos] == '(' and arguments is None:
+            end = _match_balanced(text, pos)
+            if end < 0:
+                return None
+            arguments = _arguments_code(text[pos:end])
+            pos = end
+        else:
+            return None
+
+    if literal.lstrip('r')[:3] in ('"""', "'''") and who is None:
+        # Chaîne triple de narration : un paragraphe par réplique
+        inner = literal.lstrip('r')[3:-3]
+        paragraphs = [re.sub(r'\s+', ' ', p).strip() for p in re.split(r'\n[ \t]*\n', inner)]
+        whats = [re.sub(r'\\(u([0-9a-fA-F]{1,4})|.)', _dequote, p) for p in paragraphs if p]
+    else:
+        whats = [renpy_string_value(literal)]
+
+    says = []
+    for what in whats:
+        code = []
+        if who:
+            code.append(who)
+        code.extend(attributes)
+        if temporary:
+            code.append("@")
+            code.extend(temporary)
+        code.append(encode_say_string(what))
+        if not interact:
+            code.append("nointeract")
+        if explicit_id:
+            code.extend(("id", explicit_id))
+        if arguments:
+            code.append(arguments)
+        if with_:
+            code.extend(("with", with_))
+        says.append({'code': " ".join(code), 'explicit_id': explicit_id})
+    return says
+
+
+# --- Analyse d'un fichier ---
+class _ScriptWalker:
+    """Parcours de l'arbre d'un fichier dans l'ordre de restructuration de Ren'Py"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.label: Optional[str] = None
+        self.alternate: Optional[str] = None
+        self.global_label: Optional[str] = None
+        self.groups: List[Dict[str, Any]] = []
+        self.strings: List[Tuple[int, str]] = []
+
+    def _emit(self, group: List[Tuple[int, str]], explicit_id: Optional[str]):
+        md5 = hashlib.md5()
+        for _, code in group:
+            md5.update((code + "\r\n").encode("utf-8"))
+        self.groups.append({
+            'line': group[0][0],
+            'codes': [code for _, code in group],
+            'digest': md5.hexdigest()[:8],
+            'label': self.label,
+            'alternate': self.alternate,
+            'explicit_id': explicit_id,
+        })
+
+    def _enter_label(self, text: str):
+        m = _LABEL_RE.match(text)
+        if not m:
+            return
+        name, rest = m.group(1), m.group(2)
+        if name.startswith('.'):
+            name = f"{self.global_label}{name}" if self.global_label else name[1:]
+        elif '.' not in name:
+            self.global_label = name
+        if re.search(r'\bhide\s*:?\s*$', rest):
+            return
+        if name.startswith('_'):
+            self.alternate = name
+        else:
+            self.label = name
+            self.alternate = None
+
+    def walk(self, children: List[_Node]):
+        group: List[Tuple[int, str]] = []
+        for node in children:
+            text = node.text
+            word_match = re.match(r'[^\W\d]\w*|\$', text)
+            word = word_match.group(0) if word_match else ''
+
+            if word == 'label':
+                self._enter_label(text)
+                self.walk(node.children)
+                group = []
+            elif word == 'menu' and text.endswith(':'):
+                if _LABEL_RE.match(text):
+                    # « menu <nom>: » déclare une étiquette (nœud Label) avant la légende
+                    self._enter_label(text)
+                    group = []
+                group = self._walk_menu(node, group)
+            elif word == 'voice' or re.match(r'nvl\s+clear\b', text):
+                # Instructions « traduisibles » : regroupées avec la réplique suivante
+                group.append((node.line, re.sub(r'\s+', ' ', text)))
+            else:
+                says = None if node.children else parse_say(text)
+                if says:
+                    for say in says:
+                        group.append((node.line, say['code']))
+                        self._emit(group, say['explicit_id'])
+                        group = []
+                    continue
+                group = []
+                if word in _SCRIPT_BLOCKS and text.endswith(':') and not (word == 'init' and 'python' in text.split()):
+                    self.walk(node.children)
+
+    def _walk_menu(self, node: _Node, group: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        # La légende (réplique sans bloc) précède le menu, sans interaction
+        for child in node.children:
+            if not child.children and not child.text.endswith(':'):
+                says = parse_say(child.text, interact=False)
+                if says:
+                    group.append((child.line, says[0]['code']))
+                    self._emit(group, says[0]['explicit_id'])
+                    break
+        for child in node.children:
+            if not child.text.endswith(':'):
+                continue
+            m = _STRING_LITERAL_RE.match(child.text)
+            if m:
+                text = renpy_string_value(m.group(0))
+                if text:
+                    self.strings.append((child.line, text))
+                self.walk(child.children)
+        return []
+
+
+def parse_script_file(file_path: str, rel_name: str) -> Dict[str, Any]:
+    """
+    Blocs de dialogue et chaînes traduisibles d'un script (exécutable dans un processus).
+
+    Returns:
+        dict: rel, groups (line, codes, digest, label, alternate, explicit_id), strings (line, text), error
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
+            content = f.read()
+        root, flat = _build_tree(content)
+        walker = _ScriptWalker(rel_name)
+        walker.walk(root.children)
+
+        # Chaînes _() / __() de toutes les lignes logiques (python, screens...)
+        for line, logical in flat:
+            if '_' not in logical:
+                continue
+            for m in _TRANSLATABLE_RE.finditer(logical):
+                try:
+                    value = ast.literal_eval("u" + m.group(1).strip())
+                except (ValueError, SyntaxError):
+                    continue
+                if value:
+                    walker.strings.append((line, value))
+        walker.strings.sort(key=lambda item: item[0])
+        return {'rel': rel_name, 'groups': walker.groups, 'strings': walker.strings, 'error': None}
+    except Exception as e:
+        return {'rel': rel_name, 'groups': [], 'strings': [], 'error': str(e)}
+
+
+def _parse_script_worker(task: Tuple[str, str]) -> Dict[str, Any]:
+    with worker_span("native_tl.file", file=task[1]):
+        file_result = parse_script_file(*task)
+    # Spans et messages de log du processus worker, rapatriés avec le résultat
+    return attach_worker_records(file_result)
+
+
+# --- Traductions existantes ---
+def collect_existing_translations(tl_folder: str, language: str) -> Tuple[set, set]:
+    """(identifiants de dialogues, chaînes old) déjà traduits dans un dossier tl/<langue>"""
+    identifiers, strings = set(), set()
+    if not os.path.isdir(tl_folder):
+        return identifiers, strings
+    for root, _, files in os.walk(tl_folder):
+        for filename in files:
+            if not filename.endswith('.rpy'):
+                continue
+            try:
+                file_ids, file_strings = _file_translations(os.path.join(root, filename), language)
+            except Exception as e:
+                log_message("ATTENTION", f"Fichier tl illisible ignoré {filename}: {e}", category="renpy_generator_tl")
+                continue
+            identifiers |= file_ids
+            strings |= file_strings
+    return identifiers, strings
+
+
+def _file_translations(file_path: str, language: str) -> Tuple[set, set]:
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        content = f.read()
+    identifiers = {identifier for lang, identifier in _TRANSLATE_ID_RE.findall(content)
+                   if lang == language and identifier != 'strings'}
+    return identifiers, {renpy_string_value(literal) for literal in _OLD_RE.findall(content)}
+
+
+class NativeTranslationGenerator:
+    """
+    Génère game/tl/<langue>/ à partir des scripts du projet.
+
+    Comme le SDK, les fichiers tl existants sont complétés (ajout en fin de fichier)
+    et les traductions déjà présentes ne sont pas régénérées.
+    """
+
+    def __init__(self, project_path: str, language: str, output_folder: Optional[str] = None,
+                 skip_existing: bool = True, max_workers: Optional[int] = None):
+        self.project_path = project_path
+        self.language = language
+        self.game_dir = os.path.join(project_path, "game")
+        self.output_folder = output_folder or os.path.join(self.game_dir, "tl", language)
+        self.skip_existing = skip_existing
+        self.max_workers = max_workers
+
+    def script_files(self) -> List[Tuple[str, str]]:
+        """(chemin, nom relatif à game/) des scripts, dans l'ordre de chargement de Ren'Py"""
+        files = []
+        tl_root = os.path.join(self.game_dir, "tl")
+        for root, dirs, names in os.walk(self.game_dir):
+            if os.path.normcase(root) == os.path.normcase(tl_root):
+                dirs[:] = []
+                continue
+            dirs[:] = [d for d in dirs if os.path.normcase(os.path.join(root, d)) != os.path.normcase(tl_root)]
+            for name in names:
+                if name.endswith(('.rpy', '.rpym')):
+                    path = os.path.join(root, name)
+                    files.append((path, os.path.relpath(path, self.game_dir).replace(os.sep, '/')))
+        files.sort(key=lambda item: os.path.splitext(item[1])[0])
+        return files
+
+    def _parse_all(self, files: List[Tuple[str, str]], progress_callback: Optional[Callable[[int, int], None]],
+                   is_cancelled: Optional[Callable[[], bool]]) -> List[Dict[str, Any]]:
+        # Peu de fichiers : inutile de payer le démarrage des processus
+        workers = self.max_workers if len(files) >= PARALLEL_MIN_FILES else 1
+        parsed = []
+        if is_cancelled and is_cancelled():
+            raise InterruptedError("Opération annulée.")
+        for file_result in iter_process_map(_parse_script_worker, files, workers,
+                                            label="Analyse parallèle des scripts", category="renpy_generator_tl"):
+            if is_cancelled and is_cancelled():
+                raise InterruptedError("Opération annulée.")
+            parsed.append(file_result)
+            if progress_callback:
+                progress_callback(len(parsed), len(files))
+        return parsed
+
+    @staticmethod
+    def _unique_identifier(label: Optional[str], digest: str, used: set) -> str:
+        base = digest if label is None else label.replace(".", "_") + "_" + digest
+        identifier, i = base, 0
+        while identifier in used:
+            i += 1
+            identifier = f"{base}_{i}"
+        return identifier
+
+    def generate(self, progress_callback: Optional[Callable[[int, int], None]] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """
+        Analyse les scripts et écrit les fichiers tl.
+
+        Returns:
+            dict: success, files (fichiers écrits), dialogues, strings, skipped, scripts, errors, elapsed
+        """
+        start_time = time.time()
+        result = {'success': False, 'files': [], 'dialogues': 0, 'strings': 0, 'skipped': 0,
+                  'scripts': 0, 'errors': [], 'elapsed': 0.0}
+
+        files = self.script_files()
+        result['scripts'] = len(files)
+        if not files:
+            result['errors'].append("Aucun script .rpy trouvé dans le dossier game (fichiers .rpyc/.rpa non décompilés ?)")
+            return result
+
+        existing_ids, existing_strings = (collect_existing_translations(self.output_folder, self.language)
+                                          if self.skip_existing else (set(), set()))
+        parsed = self._parse_all(files, progress_callback, is_cancelled)
+
+        # Identifiants attribués dans l'ordre de chargement (collisions entre fichiers comprises)
+        used_ids: set = set()
+        dialogues: Dict[str, List[str]] = {}
+        strings: Dict[str, List[str]] = {}
+        seen_strings = set(existing_strings)
+
+        for file_result in parsed:
+            rel = file_result['rel']
+            if file_result['error']:
+                result['errors'].append(f"{rel}: {file_result['error']}")
+                continue
+            tl_name = rel[:-1] if rel.endswith('.rpym') else rel
+
+            for group in file_result['groups']:
+                if group['explicit_id']:
+                    identifier = group['explicit_id']
+                else:
+                    identifier = self._unique_identifier(group['label'], group['digest'], used_ids)
+                used_ids.add(identifier)
+                alternate = None
+                if group['alternate'] is not None:
+                    alternate = self._unique_identifier(group['alternate'], group['digest'], used_ids)
+                    used_ids.add(alternate)
+
+                if identifier in existing_ids or (alternate and alternate in existing_ids):
+                    result['skipped'] += 1
+                    continue
+                block = [f"# game/{rel}:{group['line']}\n",
+                         f"translate {self.language} {identifier.replace('.', '_')}:\n", "\n"]
+                block.extend(f"    # {code}\n" for code in group['codes'])
+                block.extend(f"    {code}\n" for code in group['codes'])
+                block.append("\n")
+                dialogues.setdefault(tl_name, []).append("".join(block))
+                result['dialogues'] += 1
+
+            for line, text in file_result['strings']:
+                if text in seen_strings:
+                    if text in existing_strings:
+                        result['skipped'] += 1
+                    continue
+                seen_strings.add(text)
+                strings.setdefault(tl_name, []).append(
+                    f"    # game/{rel}:{line}\n    old \"{quote_unicode(text)}\"\n    new \"{quote_unicode(text)}\"\n\n")
+                result['strings'] += 1
+
+        result['files'] = self._write_files(dialogues, strings)
+        result['success'] = not result['errors'] or bool(result['files'])
+        result['elapsed'] = time.time() - start_time
+        log_message("INFO", f"Génération native {self.language}: {result['dialogues']} dialogues, {result['strings']} chaînes, "
+                    f"{len(result['files'])} fichier(s) en {result['elapsed']:.2f}s ({result['scripts']} scripts, "
+                    f"{result['skipped']} déjà traduits)", category="renpy_generator_tl")
+        return result
+
+    def _write_files(self, dialogues: Dict[str, List[str]], strings: Dict[str, List[str]]) -> List[str]:
+        os.makedirs(self.output_folder, exist_ok=True)
+        header = f"# TODO: Translation updated at {time.strftime('%Y-%m-%d %H:%M')}\n\n"
+        written = []
+        for tl_name in sorted(set(dialogues) | set(strings)):
+            content = [header]
+            content.extend(dialogues.get(tl_name, ()))
+            if tl_name in strings:
+                content.append(f"translate {self.language} strings:\n\n")
+                content.extend(strings[tl_name])
+
+            tl_path = os.path.join(self.output_folder, *tl_name.split('/'))
+            os.makedirs(os.path.dirname(tl_path), exist_ok=True)
+            is_new = not os.path.exists(tl_path)
+            with open(tl_path, 'a', encoding='utf-8') as f:
+                if is_new:
+                    f.write('\ufeff')
+                f.write("".join(content))
+            written.append(tl_path)
+        return written
+
+
+# --- Validation ---
+def _tl_folder_contents(tl_folder: str, language: str) -> Dict[str, Tuple[set, set]]:
+    contents = {}
+    for root, _, files in os.walk(tl_folder):
+        for filename in files:
+            if filename.endswith('.rpy'):
+                path = os.path.join(root, filename)
+                rel = os.path.relpath(path, tl_folder).replace(os.sep, '/')
+                contents[rel] = _file_translations(path, language)
+    return contents
+
+
+def compare_tl_folders(generated_folder: str, reference_folder: str, language: str, samples: int = 20) -> Dict[str, Any]:
+    """
+    Compare identifiants et chaînes old de deux dossiers tl (génération native / SDK).
+
+    Returns:
+        dict: compteurs identifiers/strings (matched, missing, extra), échantillons des écarts
+    """
+    generated = _tl_folder_contents(generated_folder, language)
+    reference = _tl_folder_contents(reference_folder, language)
+    report = {'files': len(reference), 'identifiers': {'matched': 0, 'missing': 0, 'extra': 0},
+              'strings': {'matched': 0, 'missing': 0, 'extra': 0}, 'missing_samples': [], 'extra_samples': []}
+
+    for rel in sorted(set(generated) | set(reference)):
+        gen_ids, gen_strings = generated.get(rel, (set(), set()))
+        ref_ids, ref_strings = reference.get(rel, (set(), set()))
+        for kind, gen, ref in (('identifiers', gen_ids, ref_ids), ('strings', gen_strings, ref_strings)):
+            report[kind]['matched'] += len(gen & ref)
+            report[kind]['missing'] += len(ref - gen)
+            report[kind]['extra'] += len(gen - ref)
+            for key, values in (('missing_samples', ref - gen), ('extra_samples', gen - ref)):
+                for value in sorted(values)[:max(0, samples - len(report[key]))]:
+                    report[key].append(f"{rel}: {value}")
+
+    total_ref = len(set().union(*(ids for ids, _ in reference.values()))) if reference else 0
+    report['identifier_match_rate'] = report['identifiers']['matched'] / total_ref if total_ref else 1.0
+    return report
+
+
+def validate_native_generation(project_path: str, language: str, reference_folder: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Génère les traductions dans un dossier temporaire et les compare à une sortie de
+    référence du SDK (par défaut game/tl/<langue> du projet).
+    """
+    reference_folder = reference_folder or os.path.join(project_path, "game", "tl", language)
+    temp_dir = tempfile.mkdtemp(prefix="renextract_native_tl_")
+    try:
+        generation = NativeTranslationGenerator(project_path, language, output_folder=temp_dir,
+                                                skip_existing=False).generate()
+        report = compare_tl_folders(temp_dir, reference_folder, language)
+        report['generation'] = {k: generation[k] for k in ('dialogues', 'strings', 'scripts', 'errors', 'elapsed')}
+        log_message("INFO", f"Validation génération native {language}: {report['identifiers']['matched']} identifiants identiques, "
+                    f"{report['identifiers']['missing']} manquants, {report['identifiers']['extra']} en trop | chaînes: "
+                    f"{report['strings']['matched']}/{report['strings']['matched'] + report['strings']['missing']}",
+                    category="renpy_generator_tl")
+        return report
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
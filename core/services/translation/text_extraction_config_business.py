@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import List, Dict, Set, Optional, Any, Tuple
 from datetime import datetime
 from infrastructure.logging.logging import log_message
+from core.services.translation.translation_corpus import get_translation_corpus
 from infrastructure.config.constants import (
     LEGACY_DEFAULT_LANGUAGE_STARTUP_FILENAME,
     RENEXTRACT_DEFAULT_LANGUAGE_STARTUP_FILENAME,
@@ -215,7 +216,8 @@ class TextExtractionConfigBusiness:
     def analyze_existing_translations(self, tl_folder: str) -> Set[str]:
         """
         Analyse le dossier tl pour identifier les textes déjà traduits
-        Migré depuis OptimizedTextExtractor._analyze_existing_translations
+        Corpus persistant partagé avec OptimizedTextExtractor : seuls les fichiers
+        modifiés depuis la dernière analyse sont relus
         
         Args:
             tl_folder (str): Chemin vers le dossier de traductions
@@ -232,49 +234,12 @@ class TextExtractionConfigBusiness:
                 log_message("INFO", "Dossier tl vide ou inexistant", category="extraction_config")
                 return existing_translations
             
-            # Patterns pour détecter les textes déjà traduits
-            tl_old_double_pattern = re.compile(r'old\s+"([^"\\]*(?:\\.[^"\\]*)*)"')
-            tl_old_single_pattern = re.compile(r"old\s+'([^'\\]*(?:\\.[^'\\]*)*)'")
-            i18n_double_pattern = re.compile(r'__?\(\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
-            i18n_single_pattern = re.compile(r"__?\(\s*'([^'\\]*(?:\\.[^'\\]*)*)'")            
-            rpy_files = self._safe_collect_files(tl_folder, "*.rpy")
-            
-            if not rpy_files:
+            corpus = get_translation_corpus(tl_folder)
+            existing_translations = corpus.existing_translations()
+            if not existing_translations:
                 log_message("INFO", "Dossier tl vide ou inexistant", category="extraction_config")
                 return existing_translations
             
-            translations_count = 0
-            
-            for filepath in rpy_files:
-                try:
-                    with open(filepath, encoding="utf-8") as f:
-                        content = f.read()
-                        
-                        # NOUVEAU
-                        for match in tl_old_double_pattern.finditer(content):
-                            text = match.group(1).strip()
-                            if text:
-                                existing_translations.add(text)
-
-                        for match in tl_old_single_pattern.finditer(content):
-                            text = match.group(1).strip()
-                            if text:
-                                existing_translations.add(text)
-
-                        for match in i18n_double_pattern.finditer(content):
-                            text = match.group(1).strip()
-                            if text:
-                                existing_translations.add(text)
-
-                        for match in i18n_single_pattern.finditer(content):
-                            text = match.group(1).strip()
-                            if text:
-                                existing_translations.add(text)
-                                
-                except Exception as e:
-                    log_message("ATTENTION", f"Erreur lecture fichier tl {os.path.basename(filepath)}: {e}", category="extraction_config")
-                    continue
-            
             log_message("INFO", f"Anti-doublons activé: {len(existing_translations)} textes uniques détectés", category="extraction_config")
             
         except Exception as e:
@@ -16,11 +16,14 @@ import re
 import glob
 import threading
 from pathlib import Path
-from typing import Dict, Set, List, Any, Optional, Pattern
+from typing import Dict, Set, List, Any, Optional, Pattern, Tuple, Callable
 from datetime import datetime
 from infrastructure.logging.logging import log_message
+from infrastructure.logging.tracing import worker_span
+from infrastructure.helpers.process_pool import attach_worker_records, iter_process_map
 from infrastructure.helpers.unified_functions import show_translated_messagebox
 from core.models.backup.unified_backup_manager import BackupType, UnifiedBackupManager
+from core.services.translation.translation_corpus import get_translation_corpus
 
 
 class OptimizedTextExtractor:
@@ -30,11 +33,36 @@ class OptimizedTextExtractor:
     Utilise des patterns regex optimisés pour une détection précise et efficace
     """
     
-    def __init__(self):
-        """Initialise l'extracteur unifié"""
+    # Nombre minimal de fichiers pour justifier le démarrage d'un pool de processus
+    PARALLEL_MIN_FILES = 20
+    
+    # Patterns gardés hors de l'alternative combinée (« #.* » en DOTALL relit la fin du
+    # fichier depuis chaque « # » ; activity_description est rare)
+    SEPARATE_SCAN_PATTERNS = ('commented_input_double', 'commented_input_single', 'activity_description')
+    
+    def __init__(self, combined_scan: Optional[bool] = None):
+        """
+        Initialise l'extracteur unifié
+        
+        Args:
+            combined_scan: une seule recherche des positions candidates par fichier pour les
+                           patterns intégrés (défaut : option targeted_extraction_combined_scan)
+        """
         self.existing_translations = set()  # Textes déjà dans tl/
         self.patterns = self._init_targeted_patterns()
         self.custom_patterns = self._init_custom_patterns()
+        self._stats_pattern_names = set(self._initialize_stats_patterns())
+        
+        if combined_scan is None:
+            try:
+                from infrastructure.config.config import config_manager
+                combined_scan = config_manager.get('targeted_extraction_combined_scan', False)
+            except Exception:
+                combined_scan = False
+        # Passe combinée : pattern individuel, décalage de son ancrage et classe de tête par pattern
+        self._combined_branches: Dict[str, Tuple[Pattern, int, Pattern]] = {}
+        self._combined_lead_cache: Dict[str, List[str]] = {}
+        self.combined_pattern = self._build_combined_pattern() if combined_scan else None
         
     def _init_targeted_patterns(self) -> Dict[str, Pattern]:
         """Patterns regex unifiés avec gestion séparée des guillemets simples et doubles"""
@@ -144,6 +172,96 @@ class OptimizedTextExtractor:
         
         return custom_patterns
 
+    def _build_combined_pattern(self) -> Optional[Pattern]:
+        """
+        Réunit les patterns intégrés en une seule alternative, qui ne sert qu'à trouver
+        les positions où au moins un pattern correspond (voir _scan_combined).
+        
+        - \\w+\\.attr devient (?<=\\w)\\.attr : même texte capturé, ancré sur le point
+        - un préfixe (?=[...]) liste les caractères de tête possibles : le moteur saute
+          directement aux positions candidates au lieu d'essayer chaque alternative partout
+        
+        Returns:
+            Pattern compilé, ou None si un pattern ne se prête pas à la combinaison (mode classique)
+        """
+        branches = []
+        lead_chars = set()
+        individual = {}
+        for pattern_name in self._get_all_pattern_names():
+            if pattern_name in self.SEPARATE_SCAN_PATTERNS or pattern_name not in self.patterns:
+                continue
+            compiled = self.patterns[pattern_name]
+            if not compiled.flags & re.IGNORECASE:
+                log_message("DEBUG", f"Pattern {pattern_name} sensible à la casse : passe combinée désactivée", category="extraction_results")
+                return None
+            
+            source = compiled.pattern
+            anchor_offset = 0
+            if source.startswith(r'\w+\.'):
+                source = r'(?<=\w)' + source[len(r'\w+'):]
+                anchor_offset = 1  # le \w qui précède le point appartient à la correspondance d'origine
+            head = re.sub(r'^(?:\(\?<[=!][^)]*\)|\\b)*', '', source)
+            if head.startswith(r'\.'):
+                lead = r'\.'
+                lead_chars.add(lead)
+            elif head[:1].isalpha():
+                lead = head[0].lower() + head[0].upper()
+                lead_chars.update(lead)
+            else:
+                log_message("DEBUG", f"Pattern {pattern_name} sans caractère de tête fixe : passe combinée désactivée", category="extraction_results")
+                return None
+            
+            if compiled.flags & re.DOTALL:
+                source = f"(?s:{source})"
+            branches.append(f"(?:{source})")
+            individual[pattern_name] = (source, anchor_offset, lead)
+        
+        try:
+            combined = re.compile(f"(?=[{''.join(sorted(lead_chars))}])(?:{'|'.join(branches)})", re.IGNORECASE)
+            self._combined_branches = {
+                name: (re.compile(source, re.IGNORECASE), offset, re.compile(f"[{lead}]", re.IGNORECASE))
+                for name, (source, offset, lead) in individual.items()
+            }
+        except re.error as e:
+            log_message("ATTENTION", f"Passe combinée indisponible: {e}", category="extraction_results")
+            return None
+        self._combined_lead_cache = {}
+        return combined
+    
+    def _scan_combined(self, content: str) -> Dict[str, List]:
+        """
+        Correspondances de chaque pattern de la passe combinée, identiques à un finditer
+        par pattern : à chaque position trouvée par l'alternative, tous les patterns dont
+        le caractère de tête convient sont essayés, chacun reprenant après la fin de sa
+        propre correspondance précédente (les correspondances de patterns différents
+        peuvent se recouvrir).
+        """
+        matches = {name: [] for name in self._combined_branches}
+        next_start = dict.fromkeys(self._combined_branches, 0)
+        lead_cache = self._combined_lead_cache
+        search = self.combined_pattern.search
+        pos = 0
+        while True:
+            found = search(content, pos)
+            if found is None:
+                break
+            position = found.start()
+            char = content[position]
+            names = lead_cache.get(char)
+            if names is None:
+                names = lead_cache[char] = [name for name, (_, _, lead) in self._combined_branches.items()
+                                            if lead.match(char)]
+            for name in names:
+                branch, anchor_offset, _ = self._combined_branches[name]
+                if position - anchor_offset < next_start[name]:
+                    continue
+                match = branch.match(content, position)
+                if match:
+                    matches[name].append(match)
+                    next_start[name] = match.end()
+            pos = position + 1
+        return matches
+
     def _is_variable_pattern(self, text: str) -> bool:
         """Vérifie si un texte ressemble à une variable plutôt qu'à du texte traduisible"""
         text = text.strip()
@@ -167,7 +285,9 @@ class OptimizedTextExtractor:
         return False
 
     def _extract_text_from_match(self, match, pattern_name: str) -> str:
-        """Version mise à jour pour extraire le texte selon le pattern (guillemets séparés)"""
+        """
+        Version mise à jour pour extraire le texte selon le pattern (guillemets séparés)
+        """
         try:
             # Tous les nouveaux patterns ont le texte dans group(1)
             if pattern_name.endswith('_double') or pattern_name.endswith('_single'):
@@ -199,42 +319,33 @@ class OptimizedTextExtractor:
         except (IndexError, AttributeError):
             return []
     
-    def _process_custom_pattern_matches(self, pattern_name: str, matches, all_detected: list, 
-                            seen_texts: set, duplicate_counts: dict, results: dict, 
-                            stats: dict) -> None:
-        """Nouvelle fonction pour traiter les patterns personnalisés avec support des groupes multiples"""
-        for match in matches:
-            # ✅ NOUVELLE LOGIQUE : Extraire tous les groupes capturés
-            all_groups = self._extract_all_groups_from_match(match, pattern_name)
-            
-            if not all_groups:
-                continue
-            
-            # ✅ NOUVELLE LOGIQUE : Traiter chaque groupe comme un texte séparé
-            for group_text in all_groups:
-                if not group_text or not group_text.strip():
-                    continue
-                    
-                text = group_text.strip()
-                all_detected.append(text)
-                
-                if text in seen_texts:
-                    # Gérer le cas où le pattern n'est pas dans duplicate_counts
-                    if pattern_name in duplicate_counts:
-                        duplicate_counts[pattern_name] += 1
-                    log_message("DEBUG", f"🔄 DOUBLON {pattern_name}: '{text[:30]}...'", category="extraction_results")
-                else:
-                    seen_texts.add(text)
-                
-                if self._is_valid_and_new_with_stats(text, stats):
-                    # Les patterns personnalisés sont toujours classés en auto_safe
-                    self._assign_text('auto_safe', text, results)
-                    log_message("DEBUG", f"✅ {pattern_name} (custom) auto-safe: '{text[:30]}...'", category="extraction_results")
-                
-                # Mettre à jour les stats pour les patterns personnalisés
-                if pattern_name not in stats['patterns_found']:
-                    stats['patterns_found'][pattern_name] = 0
-                stats['patterns_found'][pattern_name] += 1
+    def _collect_file_candidates(self, content: str) -> List[Tuple[str, str, bool]]:
+        """
+        Textes détectés dans un fichier : (pattern, texte, pattern personnalisé)
+        En mode combiné, une seule recherche couvre les patterns intégrés hors SEPARATE_SCAN_PATTERNS ;
+        résultats et ordre identiques au mode classique (un finditer par pattern).
+        """
+        candidates = []
+        combined_matches = self._scan_combined(content) if self.combined_pattern is not None else {}
+        
+        # Traiter les patterns avec gestion séparée des guillemets
+        for pattern_name in self._get_all_pattern_names():
+            if pattern_name in self.patterns:
+                matches = combined_matches.get(pattern_name)
+                if matches is None:
+                    matches = self.patterns[pattern_name].finditer(content)
+                for match in matches:
+                    text = self._extract_text_from_match(match, pattern_name)
+                    if text:
+                        candidates.append((pattern_name, text.strip(), False))
+        
+        # Patterns personnalisés : chaque groupe capturé est un texte séparé
+        for pattern_name, pattern in self.custom_patterns.items():
+            for match in pattern.finditer(content):
+                for group_text in self._extract_all_groups_from_match(match, pattern_name):
+                    candidates.append((pattern_name, group_text, True))
+        
+        return candidates
 
     def _get_all_pattern_names(self) -> List[str]:
         """Retourne la liste complète des noms de patterns à traiter"""
@@ -259,16 +370,84 @@ class OptimizedTextExtractor:
             'custom_dialogue_double', 'custom_dialogue_single'
         ]
 
-    def _process_pattern_matches(self, pattern_name: str, matches, all_detected: list, 
-                            seen_texts: set, duplicate_counts: dict, results: dict, 
-                            stats: dict) -> None:
-        """Version mise à jour pour traiter tous les patterns avec guillemets séparés"""
-        for match in matches:
-            text = self._extract_text_from_match(match, pattern_name)
-            if not text:
-                continue
-                
-            text = text.strip()
+    def _evaluate_candidate(self, pattern_name: str, text: str, is_custom: bool,
+                            stats: dict) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Classe un texte détecté selon son pattern.
+        
+        Returns:
+            (catégorie cible ou None, clé de statistique à incrémenter ou None)
+        """
+        if is_custom:
+            # Les patterns personnalisés sont toujours classés en auto_safe (et toujours comptés)
+            if self._is_valid_and_new_with_stats(text, stats):
+                log_message("DEBUG", f"✅ {pattern_name} (custom) auto-safe: '{text[:30]}...'", category="extraction_results")
+                return 'auto_safe', pattern_name
+            return None, pattern_name
+        
+        if not self._is_valid_and_new_with_stats(text, stats):
+            return None, None
+        
+        # Classification selon le type de pattern
+        base_pattern_name = self._get_base_pattern_name(pattern_name)
+        category = None
+        if base_pattern_name in ['character_def', 'input_calls', 'notify_calls', 'show_text', 
+                            'text_param', 'renpy_notify', 'activity_title', 'activity_description', 
+                            'character_info', 'text_element_with_attrs', 'commented_input']:
+            category = 'auto_safe'
+        elif base_pattern_name in ['character_age', 'character_connection', 'character_relationship']:
+            category = 'auto_safe' if self._is_character_attribute_auto_safe(text) else 'text_check'
+        elif base_pattern_name in ['textbutton']:
+            category = 'auto_safe' if self._is_textbutton_auto_safe(text) else 'textbutton_check'
+        elif base_pattern_name in ['text_element']:
+            category = 'auto_safe' if self._is_text_auto_safe(text) else 'text_check'
+        elif base_pattern_name in ['method_calls_text', 'custom_dialogue']:
+            category = 'auto_safe' if self._is_method_call_auto_safe(text) else 'text_check'
+        
+        if category == 'auto_safe':
+            log_message("DEBUG", f"✅ {pattern_name} auto-safe: '{text[:30]}...'", category="extraction_results")
+        elif category:
+            log_message("DEBUG", f"🟡 {pattern_name} à vérifier: '{text[:30]}...'", category="extraction_results")
+        
+        # Statistiques seulement pour les patterns de base connus
+        stats_key = base_pattern_name if base_pattern_name in self._stats_pattern_names else None
+        return category, stats_key
+
+    def _analyze_file(self, filepath: str) -> Dict[str, Any]:
+        """
+        Analyse un fichier sans toucher à l'état partagé (utilisable dans un processus worker)
+        
+        Returns:
+            dict: 'items' [(pattern, texte, catégorie, clé de stat)], 'rejection_reasons',
+                  'read' (fichier lu), 'error' (message ou None)
+        """
+        analysis = {
+            'items': [],
+            'rejection_reasons': {'too_short': 0, 'duplicate': 0, 'technical': 0},
+            'read': False,
+            'error': None
+        }
+        try:
+            with open(filepath, encoding="utf-8") as f:
+                content = f.read()
+            analysis['read'] = True
+            log_message("DEBUG", f"Traitement: {os.path.basename(filepath)} ({len(content)} caractères)", category="extraction_results")
+            
+            stats = {'rejection_reasons': analysis['rejection_reasons']}
+            for pattern_name, text, is_custom in self._collect_file_candidates(content):
+                category, stats_key = self._evaluate_candidate(pattern_name, text, is_custom, stats)
+                analysis['items'].append((pattern_name, text, category, stats_key))
+        except Exception as e:
+            analysis['error'] = str(e)
+        return analysis
+
+    def _merge_file_analysis(self, analysis: Dict[str, Any], all_detected: list, seen_texts: set,
+                             duplicate_counts: dict, results: dict, stats: dict) -> None:
+        """Intègre l'analyse d'un fichier (dans l'ordre des fichiers : agrégation déterministe)"""
+        for reason, count in analysis['rejection_reasons'].items():
+            stats['rejection_reasons'][reason] += count
+        
+        for pattern_name, text, category, stats_key in analysis['items']:
             all_detected.append(text)
             
             if text in seen_texts:
@@ -279,62 +458,46 @@ class OptimizedTextExtractor:
             else:
                 seen_texts.add(text)
             
-            if self._is_valid_and_new_with_stats(text, stats):
-                # Classification selon le type de pattern
-                base_pattern_name = self._get_base_pattern_name(pattern_name)
-                
-                if base_pattern_name in ['character_def', 'input_calls', 'notify_calls', 'show_text', 
-                                    'text_param', 'renpy_notify', 'activity_title', 'activity_description', 
-                                    'character_info', 'text_element_with_attrs', 'commented_input']:
-                    self._assign_text('auto_safe', text, results)
-                    log_message("DEBUG", f"✅ {pattern_name} auto-safe: '{text[:30]}...'", category="extraction_results")
-                    
-                elif base_pattern_name in ['character_age', 'character_connection', 'character_relationship']:
-                    if self._is_character_attribute_auto_safe(text):
-                        self._assign_text('auto_safe', text, results)
-                        log_message("DEBUG", f"✅ {pattern_name} auto-safe: '{text[:30]}...'", category="extraction_results")
-                    else:
-                        self._assign_text('text_check', text, results)
-                        log_message("DEBUG", f"🟡 {pattern_name} à vérifier: '{text[:30]}...'", category="extraction_results")
-                        
-                elif base_pattern_name in ['textbutton']:
-                    if self._is_textbutton_auto_safe(text):
-                        self._assign_text('auto_safe', text, results)
-                        log_message("DEBUG", f"✅ {pattern_name} auto-safe: '{text[:30]}...'", category="extraction_results")
-                    else:
-                        self._assign_text('textbutton_check', text, results)
-                        log_message("DEBUG", f"🟡 {pattern_name} à vérifier: '{text[:30]}...'", category="extraction_results")
-                        
-                elif base_pattern_name in ['text_element']:
-                    if self._is_text_auto_safe(text):
-                        self._assign_text('auto_safe', text, results)
-                        log_message("DEBUG", f"✅ {pattern_name} auto-safe: '{text[:30]}...'", category="extraction_results")
-                    else:
-                        self._assign_text('text_check', text, results)
-                        log_message("DEBUG", f"🟡 {pattern_name} à vérifier: '{text[:30]}...'", category="extraction_results")
-                        
-                elif base_pattern_name in ['method_calls_text', 'custom_dialogue']:
-                    if self._is_method_call_auto_safe(text):
-                        self._assign_text('auto_safe', text, results)
-                        log_message("DEBUG", f"✅ {pattern_name} auto-safe: '{text[:30]}...'", category="extraction_results")
-                    else:
-                        self._assign_text('text_check', text, results)
-                        log_message("DEBUG", f"🟡 {pattern_name} à vérifier: '{text[:30]}...'", category="extraction_results")
-                
-                # Gestion des patterns personnalisés
-                elif base_pattern_name.startswith('custom_'):
-                    # Les patterns personnalisés sont toujours classés en auto_safe
-                    self._assign_text('auto_safe', text, results)
-                    log_message("DEBUG", f"✅ {pattern_name} (custom) auto-safe: '{text[:30]}...'", category="extraction_results")
-                
-                # Mettre à jour les stats seulement si la clé existe
-                if base_pattern_name in stats['patterns_found']:
-                    stats['patterns_found'][base_pattern_name] += 1
-                elif base_pattern_name.startswith('custom_'):
-                    # Créer la clé pour les patterns personnalisés si elle n'existe pas
-                    if base_pattern_name not in stats['patterns_found']:
-                        stats['patterns_found'][base_pattern_name] = 0
-                    stats['patterns_found'][base_pattern_name] += 1
+            if category:
+                self._assign_text(category, text, results)
+            if stats_key:
+                stats['patterns_found'][stats_key] = stats['patterns_found'].get(stats_key, 0) + 1
+
+    def _should_scan_in_parallel(self, total_files: int, max_workers: Optional[int]) -> bool:
+        """Le mode parallèle n'est utilisé que s'il est activé et que le volume le justifie"""
+        try:
+            from infrastructure.config.config import config_manager
+            if not config_manager.get('targeted_extraction_parallel', True):
+                return False
+        except Exception:
+            pass
+        
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        return workers > 1 and total_files >= self.PARALLEL_MIN_FILES
+
+    def _analyze_files_parallel(self, files: List[str], max_workers: Optional[int],
+                                progress_callback: Optional[Callable[[int, int], None]]) -> List[Dict[str, Any]]:
+        """
+        Analyse les fichiers sur un pool de processus.
+        
+        Returns:
+            Analyses dans l'ordre des fichiers
+        """
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        workers = max(1, min(int(workers), len(files)))
+        log_message("INFO", f"⚡ Extraction ciblée parallèle : {len(files)} fichiers, {workers} processus", category="extraction_results")
+        
+        analyses = []
+        # Résultats dans l'ordre des fichiers, progression au fil de l'eau
+        for analysis in iter_process_map(_analyze_file_worker, files, workers,
+                                         initializer=_init_targeted_worker,
+                                         initargs=(self.existing_translations, self.custom_patterns,
+                                                   self.combined_pattern is not None),
+                                         label="Extraction ciblée parallèle", category="extraction_results"):
+            analyses.append(analysis)
+            if progress_callback:
+                progress_callback(len(analyses), len(files))
+        return analyses
 
     def _get_base_pattern_name(self, pattern_name: str) -> str:
         """Extrait le nom de pattern de base (sans _double/_single)"""
@@ -397,9 +560,15 @@ class OptimizedTextExtractor:
    
     def extract_targeted_texts(self, game_folder: str, tl_folder: str = None, 
                               existing_translations: Set[str] = None,
-                              excluded_files: List[str] = None) -> Dict[str, Set[str]]:
+                              excluded_files: List[str] = None,
+                              progress_callback: Optional[Callable[[int, int], None]] = None,
+                              max_workers: Optional[int] = None) -> Dict[str, Set[str]]:
         """
         Extraction ciblée avec patterns spécialisés et gestion séparée des guillemets
+        
+        Args:
+            progress_callback: appelé avec (fichiers analysés, total) au fil de l'analyse
+            max_workers: processus pour le mode parallèle (défaut : nombre de cœurs, 1 = séquentiel)
         """
         log_message("INFO", f"Début extraction CIBLÉE dans: {game_folder}", category="extraction_results")
         
@@ -446,6 +615,7 @@ class OptimizedTextExtractor:
         for custom_pattern_name in self.custom_patterns.keys():
             duplicate_counts[custom_pattern_name] = 0
 
+        files_to_scan = []
         for filepath in all_files:
             if '/tl/' in filepath.replace('\\', '/') or '\\tl\\' in filepath:
                 continue
@@ -455,34 +625,25 @@ class OptimizedTextExtractor:
                 stats['files_excluded'] += 1
                 log_message("DEBUG", f"Fichier exclu: {filename}", category="extraction_results")
                 continue
-                
-            try:
-                with open(filepath, encoding="utf-8") as f:
-                    content = f.read()
-                    stats['files_processed'] += 1
-                    log_message("DEBUG", f"Traitement: {filename} ({len(content)} caractères)", category="extraction_results")
-                    
-                    # Traiter tous les patterns avec gestion séparée des guillemets
-                    for pattern_name in self._get_all_pattern_names():
-                        if pattern_name in self.patterns:
-                            matches = self.patterns[pattern_name].finditer(content)
-                            self._process_pattern_matches(
-                                pattern_name, matches, all_detected, seen_texts, 
-                                duplicate_counts, results, stats
-                            )
-                    
-                    # Traiter les patterns personnalisés avec support des groupes multiples
-                    for pattern_name, pattern in self.custom_patterns.items():
-                        matches = pattern.finditer(content)
-                        self._process_custom_pattern_matches(
-                            pattern_name, matches, all_detected, seen_texts, 
-                            duplicate_counts, results, stats
-                        )
-                            
-            except Exception as e:
+            files_to_scan.append(filepath)
+        
+        analyses = None
+        if self._should_scan_in_parallel(len(files_to_scan), max_workers):
+            analyses = self._analyze_files_parallel(files_to_scan, max_workers, progress_callback)
+        if analyses is None:
+            analyses = []
+            for filepath in files_to_scan:
+                analyses.append(self._analyze_file(filepath))
+                if progress_callback:
+                    progress_callback(len(analyses), len(files_to_scan))
+        
+        for filepath, analysis in zip(files_to_scan, analyses):
+            if analysis['read']:
+                stats['files_processed'] += 1
+            if analysis['error']:
                 stats['files_error'] += 1
-                log_message("ATTENTION", f"Erreur lecture {filename}: {e}", category="extraction_results")
-                continue
+                log_message("ATTENTION", f"Erreur lecture {os.path.basename(filepath)}: {analysis['error']}", category="extraction_results")
+            self._merge_file_analysis(analysis, all_detected, seen_texts, duplicate_counts, results, stats)
         
         total_found = len(all_detected)
         total_unique = len(seen_texts)
@@ -508,49 +669,20 @@ class OptimizedTextExtractor:
 
 
     def _analyze_existing_translations(self, tl_folder: str) -> None:
-        """Analyse le dossier tl pour identifier les textes déjà traduits"""
+        """Identifie les textes déjà traduits du dossier tl (corpus persistant, seuls les fichiers modifiés sont relus)"""
         log_message("INFO", f"🔍 Analyse du dossier tl: {tl_folder}", category="extraction_results")
         
-        rpy_files = list(glob.glob(os.path.join(tl_folder, "**/*.rpy"), recursive=True))
+        try:
+            corpus = get_translation_corpus(tl_folder)
+            self.existing_translations.update(corpus.existing_translations())
+        except Exception as e:
+            log_message("ATTENTION", f"Erreur analyse du dossier tl {tl_folder}: {e}", category="extraction_results")
+            return
         
-        if not rpy_files:
+        if not self.existing_translations:
             log_message("INFO", f"📂 Dossier tl vide ou inexistant", category="extraction_results")
             return
         
-        translations_count = 0
-        
-        for filepath in rpy_files:
-            try:
-                with open(filepath, encoding="utf-8") as f:
-                    content = f.read()
-                    
-                # NOUVEAU - 4 patterns avec échappements
-                for match in self.patterns['tl_old_double'].finditer(content):
-                    text = match.group(1).strip()
-                    if text:
-                        self.existing_translations.add(text)
-                        translations_count += 1
-
-                for match in self.patterns['tl_old_single'].finditer(content):
-                    text = match.group(1).strip()
-                    if text:
-                        self.existing_translations.add(text)
-                        translations_count += 1
-
-                for match in self.patterns['i18n_existing_double'].finditer(content):
-                    text = match.group(1).strip()
-                    if text:
-                        self.existing_translations.add(text)
-
-                for match in self.patterns['i18n_existing_single'].finditer(content):
-                    text = match.group(1).strip()
-                    if text:
-                        self.existing_translations.add(text)
-                            
-            except Exception as e:
-                log_message("ATTENTION", f"Erreur lecture fichier tl {os.path.basename(filepath)}: {e}", category="extraction_results")
-                continue
-        
         log_message("INFO", f"📊 Anti-doublons activé: {len(self.existing_translations)} textes uniques détectés", category="extraction_results")
 
     def _is_valid_and_new_with_stats(self, text: str, stats: dict) -> bool:
@@ -709,12 +841,21 @@ class TextExtractionResultsBusiness:
                 existing_translations = extraction_params.get('existing_translations', None)
                 excluded_files = extraction_params.get('excluded_files', [])
                 
+                # Progression fichier par fichier, ramenée sur la plage 30-70 %
+                last_percent = [-1]
+                def on_files_progress(done, total):
+                    percent = 30 + (40 * done // total if total else 40)
+                    if percent != last_percent[0] and progress_callback and not self.operation_cancelled:
+                        last_percent[0] = percent
+                        progress_callback(percent, f"Analyse des fichiers ({done}/{total})...")
+                
                 # CORRIGÉ: Appeler la méthode avec le bon nom
                 results = extractor.extract_targeted_texts(
                     game_folder, 
                     tl_folder, 
                     existing_translations,
-                    excluded_files
+                    excluded_files,
+                    progress_callback=on_files_progress
                 )
                 
                 if progress_callback:
@@ -1184,6 +1325,27 @@ def format_extraction_statistics(stats: Dict[str, Any]) -> str:
     except Exception:
         return "Statistiques non disponibles"
 
+# ===== EXTRACTION CIBLÉE PARALLÈLE (WORKERS) =====
+
+_worker_extractor = None
+
+
+def _init_targeted_worker(existing_translations: Set[str], custom_patterns: Dict[str, Pattern], combined_scan: bool):
+    """Initialise l'extracteur d'un processus worker avec les données partagées en lecture seule"""
+    global _worker_extractor
+    _worker_extractor = OptimizedTextExtractor(combined_scan=combined_scan)
+    _worker_extractor.existing_translations = existing_translations
+    _worker_extractor.custom_patterns = custom_patterns
+
+
+def _analyze_file_worker(filepath: str) -> Dict[str, Any]:
+    """Worker (processus séparé) : analyse d'un fichier .rpy"""
+    with worker_span("extraction_results.file", file=os.path.basename(filepath)):
+        analysis = _worker_extractor._analyze_file(filepath)
+    # Spans et messages de log du processus worker, rapatriés avec le résultat
+    return attach_worker_records(analysis)
+
+
 # Exports
 __all__ = [
     'OptimizedTextExtractor',
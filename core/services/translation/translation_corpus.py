@@ -0,0 +1,209 @@
+# core/services/translation/translation_corpus.py
+"""
+Corpus des chaînes source déjà traduites d'une langue (anti-doublons)
+- Chaînes old "..." / old '...' et _("...") / __("...") des fichiers tl/<langue>
+- Lignes old brutes par fichier (recherche des chaînes orphelines du nettoyage)
+- Corpus persistant (cache_manager), invalidé fichier par fichier (mtime/taille) :
+  une nouvelle analyse ne relit que les fichiers modifiés
+"""
+
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from infrastructure.logging.logging import log_message
+
+__all__ = ['TranslationCorpus', 'get_translation_corpus', 'collect_old_texts']
+
+# Mêmes motifs que l'extraction ciblée (avec gestion des échappements)
+_EXISTING_PATTERNS = (
+    re.compile(r'old\s+"([^"\\]*(?:\\.[^"\\]*)*)"'),
+    re.compile(r"old\s+'([^'\\]*(?:\\.[^'\\]*)*)'"),
+    re.compile(r'__?\(\s*"([^"\\]*(?:\\.[^"\\]*)*)"'),
+    re.compile(r"__?\(\s*'([^'\\]*(?:\\.[^'\\]*)*)'"),
+)
+_DOUBLE_QUOTED = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"')
+_SINGLE_QUOTED = re.compile(r"'([^'\\]*(?:\\.[^'\\]*)*)'")
+
+_corpora: Dict[str, 'TranslationCorpus'] = {}
+_corpora_lock = threading.Lock()
+
+
+def _quoted_text(line: str) -> str:
+    """Texte entre guillemets d'une ligne old (doubles d'abord, puis simples)"""
+    match = _DOUBLE_QUOTED.search(line) or _SINGLE_QUOTED.search(line)
+    return match.group(1) if match else ""
+
+
+def _parse_tl_file(file_path: str) -> Dict[str, List[str]]:
+    """Chaînes existantes (dédoublonnées) et textes old ligne par ligne d'un fichier tl"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    strings = set()
+    for pattern in _EXISTING_PATTERNS:
+        for match in pattern.finditer(content):
+            text = match.group(1).strip()
+            if text:
+                strings.add(text)
+
+    old_texts = []
+    # split('\n') et non splitlines() : mêmes lignes qu'une lecture ligne par ligne
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('old '):
+            old_text = _quoted_text(stripped)
+            if old_text:
+                old_texts.append(old_text)
+
+    return {'strings': sorted(strings), 'old_texts': old_texts}
+
+
+def _split_tl_folder(tl_folder: str) -> Tuple[str, str]:
+    """(projet, langue) d'un dossier <projet>/game/tl/<langue> ; sinon (dossier, '')"""
+    tl_folder = os.path.normpath(os.path.abspath(tl_folder))
+    parent = os.path.dirname(tl_folder)
+    if os.path.basename(parent).lower() == 'tl':
+        return os.path.dirname(os.path.dirname(parent)), os.path.basename(tl_folder)
+    return tl_folder, ''
+
+
+class TranslationCorpus:
+    """
+    Corpus d'un dossier de langue.
+
+    refresh() restaure le corpus enregistré au premier appel, puis ne relit que les
+    fichiers dont la date ou la taille a changé ; le corpus est réenregistré s'il a changé.
+    """
+
+    def __init__(self, tl_folder: str):
+        self.tl_folder = os.path.normpath(os.path.abspath(tl_folder))
+        self.project_path, self.language = _split_tl_folder(self.tl_folder)
+        self._files: Optional[Dict[str, Dict[str, Any]]] = None
+        self._existing: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            from core.models.cache.cache_manager import cache_manager
+            return cache_manager.get_translation_corpus(self.project_path, self.language)
+        except Exception as e:
+            log_message("DEBUG", f"Corpus anti-doublons non chargé: {e}", category="extraction_config")
+            return {}
+
+    def _save(self, files: Dict[str, Dict[str, Any]]):
+        try:
+            from core.models.cache.cache_manager import cache_manager
+            cache_manager.set_translation_corpus(self.project_path, self.language, files)
+        except Exception as e:
+            log_message("ATTENTION", f"Corpus anti-doublons non sauvegardé: {e}", category="extraction_config")
+
+    def _scan_files(self) -> Dict[str, os.stat_result]:
+        found = {}
+        for root, _, files in os.walk(self.tl_folder):
+            for filename in files:
+                if filename.endswith('.rpy'):
+                    file_path = os.path.join(root, filename)
+                    try:
+                        found[os.path.relpath(file_path, self.tl_folder)] = os.stat(file_path)
+                    except OSError:
+                        continue
+        return found
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Met le corpus à jour d'après les fichiers présents.
+
+        Returns:
+            dict: fichiers relus, inchangés, retirés, en erreur et nombre de chaînes
+        """
+        with self._lock:
+            stats = {'parsed': 0, 'unchanged': 0, 'removed': 0, 'errors': 0, 'strings': 0}
+            known = self._files if self._files is not None else self._load()
+            current = self._scan_files()
+
+            files = {}
+            for rel_path, stat_result in sorted(current.items()):
+                entry = known.get(rel_path)
+                if entry and entry.get('mtime_ns') == stat_result.st_mtime_ns and entry.get('size') == stat_result.st_size:
+                    files[rel_path] = entry
+                    stats['unchanged'] += 1
+                    continue
+                try:
+                    parsed = _parse_tl_file(os.path.join(self.tl_folder, rel_path))
+                except Exception as e:
+                    stats['errors'] += 1
+                    log_message("ATTENTION", f"Erreur lecture fichier tl {os.path.basename(rel_path)}: {e}", category="extraction_config")
+                    continue
+                files[rel_path] = {'mtime_ns': stat_result.st_mtime_ns, 'size': stat_result.st_size, **parsed}
+                stats['parsed'] += 1
+            stats['removed'] = len(set(known) - set(current))
+
+            changed = stats['parsed'] or stats['removed'] or files.keys() != known.keys()
+            if changed or self._files is None:
+                self._existing = {text for entry in files.values() for text in entry['strings']}
+            self._files = files
+            if changed:
+                self._save(files)
+
+            stats['strings'] = len(self._existing)
+            log_message("DEBUG", f"Corpus anti-doublons {self.language or self.tl_folder}: {stats['strings']} chaînes | "
+                        f"{stats['parsed']} relu(s), {stats['unchanged']} inchangé(s), {stats['removed']} retiré(s)",
+                        category="extraction_config")
+            return stats
+
+    def existing_translations(self) -> Set[str]:
+        """Chaînes déjà présentes dans le dossier de langue (copie)"""
+        with self._lock:
+            return set(self._existing)
+
+    def old_texts(self, file_path: str) -> Optional[List[str]]:
+        """Textes des lignes old d'un fichier du dossier (None s'il n'est pas dans le corpus)"""
+        rel_path = os.path.relpath(os.path.abspath(file_path), self.tl_folder)
+        with self._lock:
+            entry = (self._files or {}).get(rel_path)
+            return list(entry['old_texts']) if entry else None
+
+
+def get_translation_corpus(tl_folder: str) -> TranslationCorpus:
+    """Corpus à jour d'un dossier de langue (instance partagée dans le processus)"""
+    key = os.path.normcase(os.path.normpath(os.path.abspath(tl_folder)))
+    with _corpora_lock:
+        corpus = _corpora.get(key)
+        if corpus is None:
+            corpus = _corpora[key] = TranslationCorpus(tl_folder)
+    corpus.refresh()
+    return corpus
+
+
+def _language_folder_of(file_path: str) -> Optional[str]:
+    """Dossier tl/<langue> contenant le fichier, ou None"""
+    parts = os.path.normpath(os.path.abspath(file_path)).split(os.sep)
+    for i in range(len(parts) - 2, 0, -1):
+        if parts[i].lower() == 'tl' and i + 1 < len(parts) - 1:
+            return os.sep.join(parts[:i + 2]) or os.sep
+    return None
+
+
+def collect_old_texts(file_paths: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Textes old de chaque fichier, servis par le corpus de sa langue.
+    Les fichiers hors d'un dossier tl/<langue> sont lus directement.
+    """
+    by_folder: Dict[Optional[str], List[str]] = {}
+    for file_path in file_paths:
+        by_folder.setdefault(_language_folder_of(file_path), []).append(file_path)
+
+    old_texts = {}
+    for folder, paths in by_folder.items():
+        corpus = get_translation_corpus(folder) if folder else None
+        for file_path in paths:
+            texts = corpus.old_texts(file_path) if corpus else None
+            if texts is None:
+                try:
+                    texts = _parse_tl_file(file_path)['old_texts']
+                except Exception:
+                    continue
+            old_texts[file_path] = texts
+    return old_texts
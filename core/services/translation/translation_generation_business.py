@@ -6,6 +6,7 @@
 Logique métier complète pour la génération de traductions Ren'Py
 - Génération via l'exécutable du jeu (méthode embedded)
 - Génération via SDK Ren'Py
+- Génération native des fichiers tl (analyse des scripts, sans lancer le jeu)
 - Détection automatique de l'exécutable
 - Création de fichiers de commande temporaires
 - Monitoring en temps réel avec timeout
@@ -16,7 +17,6 @@ Logique métier complète pour la génération de traductions Ren'Py
 import os
 import sys
 import json
-import subprocess
 import threading
 import glob
 import re
@@ -29,15 +29,18 @@ from typing import Dict, List, Optional, Callable, Any, Tuple
 from datetime import datetime
 
 from infrastructure.logging.logging import log_message
+from infrastructure.logging.tracing import trace_run, trace_span
 from infrastructure.config.config import config_manager
 from infrastructure.config.constants import (
     LEGACY_DEFAULT_LANGUAGE_STARTUP_FILENAME,
     RENEXTRACT_DEFAULT_LANGUAGE_STARTUP_FILENAME,
 )
 from infrastructure.helpers.unified_functions import show_translated_messagebox
+from infrastructure.helpers.process_runner import ProcessRunner
 from core.models.backup.unified_backup_manager import BackupType
 from core.tools.sdk_manager import get_sdk_manager
 from core.services.translation.font_manager import FontManager
+from core.services.translation.native_tl_generator import NativeTranslationGenerator
 from core.models.backup.unified_backup_manager import UnifiedBackupManager
 from core.services.common.common import get_french_common_translations
 
@@ -616,10 +619,12 @@ init python early hide:
             start_time = time.time()
             try:
                 self.current_project_path = project_path
-                result = self.generate_translations_embedded(
-                    project_path, language, options, 
-                    progress_callback, status_callback
-                )
+                with trace_run("translation_generation", language=language, method="embedded") as span:
+                    result = self.generate_translations_embedded(
+                        project_path, language, options, 
+                        progress_callback, status_callback
+                    )
+                    span.set(success=bool(result.get('success')), files=len(result.get('translation_files', [])))
                 result['execution_time'] = time.time() - start_time
                 
                 # Ajouter un résumé synthétique pour le popup
@@ -694,6 +699,8 @@ init python early hide:
         Génère les fichiers de traduction via l'exécutable du jeu avec monitoring temps réel
         ORDRE: common.rpy et screen.rpy AVANT la génération TL
         MODIFIÉ: Support polices personnalisées sans RTL
+        Génération native (sans exécutable) si options['native_generation'] / translation_generation_native,
+        ou si aucun exécutable n'est trouvé (translation_generation_native_fallback)
         
         Args:
             project_path: Chemin vers le projet
@@ -707,7 +714,6 @@ init python early hide:
         """
         result = {'success': False, 'errors': [], 'warnings': [], 'translation_files': [], 'output_folder': None, 'language': language}
         start_time = time.time()
-        command_filepath = None
         
         if options is None:
             options = {}
@@ -740,7 +746,8 @@ init python early hide:
                     status_callback("Préparation du fichier common français...")
                 
                 try:
-                    common_success, common_message = self.create_french_common_file_pre_generation(project_path, language)
+                    with trace_span("generation.french_common"):
+                        common_success, common_message = self.create_french_common_file_pre_generation(project_path, language)
                     if common_success:
                         result['french_common_prepared'] = True
                         result['french_common_message'] = common_message
@@ -760,7 +767,8 @@ init python early hide:
                     status_callback("Préparation du fichier screens français...")
                 
                 try:
-                    screens_success, screens_message = self.create_french_screen_file_pre_generation(project_path, language)
+                    with trace_span("generation.french_screens"):
+                        screens_success, screens_message = self.create_french_screen_file_pre_generation(project_path, language)
                     if screens_success:
                         result['french_screens_prepared'] = True
                         result['french_screens_message'] = screens_message
@@ -775,191 +783,26 @@ init python early hide:
             if status_callback:
                 status_callback("Détection de l'exécutable du jeu...")
             
-            executable_path = self.detect_game_executable(project_path)
-            if not executable_path:
-                result['errors'].append("Aucun exécutable de jeu trouvé dans le projet.")
-                return result
-            
-            if progress_callback:
-                progress_callback(20, "Initialisation de Ren'Py...")
-            if status_callback:
-                status_callback("Initialisation de Ren'Py...")
-            
-            command_filepath = self.create_translation_command_file(project_path, language)
-            
-            if progress_callback:
-                progress_callback(30, "Analyse des fichiers sources...")
-            
-            cmd = self._build_execution_command(executable_path)
-            
-            env = os.environ.copy()
-            env['RENPY_PLATFORM'] = 'all'
-            
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            if progress_callback:
-                progress_callback(40, "Génération des traductions...")
-            if status_callback:
-                status_callback("Génération des traductions...")
-            
-            # ✅ NOUVEAU : Supprimer traceback.txt s'il existe
-            traceback_path = os.path.join(project_path, "traceback.txt")
-            if os.path.exists(traceback_path):
-                try:
-                    os.remove(traceback_path)
-                    log_message("INFO", "traceback.txt supprimé avant génération", category="renpy_generator_tl")
-                except Exception as e:
-                    log_message("ATTENTION", f"Impossible de supprimer traceback.txt : {e}", category="renpy_generator_tl")
-            
-            # === GÉNÉRATION TRADUCTIONS REN'PY ===
-            # ✅ CORRECTION : Masquer la fenêtre console sur Windows
-            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            
-            process = subprocess.Popen(
-                cmd,
-                cwd=project_path,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',
-                startupinfo=startupinfo,
-                env=env,
-                creationflags=creationflags
-            )
-            
-            # ✅ NOUVEAU : Surveillance traceback.txt en temps réel
-            traceback_detected = False
-            
-            def monitor_traceback():
-                nonlocal traceback_detected
-                while process.poll() is None:
-                    if os.path.exists(traceback_path):
-                        traceback_detected = True
-                        log_message("ERREUR", f"traceback.txt détecté pendant la génération Ren'Py", category="renpy_generator_tl")
-                        # Arrêter le processus si traceback détecté
-                        try:
-                            process.terminate()
-                        except Exception:
-                            pass
-                        break
-                    time.sleep(0.5)  # Vérifier toutes les 500ms
-            
-            # Démarrer la surveillance
-            monitor_thread = threading.Thread(target=monitor_traceback, daemon=True)
-            monitor_thread.start()
-            
-            # Monitoring en temps réel avec timeout adaptatif
             tl_folder = os.path.join(game_dir, "tl", language)
-            generation_start_time = time.time()
-            timeout_seconds = 600  # 10 minutes d'inactivité (pas de nouveaux fichiers)
-            initial_timeout = 300  # 5 minutes avant le premier fichier
-            last_file_count = 0
-            last_activity_time = time.time()  # Dernière fois qu'un nouveau fichier a été détecté
-            first_file_detected = False  # Indique si au moins un fichier a été généré
-            
-            while process.poll() is None:
-                # Vérifier si traceback a été détecté
-                if traceback_detected:
-                    try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
-                    
-                    result['errors'].append(
-                        "Erreur Ren'Py détectée (traceback.txt généré). "
-                        "Le problème vient du jeu, pas de RenExtract. "
-                        "Consultez traceback.txt dans le dossier du projet pour plus de détails."
-                    )
-                    log_message("ERREUR", "Génération annulée - traceback.txt détecté lors de la génération", category="renpy_generator_tl")
-                    return result
-                
-                elapsed_time = time.time() - generation_start_time
-                
-                # Progression basée sur les fichiers générés
-                current_files = 0
-                if os.path.isdir(tl_folder):
-                    current_files = len([f for f in os.listdir(tl_folder) if f.endswith('.rpy')])
-                
-                # ✅ NOUVEAU : Détecter si de nouveaux fichiers sont générés
-                if current_files > last_file_count:
-                    # Nouveaux fichiers détectés - réinitialiser le timer d'inactivité
-                    last_activity_time = time.time()
-                    last_file_count = current_files
-                    if not first_file_detected:
-                        first_file_detected = True
-                        log_message("INFO", f"Premier fichier généré après {int(elapsed_time)}s", category="renpy_generator_tl")
-                    else:
-                        log_message("DEBUG", f"Progression détectée : {current_files} fichiers générés", category="renpy_generator_tl")
-                
-                # ✅ NOUVEAU : Timeout adaptatif basé sur l'inactivité
-                if first_file_detected:
-                    # Une fois qu'au moins un fichier a été généré, utiliser le timeout d'inactivité
-                    inactivity_time = time.time() - last_activity_time
-                    if inactivity_time > timeout_seconds:
-                        # Aucun nouveau fichier depuis 2 minutes - probablement bloqué
-                        log_message("ATTENTION", f"Timeout adaptatif : Aucun nouveau fichier depuis {int(inactivity_time)}s ({current_files} fichiers au total)", category="renpy_generator_tl")
-                        process.terminate()
-                        try:
-                            process.wait(timeout=5)
-                        except subprocess.TimeoutExpired:
-                            process.kill()
-                            process.wait()
-                        
-                        result['errors'].append(
-                            f"La génération semble bloquée (aucun nouveau fichier depuis {int(inactivity_time)}s). "
-                            f"{current_files} fichier(s) généré(s) avant l'arrêt. "
-                            "Le projet pourrait être trop volumineux ou il y a un problème avec Ren'Py."
-                        )
-                        return result
-                else:
-                    # Aucun fichier généré encore - utiliser le timeout initial
-                    if elapsed_time > initial_timeout:
-                        log_message("ATTENTION", f"Timeout initial : Aucun fichier généré après {int(elapsed_time)}s", category="renpy_generator_tl")
-                        process.terminate()
-                        try:
-                            process.wait(timeout=5)
-                        except subprocess.TimeoutExpired:
-                            process.kill()
-                            process.wait()
-                        
-                        result['errors'].append(
-                            f"La génération n'a pas démarré correctement (aucun fichier généré après {int(elapsed_time)}s). "
-                            "Vérifiez que Ren'Py fonctionne correctement avec ce projet."
-                        )
+            use_native = options.get('native_generation', config_manager.get('translation_generation_native', False))
+            if not use_native:
+                with trace_span("generation.detect_executable"):
+                    executable_path = self.detect_game_executable(project_path)
+                if not executable_path:
+                    if not config_manager.get('translation_generation_native_fallback', True):
+                        result['errors'].append("Aucun exécutable de jeu trouvé dans le projet.")
                         return result
-                
-                estimated_progress = min(30, (current_files * 30) // max(20, 1))
-                total_progress = 40 + estimated_progress
-                
-                minutes = int(elapsed_time // 60)
-                seconds = int(elapsed_time % 60)
-                time_str = f"{minutes}m {seconds:02d}s" if minutes > 0 else f"{seconds}s"
-                
-                status_message = f"Génération des traductions... ({time_str})"
-                if current_files > 0:
-                    status_message += f" - {current_files} fichiers générés"
-                
-                if progress_callback:
-                    progress_callback(total_progress, status_message)
-                
-                time.sleep(0.5)
-            
-            stdout, stderr = process.communicate()
-            
-            # ✅ Vérifier si traceback.txt a été généré pendant l'exécution
-            if traceback_detected or os.path.exists(traceback_path):
-                result['errors'].append(
-                    "Erreur Ren'Py détectée (traceback.txt généré). "
-                    "Le problème vient du jeu, pas de RenExtract. "
-                    "Consultez traceback.txt dans le dossier du projet pour plus de détails."
-                )
-                log_message("ERREUR", f"traceback.txt détecté - Erreur Ren'Py lors de la génération", category="renpy_generator_tl")
+                    # Projet sans exécutable (scripts seuls) : génération native
+                    result['warnings'].append("Aucun exécutable de jeu trouvé : génération native des traductions utilisée.")
+                    log_message("ATTENTION", "Aucun exécutable de jeu trouvé - génération native des fichiers tl", category="renpy_generator_tl")
+                    use_native = True
+
+            if use_native:
+                process_info = self._run_native_generation(project_path, language, result, progress_callback, status_callback)
+            else:
+                process_info = self._run_embedded_generation_process(project_path, language, executable_path, result,
+                                                                     progress_callback, status_callback)
+            if process_info is None:
                 return result
             
             # === VÉRIFICATION RÉSULTATS GÉNÉRATION ===
@@ -992,7 +835,8 @@ init python early hide:
                             'individual_fonts': options.get('individual_fonts', {})
                         }
                         
-                        font_success, font_info = self.create_individual_font_system_file(project_path, language, font_options)
+                        with trace_span("generation.font_system"):
+                            font_success, font_info = self.create_individual_font_system_file(project_path, language, font_options)
                         
                         if font_success:
                             result['font_applied'] = True
@@ -1106,9 +950,10 @@ init python early hide:
             else:
                 # Échec de la génération
                 error_msg = "La génération a échoué. "
+                stdout, stderr = process_info['stdout'], process_info['stderr']
                 
-                if process.returncode != 0:
-                    error_msg += f"Code de sortie : {process.returncode}. "
+                if process_info['returncode'] != 0:
+                    error_msg += f"Code de sortie : {process_info['returncode']}. "
                 
                 if stderr:
                     error_msg += f"Erreur : {stderr[:200]}"
@@ -1123,21 +968,6 @@ init python early hide:
         except Exception as e:
             result['errors'].append(f"Erreur inattendue : {e}")
         finally:
-            # === NETTOYAGE ===
-            temp_files_to_clean = []
-            
-            if command_filepath:
-                temp_files_to_clean.append(command_filepath)
-                rpyc_filepath = command_filepath.replace('.rpy', '.rpyc')
-                temp_files_to_clean.append(rpyc_filepath)
-            
-            for temp_file in temp_files_to_clean:
-                if os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                    except Exception as e:
-                        result['warnings'].append(f"Impossible de supprimer {os.path.basename(temp_file)}: {e}")
-            
             # === RÉSUMÉ FINAL - SECTION À MODIFIER ===
             if result['success']:
                 files_count = len(result.get('translation_files', []))
@@ -1174,6 +1004,185 @@ init python early hide:
         result['execution_time'] = time.time() - start_time
         return result
     
+    def _run_embedded_generation_process(self, project_path: str, language: str, executable_path: str, result: Dict[str, Any],
+                                         progress_callback: Optional[Callable] = None,
+                                         status_callback: Optional[Callable] = None) -> Optional[Dict[str, Any]]:
+        """
+        Lance l'exécutable du jeu avec le fichier de commande de traduction et surveille la génération
+        
+        Returns:
+            Dict returncode/stdout/stderr du processus, ou None si la génération a été interrompue
+            (erreurs ajoutées à result['errors'])
+        """
+        game_dir = os.path.join(project_path, "game")
+        command_filepath = None
+        
+        try:
+            if progress_callback:
+                progress_callback(20, "Initialisation de Ren'Py...")
+            if status_callback:
+                status_callback("Initialisation de Ren'Py...")
+            
+            command_filepath = self.create_translation_command_file(project_path, language)
+            
+            if progress_callback:
+                progress_callback(30, "Analyse des fichiers sources...")
+            
+            cmd = self._build_execution_command(executable_path)
+            
+            env = os.environ.copy()
+            env['RENPY_PLATFORM'] = 'all'
+            
+            if progress_callback:
+                progress_callback(40, "Génération des traductions...")
+            if status_callback:
+                status_callback("Génération des traductions...")
+            
+            # ✅ NOUVEAU : Supprimer traceback.txt s'il existe
+            traceback_path = os.path.join(project_path, "traceback.txt")
+            if os.path.exists(traceback_path):
+                try:
+                    os.remove(traceback_path)
+                    log_message("INFO", "traceback.txt supprimé avant génération", category="renpy_generator_tl")
+                except Exception as e:
+                    log_message("ATTENTION", f"Impossible de supprimer traceback.txt : {e}", category="renpy_generator_tl")
+            
+            # === GÉNÉRATION TRADUCTIONS REN'PY ===
+            # Sorties lues en continu ; fichiers tl et traceback.txt signalés par la surveillance des dossiers
+            tl_folder = os.path.join(game_dir, "tl", language)
+            tl_folder_abs = os.path.abspath(tl_folder)
+            traceback_abs = os.path.abspath(traceback_path)
+            timeout_seconds = 600  # 10 minutes d'inactivité (aucun fichier tl écrit)
+            initial_timeout = 300  # 5 minutes avant le premier fichier
+            generated_files = set()
+            if os.path.isdir(tl_folder):
+                generated_files = {f for f in os.listdir(tl_folder) if f.endswith('.rpy')}
+            first_file_detected = bool(generated_files)  # Indique si au moins un fichier a été généré
+            last_activity_time = time.time()  # Dernière écriture d'un fichier tl
+            traceback_detected = False
+            
+            with ProcessRunner(cmd, cwd=project_path, env=env, watch_dirs=[project_path, tl_folder]) as runner:
+                for event in runner.events(is_cancelled=lambda: self.operation_cancelled):
+                    if event.kind == 'file':
+                        if event.data == traceback_abs:
+                            traceback_detected = True
+                            log_message("ERREUR", "traceback.txt détecté pendant la génération Ren'Py", category="renpy_generator_tl")
+                            break
+                        if os.path.dirname(event.data) == tl_folder_abs and event.data.endswith('.rpy'):
+                            # Fichier créé ou complété : la génération progresse
+                            last_activity_time = time.time()
+                            file_name = os.path.basename(event.data)
+                            if file_name not in generated_files:
+                                generated_files.add(file_name)
+                                if not first_file_detected:
+                                    first_file_detected = True
+                                    log_message("INFO", f"Premier fichier généré après {int(runner.elapsed)}s", category="renpy_generator_tl")
+                                else:
+                                    log_message("DEBUG", f"Progression détectée : {len(generated_files)} fichiers générés", category="renpy_generator_tl")
+                        continue
+                    if event.kind != 'tick':
+                        continue
+                    
+                    elapsed_time = event.data
+                    current_files = len(generated_files)
+                    
+                    # Timeout adaptatif basé sur l'inactivité
+                    if first_file_detected:
+                        inactivity_time = time.time() - last_activity_time
+                        if inactivity_time > timeout_seconds:
+                            log_message("ATTENTION", f"Timeout adaptatif : Aucun nouveau fichier depuis {int(inactivity_time)}s ({current_files} fichiers au total)", category="renpy_generator_tl")
+                            result['errors'].append(
+                                f"La génération semble bloquée (aucun nouveau fichier depuis {int(inactivity_time)}s). "
+                                f"{current_files} fichier(s) généré(s) avant l'arrêt. "
+                                "Le projet pourrait être trop volumineux ou il y a un problème avec Ren'Py."
+                            )
+                            return None
+                    elif elapsed_time > initial_timeout:
+                        log_message("ATTENTION", f"Timeout initial : Aucun fichier généré après {int(elapsed_time)}s", category="renpy_generator_tl")
+                        result['errors'].append(
+                            f"La génération n'a pas démarré correctement (aucun fichier généré après {int(elapsed_time)}s). "
+                            "Vérifiez que Ren'Py fonctionne correctement avec ce projet."
+                        )
+                        return None
+                    
+                    estimated_progress = min(30, (current_files * 30) // max(20, 1))
+                    total_progress = 40 + estimated_progress
+                    
+                    minutes = int(elapsed_time // 60)
+                    seconds = int(elapsed_time % 60)
+                    time_str = f"{minutes}m {seconds:02d}s" if minutes > 0 else f"{seconds}s"
+                    
+                    status_message = f"Génération des traductions... ({time_str})"
+                    if current_files > 0:
+                        status_message += f" - {current_files} fichiers générés"
+                    
+                    if progress_callback:
+                        progress_callback(total_progress, status_message)
+            
+            returncode, stdout, stderr = runner.result()
+            
+            # ✅ Vérifier si traceback.txt a été généré pendant l'exécution
+            if traceback_detected or os.path.exists(traceback_path):
+                result['errors'].append(
+                    "Erreur Ren'Py détectée (traceback.txt généré). "
+                    "Le problème vient du jeu, pas de RenExtract. "
+                    "Consultez traceback.txt dans le dossier du projet pour plus de détails."
+                )
+                log_message("ERREUR", f"traceback.txt détecté - Erreur Ren'Py lors de la génération", category="renpy_generator_tl")
+                return None
+            
+            return {'returncode': returncode, 'stdout': stdout, 'stderr': stderr}
+        finally:
+            # === NETTOYAGE ===
+            temp_files_to_clean = []
+            
+            if command_filepath:
+                temp_files_to_clean.append(command_filepath)
+                rpyc_filepath = command_filepath.replace('.rpy', '.rpyc')
+                temp_files_to_clean.append(rpyc_filepath)
+            
+            for temp_file in temp_files_to_clean:
+                if os.path.exists(temp_file):
+                    try:
+                        os.remove(temp_file)
+                    except Exception as e:
+                        result['warnings'].append(f"Impossible de supprimer {os.path.basename(temp_file)}: {e}")
+    
+    def _run_native_generation(self, project_path: str, language: str, result: Dict[str, Any],
+                               progress_callback: Optional[Callable] = None,
+                               status_callback: Optional[Callable] = None) -> Optional[Dict[str, Any]]:
+        """
+        Génère les fichiers tl sans lancer le jeu (analyse des scripts .rpy par RenExtract)
+        
+        Returns:
+            Dict returncode/stdout/stderr (même forme que la génération par l'exécutable),
+            ou None en cas d'échec (erreurs ajoutées à result['errors'])
+        """
+        if progress_callback:
+            progress_callback(40, "Génération native des traductions...")
+        if status_callback:
+            status_callback("Génération native des traductions...")
+        
+        def on_progress(done: int, total: int):
+            if progress_callback:
+                progress_callback(40 + (done * 40) // max(total, 1), f"Analyse des scripts... ({done}/{total})")
+        
+        generator = NativeTranslationGenerator(
+            project_path, language,
+            max_workers=config_manager.get('translation_generation_native_workers', None)
+        )
+        with trace_span("generation.native_tl"):
+            native_result = generator.generate(progress_callback=on_progress,
+                                               is_cancelled=lambda: self.operation_cancelled)
+        
+        result['native_generation'] = {k: native_result[k] for k in ('dialogues', 'strings', 'skipped', 'scripts', 'elapsed')}
+        for error in native_result['errors']:
+            result['warnings'].append(f"Génération native : {error}")
+        if not native_result['success']:
+            result['errors'].append("La génération native a échoué : " + "; ".join(native_result['errors'][:3]))
+            return None
+        return {'returncode': 0, 'stdout': '', 'stderr': ''}
+    
     def generate_translations_with_sdk_threaded(self, project_path: str, language: str = "french", options: Optional[Dict] = None,
                                               progress_callback: Optional[Callable] = None,
                                               status_callback: Optional[Callable] = None,
@@ -1196,10 +1205,12 @@ init python early hide:
             start_time = time.time()
             try:
                 self.current_project_path = project_path
-                result = self.generate_translations_with_sdk(
-                    project_path, language, options, 
-                    progress_callback, status_callback
-                )
+                with trace_run("translation_generation", language=language, method="sdk") as span:
+                    result = self.generate_translations_with_sdk(
+                        project_path, language, options, 
+                        progress_callback, status_callback
+                    )
+                    span.set(success=bool(result.get('success')), files=len(result.get('translation_files', [])))
                 result['execution_time'] = time.time() - start_time
                 
                 # Ajouter un résumé synthétique pour le popup
@@ -1318,7 +1329,8 @@ init python early hide:
                 self.status_callback("Recherche du SDK Ren'Py...")
             
             # Obtenir le SDK optimal
-            sdk_path = self.sdk_manager.get_sdk_for_cleaning()
+            with trace_span("generation.sdk_lookup"):
+                sdk_path = self.sdk_manager.get_sdk_for_cleaning()
             if not sdk_path:
                 result['errors'].append("Aucun SDK Ren'Py trouvé ou téléchargeable.")
                 return result
@@ -1348,12 +1360,6 @@ init python early hide:
             env = os.environ.copy()
             env['RENPY_PLATFORM'] = 'all'
             
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-            
             # ✅ NOUVEAU : Supprimer traceback.txt s'il existe
             traceback_path = os.path.join(project_path, "traceback.txt")
             if os.path.exists(traceback_path):
@@ -1363,94 +1369,41 @@ init python early hide:
                 except Exception as e:
                     log_message("ATTENTION", f"Impossible de supprimer traceback.txt : {e}", category="renpy_generator_tl")
             
-            # Lancer le processus avec monitoring
-            # ✅ CORRECTION : Masquer la fenêtre console sur Windows
-            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',
-                startupinfo=startupinfo,
-                env=env,
-                creationflags=creationflags
-            )
-            
-            # ✅ NOUVEAU : Surveillance traceback.txt en temps réel
+            # Lancer le processus avec monitoring (sorties lues en continu, traceback.txt surveillé)
+            tl_folder = os.path.join(game_dir, "tl", language)
+            traceback_abs = os.path.abspath(traceback_path)
+            timeout_seconds = 180  # 3 minutes pour SDK
             traceback_detected = False
             
-            def monitor_traceback():
-                nonlocal traceback_detected
-                while process.poll() is None:
-                    if os.path.exists(traceback_path):
+            with ProcessRunner(cmd, env=env, watch_dirs=[project_path], tick_interval=1.0) as runner:
+                for event in runner.events(is_cancelled=lambda: self.operation_cancelled):
+                    if event.kind == 'file' and event.data == traceback_abs:
                         traceback_detected = True
                         log_message("ERREUR", f"traceback.txt détecté pendant la génération SDK Ren'Py", category="renpy_generator_tl")
-                        # Arrêter le processus si traceback détecté
-                        try:
-                            process.terminate()
-                        except Exception:
-                            pass
                         break
-                    time.sleep(0.5)  # Vérifier toutes les 500ms
-            
-            # Démarrer la surveillance
-            monitor_thread = threading.Thread(target=monitor_traceback, daemon=True)
-            monitor_thread.start()
-            
-            # Monitoring avec timeout
-            tl_folder = os.path.join(game_dir, "tl", language)
-            generation_start_time = time.time()
-            timeout_seconds = 180  # 3 minutes pour SDK
-            
-            while process.poll() is None:
-                # Vérifier si traceback a été détecté
-                if traceback_detected:
-                    try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
+                    if event.kind != 'tick':
+                        continue
                     
-                    result['errors'].append(
-                        "Erreur Ren'Py détectée (traceback.txt généré). "
-                        "Le problème vient du jeu, pas de RenExtract. "
-                        "Consultez traceback.txt dans le dossier du projet pour plus de détails."
-                    )
-                    log_message("ERREUR", "Génération SDK annulée - traceback.txt détecté", category="renpy_generator_tl")
-                    return result
-                elapsed_time = time.time() - generation_start_time
-                
-                if elapsed_time > timeout_seconds:
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
+                    elapsed_time = event.data
+                    if elapsed_time > timeout_seconds:
+                        result['errors'].append(f"La génération SDK a dépassé le temps limite (3 minutes).")
+                        log_message("ERREUR", "Timeout lors de la génération SDK", category="renpy_generator_tl")
+                        return result
                     
-                    result['errors'].append(f"La génération SDK a dépassé le temps limite (3 minutes).")
-                    log_message("ERREUR", "Timeout lors de la génération SDK", category="renpy_generator_tl")
-                    return result
-                
-                # Progression basée sur le temps
-                progress_percent = min(70, 30 + int((elapsed_time / timeout_seconds) * 40))
-                
-                minutes = int(elapsed_time // 60)
-                seconds = int(elapsed_time % 60)
-                time_str = f"{minutes}m {seconds:02d}s" if minutes > 0 else f"{seconds}s"
-                
-                if progress_callback:
-                    progress_callback(progress_percent, f"Génération SDK en cours... ({time_str})")
-                elif self.progress_callback:
-                    self.progress_callback(progress_percent, f"Génération SDK en cours... ({time_str})")
-                
-                time.sleep(1)
+                    # Progression basée sur le temps
+                    progress_percent = min(70, 30 + int((elapsed_time / timeout_seconds) * 40))
+                    
+                    minutes = int(elapsed_time // 60)
+                    seconds = int(elapsed_time % 60)
+                    time_str = f"{minutes}m {seconds:02d}s" if minutes > 0 else f"{seconds}s"
+                    
+                    if progress_callback:
+                        progress_callback(progress_percent, f"Génération SDK en cours... ({time_str})")
+                    elif self.progress_callback:
+                        self.progress_callback(progress_percent, f"Génération SDK en cours... ({time_str})")
             
             # Récupérer la sortie
-            stdout, stderr = process.communicate()
+            returncode, stdout, stderr = runner.result()
             
             # ✅ Vérifier si traceback.txt a été généré pendant l'exécution
             if traceback_detected or os.path.exists(traceback_path):
@@ -1486,7 +1439,7 @@ init python early hide:
                 
                 log_message("INFO", f"Génération SDK réussie ! {len(translation_files)} fichiers créés", category="renpy_generator_tl")
             else:
-                error_msg = f"Génération SDK échouée. Code: {process.returncode}"
+                error_msg = f"Génération SDK échouée. Code: {returncode}"
                 if stderr:
                     error_msg += f" Erreur: {stderr[:200]}"
                 result['errors'].append(error_msg)
@@ -353,12 +353,12 @@ DEFAULT_CONFIG = {
     "html_reports_theme": "dark",
     "auto_enable_debug_on_init_errors": True,
     "last_directory":"","auto_open_files":True,"auto_open_folders":True,"language":"fr","theme_colors":THEME_COLORS_DEFAULT,
-    "debug_mode":False,"debug_level":3,
+    "debug_mode":False,"debug_level":3,"performance_tracing":False,
     "html_auto_refresh": True,
     "html_auto_refresh_seconds": 30,
-    "extraction_detect_duplicates":True,"default_save_mode":"overwrite",
+    "extraction_detect_duplicates":True,"extraction_incremental":False,"reconstruction_streaming":True,"default_save_mode":"overwrite",
     "extraction_excluded_files":"",
-    "cleanup_excluded_files":"common.rpy",
+    "cleanup_excluded_files":"common.rpy","cleanup_parallel":True,
     "coherence_check_variables":True,"coherence_check_tags":True,"coherence_check_special_codes":True,"coherence_check_untranslated":True,"coherence_untranslated_threshold_percent":80,"coherence_check_ellipsis":True,
 
     # --- Ports configurables ---
@@ -370,7 +370,7 @@ DEFAULT_CONFIG = {
     "orphaned_ports": [8765, 45000, 8767],
     "coherence_check_escape_sequences":True,"coherence_check_percentages":True,"coherence_check_quotations":True,"coherence_check_parentheses":True,
     "coherence_check_syntax":True,"coherence_check_deepl_ellipsis":True,"coherence_check_isolated_percent":True,"coherence_check_line_structure":True,"coherence_check_length_difference":True,
-    "coherence_excluded_files":"",
+    "coherence_excluded_files":"","coherence_parallel":True,"coherence_results_cache":True,
     "coherence_auto_open_report":True,"coherence_reuse_translate_tab":True,
     "realtime_editor_enabled":True,"realtime_monitoring_interval":200,"realtime_auto_backup":True,"realtime_default_language":"french",
     "realtime_autosave_every_n":0,"realtime_autosave_before_choice_menu":True,"realtime_autosave_after_choice_if_pending":True,
@@ -381,7 +381,8 @@ DEFAULT_CONFIG = {
     "language_selector_integration":False,"developer_console_integration":False,"default_language_at_startup_integration":False,
     "dark_mode":True,"show_output_path_display":False,
     "last_game_directory":"",
-    "custom_extraction_patterns":[]
+    "custom_extraction_patterns":[],"targeted_extraction_combined_scan":False,"targeted_extraction_parallel":True,"backup_deduplication":True,"backup_catalog":True,"backup_zip_parallel":True,"realtime_batch_flush":True,
+    "translation_generation_native":False,"translation_generation_native_fallback":True
 }
 # font_preferences et advanced_screen_options → font_and_screen_options.json (voir config.py)
 # Note: Les catégories de logs sont maintenant extraites dynamiquement depuis le fichier HTML
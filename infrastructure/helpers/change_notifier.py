@@ -0,0 +1,213 @@
+# infrastructure/helpers/change_notifier.py
+"""
+Notifications de modification de dossiers fournies par le système
+- inotify (Linux) via ctypes : nom et nature de chaque entrée créée, écrite, déplacée ou supprimée
+- FindFirstChangeNotification (Windows) : dossier modifié, sans nom d'entrée
+- wake() interrompt une attente en cours depuis un autre thread
+Utilisées par la lecture en continu du log de dialogues et la surveillance des processus.
+"""
+
+import os
+import select
+import struct
+import sys
+from typing import Iterable, List, NamedTuple, Optional
+
+__all__ = ['ChangeEvent', 'create_change_notifier']
+
+_INOTIFY_HEADER = struct.Struct('iIII')
+
+
+class ChangeEvent(NamedTuple):
+    """Modification signalée ; name vaut None quand le système ne précise pas l'entrée (Windows)"""
+    directory: str
+    name: Optional[str]
+    is_dir: bool
+    removed: bool
+
+
+def create_change_notifier(directories: Iterable[str] = ()):
+    """
+    Notifications pour les dossiers donnés (d'autres s'ajoutent avec watch()),
+    ou None si le système n'en fournit pas ou qu'un dossier ne peut pas être surveillé.
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            notifier = _InotifyNotifier()
+        elif sys.platform == 'win32':
+            notifier = _WindowsChangeNotifier()
+        else:
+            return None
+    except Exception:
+        return None
+    for directory in directories:
+        if not notifier.watch(directory):
+            notifier.close()
+            return None
+    return notifier
+
+
+class _InotifyNotifier:
+    """inotify via ctypes (aucune dépendance externe)"""
+
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_ISDIR = 0x40000000
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._wake_r, self._wake_w = os.pipe()
+        self._watches = {}  # wd -> dossier
+
+    def watch(self, directory: str) -> bool:
+        """Ajoute un dossier (non récursif) ; False s'il ne peut pas être surveillé"""
+        directory = os.path.abspath(directory)
+        if directory in self._watches.values():
+            return True
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._MASK)
+        if wd < 0:
+            return False
+        self._watches[wd] = directory
+        return True
+
+    def wait(self, timeout: Optional[float]) -> List[ChangeEvent]:
+        """Attend au plus timeout secondes (None : sans limite) ; liste vide après délai ou wake()"""
+        readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        if self._wake_r in readable:
+            os.read(self._wake_r, 64)
+        if self._fd not in readable:
+            return []
+
+        events = []
+        try:
+            while True:
+                data = os.read(self._fd, 64 * 1024)
+                if not data:
+                    break
+                offset = 0
+                while offset < len(data):
+                    wd, mask, _, name_len = _INOTIFY_HEADER.unpack_from(data, offset)
+                    name = data[offset + _INOTIFY_HEADER.size:offset + _INOTIFY_HEADER.size + name_len].rstrip(b'\0')
+                    offset += _INOTIFY_HEADER.size + name_len
+                    directory = self._watches.get(wd)
+                    if directory is None or not name:
+                        continue
+                    events.append(ChangeEvent(directory, os.fsdecode(name), bool(mask & self._IN_ISDIR),
+                                              bool(mask & (self._IN_DELETE | self._IN_MOVED_FROM))))
+        except BlockingIOError:
+            pass
+        return events
+
+    def wake(self):
+        os.write(self._wake_w, b'x')
+
+    def close(self):
+        if self._fd is None:
+            return
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd = None
+
+
+class _WindowsChangeNotifier:
+    """FindFirstChangeNotification par dossier ; un événement Win32 sert au réveil"""
+
+    _FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+    _FILE_NOTIFY_CHANGE_DIR_NAME = 0x00000002
+    _FILE_NOTIFY_CHANGE_SIZE = 0x00000008
+    _FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+    _WAIT_OBJECT_0 = 0x00000000
+    _INFINITE = 0xFFFFFFFF
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+        kernel32.FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+        kernel32.FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+        kernel32.FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+                                                    wintypes.BOOL, wintypes.DWORD]
+        kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+        self._ctypes = ctypes
+        self._wintypes = wintypes
+        self._kernel32 = kernel32
+
+        # Réveil : événement à réinitialisation automatique
+        self._wake_event = kernel32.CreateEventW(None, False, False, None)
+        if not self._wake_event:
+            raise OSError(ctypes.get_last_error(), "CreateEventW")
+        self._handles = []      # handles de notification
+        self._directories = []  # dossier de chaque handle
+
+    def watch(self, directory: str) -> bool:
+        """Ajoute un dossier (non récursif) ; False s'il ne peut pas être surveillé"""
+        directory = os.path.abspath(directory)
+        if directory in self._directories:
+            return True
+        if len(self._handles) >= 63:
+            # WaitForMultipleObjects : 64 handles au plus, réveil compris
+            return False
+        flags = (self._FILE_NOTIFY_CHANGE_FILE_NAME | self._FILE_NOTIFY_CHANGE_DIR_NAME
+                 | self._FILE_NOTIFY_CHANGE_SIZE | self._FILE_NOTIFY_CHANGE_LAST_WRITE)
+        handle = self._kernel32.FindFirstChangeNotificationW(directory, False, flags)
+        if not handle or handle == self._ctypes.c_void_p(-1).value:
+            return False
+        self._handles.append(handle)
+        self._directories.append(directory)
+        return True
+
+    def wait(self, timeout: Optional[float]) -> List[ChangeEvent]:
+        """Attend au plus timeout secondes (None : sans limite) ; liste vide après délai ou wake()"""
+        handles = [self._wake_event] + self._handles
+        array = (self._wintypes.HANDLE * len(handles))(*handles)
+        milliseconds = self._INFINITE if timeout is None else int(timeout * 1000)
+        index = self._kernel32.WaitForMultipleObjects(len(handles), array, False, milliseconds) - self._WAIT_OBJECT_0
+        if not 1 <= index < len(handles):
+            return []
+
+        # Le premier handle signalé est rendu par l'attente, les suivants sont relevés sans attendre
+        events = []
+        for position in range(index - 1, len(self._handles)):
+            handle = self._handles[position]
+            if position == index - 1 or self._kernel32.WaitForSingleObject(handle, 0) == self._WAIT_OBJECT_0:
+                self._kernel32.FindNextChangeNotification(handle)
+                events.append(ChangeEvent(self._directories[position], None, False, False))
+        return events
+
+    def wake(self):
+        self._kernel32.SetEvent(self._wake_event)
+
+    def close(self):
+        if self._wake_event is None:
+            return
+        for handle in self._handles:
+            self._kernel32.FindCloseChangeNotification(handle)
+        self._handles = []
+        self._directories = []
+        self._kernel32.CloseHandle(self._wake_event)
+        self._wake_event = None
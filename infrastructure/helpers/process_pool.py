@@ -0,0 +1,76 @@
+# infrastructure/helpers/process_pool.py
+"""
+Pool de processus partagé par les traitements fichier par fichier
+(extraction, nettoyage, cohérence, extraction ciblée, génération native des tl)
+- Processus « spawn » : pas de fork d'un processus Tk/threads (comportement identique Windows/Linux)
+- Résultats dans l'ordre des tâches, au fur et à mesure (executor.map, chunksize=1)
+- Spans de traçage et messages de log des workers fusionnés dans le processus principal
+- Pool indisponible ou interrompu : tâches restantes exécutées dans ce processus
+"""
+
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from infrastructure.logging.logging import log_message, pop_worker_log_records, merge_worker_log_records
+from infrastructure.logging.tracing import pop_worker_events, merge_worker_events
+
+__all__ = ['attach_worker_records', 'iter_process_map']
+
+
+def attach_worker_records(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Joint au résultat d'un worker ses spans et messages de log (à appeler en fin de worker)"""
+    trace_events = pop_worker_events()
+    if trace_events:
+        result['trace_events'] = trace_events
+    log_records = pop_worker_log_records()
+    if log_records:
+        result['log_records'] = log_records
+    return result
+
+
+def _merge_worker_records(result: Dict[str, Any]) -> Dict[str, Any]:
+    merge_worker_events(result.pop('trace_events', None))
+    merge_worker_log_records(result.pop('log_records', None))
+    return result
+
+
+def iter_process_map(worker: Callable[[Any], Dict[str, Any]], tasks: Iterable[Any], max_workers: Optional[int] = None,
+                     initializer: Optional[Callable] = None, initargs: tuple = (),
+                     label: str = "Traitement parallèle", category: str = "process_pool") -> Iterator[Dict[str, Any]]:
+    """
+    Applique worker (fonction de module, résultat dict) à chaque tâche, dans l'ordre des tâches.
+
+    Args:
+        max_workers: Processus (défaut : nombre de cœurs) ; 1 : exécution dans ce processus
+        initializer, initargs: Initialisation de chaque processus (données partagées en lecture seule),
+                               appelée aussi dans ce processus avant une exécution séquentielle
+        label, category: Libellé et catégorie du message de reprise en mode séquentiel
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(int(workers), len(tasks)))
+
+    done = 0
+    if workers > 1:
+        try:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=initializer, initargs=initargs) as executor:
+                for result in executor.map(worker, tasks, chunksize=1):
+                    done += 1
+                    yield _merge_worker_records(result)
+            return
+        except Exception as e:
+            # Traitements idempotents : seules les tâches sans résultat sont reprises
+            log_message("ATTENTION", f"{label} interrompu ({e}), reprise en mode séquentiel de {len(tasks) - done} fichier(s)",
+                        category=category)
+
+    if initializer is not None:
+        initializer(*initargs)
+    for task in tasks[done:]:
+        yield _merge_worker_records(worker(task))
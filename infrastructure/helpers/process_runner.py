@@ -0,0 +1,352 @@
+# infrastructure/helpers/process_runner.py
+"""
+Exécution surveillée des processus Ren'Py (jeu, SDK, lint)
+- stdout/stderr lus en continu par deux threads : un jeu bavard ne bloque plus sur
+  un tampon de pipe plein
+- Surveillance de dossiers (création / écriture de fichiers) : notifications du
+  système (inotify sous Linux, notifications de dossier sous Windows), comparaison
+  périodique de scandir ailleurs
+- Boucle d'événements unique (sortie, fichiers, tic d'horloge) au lieu de boucles
+  de sondage et d'un thread traceback.txt par lancement
+- Annulation structurée : terminate, délai de grâce, kill, puis arrêt des lecteurs
+  et de la surveillance dans tous les cas
+"""
+
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from infrastructure.helpers.change_notifier import create_change_notifier
+from infrastructure.helpers.subprocess_helper import get_subprocess_flags
+from infrastructure.logging.logging import log_message
+
+__all__ = ['ProcessEvent', 'ProcessRunner', 'create_file_watcher']
+
+
+class ProcessEvent(NamedTuple):
+    """kind : 'stdout' / 'stderr' (ligne), 'file' (chemin créé ou écrit), 'tick' (temps écoulé), 'exit' (code retour)"""
+    kind: str
+    data: object
+
+
+# --- Surveillance de dossiers ---
+def _snapshot_files(directory: str):
+    """{nom: mtime} des fichiers d'un dossier (vide s'il est illisible)"""
+    entries = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file():
+                    entries[entry.name] = entry.stat().st_mtime_ns
+    except OSError:
+        pass
+    return entries
+
+
+class _PollingWatcher:
+    """Compare périodiquement (nom, mtime) des fichiers des dossiers surveillés"""
+
+    def __init__(self, directories: Iterable[str], callback: Callable[[str], None], interval: float = 0.5):
+        self.directories = [os.path.abspath(d) for d in directories]
+        self.callback = callback
+        self.interval = interval
+        self._stop = threading.Event()
+        self._snapshots = {d: _snapshot_files(d) for d in self.directories}
+        self._thread = threading.Thread(target=self._run, name="file-watch-poll", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            for directory in self.directories:
+                current = _snapshot_files(directory)
+                previous = self._snapshots[directory]
+                for name, mtime in current.items():
+                    if previous.get(name) != mtime:
+                        self.callback(os.path.join(directory, name))
+                self._snapshots[directory] = current
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2)
+
+
+class _NotifiedWatcher:
+    """
+    Surveillance par notifications du système (infrastructure/helpers/change_notifier.py).
+    Un dossier surveillé qui n'existe pas encore est rattaché dès que son chemin apparaît
+    (surveillance de l'ancêtre existant). Quand la notification ne nomme pas l'entrée
+    (Windows), le dossier est comparé à son état précédent.
+    """
+
+    def __init__(self, directories: Iterable[str], callback: Callable[[str], None], notifier):
+        self.callback = callback
+        self.targets = {os.path.abspath(d) for d in directories}
+        self._notifier = notifier
+        self._watched = set()
+        self._snapshots = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="file-watch-notify", daemon=True)
+        for target in self.targets:
+            self._attach_nearest(target)
+
+    def _add_watch(self, directory: str) -> bool:
+        if directory in self._watched:
+            return True
+        if not self._notifier.watch(directory):
+            return False
+        self._watched.add(directory)
+        return True
+
+    def _attach_nearest(self, target: str):
+        """Surveille target, ou son ancêtre existant le plus proche"""
+        path = target
+        while not os.path.isdir(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                return
+            path = parent
+        if path == target:
+            if self._add_watch(target):
+                self._snapshots[target] = _snapshot_files(target)
+            return
+        self._add_watch(path)
+        # Le chemin a pu être créé entre le test et l'ajout de la surveillance
+        self._descend(path)
+
+    def _descend(self, directory: str):
+        """Rattache les sous-dossiers apparus sur le chemin des cibles pas encore surveillées"""
+        for target in self.targets:
+            if target in self._watched or not target.startswith(directory + os.sep):
+                continue
+            child = os.path.join(directory, os.path.relpath(target, directory).split(os.sep)[0])
+            if child not in self._watched:
+                if not os.path.isdir(child) or not self._add_watch(child):
+                    continue
+                if child in self.targets:
+                    # Fichiers écrits avant la surveillance du dossier
+                    self._report_changes(child)
+            self._descend(child)
+
+    def _report_changes(self, directory: str):
+        """Signale les fichiers créés ou modifiés depuis l'état précédent du dossier"""
+        current = _snapshot_files(directory)
+        previous = self._snapshots.get(directory, {})
+        for name, mtime in current.items():
+            if previous.get(name) != mtime:
+                self.callback(os.path.join(directory, name))
+        self._snapshots[directory] = current
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                events = self._notifier.wait(None)
+            except Exception as e:
+                log_message("DEBUG", f"Notifications de dossier interrompues : {e}", category="process_runner")
+                return
+            for event in events:
+                if self._stop.is_set():
+                    return
+                if event.name is None:
+                    if event.directory in self.targets:
+                        self._report_changes(event.directory)
+                    self._descend(event.directory)
+                elif event.removed:
+                    continue
+                elif event.is_dir:
+                    self._descend(event.directory)
+                elif event.directory in self.targets:
+                    self.callback(os.path.join(event.directory, event.name))
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._notifier.wake()
+            self._thread.join(timeout=2)
+        self._notifier.close()
+
+
+def create_file_watcher(directories: Iterable[str], callback: Callable[[str], None], interval: float = 0.5):
+    """
+    Surveillance des fichiers créés ou écrits dans des dossiers (non récursive).
+    callback(chemin) est appelé depuis un thread de surveillance ; start()/stop() à la charge de l'appelant.
+    """
+    directories = list(directories)
+    notifier = create_change_notifier()
+    if notifier is not None:
+        try:
+            return _NotifiedWatcher(directories, callback, notifier)
+        except Exception as e:
+            notifier.close()
+            log_message("DEBUG", f"Notifications de dossier indisponibles ({e}), surveillance par scrutation",
+                        category="process_runner")
+    return _PollingWatcher(directories, callback, interval)
+
+
+# --- Processus ---
+class ProcessRunner:
+    """
+    Lance un processus et expose ses sorties, les fichiers surveillés et sa fin
+    sous forme d'événements.
+
+    Utilisation :
+        with ProcessRunner(cmd, cwd=..., watch_dirs=[...]) as runner:
+            for event in runner.events(is_cancelled=...):
+                ...
+        returncode, stdout, stderr = runner.result()
+    Sortir de la boucle (break, return, exception) arrête proprement le processus.
+    """
+
+    def __init__(self, cmd: List[str], cwd: Optional[str] = None, env: Optional[dict] = None,
+                 watch_dirs: Iterable[str] = (), tick_interval: float = 0.5, grace_period: float = 5.0,
+                 hide_window: bool = True):
+        self.cmd = cmd
+        self.cwd = cwd
+        self.env = env
+        self.watch_dirs = list(watch_dirs)
+        self.tick_interval = tick_interval
+        self.grace_period = grace_period
+        self.hide_window = hide_window
+        self.process: Optional[subprocess.Popen] = None
+        self.start_time = 0.0
+        self._events: 'queue.Queue[ProcessEvent]' = queue.Queue()
+        self._output = {'stdout': [], 'stderr': []}
+        self._readers: List[threading.Thread] = []
+        self._watcher = None
+
+    def __enter__(self) -> 'ProcessRunner':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def start(self):
+        startupinfo = None
+        if sys.platform == "win32" and self.hide_window:
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+
+        if self.watch_dirs:
+            # Surveillance active avant le lancement : aucun fichier du processus n'est manqué
+            self._watcher = create_file_watcher(self.watch_dirs, lambda path: self._events.put(ProcessEvent('file', path)),
+                                                self.tick_interval)
+            self._watcher.start()
+
+        self.start_time = time.time()
+        try:
+            self.process = subprocess.Popen(
+                self.cmd,
+                cwd=self.cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='ignore',
+                startupinfo=startupinfo,
+                env=self.env,
+                creationflags=get_subprocess_flags() if self.hide_window else 0
+            )
+        except Exception:
+            # Lancement impossible : __exit__ ne sera pas appelé, la surveillance s'arrête ici
+            if self._watcher is not None:
+                self._watcher.stop()
+                self._watcher = None
+            raise
+        for name, stream in (('stdout', self.process.stdout), ('stderr', self.process.stderr)):
+            reader = threading.Thread(target=self._drain, args=(name, stream), name=f"process-{name}", daemon=True)
+            reader.start()
+            self._readers.append(reader)
+
+    def _drain(self, name: str, stream):
+        try:
+            for line in stream:
+                self._output[name].append(line)
+                self._events.put(ProcessEvent(name, line))
+        except (OSError, ValueError):
+            pass
+        finally:
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    @property
+    def elapsed(self) -> float:
+        return time.time() - self.start_time
+
+    def events(self, is_cancelled: Optional[Callable[[], bool]] = None) -> Iterator[ProcessEvent]:
+        """
+        Événements jusqu'à la fin du processus ('exit' en dernier).
+        Un 'tick' est émis au moins toutes les tick_interval secondes (progression, délais).
+        is_cancelled() vrai : processus arrêté et InterruptedError levée.
+        """
+        next_tick = time.monotonic() + self.tick_interval
+        while True:
+            if is_cancelled and is_cancelled():
+                self.terminate()
+                raise InterruptedError("Opération annulée.")
+
+            timeout = max(0.0, next_tick - time.monotonic())
+            try:
+                event = self._events.get(timeout=timeout)
+            except queue.Empty:
+                event = None
+
+            if event is not None:
+                yield event
+            if time.monotonic() >= next_tick:
+                next_tick = time.monotonic() + self.tick_interval
+                yield ProcessEvent('tick', self.elapsed)
+
+            if self.process.poll() is not None and self._events.empty():
+                self._join_readers()
+                # Dernières lignes lues après la fin du processus
+                while not self._events.empty():
+                    yield self._events.get_nowait()
+                yield ProcessEvent('exit', self.process.returncode)
+                return
+
+    def terminate(self):
+        """terminate puis kill après le délai de grâce"""
+        if self.process is None or self.process.poll() is not None:
+            return
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=self.grace_period)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        except OSError:
+            pass
+
+    def _join_readers(self):
+        for reader in self._readers:
+            reader.join(timeout=self.grace_period)
+
+    def stop(self):
+        """Arrête le processus s'il tourne encore, puis lecteurs et surveillance"""
+        try:
+            self.terminate()
+            self._join_readers()
+        finally:
+            if self._watcher is not None:
+                self._watcher.stop()
+                self._watcher = None
+
+    def result(self) -> Tuple[Optional[int], str, str]:
+        """(code retour, stdout, stderr) ; à appeler après events() ou stop()"""
+        returncode = self.process.returncode if self.process else None
+        return returncode, "".join(self._output['stdout']), "".join(self._output['stderr'])
@@ -1,7 +1,7 @@
 # utils/logging.py — HTML-only logger + filtres + badges + panneau catégories + debug idempotent + AUTO-REFRESH
-import os, glob, datetime, threading, html as _html
+import os, glob, datetime, threading, multiprocessing, html as _html
+from collections import deque
 from pathlib import Path
-from queue import Queue, Empty
 import atexit, time
 
 # ====== CONFIG PAR DÉFAUT (surchargée par config_manager si présent) ======
@@ -9,6 +9,11 @@ MAX_LOG_FILES = 5               # nombre max de fichiers HTML conservés
 MAX_FILE_SIZE_MB = 50            # rotation quand on dépasse cette taille (Mo)
 LOG_ENCODING = "utf-8"
 
+# Tampon d'écriture (un seul thread écrivain, formats txt et html)
+LOG_BUFFER_SIZE = 20000         # messages en attente max ; au-delà : abandon (DEBUG/INFO) ou attente (ATTENTION/ERREUR)
+LOG_BACKPRESSURE_S = 0.5        # attente max d'un message ATTENTION/ERREUR quand le tampon est plein
+WORKER_LOG_RECORDS = 2000       # messages gardés en mémoire par un processus worker entre deux rapatriements
+
 # HTML options
 HTML_FLUSH_MS = 200             # flush batch toutes X ms
 HTML_MAX_SIZE_MB = 50           # coupe l'HTML runtime s'il dépasse cette taille (Mo)
@@ -462,6 +467,60 @@ def _header_html(theme_default: str, known_categories_json: str = "[]") -> str:
     </script>
     """
 
+class _LogRingBuffer:
+    """
+    Tampon borné entre les appelants de log_message et le thread écrivain.
+    Tampon plein : les messages courants sont abandonnés (et comptés), les messages
+    ATTENTION/ERREUR attendent un peu puis évincent le plus ancien message en attente.
+    """
+
+    def __init__(self, capacity):
+        self._items = deque()
+        self._capacity = max(100, int(capacity))
+        self._cond = threading.Condition(threading.Lock())
+        self.dropped = 0
+
+    def put(self, item, critical=False):
+        with self._cond:
+            if len(self._items) >= self._capacity:
+                if not critical:
+                    self.dropped += 1
+                    return False
+                deadline = time.monotonic() + LOG_BACKPRESSURE_S
+                while len(self._items) >= self._capacity:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._items.popleft()
+                        self.dropped += 1
+                        break
+                    self._cond.wait(remaining)
+            self._items.append(item)
+            if len(self._items) == 1:
+                self._cond.notify_all()  # l'écrivain attend peut-être un premier message
+            return True
+
+    def take_all(self, timeout):
+        """Attend au plus timeout qu'un message arrive, puis retire tout le contenu (liste, nb abandonnés)"""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            items = list(self._items)
+            self._items.clear()
+            dropped, self.dropped = self.dropped, 0
+            if items:
+                self._cond.notify_all()  # libère les appelants en attente de place
+            return items, dropped
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+
+def _in_worker_process() -> bool:
+    # Le nom est fixé dès la préparation d'un processus spawn, parent_process() seulement au démarrage
+    return multiprocessing.parent_process() is not None or multiprocessing.current_process().name != 'MainProcess'
+
+
 class HtmlOnlyLogger:
     def __init__(self, app_version="inconnue"):
         self.app_version = app_version
@@ -473,11 +532,18 @@ class HtmlOnlyLogger:
         self.debug_enabled = False
         self.log_level = 3
         self.log_format = "html"  # ✅ NOUVEAU : format des logs
-        self._html_q = Queue()
-        self._html_thread = None
-        self._html_running = False
+        self._writer_thread = None
+        self._writer_running = False
+        self._out = None              # fichier courant, ouvert par le thread écrivain uniquement
+        self._bytes_written = 0       # taille du fichier courant tenue par l'écrivain (pas de stat par message)
         self._html_disabled_runtime = False
+        self._worker_records = None   # processus worker : messages gardés en mémoire, rapatriés par le parent
         self._load_config()
+        self._buffer = _LogRingBuffer(LOG_BUFFER_SIZE)
+        if _in_worker_process():
+            # Ni création, ni rotation, ni nettoyage de fichiers : le log de session appartient au parent
+            self._worker_records = deque(maxlen=WORKER_LOG_RECORDS)
+            return
         self._ensure_log_directory()
         self._initialize_logging()
 
@@ -529,35 +595,33 @@ class HtmlOnlyLogger:
         category     = kwargs.pop("category", None)
         custom_color = kwargs.pop("color", None)
         if not self._should_log_message(level, category): return
-        with self._lock:
-            try:   final = str(message).format(*args, **kwargs) if (args or kwargs) else str(message)
-            except (IndexError, KeyError): final = f"{message} (Erreur de formatage des arguments)"
-            self._rotate_if_needed()
-            
-            ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-            debug_src = ""
-            if self.debug_enabled and LOG_LEVELS.get((level or '').upper(), 3) >= 4:
-                try:
-                    import inspect
-                    frame = inspect.currentframe()
-                    while frame and frame.f_code.co_filename == __file__: frame = frame.f_back
-                    if frame: debug_src = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
-                except Exception: pass
-            
-            # ✅ FORMAT TXT : Logger en .txt
-            if self.log_format == "txt" and self.current_txt_file:
-                try:
-                    txt_line = self._format_txt_row(ts, level, category or "general", debug_src, final, exception)
-                    with open(self.current_txt_file, "a", encoding=LOG_ENCODING) as tf:
-                        tf.write(txt_line)
-                except Exception: pass
-            
-            # ✅ FORMAT HTML : Logger en .html
-            elif self.log_format == "html" and self.current_html_file and not self._html_disabled_runtime:
-                try:
-                    line = self._format_html_row(ts, level, category or "general", debug_src, final, custom_color, exception)
-                    self._html_q.put(line)
-                except Exception: pass
+        worker = self._worker_records is not None
+        if not worker and (not self._writer_running or self._html_disabled_runtime): return
+        try:   final = str(message).format(*args, **kwargs) if (args or kwargs) else str(message)
+        except (IndexError, KeyError): final = f"{message} (Erreur de formatage des arguments)"
+        if worker:
+            self._worker_records.append((level, final, category, str(exception) if exception else None))
+            return
+        
+        ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        prio = LOG_LEVELS.get((level or '').upper(), 3)
+        debug_src = ""
+        if self.debug_enabled and prio >= 4:
+            try:
+                import inspect
+                frame = inspect.currentframe()
+                while frame and frame.f_code.co_filename == __file__: frame = frame.f_back
+                if frame: debug_src = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+            except Exception: pass
+        
+        # Formatage dans le thread appelant, écriture (et rotation) par le thread écrivain
+        try:
+            if self.log_format == "txt":
+                row = self._format_txt_row(ts, level, category or "general", debug_src, final, exception)
+            else:
+                row = self._format_html_row(ts, level, category or "general", debug_src, final, custom_color, exception)
+            self._buffer.put(row, critical=prio <= 2)
+        except Exception: pass
 
     # --- internes ---
     def _get_log_directory(self):
@@ -573,7 +637,7 @@ class HtmlOnlyLogger:
                 return "."
 
     def _load_config(self):
-        global MAX_LOG_FILES, MAX_FILE_SIZE_MB, HTML_FLUSH_MS, HTML_MAX_SIZE_MB, HTML_THEME, HTML_AUTO_REFRESH, HTML_AUTO_REFRESH_SECONDS
+        global MAX_LOG_FILES, MAX_FILE_SIZE_MB, HTML_FLUSH_MS, HTML_MAX_SIZE_MB, HTML_THEME, HTML_AUTO_REFRESH, HTML_AUTO_REFRESH_SECONDS, LOG_BUFFER_SIZE
         
         try:
             # ✅ CORRECTION : Charger directement depuis le fichier JSON pour éviter la circularité
@@ -594,6 +658,7 @@ class HtmlOnlyLogger:
                 MAX_LOG_FILES      = int(config.get("max_log_files", MAX_LOG_FILES))
                 MAX_FILE_SIZE_MB   = float(config.get("max_file_size_mb", MAX_FILE_SIZE_MB))
                 HTML_FLUSH_MS      = int(config.get("html_log_flush_ms", HTML_FLUSH_MS))
+                LOG_BUFFER_SIZE    = int(config.get("log_buffer_size", LOG_BUFFER_SIZE))
                 HTML_MAX_SIZE_MB   = float(config.get("html_log_max_size_mb", HTML_MAX_SIZE_MB))
                 HTML_THEME         = str(config.get("html_log_theme", HTML_THEME)).lower()
                 HTML_AUTO_REFRESH  = bool(config.get("html_auto_refresh", HTML_AUTO_REFRESH))
@@ -615,6 +680,14 @@ class HtmlOnlyLogger:
 
     def _get_timestamp(self): return datetime.datetime.now().strftime("%Y-%m-%d__%H-%M-%S")
 
+    def _new_log_path(self, extension):
+        """Chemin d'un nouveau fichier de log (suffixe si une rotation a lieu dans la même seconde)"""
+        base = os.path.join(self.log_dir, f"{self.log_prefix}_{self._get_timestamp()}")
+        path, index = f"{base}.{extension}", 2
+        while os.path.exists(path):
+            path, index = f"{base}_{index}.{extension}", index + 1
+        return path
+
     def _get_existing_html_logs(self):
         try:
             return sorted(glob.glob(os.path.join(self.log_dir, f"{self.log_prefix}_*.html")), key=os.path.getmtime, reverse=True)
@@ -717,8 +790,7 @@ class HtmlOnlyLogger:
                 f'{src_part}<span class="msg">{safe_msg}</span>{exc_part}</div>\n')
 
     def _create_new_html(self):
-        filename = f"{self.log_prefix}_{self._get_timestamp()}.html"
-        html_path = os.path.join(self.log_dir, filename)
+        html_path = self._new_log_path("html")
         try:
             self._write_html_header(html_path)
             self._append_html_session_block(html_path, new_session=True)
@@ -735,72 +807,110 @@ class HtmlOnlyLogger:
                     except Exception: pass
         except Exception: pass
 
+    def _current_log_file(self):
+        return self.current_txt_file if self.log_format == "txt" else self.current_html_file
+
     def _should_rotate(self):
+        """Contrôle sur disque, utilisé uniquement au démarrage (ensuite : compteur de l'écrivain)"""
         try:
             # ✅ Vérifier le bon fichier selon le format
-            current_file = self.current_txt_file if self.log_format == "txt" else self.current_html_file
+            current_file = self._current_log_file()
             if not current_file or not os.path.exists(current_file): return True
             return (os.path.getsize(current_file)/(1024*1024)) >= MAX_FILE_SIZE_MB
         except Exception:
             return True
 
-    def _rotate_if_needed(self):
-        if self._should_rotate():
-            # ✅ FORMAT TXT : Créer nouveau .txt
-            if self.log_format == "txt":
-                txt_path = self._create_new_txt()
-                if txt_path:
-                    self.current_txt_file = txt_path
-                    self._cleanup_old_txt()
-            # ✅ FORMAT HTML : Créer nouveau .html
-            else:
-                html_path = self._create_new_html()
-                if html_path:
-                    self.current_html_file = html_path
-                    self._cleanup_old_html()
+    def _open_output(self):
+        """Ouvre le fichier courant en ajout et initialise le compteur d'octets"""
+        self._close_output()
+        current_file = self._current_log_file()
+        if current_file:
+            self._out = open(current_file, "ab")
+            self._out.seek(0, os.SEEK_END)
+            self._bytes_written = self._out.tell()
+
+    def _close_output(self):
+        if self._out is not None:
+            try: self._out.close()
+            except Exception: pass
+            self._out = None
 
-    def _start_html_flusher(self):
-        if self._html_thread or not self.current_html_file: return
-        self._html_running = True
+    def _rotate_if_needed(self):
+        """Rotation d'après le compteur d'octets (thread écrivain)"""
+        if self._out is not None and self._bytes_written < MAX_FILE_SIZE_MB * 1024 * 1024:
+            return
+        # ✅ FORMAT TXT : Créer nouveau .txt
+        if self.log_format == "txt":
+            txt_path = self._create_new_txt()
+            if txt_path:
+                self.current_txt_file = txt_path
+                self._cleanup_old_txt()
+        # ✅ FORMAT HTML : Créer nouveau .html
+        else:
+            html_path = self._create_new_html()
+            if html_path:
+                self.current_html_file = html_path
+                self._cleanup_old_html()
+        self._open_output()
+
+    def _dropped_row(self, dropped):
+        ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        message = f"⚠️ {dropped} message(s) de log ignoré(s) : tampon d'écriture plein"
+        if self.log_format == "txt":
+            return self._format_txt_row(ts, "ATTENTION", "utils_logging", "", message, None)
+        return self._format_html_row(ts, "ATTENTION", "utils_logging", "", message, None, None)
+
+    def _write_rows(self, rows, dropped=0):
+        if dropped:
+            rows.append(self._dropped_row(dropped))
+        if not rows or self._html_disabled_runtime:
+            return
+        self._rotate_if_needed()
+        if self._out is None:
+            return
+        # HTML runtime plafonné : au-delà, plus rien n'est écrit pour cette session
+        if self.log_format == "html" and self._bytes_written >= HTML_MAX_SIZE_MB * 1024 * 1024:
+            self._html_disabled_runtime = True
+            return
+        data = "".join(rows)
+        if os.linesep != "\n":
+            data = data.replace("\n", os.linesep)  # mêmes fins de ligne qu'une écriture en mode texte
+        payload = data.encode(LOG_ENCODING, errors="replace")
+        self._out.write(payload)
+        self._out.flush()
+        self._bytes_written += len(payload)
+
+    def _start_log_writer(self):
+        if self._writer_thread or not self._current_log_file(): return
+        self._writer_running = True
         def _worker():
             interval = max(50, int(HTML_FLUSH_MS)) / 1000.0
-            while self._html_running:
+            try:
+                self._open_output()
+            except Exception:
+                pass
+            while self._writer_running:
                 try:
-                    try:
-                        if self.current_html_file and os.path.exists(self.current_html_file):
-                            if (os.path.getsize(self.current_html_file)/(1024*1024)) >= HTML_MAX_SIZE_MB:
-                                self._html_disabled_runtime = True
-                                try:
-                                    while True: self._html_q.get_nowait()
-                                except Empty: pass
-                                time.sleep(interval); continue
-                    except Exception: pass
-
-                    buf = []
-                    try:
-                        line = self._html_q.get(timeout=interval); buf.append(line)
-                        while True: buf.append(self._html_q.get_nowait())
-                    except Empty: pass
-
-                    if buf and not self._html_disabled_runtime:
-                        with open(self.current_html_file, "a", encoding=LOG_ENCODING) as hf:
-                            hf.writelines(buf)
+                    rows, dropped = self._buffer.take_all(interval)
+                    self._write_rows(rows, dropped)
                 except Exception:
                     time.sleep(interval)
-        self._html_thread = threading.Thread(target=_worker, name="HtmlLogFlusher", daemon=True)
-        self._html_thread.start()
-        atexit.register(self._stop_html_flusher)
-
-    def _stop_html_flusher(self):
-        self._html_running = False
-        try:
-            remaining = []
-            while True: remaining.append(self._html_q.get_nowait())
-        except Empty: pass
+            # Arrêt : dernier lot puis fermeture
+            try:
+                rows, dropped = self._buffer.take_all(0)
+                self._write_rows(rows, dropped)
+            except Exception: pass
+            self._close_output()
+        self._writer_thread = threading.Thread(target=_worker, name="LogWriter", daemon=True)
+        self._writer_thread.start()
+        atexit.register(self._stop_log_writer)
+
+    def _stop_log_writer(self):
+        if not self._writer_running: return
+        self._writer_running = False
+        self._buffer.wake()
         try:
-            if remaining and self.current_html_file and not self._html_disabled_runtime:
-                with open(self.current_html_file, "a", encoding=LOG_ENCODING) as hf:
-                    hf.writelines(remaining)
+            self._writer_thread.join(timeout=5)
         except Exception: pass
 
     def _initialize_logging(self):
@@ -809,6 +919,7 @@ class HtmlOnlyLogger:
             if self.log_format == "txt":
                 self.current_txt_file = self._create_new_txt()
                 self._cleanup_old_txt()
+                self._start_log_writer()
                 self.log_message("INFO", "Format de log : TXT", category="utils_logging")
             # ✅ FORMAT HTML : Initialiser .html
             else:
@@ -819,7 +930,7 @@ class HtmlOnlyLogger:
                 else:
                     self.current_html_file = self._create_new_html()
                     self._cleanup_old_html()
-                self._start_html_flusher()
+                self._start_log_writer()
                 self.log_message("INFO", "Format de log : HTML", category="utils_logging")
         except Exception: pass
 
@@ -832,8 +943,7 @@ class HtmlOnlyLogger:
 
     def _create_new_txt(self):
         """Crée un nouveau fichier de log .txt"""
-        filename = f"{self.log_prefix}_{self._get_timestamp()}.txt"
-        txt_path = os.path.join(self.log_dir, filename)
+        txt_path = self._new_log_path("txt")
         try:
             with open(txt_path, "w", encoding=LOG_ENCODING) as tf:
                 v = self._resolved_version()
@@ -874,6 +984,19 @@ def get_logger(app_version="inconnue"):
 def initialize_log(app_version="inconnue"): get_logger(app_version=app_version)
 def log_message(level, message, *args, **kwargs): get_logger().log_message(level, message, *args, **kwargs)
 
+def pop_worker_log_records():
+    """Messages journalisés par ce processus worker depuis le dernier appel (None si aucun), à renvoyer avec le résultat"""
+    logger = _logger_instance
+    if logger is None or not logger._worker_records: return None
+    records = list(logger._worker_records)
+    logger._worker_records.clear()
+    return records
+
+def merge_worker_log_records(records):
+    """Écrit dans le log de la session les messages rapatriés d'un processus worker"""
+    for level, message, category, exception in records or ():
+        log_message(level, message, category=category, exception=exception)
+
 def log_performance(operation, file_name, duration, details=None):
     try:
         msg = f"[PERFORMANCE] {operation} - {file_name} - {duration:.2f}s"
@@ -0,0 +1,368 @@
+# infrastructure/logging/tracing.py
+"""
+Traçage des performances par phases (spans imbriqués + compteurs)
+
+- trace_run() ouvre une exécution tracée (extraction, reconstruction, nettoyage...)
+- trace_span() mesure une phase ; imbrication suivie par thread
+- trace_counter() cumule un compteur sur l'exécution en cours
+- worker_span() / pop_worker_events() / merge_worker_events() : spans mesurés
+  dans les processus workers puis rapatriés dans l'exécution du processus principal
+
+À la fin de l'exécution : export d'un fichier « Chrome trace event » (chrome://tracing,
+Perfetto) dans <logs>/traces et résumé agrégé par phase dans le log.
+
+Désactivé (option performance_tracing), chaque appel se limite à un test et
+retourne un span vide partagé.
+"""
+
+import datetime
+import glob
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from infrastructure.logging.logging import get_logger, log_message
+
+__all__ = [
+    'trace_run',
+    'trace_span',
+    'trace_counter',
+    'worker_span',
+    'pop_worker_events',
+    'merge_worker_events',
+    'is_tracing'
+]
+
+MAX_TRACE_FILES = 10            # fichiers de trace conservés
+SUMMARY_MAX_PHASES = 25         # phases listées dans le résumé du log
+
+_run_lock = threading.Lock()
+_active_run: Optional['_TraceRun'] = None
+_local = threading.local()
+
+# Côté worker : None = option pas encore lue
+_worker_enabled: Optional[bool] = None
+_worker_events: List[Dict] = []
+
+
+def _tracing_enabled() -> bool:
+    """Lecture de l'option (import tardif : le logger est importé avant la configuration)"""
+    try:
+        from infrastructure.config.config import config_manager
+        return bool(config_manager.get('performance_tracing', False))
+    except Exception:
+        return False
+
+
+def _in_worker_process() -> bool:
+    # Le nom est fixé dès la préparation d'un processus spawn, parent_process() seulement au démarrage
+    return multiprocessing.parent_process() is not None or multiprocessing.current_process().name != 'MainProcess'
+
+
+def _span_stack() -> List['_Span']:
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+class _NoopSpan:
+    """Span vide retourné quand le traçage est inactif"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+    def count(self, name, value=1):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _TraceRun:
+    """Événements d'une exécution tracée"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = datetime.datetime.now()
+        self.origin_ns = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events: List[Dict] = []
+        self.counters: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+        self._thread_names: Dict[int, str] = {}
+
+    def add_span(self, name, start_ns, end_ns, tid, args, pid=None):
+        event = {
+            'name': name,
+            'ph': 'X',
+            'ts': (start_ns - self.origin_ns) / 1000.0,
+            'dur': (end_ns - start_ns) / 1000.0,
+            'pid': pid or self.pid,
+            'tid': tid
+        }
+        if args:
+            event['args'] = args
+        with self._lock:
+            self.events.append(event)
+            if tid not in self._thread_names and (pid or self.pid) == self.pid:
+                self._thread_names[tid] = threading.current_thread().name
+
+    def add_counter(self, name, value):
+        now_ns = time.perf_counter_ns()
+        with self._lock:
+            self.counters[name] += value
+            self.events.append({
+                'name': name,
+                'ph': 'C',
+                'ts': (now_ns - self.origin_ns) / 1000.0,
+                'pid': self.pid,
+                'tid': 0,
+                'args': {'value': self.counters[name]}
+            })
+
+    # --- export ---
+    def _metadata_events(self):
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+                   'args': {'name': f"RenExtract - {self.name}"}}]
+        for tid, thread_name in self._thread_names.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                           'args': {'name': thread_name}})
+        for pid in sorted({e['pid'] for e in self.events if e['pid'] != self.pid}):
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                           'args': {'name': f"Worker {pid}"}})
+        return events
+
+    def export(self) -> Optional[str]:
+        """Écrit le fichier de trace ; retourne son chemin (None en cas d'échec)"""
+        try:
+            trace_dir = os.path.join(get_logger().log_dir, 'traces')
+            os.makedirs(trace_dir, exist_ok=True)
+            safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', self.name).strip('_') or 'run'
+            base = f"trace_{self.started_at.strftime('%Y%m%d_%H%M%S')}_{safe_name}"
+            trace_path = os.path.join(trace_dir, f"{base}.json")
+            suffix = 2
+            while os.path.exists(trace_path):
+                trace_path = os.path.join(trace_dir, f"{base}_{suffix}.json")
+                suffix += 1
+
+            with self._lock:
+                payload = {
+                    'traceEvents': self._metadata_events() + self.events,
+                    'displayTimeUnit': 'ms',
+                    'otherData': {
+                        'run': self.name,
+                        'started_at': self.started_at.isoformat(timespec='seconds'),
+                        'counters': dict(self.counters)
+                    }
+                }
+            temp_path = f"{trace_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, trace_path)
+            self._prune_old_traces(trace_dir)
+            return trace_path
+        except Exception as e:
+            log_message("ATTENTION", f"Export de la trace impossible: {e}", category="performance")
+            return None
+
+    @staticmethod
+    def _prune_old_traces(trace_dir):
+        traces = sorted(glob.glob(os.path.join(trace_dir, 'trace_*.json')), key=os.path.getmtime)
+        for old_trace in traces[:-MAX_TRACE_FILES]:
+            try:
+                os.remove(old_trace)
+            except OSError:
+                pass
+
+    def summary(self) -> str:
+        """Résumé agrégé par phase : durée totale, appels, moyenne, maximum"""
+        phases = defaultdict(lambda: [0.0, 0, 0.0])
+        for event in self.events:
+            if event['ph'] != 'X':
+                continue
+            stats = phases[event['name']]
+            stats[0] += event['dur']
+            stats[1] += 1
+            stats[2] = max(stats[2], event['dur'])
+
+        lines = [f"[TRACE] {self.name} - {len(phases)} phases"]
+        ordered = sorted(phases.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (total_us, calls, max_us) in ordered[:SUMMARY_MAX_PHASES]:
+            lines.append(f"  {name}: total {total_us / 1000:.1f} ms | {calls} appel(s) | "
+                         f"moy {total_us / calls / 1000:.2f} ms | max {max_us / 1000:.1f} ms")
+        if len(ordered) > SUMMARY_MAX_PHASES:
+            lines.append(f"  ... {len(ordered) - SUMMARY_MAX_PHASES} autres phases")
+        if self.counters:
+            lines.append("  Compteurs: " + " | ".join(f"{k}: {v:g}" for k, v in sorted(self.counters.items())))
+        return "\n".join(lines)
+
+
+class _Span:
+    """Phase mesurée dans l'exécution en cours"""
+
+    __slots__ = ('run', 'name', 'args', 'start_ns', 'is_root')
+
+    def __init__(self, run: _TraceRun, name: str, args: Dict, is_root: bool = False):
+        self.run = run
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+        self.is_root = is_root
+
+    def __enter__(self):
+        _span_stack().append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        stack = _span_stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.run.add_span(self.name, self.start_ns, end_ns, threading.get_ident(), self.args)
+        if self.is_root:
+            _finish_run(self.run)
+        return False
+
+    def set(self, **args):
+        """Ajoute des arguments affichés dans la trace"""
+        self.args.update(args)
+
+    def count(self, name, value=1):
+        """Compteur propre au span (argument cumulé)"""
+        self.args[name] = self.args.get(name, 0) + value
+
+
+def _finish_run(run: _TraceRun):
+    global _active_run
+    with _run_lock:
+        if _active_run is run:
+            _active_run = None
+    trace_path = run.export()
+    summary = run.summary()
+    if trace_path:
+        summary += f"\n  Trace: {trace_path}"
+    log_message("INFO", summary, category="performance")
+
+
+def trace_run(name: str, **args):
+    """
+    Ouvre une exécution tracée (ou un simple span si une exécution est déjà en cours).
+    Rien n'est tracé dans les processus workers ni quand l'option est désactivée.
+    """
+    global _active_run
+    run = _active_run
+    if run is not None:
+        return _Span(run, name, args)
+    if _in_worker_process() or not _tracing_enabled():
+        return _NOOP_SPAN
+    with _run_lock:
+        if _active_run is not None:
+            return _Span(_active_run, name, args)
+        run = _active_run = _TraceRun(name)
+    return _Span(run, name, args, is_root=True)
+
+
+def trace_span(name: str, **args):
+    """Mesure une phase de l'exécution en cours (span vide si aucune exécution)"""
+    run = _active_run
+    if run is None:
+        return _NOOP_SPAN
+    return _Span(run, name, args)
+
+
+def trace_counter(name: str, value=1):
+    """Cumule un compteur de l'exécution en cours"""
+    run = _active_run
+    if run is not None:
+        run.add_counter(name, value)
+
+
+def is_tracing() -> bool:
+    return _active_run is not None
+
+
+# ===== PROCESSUS WORKERS =====
+
+class _WorkerSpan:
+    """Span mesuré dans un processus worker, conservé jusqu'à pop_worker_events()"""
+
+    __slots__ = ('name', 'args', 'start_ns')
+
+    def __init__(self, name: str, args: Dict):
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        _worker_events.append({
+            'name': self.name,
+            'start_ns': self.start_ns,
+            'end_ns': time.perf_counter_ns(),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': self.args
+        })
+        return False
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def count(self, name, value=1):
+        self.args[name] = self.args.get(name, 0) + value
+
+
+def worker_span(name: str, **args):
+    """
+    Span d'une tâche de worker : dans le processus principal, équivaut à trace_span() ;
+    dans un processus worker, mesuré localement si l'option est active.
+    """
+    global _worker_enabled
+    if not _in_worker_process():
+        return trace_span(name, **args)
+    if _worker_enabled is None:
+        _worker_enabled = _tracing_enabled()
+    if not _worker_enabled:
+        return _NOOP_SPAN
+    return _WorkerSpan(name, args)
+
+
+def pop_worker_events() -> Optional[List[Dict]]:
+    """Événements mesurés depuis le dernier appel (None si aucun), à renvoyer avec le résultat"""
+    if not _worker_events:
+        return None
+    events = list(_worker_events)
+    _worker_events.clear()
+    return events
+
+
+def merge_worker_events(events: Optional[List[Dict]]):
+    """Intègre dans l'exécution en cours les spans rapatriés d'un worker"""
+    run = _active_run
+    if run is None or not events:
+        return
+    # perf_counter est une horloge système monotone : comparable entre processus
+    for event in events:
+        run.add_span(event['name'], event['start_ns'], event['end_ns'], event['tid'], event['args'], pid=event['pid'])
@@ -48,6 +48,10 @@ def _early_single_instance_win():
 
 # Vérification instance unique dès le chargement (avant initialize_log) pour ne pas régénérer le log
 if __name__ == "__main__":
+    # Exécutable PyInstaller : les workers multiprocessing (spawn) relancent l'exe,
+    # ils doivent s'arrêter ici sans passer par le contrôle d'instance unique
+    import multiprocessing
+    multiprocessing.freeze_support()
     if not _early_single_instance_win():
         from tkinter import messagebox
         root = tk.Tk()
@@ -0,0 +1,170 @@
+# scripts/benchmark/check_extraction_golden.py
+"""
+Contrôle de non-régression de l'extraction sur un corpus de référence (golden files)
+
+Chaque fichier tl de golden/extraction/input est extrait dans un dossier de travail
+isolé ; tous les fichiers produits (à traduire, à ne pas traduire, mappings) sont
+comparés octet par octet à golden/extraction/expected/<fichier>/.
+
+Les fichiers attendus ont été générés avec l'extracteur d'avant le lexer mono-passe
+(core/services/extraction/line_lexer.py) : le contrôle vérifie que les étapes de
+protection produisent exactement la même sortie. Seuls les changements de format
+voulus y sont reportés par --update (clé "incremental" du fichier de positions).
+
+La numérotation des placeholders de [variables] de même longueur suit l'ordre d'un
+set : le contrôle se relance avec PYTHONHASHSEED=0 pour une sortie reproductible.
+
+Usage :
+    python scripts/benchmark/check_extraction_golden.py            # compare
+    python scripts/benchmark/check_extraction_golden.py --update   # régénère les fichiers attendus
+
+Code de sortie : 0 = identique, 1 = différences, 2 = fichiers attendus absents.
+"""
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(BENCHMARK_DIR, 'golden', 'extraction')
+INPUT_DIR = os.path.join(GOLDEN_DIR, 'input')
+EXPECTED_DIR = os.path.join(GOLDEN_DIR, 'expected')
+GAME_NAME = 'GoldenGame'
+LANGUAGE = 'french'
+
+# Champs variables d'une extraction à l'autre, neutralisés avant comparaison
+_VOLATILE_RE = re.compile(rb'("extraction_date": )"[^"]*"')
+
+if BENCHMARK_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARK_DIR)
+
+from run_benchmarks import _isolate_workspace  # noqa: E402
+
+
+def _read_tree(root):
+    """{chemin relatif (séparateurs /): contenu binaire normalisé} des fichiers sous root"""
+    files = {}
+    for current, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(current, name)
+            relative = os.path.relpath(path, root).replace(os.sep, '/')
+            with open(path, 'rb') as f:
+                files[relative] = _VOLATILE_RE.sub(rb'\1"-"', f.read())
+    return files
+
+
+def extract_corpus(workdir):
+    """Extrait chaque fichier du corpus ; retourne {nom de base: {chemin relatif: contenu}}"""
+    from infrastructure.config.constants import FOLDERS
+    from core.services.extraction.extraction import TextExtractor, build_extraction_settings
+
+    tl_dir = os.path.join(workdir, GAME_NAME, 'game', 'tl', LANGUAGE)
+    os.makedirs(tl_dir, exist_ok=True)
+    settings = build_extraction_settings()
+    outputs = {}
+    for name in sorted(os.listdir(INPUT_DIR)):
+        if not name.endswith('.rpy'):
+            continue
+        path = os.path.join(tl_dir, name)
+        shutil.copyfile(os.path.join(INPUT_DIR, name), path)
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        extractor = TextExtractor(settings=settings)
+        extractor.load_file_content(lines, path)
+        extractor.extract_texts()
+
+        file_base = os.path.splitext(name)[0]
+        outputs[file_base] = _read_tree(os.path.join(FOLDERS["temporaires"], GAME_NAME, file_base))
+    return outputs
+
+
+def _first_difference(expected, actual):
+    """Première ligne différente (numéro, attendu, obtenu)"""
+    expected_lines = expected.split(b'\n')
+    actual_lines = actual.split(b'\n')
+    for index, (left, right) in enumerate(zip(expected_lines, actual_lines), 1):
+        if left != right:
+            return index, left, right
+    index = min(len(expected_lines), len(actual_lines)) + 1
+    return index, b''.join(expected_lines[index - 1:index]), b''.join(actual_lines[index - 1:index])
+
+
+def compare(outputs, expected):
+    """Liste des différences (fichier, message)"""
+    differences = []
+    for file_base in sorted(set(outputs) | set(expected)):
+        produced = outputs.get(file_base, {})
+        reference = expected.get(file_base, {})
+        for relative in sorted(set(produced) | set(reference)):
+            label = f"{file_base}/{relative}"
+            if relative not in produced:
+                differences.append((label, "fichier attendu non produit"))
+            elif relative not in reference:
+                differences.append((label, "fichier produit absent de la référence"))
+            elif produced[relative] != reference[relative]:
+                line, left, right = _first_difference(reference[relative], produced[relative])
+                differences.append((label, f"ligne {line} : attendu {left!r}, obtenu {right!r}"))
+    return differences
+
+
+def _write_expected(outputs):
+    if os.path.exists(EXPECTED_DIR):
+        shutil.rmtree(EXPECTED_DIR)
+    for file_base, files in outputs.items():
+        for relative, content in files.items():
+            path = os.path.join(EXPECTED_DIR, file_base, *relative.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(content)
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extraction comparée octet par octet au corpus de référence")
+    parser.add_argument('--update', action='store_true', help="Remplace les fichiers attendus par la sortie actuelle")
+    parser.add_argument('--workdir', default=None, help="Dossier de travail (défaut : dossier temporaire supprimé à la fin)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    if os.environ.get('PYTHONHASHSEED') != '0':
+        env = dict(os.environ, PYTHONHASHSEED='0')
+        argv = sys.argv[1:] if argv is None else argv
+        return subprocess.call([sys.executable, os.path.abspath(__file__)] + list(argv), env=env)
+    args = _parse_args(argv)
+    if not args.update and not os.path.isdir(EXPECTED_DIR):
+        print(f"Aucun fichier attendu ({EXPECTED_DIR}) : relancer avec --update")
+        return 2
+
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix='renextract_golden_')
+    os.makedirs(workdir, exist_ok=True)
+    _isolate_workspace(workdir)
+    try:
+        outputs = extract_corpus(workdir)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    file_count = sum(len(files) for files in outputs.values())
+    if args.update:
+        _write_expected(outputs)
+        print(f"Référence mise à jour : {len(outputs)} fichier(s) source, {file_count} fichier(s) produit(s)")
+        return 0
+
+    differences = compare(outputs, {name: _read_tree(os.path.join(EXPECTED_DIR, name))
+                                    for name in os.listdir(EXPECTED_DIR)})
+    if differences:
+        print(f"{len(differences)} différence(s) :")
+        for label, message in differences:
+            print(f"  {label} : {message}")
+        return 1
+    print(f"Sortie identique à la référence : {len(outputs)} fichier(s) source, {file_count} fichier(s) comparé(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# scripts/benchmark/check_native_tl.py
+"""
+Contrôle de la génération native des fichiers tl par rapport à une sortie du SDK
+
+Par défaut : projet de référence golden/native_tl/project comparé à
+golden/native_tl/reference/<langue>. Ce projet couvre répliques avec attributs,
+attributs temporaires, with, id explicite, collisions d'identifiants, voice et
+nvl clear regroupés, narration en chaîne triple, menus (légende et choix, menu nommé),
+étiquettes locales, blocs if/else et chaînes _() des scripts et des écrans.
+
+La référence suit le format et les identifiants du SDK (<label>_<md5[:8] du code>).
+Pour valider un vrai projet, passer --project et --reference (dossier tl/<langue>
+produit par le SDK, « Generate Translations » avec chaînes non vides).
+
+Contrôles :
+- identifiants des blocs et chaînes old (compare_tl_folders)
+- contenu des fichiers, ligne « # TODO: Translation updated at ... » exceptée
+  (désactivable avec --ids-only, l'ordre des blocs pouvant différer sur un vrai projet)
+
+Code de sortie : 0 = identique, 1 = différences.
+"""
+
+import argparse
+import difflib
+import os
+import shutil
+import sys
+import tempfile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(BENCHMARK_DIR, 'golden', 'native_tl')
+DEFAULT_PROJECT = os.path.join(GOLDEN_DIR, 'project')
+DEFAULT_LANGUAGE = 'french'
+_HEADER_PREFIX = '# TODO: Translation updated at '
+
+if BENCHMARK_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARK_DIR)
+
+from run_benchmarks import _isolate_workspace  # noqa: E402
+
+
+def _tl_lines(tl_folder):
+    """{chemin relatif: lignes sans l'en-tête daté} des fichiers .rpy d'un dossier tl"""
+    files = {}
+    for root, _, names in os.walk(tl_folder):
+        for name in names:
+            if not name.endswith('.rpy'):
+                continue
+            path = os.path.join(root, name)
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                lines = [line for line in f.read().splitlines() if not line.startswith(_HEADER_PREFIX)]
+            files[os.path.relpath(path, tl_folder).replace(os.sep, '/')] = lines
+    return files
+
+
+def compare_contents(generated_folder, reference_folder):
+    """Différences de contenu (fichier, extrait de diff unifié)"""
+    generated = _tl_lines(generated_folder)
+    reference = _tl_lines(reference_folder)
+    differences = []
+    for rel in sorted(set(generated) | set(reference)):
+        if rel not in generated:
+            differences.append((rel, "fichier de référence non généré"))
+        elif rel not in reference:
+            differences.append((rel, "fichier généré absent de la référence"))
+        elif generated[rel] != reference[rel]:
+            diff = difflib.unified_diff(reference[rel], generated[rel], 'référence', 'généré', n=1, lineterm='')
+            differences.append((rel, "\n".join(list(diff)[:20])))
+    return differences
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Génération native des fichiers tl comparée à une sortie du SDK")
+    parser.add_argument('--project', default=DEFAULT_PROJECT, help="Dossier du projet (contenant game/)")
+    parser.add_argument('--language', default=DEFAULT_LANGUAGE, help="Langue des fichiers tl")
+    parser.add_argument('--reference', default=None, help="Dossier tl/<langue> de référence (défaut : celui du projet de référence)")
+    parser.add_argument('--ids-only', action='store_true', help="Compare seulement identifiants et chaînes old")
+    parser.add_argument('--workers', type=int, default=None, help="Processus d'analyse (défaut : nombre de cœurs)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    project = os.path.abspath(args.project)
+    reference = os.path.abspath(args.reference or os.path.join(GOLDEN_DIR, 'reference', args.language))
+    if not os.path.isdir(reference):
+        print(f"Dossier de référence introuvable : {reference}")
+        return 1
+
+    workdir = tempfile.mkdtemp(prefix='renextract_native_tl_')
+    _isolate_workspace(workdir)
+    try:
+        from core.services.translation.native_tl_generator import NativeTranslationGenerator, compare_tl_folders
+
+        output = os.path.join(workdir, 'tl', args.language)
+        generation = NativeTranslationGenerator(project, args.language, output_folder=output,
+                                                skip_existing=False, max_workers=args.workers).generate()
+        report = compare_tl_folders(output, reference, args.language)
+        contents = [] if args.ids_only else compare_contents(output, reference)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    for error in generation['errors']:
+        print(f"Erreur d'analyse : {error}")
+    for kind in ('identifiers', 'strings'):
+        counts = report[kind]
+        print(f"{kind}: {counts['matched']} identiques, {counts['missing']} manquants, {counts['extra']} en trop")
+    for key, title in (('missing_samples', "Manquants"), ('extra_samples', "En trop")):
+        if report[key]:
+            print(f"{title} :")
+            for sample in report[key]:
+                print(f"  {sample}")
+    for rel, message in contents:
+        print(f"Contenu différent : {rel}\n{message}")
+
+    mismatches = sum(report[kind]['missing'] + report[kind]['extra'] for kind in ('identifiers', 'strings'))
+    if mismatches or contents or generation['errors']:
+        return 1
+    print(f"Génération identique à la référence ({report['files']} fichier(s))")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# scripts/benchmark/check_targeted_scan.py
+"""
+Contrôle de parité de l'extraction ciblée : passe combinée contre un finditer par pattern
+
+Les textes détectés (pattern, texte, ordre) doivent être identiques dans les deux modes :
+- cas de régression fixes (apostrophes dans les répliques, guillemets non fermés...)
+- corpus aléatoire reproductible (graine) construit à partir de gabarits de lignes Ren'Py
+
+Usage :
+    python scripts/benchmark/check_targeted_scan.py                 # 600 fichiers aléatoires
+    python scripts/benchmark/check_targeted_scan.py --files 5000 --seed 7
+
+Code de sortie : 0 = identique, 1 = différences.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+if BENCHMARK_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARK_DIR)
+
+from run_benchmarks import _isolate_workspace  # noqa: E402
+
+# Cas signalés : une correspondance multi-lignes d'un pattern entre apostrophes
+# recouvrait des textes que les autres patterns doivent toujours trouver
+REGRESSION_CASES = {
+    'apostrophes_textbutton': (
+        'e "I\'ll text \'em tomorrow."\n'
+        'textbutton "Continue the story" action Return()\n'
+        'e "It\'s fine."\n'
+    ),
+    'unclosed_single_quote': (
+        "text 'Never closed\n"
+        'screen s():\n'
+        '    text "Inside" xalign 0.5\n'
+        '    textbutton "Go" action Return()\n'
+    ),
+    'same_start_patterns': (
+        'text "Styled" style "big"\n'
+        '$ a = Activity("Title", "Kind", "Description")\n'
+        '$ mc.age = "20"\n'
+        '$ renpy.notify("Saved")\n'
+    ),
+}
+
+_WORDS = ("I'll", "it's", "'em", "don't", "Hello", "world", "story", "\"quoted\"", "{b}bold{/b}", "[mc]", "ok")
+_TEMPLATES = (
+    'e "{t}"', "e '{t}'", 'text "{t}"', "text '{t}'", 'text "{t}" xalign 0.5', "text '{t}' color \"#fff\"",
+    'textbutton "{t}" action Return()', "textbutton '{t}'", 'show text "{t}"', 'define x = Character("{t}")',
+    "define y = Character('{t}')", '$ renpy.notify("{t}")', "$ renpy.notify('{t}')", '$ name = renpy.input("{t}")',
+    '# $ name = renpy.input("{t}")', '$ mc.age = "{t}"', "$ mc.info = '{t}'", '$ items.append("{t}")',
+    '$ npc.say("{t}")', '$ Activity("{t}", "kind", "{t}")', 'add "{t}" text="{t}"', 'text "{t}',
+    "text '{t}", 'e "{t}\\"" with dissolve', '    text "{t}" text_align 0.5',
+)
+
+
+def random_file(rng):
+    lines = []
+    for _ in range(rng.randint(1, 12)):
+        text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 5)))
+        lines.append(rng.choice(_TEMPLATES).replace('{t}', text))
+    return "\n".join(lines) + "\n"
+
+
+def compare_modes(combined, classic, cases):
+    """Noms des cas dont les textes détectés diffèrent entre les deux modes"""
+    return [name for name, content in cases
+            if combined._collect_file_candidates(content) != classic._collect_file_candidates(content)]
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Parité passe combinée / patterns séparés de l'extraction ciblée")
+    parser.add_argument('--files', type=int, default=600, help="Fichiers aléatoires générés")
+    parser.add_argument('--seed', type=int, default=1, help="Graine du corpus aléatoire")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix='renextract_targeted_')
+    _isolate_workspace(workdir)
+    try:
+        from core.services.translation.text_extraction_results_business import OptimizedTextExtractor
+
+        combined = OptimizedTextExtractor(combined_scan=True)
+        classic = OptimizedTextExtractor(combined_scan=False)
+        if combined.combined_pattern is None:
+            print("Passe combinée indisponible pour ces patterns")
+            return 1
+
+        rng = random.Random(args.seed)
+        cases = list(REGRESSION_CASES.items())
+        cases += [(f"aléatoire {index}", random_file(rng)) for index in range(args.files)]
+        failures = compare_modes(combined, classic, cases)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if failures:
+        print(f"{len(failures)}/{len(cases)} cas différents :")
+        for name in failures[:20]:
+            print(f"  {name}")
+        return 1
+    print(f"Textes détectés identiques dans les deux modes : {len(cases)} cas")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,378 @@
+# scripts/benchmark/run_benchmarks.py
+"""
+Suite de benchmarks sans interface (aucune fenêtre Tk)
+
+Mesure la durée (minimum et médiane sur plusieurs passages) et le pic mémoire
+(tracemalloc, passage séparé) de chaque traitement sur un même corpus synthétique :
+extraction, reconstruction, cohérence, nettoyage, combinaison, division et
+extraction ciblée.
+
+Limite : tracemalloc ne suit que le processus principal. Avec --workers > 1, la
+mémoire des processus du pool n'est pas comptée ; le pic mesuré est alors celui
+de la coordination, pas du traitement complet (champ peak_scope du rapport).
+
+Tout est exécuté dans un dossier de travail isolé : configuration, logs,
+temporaires et sauvegardes ne touchent pas l'installation courante.
+
+Usage :
+    python scripts/benchmark/run_benchmarks.py --save-baseline      # enregistre la référence
+    python scripts/benchmark/run_benchmarks.py                      # compare à la référence
+
+Code de sortie : 0 = OK, 1 = régression au-delà du seuil, 2 = référence inutilisable.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import fields
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(BENCHMARK_DIR))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+BASELINE_VERSION = 1
+GAME_NAME = 'BenchGame'
+
+if BENCHMARK_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARK_DIR)
+
+from synthetic_project import SyntheticProjectSpec, generate_project  # noqa: E402
+
+
+def _isolate_workspace(workdir):
+    """
+    Les dossiers de l'application (config, temporaires, sauvegardes) sont calculés
+    à l'import depuis sys.argv[0] : on le fait pointer dans le dossier de travail
+    AVANT d'importer le moindre module du dépôt.
+    """
+    sys.argv[0] = os.path.join(workdir, 'benchmark.py')
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+
+def _configure_application(workers):
+    """Options adaptées aux mesures : pas de cache de résultats, pas d'ouverture de rapport"""
+    from infrastructure.config.config import config_manager
+
+    overrides = {
+        'coherence_auto_open_report': False,
+        'coherence_results_cache': False,
+        'coherence_parallel': workers > 1,
+        'cleanup_parallel': workers > 1,
+        'targeted_extraction_parallel': workers > 1,
+        'performance_tracing': False
+    }
+    for key, value in overrides.items():
+        config_manager.config[key] = value
+    config_manager.save_config()
+
+
+# ===== BENCHMARKS =====
+# Chaque benchmark : setup(contexte) -> fonction mesurée (la préparation n'est pas chronométrée)
+
+def _fresh_copy(context, name):
+    """Copie vierge du corpus (les traitements modifient les fichiers tl)"""
+    target = os.path.join(context['scratch'], name, GAME_NAME)
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    shutil.copytree(context['project'], target)
+    return target
+
+
+def _tl_files(project):
+    tl_dir = os.path.join(project, 'game', 'tl', _tl_language(project))
+    return sorted(os.path.join(tl_dir, name) for name in os.listdir(tl_dir) if name.endswith('.rpy'))
+
+
+def _tl_language(project):
+    return sorted(os.listdir(os.path.join(project, 'game', 'tl')))[0]
+
+
+def _read_lines(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.readlines()
+
+
+def setup_extraction(context):
+    from core.services.extraction.extraction import TextExtractor, build_extraction_settings
+
+    project = _fresh_copy(context, 'extraction')
+    settings = build_extraction_settings()
+    sources = [(path, _read_lines(path)) for path in _tl_files(project)]
+
+    def run():
+        for path, lines in sources:
+            extractor = TextExtractor(settings=settings)
+            extractor.load_file_content(lines, path)
+            extractor.extract_texts(incremental=False)
+    return run
+
+
+def setup_reconstruction(context):
+    from core.services.extraction.extraction import TextExtractor, build_extraction_settings
+    from core.services.extraction.reconstruction import FileReconstructor
+
+    project = _fresh_copy(context, 'reconstruction')
+    settings = build_extraction_settings()
+    sources = [(path, _read_lines(path)) for path in _tl_files(project)]
+    # Fichiers d'extraction nécessaires à la reconstruction (non chronométré)
+    for path, lines in sources:
+        extractor = TextExtractor(settings=settings)
+        extractor.load_file_content(lines, path)
+        extractor.extract_texts(incremental=False)
+
+    def run():
+        for path, lines in sources:
+            reconstructor = FileReconstructor()
+            reconstructor.load_file_content(lines, path)
+            reconstructor.reconstruct_file('new_file')
+    return run
+
+
+def setup_coherence(context):
+    from core.services.tools.coherence_checker_business import UnifiedCoherenceChecker
+
+    project = _fresh_copy(context, 'coherence')
+    tl_folder = os.path.join(project, 'game', 'tl', _tl_language(project))
+
+    def run():
+        UnifiedCoherenceChecker().analyze_path(tl_folder, max_workers=context['workers'])
+    return run
+
+
+def setup_cleaning(context):
+    from core.services.tools.cleaning_business import UnifiedCleaner
+
+    project = _fresh_copy(context, 'cleaning')
+    language = _tl_language(project)
+
+    def run():
+        UnifiedCleaner().unified_clean(os.path.join(project, 'lint.txt'), os.path.join(project, 'game'),
+                                       os.path.join(project, 'game', 'tl'), [language], context['workers'])
+    return run
+
+
+def setup_combination(context):
+    from core.services.translation.combination_business import CombinationBusiness
+
+    project = _fresh_copy(context, 'combination')
+    tl_folder = os.path.join(project, 'game', 'tl', _tl_language(project))
+    output_file = os.path.join(context['scratch'], 'combination', 'combined.rpy')
+
+    def run():
+        CombinationBusiness().combine_translation_files(tl_folder, output_file)
+    return run
+
+
+def setup_division(context):
+    from core.services.translation.combination_business import CombinationBusiness
+
+    project = _fresh_copy(context, 'division')
+    tl_folder = os.path.join(project, 'game', 'tl', _tl_language(project))
+    combined_file = os.path.join(context['scratch'], 'division', 'combined.rpy')
+    output_folder = os.path.join(context['scratch'], 'division', 'divided')
+    CombinationBusiness().combine_translation_files(tl_folder, combined_file)
+
+    def run():
+        if os.path.exists(output_folder):
+            shutil.rmtree(output_folder)
+        os.makedirs(output_folder)
+        CombinationBusiness().divide_translation_file(combined_file, output_folder)
+    return run
+
+
+def setup_targeted_extraction(context):
+    from core.services.translation.text_extraction_results_business import OptimizedTextExtractor
+
+    project = _fresh_copy(context, 'targeted_extraction')
+    game_folder = os.path.join(project, 'game')
+    tl_folder = os.path.join(game_folder, 'tl', _tl_language(project))
+
+    def run():
+        OptimizedTextExtractor().extract_targeted_texts(game_folder, tl_folder, max_workers=context['workers'])
+    return run
+
+
+BENCHMARKS = {
+    'extraction': setup_extraction,
+    'reconstruction': setup_reconstruction,
+    'coherence': setup_coherence,
+    'cleaning': setup_cleaning,
+    'combination': setup_combination,
+    'division': setup_division,
+    'targeted_extraction': setup_targeted_extraction,
+}
+
+
+# ===== MESURES =====
+
+def measure(setup, context, repeat):
+    """Durées sur repeat passages (préparation refaite à chaque fois), puis un passage sous tracemalloc"""
+    durations = []
+    for _ in range(repeat):
+        run = setup(context)
+        start = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - start)
+
+    run = setup(context)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'min_s': round(min(durations), 4),
+        'median_s': round(statistics.median(durations), 4),
+        'runs': len(durations),
+        'peak_mb': round(peak / (1024 * 1024), 2)
+    }
+
+
+def compare(results, baseline, time_threshold, memory_threshold):
+    """Liste des régressions (nom, mesure, référence, actuel, variation)"""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get('results', {}).get(name)
+        if not reference:
+            continue
+        checks = (('min_s', time_threshold), ('peak_mb', memory_threshold))
+        for metric, threshold in checks:
+            ref_value, value = reference.get(metric), current.get(metric)
+            if not ref_value or value is None:
+                continue
+            change = value / ref_value - 1
+            if change > threshold:
+                regressions.append((name, metric, ref_value, value, change))
+    return regressions
+
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return baseline if baseline.get('version') == BASELINE_VERSION else None
+
+
+def save_baseline(path, spec, workers, results):
+    payload = {
+        'version': BASELINE_VERSION,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'workers': workers,
+        # tracemalloc ne voit pas les processus du pool
+        'peak_scope': 'main_process' if workers <= 1 else 'main_process_only_workers_excluded',
+        'spec': spec.to_dict(),
+        'results': results
+    }
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def _print_table(results, baseline, workers):
+    reference = (baseline or {}).get('results', {})
+    print(f"{'benchmark':<22}{'min (s)':>10}{'médiane':>10}{'pic (Mo)':>10}{'réf. (s)':>10}{'écart':>9}")
+    for name, result in results.items():
+        ref = reference.get(name, {}).get('min_s')
+        delta = f"{(result['min_s'] / ref - 1) * 100:+.1f}%" if ref else '-'
+        ref_text = f"{ref:.3f}" if ref else '-'
+        print(f"{name:<22}{result['min_s']:>10.3f}{result['median_s']:>10.3f}{result['peak_mb']:>10.2f}{ref_text:>10}{delta:>9}")
+    if workers > 1:
+        print("\nPic mémoire : processus principal uniquement (processus du pool non mesurés)")
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks RenExtract sur un corpus synthétique")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Fichier JSON de référence")
+    parser.add_argument('--save-baseline', action='store_true', help="Enregistre les mesures comme nouvelle référence")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Régression de durée tolérée (0.25 = +25%%)")
+    parser.add_argument('--memory-threshold', type=float, default=0.25, help="Régression de pic mémoire tolérée")
+    parser.add_argument('--repeat', type=int, default=3, help="Passages chronométrés par benchmark")
+    parser.add_argument('--workers', type=int, default=1, help="Processus des traitements parallèles (1 = séquentiel ; pic mémoire des processus non mesuré)")
+    parser.add_argument('--only', default='', help=f"Benchmarks à lancer, séparés par des virgules ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--workdir', default=None, help="Dossier de travail (défaut : dossier temporaire supprimé à la fin)")
+    parser.add_argument('--output', default=None, help="Écrit aussi les mesures de ce passage dans ce fichier JSON")
+    defaults = SyntheticProjectSpec()
+    corpus = parser.add_argument_group('corpus')
+    for field in fields(SyntheticProjectSpec):
+        option = '--' + field.name.replace('_', '-')
+        corpus.add_argument(option, type=type(getattr(defaults, field.name)), default=getattr(defaults, field.name))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    spec = SyntheticProjectSpec(**{f.name: getattr(args, f.name) for f in fields(SyntheticProjectSpec)})
+    selected = [name.strip() for name in args.only.split(',') if name.strip()] or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        print(f"Benchmarks inconnus : {', '.join(unknown)}")
+        return 2
+
+    baseline = None
+    if not args.save_baseline:
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            print(f"Aucune référence exploitable ({args.baseline}) : relancer avec --save-baseline")
+        elif baseline.get('spec') != spec.to_dict() or baseline.get('workers') != args.workers:
+            print("La référence a été mesurée sur un autre corpus ou un autre nombre de processus")
+            return 2
+
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix='renextract_bench_')
+    os.makedirs(workdir, exist_ok=True)
+    _isolate_workspace(workdir)
+    try:
+        _configure_application(args.workers)
+        corpus = generate_project(os.path.join(workdir, 'corpus', GAME_NAME), spec)
+        print(f"Corpus : {corpus['stats']} -> {corpus['project']}")
+        context = {
+            'project': corpus['project'],
+            'scratch': os.path.join(workdir, 'scratch'),
+            'workers': args.workers
+        }
+
+        results = {}
+        for name in selected:
+            results[name] = measure(BENCHMARKS[name], context, max(1, args.repeat))
+            print(f"  {name}: {results[name]['min_s']:.3f}s (pic {results[name]['peak_mb']:.2f} Mo)")
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print()
+    _print_table(results, baseline, args.workers)
+    if args.output:
+        save_baseline(args.output, spec, args.workers, results)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, spec, args.workers, results)
+        print(f"\nRéférence enregistrée : {args.baseline}")
+        return 0
+    if baseline is None:
+        return 2
+
+    regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+    if regressions:
+        print("\nRégressions :")
+        for name, metric, ref_value, value, change in regressions:
+            print(f"  {name} [{metric}] : {ref_value} -> {value} ({change * 100:+.1f}%)")
+        return 1
+    print("\nAucune régression au-delà des seuils")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
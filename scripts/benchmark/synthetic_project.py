@@ -0,0 +1,276 @@
+# scripts/benchmark/synthetic_project.py
+"""
+Générateur de projets Ren'Py synthétiques (corpus de benchmark)
+
+Produit, de façon déterministe (graine fixe) :
+- game/*.rpy : labels, dialogues, menus, écrans (text / textbutton / renpy.input)
+- game/tl/<langue>/*.rpy : blocs « translate <langue> <id>: » et blocs strings old/new
+- lint.txt : traductions orphelines au format du lint Ren'Py (pour le nettoyage)
+
+Densité de dialogues, fréquence des balises, variables, astérisques, tildes,
+blocs strings, orphelins et incohérences volontaires sont réglables.
+
+Usage autonome :
+    python scripts/benchmark/synthetic_project.py <dossier> [--files 40] [--dialogues-per-file 200] [--seed 1]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Tuple
+
+__all__ = ['SyntheticProjectSpec', 'generate_project']
+
+_WORDS = (
+    "the morning light was soft and quiet when we finally reached the old house near river "
+    "she never told me why her brother left town that summer but I could guess anyway "
+    "maybe we should talk about it later tonight after dinner with everyone else around "
+    "you look tired again did you sleep at all this week I keep worrying about you "
+    "there is something strange about this place and I want to find out what really happened"
+).split()
+
+_SPEAKERS = ('e', 'm', 'j', 'mc')
+_TAGS = (('{i}', '{/i}'), ('{b}', '{/b}'), ('{color=#ff0000}', '{/color}'), ('{size=+10}', '{/size}'))
+_VARIABLES = ('[player_name]', '[mc]', '[points]', '[day_count]', '[persistent.nickname]')
+_ASTERISKS = ('*sigh*', '*laughs*', '*whispers*', '*blushes*')
+_TILDES = ('~hey~', '~yes~', '~please~')
+_WIDGETS = ('text', 'textbutton')
+
+# Mots hors balises {..} et variables [..] : seuls ces mots sont « traduits »
+_TRANSLATABLE_RE = re.compile(r'(\[[^\]]*\]|\{[^}]*\})|([A-Za-z]+)')
+
+
+@dataclass
+class SyntheticProjectSpec:
+    """Paramètres du corpus (tous les ratios sont des probabilités par ligne de dialogue)"""
+    files: int = 40
+    dialogues_per_file: int = 200
+    language: str = 'french'
+    tag_ratio: float = 0.25
+    variable_ratio: float = 0.15
+    asterisk_ratio: float = 0.05
+    tilde_ratio: float = 0.03
+    menu_ratio: float = 0.04
+    strings_per_file: int = 30
+    screen_texts_per_file: int = 10
+    orphan_ratio: float = 0.02
+    incoherence_ratio: float = 0.02
+    seed: int = 1
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SyntheticProjectSpec':
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+
+class _ProjectWriter:
+    """Construit un projet fichier par fichier à partir d'un générateur pseudo-aléatoire"""
+
+    def __init__(self, spec: SyntheticProjectSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.stats = {'game_files': 0, 'tl_files': 0, 'dialogues': 0, 'strings': 0,
+                      'orphan_blocks': 0, 'orphan_strings': 0, 'incoherences': 0}
+        self.lint_entries: List[Tuple[str, int, str]] = []
+
+    # --- texte ---
+    def _sentence(self, min_words=4, max_words=14) -> str:
+        words = self.rng.choices(_WORDS, k=self.rng.randint(min_words, max_words))
+        words[0] = words[0].capitalize()
+        return " ".join(words) + self.rng.choice(('.', '!', '?', '...'))
+
+    def _decorate(self, text: str) -> str:
+        rng, spec = self.rng, self.spec
+        words = text.split(' ')
+        if rng.random() < spec.tag_ratio and len(words) > 2:
+            opening, closing = rng.choice(_TAGS)
+            i = rng.randrange(len(words) - 1)
+            words[i] = opening + words[i]
+            words[i + 1] = words[i + 1] + closing
+        if rng.random() < spec.variable_ratio:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(_VARIABLES))
+        if rng.random() < spec.asterisk_ratio:
+            words.insert(0, rng.choice(_ASTERISKS))
+        if rng.random() < spec.tilde_ratio:
+            words.append(rng.choice(_TILDES))
+        return " ".join(words)
+
+    def _translate(self, text: str) -> str:
+        """Traduction factice : même structure, mots inversés ; parfois une incohérence volontaire"""
+        translated = _TRANSLATABLE_RE.sub(lambda m: m.group(1) or m.group(2)[::-1], text)
+        if self.rng.random() < self.spec.incoherence_ratio:
+            for token in _VARIABLES + tuple(tag for pair in _TAGS for tag in pair):
+                if token in translated:
+                    translated = translated.replace(token, '', 1)
+                    self.stats['incoherences'] += 1
+                    break
+        return translated
+
+    @staticmethod
+    def _block_id(label: str, text: str) -> str:
+        return f"{label}_{hashlib.md5(text.encode('utf-8')).hexdigest()[:8]}"
+
+    # --- fichiers ---
+    def write_file(self, game_dir: str, tl_dir: str, index: int):
+        spec, rng = self.spec, self.rng
+        name = f"chapter_{index:03d}"
+        label = name
+        game_lines = [f"# Chapitre synthétique {index}", ""]
+        tl_lines = ["# TODO: Translation updated at 2024-01-01 00:00", ""]
+        strings = []
+        used_ids = set()
+
+        if index == 1:
+            game_lines += [f'define {s} = Character("{s.upper()} {i}", color="#c8ffc8")' for i, s in enumerate(_SPEAKERS)]
+            game_lines.append("")
+
+        game_lines.append(f"label {label}:")
+        game_lines.append("    scene bg room")
+        for _ in range(spec.dialogues_per_file):
+            if rng.random() < spec.menu_ratio:
+                game_lines.append("    menu:")
+                for _ in range(rng.randint(2, 3)):
+                    choice = self._sentence(2, 5)
+                    game_lines.append(f'        "{choice}":')
+                    game_lines.append(f"            jump {label}_end")
+                    strings.append((len(game_lines) - 1, choice))
+                continue
+
+            text = self._decorate(self._sentence())
+            speaker = rng.choice(_SPEAKERS + ('',))
+            say = f'{speaker} "{text}"' if speaker else f'"{text}"'
+            game_lines.append(f"    {say}")
+            line_number = len(game_lines)
+
+            block_id = self._block_id(label, say)
+            while block_id in used_ids:
+                block_id += "_1"
+            used_ids.add(block_id)
+            translated = self._translate(text)
+            tl_say = f'{speaker} "{translated}"' if speaker else f'"{translated}"'
+            tl_lines += [
+                f"# game/{name}.rpy:{line_number}",
+                f"translate {spec.language} {block_id}:",
+                "",
+                f"    # {say}",
+                f"    {tl_say}",
+                ""
+            ]
+            self.stats['dialogues'] += 1
+
+            if rng.random() < spec.orphan_ratio:
+                orphan_id = self._block_id(label + "_old", say)
+                tl_lines += [
+                    f"# game/{name}.rpy:{line_number}",
+                    f"translate {spec.language} {orphan_id}:",
+                    "",
+                    f"    # {say}",
+                    f"    {tl_say}",
+                    ""
+                ]
+                self.lint_entries.append((f"game/tl/{spec.language}/{name}.rpy", len(tl_lines) - 4, orphan_id))
+                self.stats['orphan_blocks'] += 1
+
+        game_lines += [f"label {label}_end:", "    return", ""]
+
+        # Écran : textes de l'extraction ciblée et chaînes de l'interface
+        game_lines.append(f"screen stats_{index:03d}():")
+        game_lines.append("    vbox:")
+        for _ in range(spec.screen_texts_per_file):
+            widget = rng.choice(_WIDGETS)
+            text = self._sentence(1, 4)
+            suffix = ' xalign 0.5' if widget == 'text' else ' action Return()'
+            game_lines.append(f'        {widget} "{text}"{suffix}')
+            strings.append((len(game_lines), text))
+        game_lines.append(f'    $ answer = renpy.input("{self._sentence(2, 4)}")')
+        game_lines.append("")
+
+        # Chaînes supplémentaires référencées par des _() (blocs strings)
+        game_lines.append("init python:")
+        for _ in range(spec.strings_per_file):
+            text = self._decorate(self._sentence(2, 8))
+            game_lines.append(f'    notify_{rng.randrange(10 ** 6)} = _("{text}")')
+            strings.append((len(game_lines), text))
+        game_lines.append("")
+
+        tl_lines += [f"translate {spec.language} strings:", ""]
+        for line_number, text in strings:
+            tl_lines += [f"    # game/{name}.rpy:{line_number}", f'    old "{text}"', f'    new "{self._translate(text)}"', ""]
+            self.stats['strings'] += 1
+            if rng.random() < spec.orphan_ratio:
+                orphan = f"{text} (removed)"
+                tl_lines += [f"    # game/{name}.rpy:{line_number}", f'    old "{orphan}"', f'    new "{self._translate(orphan)}"', ""]
+                self.stats['orphan_strings'] += 1
+
+        _write_lines(os.path.join(game_dir, f"{name}.rpy"), game_lines)
+        _write_lines(os.path.join(tl_dir, f"{name}.rpy"), tl_lines)
+        self.stats['game_files'] += 1
+        self.stats['tl_files'] += 1
+
+    def write_lint(self, path: str):
+        lines = []
+        current_file = None
+        for tl_file, line_number, orphan_id in self.lint_entries:
+            if tl_file != current_file:
+                lines += ["", f"{tl_file}:", "Orphan Translations:"]
+                current_file = tl_file
+            lines.append(f"    * line {line_number} (id {orphan_id})")
+        lines += ["", "Statistics:", f"The game contains {self.stats['dialogues']} dialogue blocks."]
+        _write_lines(path, lines)
+
+
+def _write_lines(path: str, lines: List[str]):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def generate_project(root: str, spec: SyntheticProjectSpec = None) -> Dict:
+    """
+    Génère un projet synthétique dans root (créé si besoin, fichiers existants écrasés).
+
+    Returns:
+        dict: chemins (project, game, tl, lint) et statistiques du corpus
+    """
+    spec = spec or SyntheticProjectSpec()
+    game_dir = os.path.join(root, 'game')
+    tl_dir = os.path.join(game_dir, 'tl', spec.language)
+    os.makedirs(tl_dir, exist_ok=True)
+
+    writer = _ProjectWriter(spec)
+    for index in range(1, spec.files + 1):
+        writer.write_file(game_dir, tl_dir, index)
+    lint_path = os.path.join(root, 'lint.txt')
+    writer.write_lint(lint_path)
+
+    return {
+        'project': root,
+        'game': game_dir,
+        'tl': tl_dir,
+        'lint': lint_path,
+        'spec': spec.to_dict(),
+        'stats': writer.stats
+    }
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Génère un projet Ren'Py synthétique")
+    parser.add_argument('root', help="Dossier du projet à générer")
+    defaults = SyntheticProjectSpec()
+    for field in fields(SyntheticProjectSpec):
+        option = '--' + field.name.replace('_', '-')
+        parser.add_argument(option, type=type(getattr(defaults, field.name)), default=getattr(defaults, field.name))
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+    spec = SyntheticProjectSpec(**{f.name: getattr(args, f.name) for f in fields(SyntheticProjectSpec)})
+    info = generate_project(os.path.abspath(args.root), spec)
+    print(json.dumps(info, indent=2, ensure_ascii=False))
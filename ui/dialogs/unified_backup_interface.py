@@ -54,6 +54,18 @@ def show_unified_backup_manager(parent):
 class UnifiedBackupDialog:
     """Dialogue principal du gestionnaire unifiÃ© - VERSION HARMONISÉE COHERENCE CHECKER"""
     
+    # Sauvegardes chargées par page (page suivante en arrivant en bas de la liste)
+    PAGE_SIZE = 500
+    
+    # Colonne de la liste -> colonne de tri de list_backups_page
+    SORT_FIELDS = {
+        'game': 'game_name',
+        'filename': 'file_name',
+        'type': 'type',
+        'created': 'created',
+        'size': 'size'
+    }
+    
     def __init__(self, parent):
         self.parent = parent
         self.manager = UnifiedBackupManager()
@@ -61,6 +73,11 @@ class UnifiedBackupDialog:
         self.current_filter_game = None
         self.current_filter_type = None
         self.backups = []
+        self.total_backup_count = 0
+        self._loading_page = False
+        # Tri transmis au gestionnaire : les pages suivantes arrivent déjà ordonnées
+        self.sort_by = 'created'
+        self.sort_descending = True
         self.tree = None
         
         # Enregistrer cette fenêtre dans le système de thème global
@@ -398,13 +415,13 @@ class UnifiedBackupDialog:
             self.sort_reverse[col] = False
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(list_container, orient="vertical", command=self.tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(list_container, orient="vertical", command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(list_container, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=h_scrollbar.set)
         
         # Placement
         self.tree.grid(row=0, column=0, sticky='nsew')
-        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
         
         list_container.grid_rowconfigure(0, weight=1)
@@ -516,8 +533,20 @@ class UnifiedBackupDialog:
         try:
             self._update_status("📄 Chargement des sauvegardes en cours...")
             
+            # Première page filtrée par le gestionnaire (catalogue indexé)
+            if hasattr(self.manager, 'list_backups_page'):
+                page = self.manager.list_backups_page(
+                    game_filter=self.current_filter_game,
+                    type_filter=self.current_filter_type,
+                    limit=self.PAGE_SIZE,
+                    sort_by=self.sort_by,
+                    descending=self.sort_descending
+                )
+                self.backups = page['backups']
+                self.total_backup_count = page['total']
+            
             # Charger tous les backups - utilise le cache si disponible
-            if hasattr(self.manager, 'list_all_backups'):
+            elif hasattr(self.manager, 'list_all_backups'):
                 # Charger TOUTES les sauvegardes (utilise le cache si valide)
                 all_backups = self.manager.list_all_backups()
                 
@@ -529,9 +558,11 @@ class UnifiedBackupDialog:
                 
                 if self.current_filter_type:
                     self.backups = [b for b in self.backups if b['type'] == self.current_filter_type]
+                self.total_backup_count = len(self.backups)
             else:
                 # Fallback pour ancien manager
                 self.backups = []
+                self.total_backup_count = 0
             
             # Mettre à jour l'interface
             self._update_statistics()
@@ -556,9 +587,9 @@ class UnifiedBackupDialog:
             
             if filter_info:
                 filter_text = " (" + ", ".join(filter_info) + ")"
-                self._update_status(f"✅ {len(self.backups)} sauvegardes chargées{filter_text}")
+                self._update_status(f"✅ {self.total_backup_count} sauvegardes chargées{filter_text}")
             else:
-                self._update_status(f"✅ {len(self.backups)} sauvegardes chargées - Prêt")
+                self._update_status(f"✅ {self.total_backup_count} sauvegardes chargées - Prêt")
             
         except Exception as e:
             log_message("ERREUR", f"Erreur chargement données: {e}", category="ui_backup")
@@ -566,6 +597,49 @@ class UnifiedBackupDialog:
             show_translated_messagebox('error', "Erreur", 
                                      "Erreur chargement données :\n{error}", error=str(e))
     
+    def _on_tree_yscroll(self, first, last):
+        """Met à jour la barre de défilement et charge la page suivante en bas de liste"""
+        self.v_scrollbar.set(first, last)
+        if float(last) >= 1.0 and not self._loading_page and len(self.backups) < self.total_backup_count:
+            self._loading_page = True
+            self.window.after_idle(self._load_next_page)
+    
+    def _load_next_page(self):
+        """Ajoute la page suivante de sauvegardes à la liste"""
+        try:
+            self._fetch_next_page()
+        except Exception as e:
+            log_message("ATTENTION", f"Erreur chargement page de sauvegardes: {e}", category="ui_backup")
+        finally:
+            self._loading_page = False
+    
+    def _fetch_next_page(self, limit=None):
+        """Charge et affiche les sauvegardes suivantes (une page, ou toutes si limit vaut 0)"""
+        page = self.manager.list_backups_page(
+            game_filter=self.current_filter_game,
+            type_filter=self.current_filter_type,
+            offset=len(self.backups),
+            limit=self.PAGE_SIZE if limit is None else (limit or None),
+            sort_by=self.sort_by,
+            descending=self.sort_descending
+        )
+        self.total_backup_count = page['total']
+        self.backups.extend(page['backups'])
+        for backup in page['backups']:
+            self._add_backup_to_tree(backup)
+        log_message("DEBUG", f"Page de sauvegardes chargée: {len(self.backups)}/{self.total_backup_count}", category="ui_backup")
+    
+    def _load_all_pages(self):
+        """Charge les pages restantes : « tout sélectionner » porte sur toutes les sauvegardes filtrées"""
+        if not hasattr(self.manager, 'list_backups_page') or len(self.backups) >= self.total_backup_count:
+            return
+        self._loading_page = True
+        try:
+            self._update_status(f"📄 Chargement des {self.total_backup_count} sauvegardes...")
+            self._fetch_next_page(limit=0)
+        finally:
+            self._loading_page = False
+    
     def _update_statistics(self):
         """Met à jour les statistiques avec structure hiérarchique"""
         try:
@@ -585,8 +659,16 @@ class UnifiedBackupDialog:
                 }.get(self.current_filter_type, str(self.current_filter_type))
                 filter_parts.append(f"type: {type_display}")
             
+            # Statistiques calculées par le gestionnaire (toutes les pages)
+            if hasattr(self.manager, 'list_backups_page'):
+                stats = self.manager.get_backup_statistics(self.current_filter_game, self.current_filter_type)
+                total_backups = stats['total_backups']
+                total_size_mb = stats['total_size'] / (1024 * 1024)
+                total_games = len(stats['by_game'])
+                total_files = stats['total_files']
+            
             # TOUJOURS utiliser la même source de données pour la cohérence
-            if filter_parts:
+            elif filter_parts:
                 # Mode FILTRÉ : utiliser self.backups (données filtrées)
                 total_backups = len(self.backups)
                 total_size_mb = sum(b.get('size', 0) for b in self.backups) / (1024 * 1024)
@@ -625,7 +707,9 @@ class UnifiedBackupDialog:
     def _update_game_filter(self):
         """Met à jour la liste des jeux dans le filtre"""
         try:
-            if hasattr(self.manager, 'list_all_backups'):
+            if hasattr(self.manager, 'list_backup_games'):
+                self.game_combo['values'] = ["Tous"] + self.manager.list_backup_games()
+            elif hasattr(self.manager, 'list_all_backups'):
                 all_backups = self.manager.list_all_backups()
                 games = ["Tous"] + sorted(set(b['game_name'] for b in all_backups))
                 self.game_combo['values'] = games
@@ -738,6 +822,10 @@ class UnifiedBackupDialog:
             new_state = not self.select_all_var.get()
             self.select_all_var.set(new_state)
             
+            # Sélection : toutes les sauvegardes filtrées, pas seulement les pages affichées
+            if new_state:
+                self._load_all_pages()
+            
             # Mettre à jour toutes les checkboxes
             for item in self.tree.get_children():
                 item_tags = self.tree.item(item, 'tags')
@@ -851,7 +939,7 @@ class UnifiedBackupDialog:
             if selected_count > 0:
                 self._update_status(f"📌 {selected_count} sauvegarde(s) sélectionnée(s)")
             else:
-                total = len(self.backups)
+                total = self.total_backup_count
                 self._update_status(f"✅ {total} sauvegardes chargées - Prêt")
                 
         except Exception as e:
@@ -1635,23 +1723,30 @@ class UnifiedBackupDialog:
             self.sort_reverse[col] = not self.sort_reverse[col]
             reverse = self.sort_reverse[col]
             
-            # Récupérer tous les éléments
-            items = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
-            
-            # Tri spécial selon la colonne
-            if col == 'created':
-                # Tri par date
-                items.sort(key=lambda x: self._parse_date_for_sort(x[0]), reverse=reverse)
-            elif col == 'size':
-                # Tri par taille (convertir en bytes)
-                items.sort(key=lambda x: self._parse_size_for_sort(x[0]), reverse=reverse)
+            if hasattr(self.manager, 'list_backups_page'):
+                # Tri par le gestionnaire puis rechargement depuis la première page :
+                # un tri local ne porterait que sur les pages déjà chargées
+                self.sort_by = self.SORT_FIELDS[col]
+                self.sort_descending = reverse
+                self._load_data()
             else:
-                # Tri alphabétique standard
-                items.sort(key=lambda x: x[0].lower(), reverse=reverse)
-            
-            # Réorganiser les éléments
-            for index, (val, child) in enumerate(items):
-                self.tree.move(child, '', index)
+                # Récupérer tous les éléments
+                items = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
+                
+                # Tri spécial selon la colonne
+                if col == 'created':
+                    # Tri par date
+                    items.sort(key=lambda x: self._parse_date_for_sort(x[0]), reverse=reverse)
+                elif col == 'size':
+                    # Tri par taille (convertir en bytes)
+                    items.sort(key=lambda x: self._parse_size_for_sort(x[0]), reverse=reverse)
+                else:
+                    # Tri alphabétique standard
+                    items.sort(key=lambda x: x[0].lower(), reverse=reverse)
+                
+                # Réorganiser les éléments
+                for index, (val, child) in enumerate(items):
+                    self.tree.move(child, '', index)
             
             # Mettre à jour les en-têtes pour indiquer le tri
             for column in self.tree['columns']:
@@ -25,6 +25,7 @@ from infrastructure.config.config import config_manager
 from infrastructure.logging.logging import log_message
 from infrastructure.helpers.unified_functions import show_custom_askyesnocancel, show_custom_messagebox
 from core.models.backup.unified_backup_manager import BackupType
+from core.services.tools.tl_file_cache import tl_file_cache
 from ui.shared.editor_manager import open_file_with_editor as _open_with_editor
 from ui.shared.editor_manager_server import set_focus_callback
 
@@ -2437,14 +2438,7 @@ def save_all_menu_choices(main_interface):
 
                 # Après traitement, persister le fichier pending_modifications (si présent)
                 try:
-                    if hasattr(biz, 'pending_modifications_file') and biz.pending_modifications_file:
-                        if not biz.pending_modifications:
-                            with open(biz.pending_modifications_file, 'w', encoding='utf-8') as f:
-                                f.write('{}')
-                        else:
-                            import json
-                            with open(biz.pending_modifications_file, 'w', encoding='utf-8') as f:
-                                json.dump(biz.pending_modifications, f, indent=2, ensure_ascii=False, default=str)
+                    biz.persist_pending_modifications()
                 except Exception as e:
                     log_message('ATTENTION', f"Erreur persistance fichier pending après sauvegarde choix: {e}", category='realtime_editor')
 
@@ -2806,8 +2800,7 @@ def _analyze_dialogue_structure(main_interface, dialogue_info):
         if not os.path.exists(tl_file_path): 
             return {'is_split': False}
         
-        with open(tl_file_path, 'r', encoding='utf-8') as f: 
-            lines = f.readlines()
+        lines = tl_file_cache.get_lines(tl_file_path)
         
         target_line = dialogue_info.get('tl_line', 0) - 1
         if not (0 <= target_line < len(lines)): 
@@ -3011,6 +3004,7 @@ def _save_speaker_key_modification(main_interface, new_speaker_key):
                             # Écrire le fichier modifié
                             with open(source_file_path, 'w', encoding='utf-8') as f:
                                 f.writelines(lines)
+                            tl_file_cache.invalidate(source_file_path)
                             
                             log_message("INFO", f"Fichier source modifié: {source_file}:{source_line} ({original_speaker_key} → {new_speaker_key})", category="realtime_editor")
                         else:
@@ -3050,12 +3044,10 @@ def _save_speaker_key_modification(main_interface, new_speaker_key):
             'timestamp': time.time()
         }
         
-        # Sauvegarder dans le fichier JSON si disponible
-        if hasattr(biz, 'pending_modifications_file') and biz.pending_modifications_file:
+        # Ajouter la modification au journal des modifications en attente
+        if hasattr(biz, 'persist_pending_modifications'):
             try:
-                import json
-                with open(biz.pending_modifications_file, 'w', encoding='utf-8') as f:
-                    json.dump(biz.pending_modifications, f, indent=2, ensure_ascii=False, default=str)
+                biz.persist_pending_modifications([key])
             except Exception as e:
                 log_message("ATTENTION", f"Erreur sauvegarde JSON modification locuteur: {e}", category="realtime_editor")
         
@@ -3555,8 +3547,7 @@ def copy_and_open_translator(main_interface, text, context=""):
                             tl_file_path = os.path.join(main_interface.current_project_path, "game", tl_file)
                         
                         if os.path.exists(tl_file_path):
-                            with open(tl_file_path, 'r', encoding='utf-8') as f:
-                                lines = f.readlines()
+                            lines = tl_file_cache.get_lines(tl_file_path)
                             
                             target_index = tl_line - 1
                             if 0 <= target_index < len(lines):